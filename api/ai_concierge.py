@@ -28,50 +28,24 @@ import logging
 from llm_config import llm_completion, simple_llm_call_async
 from cb_insights_integration import cb_insights_api, cb_chat
 from google_maps_integration import google_maps_api
-from mcp_client import StartupDatabaseMCPTools
+from mcp_client import get_startup_tools
+from tool_runner import execute_tool_calls, assistant_tool_call_message
+from hybrid_retrieval import DEFAULT_TOKEN_BUDGET, retrieve_startup_context
+from startup_catalog import StartupCatalog, get_startup_catalog
 import models
 
 logger = logging.getLogger(__name__)
 
 
 class StartupDataLoader:
-    """Load and manage startup data from JSON files"""
+    """Startup lookups for the concierge, served from the shared DB-backed catalog"""
     
-    def __init__(self):
-        self.startups_data = None
-        self.startups_dir = Path(__file__).parent.parent / "app" / "startup-swipe-schedu" / "startups"
-        self._load_startups()
+    def __init__(self, db: Optional[Session] = None):
+        self.db = db
     
-    def _load_startups(self):
-        """Load startup data from JSON files"""
-        try:
-            # Try to load the extracted data first
-            extracted_file = self.startups_dir / "slush2_extracted.json"
-            if extracted_file.exists():
-                with open(extracted_file, 'r', encoding='utf-8') as f:
-                    self.startups_data = json.load(f)
-                    print(f"✓ Loaded {len(self.startups_data)} startups from slush2_extracted.json")
-                    return
-            
-            # Fallback to other files
-            for filename in ["slush2.json", "slush_full.json"]:
-                file_path = self.startups_dir / filename
-                if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            self.startups_data = data
-                        elif isinstance(data, dict) and "startups" in data:
-                            self.startups_data = data["startups"]
-                        print(f"✓ Loaded {len(self.startups_data)} startups from {filename}")
-                        return
-            
-            print("⚠️  No startup data files found")
-            self.startups_data = []
-            
-        except Exception as e:
-            print(f"✗ Error loading startup data: {e}")
-            self.startups_data = []
+    @property
+    def catalog(self) -> StartupCatalog:
+        return get_startup_catalog(self.db)
     
     def search_startups(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -82,86 +56,43 @@ class StartupDataLoader:
             limit: Maximum number of results
             
         Returns:
-            List of matching startups
+            List of matching startups (name matches first)
         """
-        if not self.startups_data:
-            return []
-        
-        query_lower = query.lower()
-        results = []
-        
-        for startup in self.startups_data:
-            # Search in name
-            if query_lower in startup.get("name", "").lower():
-                results.append(startup)
-                continue
-            
-            # Search in description
-            if query_lower in startup.get("description", "").lower():
-                results.append(startup)
-                continue
-            
-            # Search in short description
-            if query_lower in startup.get("shortDescription", "").lower():
-                results.append(startup)
-                continue
-            
-            # Search in categories
-            categories = startup.get("categories", [])
-            if isinstance(categories, list):
-                for cat in categories:
-                    if isinstance(cat, dict) and query_lower in cat.get("name", "").lower():
-                        results.append(startup)
-                        break
-            
-            if len(results) >= limit:
-                break
-        
-        return results[:limit]
+        return [r.to_dict() for r in self.catalog.search(query, limit)]
     
     def get_startup_by_id(self, startup_id: int) -> Optional[Dict[str, Any]]:
         """Get startup by ID"""
-        if not self.startups_data:
-            return None
-        
-        for startup in self.startups_data:
-            if startup.get("id") == startup_id:
-                return startup
-        
-        return None
+        record = self.catalog.get(startup_id)
+        return record.to_dict() if record else None
     
     def get_startups_by_category(self, category: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get startups by category"""
-        if not self.startups_data:
-            return []
-        
-        category_lower = category.lower()
-        results = []
-        
-        for startup in self.startups_data:
-            categories = startup.get("categories", [])
-            if isinstance(categories, list):
-                for cat in categories:
-                    if isinstance(cat, dict) and category_lower in cat.get("name", "").lower():
-                        results.append(startup)
-                        break
-            
-            if len(results) >= limit:
-                break
-        
-        return results
+        """Get startups by category (industry or topic)"""
+        return [r.to_dict() for r in self.catalog.in_category(category, limit)]
 
 
 class ContextRetriever:
     """Retrieve relevant context for AI responses"""
     
-    def __init__(self, db: Session, startup_loader: StartupDataLoader):
+    def __init__(self, db: Session, startup_loader: StartupDataLoader, token_budget: int = DEFAULT_TOKEN_BUDGET):
         self.db = db
         self.startup_loader = startup_loader
+        self.token_budget = token_budget
     
-    def get_startup_context(self, query: str) -> str:
-        """Get context about startups based on query"""
-        # Search local database
+    async def get_startup_context(self, query: str) -> str:
+        """Get context about startups based on query (hybrid BM25 + vector ranking, token-budgeted)"""
+        # Ranking and the catalog fallback are blocking DB/CPU work - keep them off the event loop
+        return await asyncio.to_thread(self._startup_context, query)
+    
+    def _startup_context(self, query: str) -> str:
+        try:
+            startups, packed = retrieve_startup_context(self.db, query, limit=10, token_budget=self.token_budget)
+            if startups:
+                logger.info(f"Startup context: {len(packed.included)} full + {len(packed.abbreviated)} short "
+                            f"in ~{packed.tokens} tokens")
+                return packed.text
+        except Exception as e:
+            logger.warning(f"Hybrid retrieval failed, falling back to catalog search: {e}")
+        
         startups = self.startup_loader.search_startups(query, limit=5)
         
         if not startups:
@@ -325,7 +256,7 @@ class AIConcierge:
     
     def __init__(self, db: Session):
         self.db = db
-        self.startup_loader = StartupDataLoader()
+        self.startup_loader = StartupDataLoader(db)
         self.context_retriever = ContextRetriever(db, self.startup_loader)
     
     async def answer_question(
@@ -428,14 +359,14 @@ Would you like me to help with a regular search using our local database instead
                 context_parts.append(attendees_context)
             else:
                 # If no attendee found, fall back to startup search
-                startup_context = self.context_retriever.get_startup_context(question)
+                startup_context = await self.context_retriever.get_startup_context(question)
                 context_parts.append(startup_context)
         else:
             # Regular classification logic
             
             # Startup-related questions (but not simple name queries)
             if any(word in question_lower for word in ["startup", "company", "funding", "investment", "series", "raise"]):
-                startup_context = self.context_retriever.get_startup_context(question)
+                startup_context = await self.context_retriever.get_startup_context(question)
                 context_parts.append(startup_context)
                 
                 # Suggest using ChatCBI for more detailed research
@@ -1090,7 +1021,7 @@ class MCPEnhancedAIConcierge(AIConcierge):
     
     def __init__(self, db: Session):
         super().__init__(db)
-        self.mcp_tools = StartupDatabaseMCPTools()
+        self.mcp_tools = get_startup_tools()
         self._init_mcp_tools()
     
     def _init_mcp_tools(self):
@@ -1191,43 +1122,15 @@ Guidelines:
                     
                     # Check for tool calls
                     if hasattr(message, 'tool_calls') and message.tool_calls:
-                        # Execute all tool calls
-                        tool_results = []
-                        for tool_call in message.tool_calls:
-                            tool_name = tool_call.function.name
-                            tool_args = json.loads(tool_call.function.arguments)
-                            
-                            logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
-                            
-                            # Call the tool
-                            result = await self.handle_tool_call(tool_name, **tool_args)
-                            
-                            tool_results.append({
-                                "tool_call_id": tool_call.id,
-                                "role": "tool",
-                                "name": tool_name,
-                                "content": json.dumps(result)
-                            })
-                        
-                        # Add assistant message with tool calls
-                        messages.append({
-                            "role": "assistant",
-                            "content": message.content or "",
-                            "tool_calls": [
-                                {
-                                    "id": tc.id,
-                                    "type": "function",
-                                    "function": {
-                                        "name": tc.function.name,
-                                        "arguments": tc.function.arguments
-                                    }
-                                }
-                                for tc in message.tool_calls
-                            ]
-                        })
+                        # Execute all tool calls concurrently (each MCP tool opens its own session)
+                        tool_results = await execute_tool_calls(
+                            message.tool_calls,
+                            lambda name, args: self.handle_tool_call(name, **args)
+                        )
                         
-                        # Add tool results
-                        messages.extend(tool_results)
+                        # Add assistant message with tool calls, then results in request order
+                        messages.append(assistant_tool_call_message(message))
+                        messages.extend(result.to_message() for result in tool_results)
                         
                         # Continue loop to let LLM process tool results
                         continue
@@ -0,0 +1,313 @@
+"""
+Analytics Snapshot - columnar copy of the catalogue for dashboard stats
+
+The stats endpoints (/startups/enrichment/stats, /stats, the funding and AXA
+tier summaries and /api/slush-events/stats/summary) used to run several
+aggregate queries per request, some of them followed by a Python walk over
+JSON columns. Instead:
+
+- build_snapshot() reads only the columns the dashboards need, one SELECT
+  per table, and keeps them column-wise (one list per column)
+- Every dashboard aggregate is computed from those columns once per build
+  and kept on the AnalyticsSnapshot, so a stats request is a dict lookup
+  and never touches the OLTP tables
+- analytics_worker() rebuilds the snapshot every
+  ANALYTICS_REFRESH_SECONDS; POST /api/analytics/refresh rebuilds at once
+
+Numbers match the SQL they replace (db_queries.get_enrichment_stats,
+get_funding_stats, get_funding_by_stage, get_axa_tier_statistics), so the
+responses keep their shape.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_REFRESH_SECONDS = float(os.getenv("ANALYTICS_REFRESH_SECONDS", "300"))
+TOP_ORGANIZERS = 10
+
+# One narrow SELECT per table; the snapshot holds nothing else
+SNAPSHOT_QUERIES = {
+    "startups": text("""
+        SELECT is_enriched, logoUrl IS NOT NULL AS has_logo, total_funding,
+               axa_priority_tier, axa_overall_score, cb_insights_id IS NOT NULL AS has_cb_id,
+               axa_use_cases, extracted_product IS NOT NULL AS has_product,
+               extracted_market IS NOT NULL AS has_market
+        FROM startups
+    """),
+    "funding_rounds": text("SELECT simplified_round, amount_millions FROM funding_rounds"),
+    "slush_events": text("SELECT organizer, status FROM slush_events"),
+}
+
+
+# ============================================
+# Columns
+# ============================================
+
+class Columns:
+    """A table held column-wise: name -> list of values, all the same length"""
+
+    def __init__(self, names: Sequence[str], rows: Iterable[Sequence[Any]]):
+        rows = list(rows)
+        self.length = len(rows)
+        self.data = {name: list(values) for name, values in zip(names, zip(*rows))} if rows \
+            else {name: [] for name in names}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.data[name]
+
+    def mask(self, name: str, predicate: Callable[[Any], bool] = bool) -> List[bool]:
+        return [predicate(value) for value in self.data[name]]
+
+    def where(self, name: str, keep: List[bool]) -> List[Any]:
+        return [value for value, k in zip(self.data[name], keep) if k]
+
+    def group_by(self, key: str, value: str, keep: Optional[List[bool]] = None) -> Dict[Any, List[Any]]:
+        """Values of one column grouped by another (rows where keep is False are skipped)"""
+        groups: Dict[Any, List[Any]] = {}
+        keep = keep or [True] * self.length
+        for k, v, kept in zip(self.data[key], self.data[value], keep):
+            if kept:
+                groups.setdefault(k, []).append(v)
+        return groups
+
+
+def _load(db: Session, table: str) -> Columns:
+    result = db.execute(SNAPSHOT_QUERIES[table])
+    return Columns(list(result.keys()), result.fetchall())
+
+
+def _json_list(value: Any) -> List[Any]:
+    """JSON array column as a list (raw SELECTs hand back the stored text)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return [part.strip() for part in value.split(",") if part.strip()]
+    return value if isinstance(value, list) else []
+
+
+def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+    return round(value, digits) if value else None
+
+
+def _pct(part: int, total: int) -> float:
+    return round(part / total * 100, 2) if total > 0 else 0
+
+
+# ============================================
+# Aggregates
+# ============================================
+
+def enrichment_stats(startups: Columns) -> Dict[str, Any]:
+    """Same result as db_queries.get_enrichment_stats"""
+    total = len(startups)
+    enriched = sum(startups.mask("is_enriched"))
+    with_funding = sum(startups.mask("total_funding", lambda v: v is not None))
+    return {
+        "total_startups": total,
+        "enriched_count": enriched,
+        "with_logo": sum(startups.mask("has_logo")),
+        "with_cb_insights_funding": with_funding,
+        "enrichment_percentage": _pct(enriched, total),
+        "funding_coverage": _pct(with_funding, total),
+    }
+
+
+def funding_stats(startups: Columns) -> Dict[str, Any]:
+    """Same result as db_queries.get_funding_stats"""
+    amounts = [v for v in startups["total_funding"] if v is not None]
+    return {
+        "total_with_funding": len(amounts),
+        "avg_funding_millions": _round(sum(amounts) / len(amounts)) if amounts else None,
+        "max_funding_millions": _round(max(amounts)) if amounts else None,
+        "min_funding_millions": _round(min(amounts)) if amounts else None,
+        "total_capital_raised_millions": _round(sum(amounts)) if amounts else None,
+    }
+
+
+def funding_by_stage(rounds: Columns) -> Dict[str, Any]:
+    """Same result as db_queries.get_funding_by_stage"""
+    groups = rounds.group_by("simplified_round", "amount_millions",
+                             rounds.mask("amount_millions", lambda v: v is not None))
+    stages = sorted(groups.items(), key=lambda item: sum(item[1]), reverse=True)
+    return {
+        "by_stage": [
+            {
+                "stage": stage,
+                "count": len(amounts),
+                "avg_amount_millions": _round(sum(amounts) / len(amounts)),
+                "total_amount_millions": _round(sum(amounts)),
+            }
+            for stage, amounts in stages
+        ]
+    }
+
+
+def axa_tier_statistics(startups: Columns) -> Dict[str, Any]:
+    """Same result as db_queries.get_axa_tier_statistics"""
+    tiered = startups.mask("axa_priority_tier", lambda v: v is not None)
+    scores = startups.group_by("axa_priority_tier", "axa_overall_score", tiered)
+    with_cb = startups.group_by("axa_priority_tier", "has_cb_id", tiered)
+    stats = {}
+    for tier in sorted(scores):
+        present = [s for s in scores[tier] if s is not None]
+        cb_count = sum(1 for v in with_cb[tier] if v)
+        stats[tier] = {
+            "total_startups": len(scores[tier]),
+            "avg_score": round(sum(present) / len(present), 1) if present else None,
+            "min_score": min(present) if present else None,
+            "max_score": max(present) if present else None,
+            "with_cb_insights_id": cb_count,
+            "cb_insights_coverage_pct": round(100.0 * cb_count / len(scores[tier]), 1),
+        }
+    return stats
+
+
+def startup_stats(startups: Columns) -> Dict[str, Any]:
+    """Body of GET /stats (tier 2 matches LIKE '%Tier 2%', which is case-insensitive)"""
+    tier2 = startups.mask("axa_priority_tier", lambda v: v is not None and "tier 2" in v.lower())
+    use_cases = Counter(uc for value in startups.where("axa_use_cases", tier2) for uc in _json_list(value))
+    return {
+        "total_startups": len(startups),
+        "tier2_startups": sum(tier2),
+        "use_cases_distribution": dict(use_cases),
+        "data_completeness": {
+            "have_extracted_product": sum(startups.mask("has_product")),
+            "have_extracted_market": sum(startups.mask("has_market")),
+            "have_funding": sum(startups.mask("total_funding", lambda v: v is not None)),
+        },
+    }
+
+
+def slush_event_stats(events: Columns) -> Dict[str, Any]:
+    """Body of GET /api/slush-events/stats/summary"""
+    organizers = Counter(events["organizer"])
+    statuses = Counter(status for value in events["status"] for status in _json_list(value))
+    return {
+        "total_events": len(events),
+        "top_organizers": [{"organizer": org, "count": count}
+                           for org, count in organizers.most_common(TOP_ORGANIZERS)],
+        "status_counts": dict(statuses),
+    }
+
+
+# ============================================
+# Snapshot
+# ============================================
+
+@dataclass
+class AnalyticsSnapshot:
+    """Every dashboard aggregate, computed from one columnar read of the catalogue"""
+    enrichment: Dict[str, Any]
+    funding: Dict[str, Any]
+    funding_by_stage: Dict[str, Any]
+    axa_tiers: Dict[str, Any]
+    startups: Dict[str, Any]
+    slush_events: Dict[str, Any]
+    built_at: datetime = field(default_factory=datetime.utcnow)
+    build_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "built_at": self.built_at.isoformat(),
+            "build_ms": round(self.build_ms, 1),
+            "enrichment": self.enrichment,
+            "funding": self.funding,
+            "funding_by_stage": self.funding_by_stage,
+            "axa_tiers": self.axa_tiers,
+            "startups": self.startups,
+            "slush_events": self.slush_events,
+        }
+
+
+def build_snapshot(db: Session) -> AnalyticsSnapshot:
+    """Read the dashboard columns and compute every aggregate from them"""
+    started = time.perf_counter()
+    startups = _load(db, "startups")
+    rounds = _load(db, "funding_rounds")
+    events = _load(db, "slush_events")
+    snapshot = AnalyticsSnapshot(
+        enrichment=enrichment_stats(startups),
+        funding=funding_stats(startups),
+        funding_by_stage=funding_by_stage(rounds),
+        axa_tiers=axa_tier_statistics(startups),
+        startups=startup_stats(startups),
+        slush_events=slush_event_stats(events),
+    )
+    snapshot.build_ms = (time.perf_counter() - started) * 1000
+    return snapshot
+
+
+class SnapshotHolder:
+    """The current snapshot; built on first use, replaced whole by refresh()"""
+
+    def __init__(self):
+        self._snapshot: Optional[AnalyticsSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> AnalyticsSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = build_snapshot(db)
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self, db: Session) -> AnalyticsSnapshot:
+        snapshot = build_snapshot(db)
+        self._snapshot = snapshot
+        return snapshot
+
+    def clear(self):
+        self._snapshot = None
+
+
+analytics = SnapshotHolder()
+
+
+def get_snapshot(db: Session) -> AnalyticsSnapshot:
+    """The current dashboard snapshot"""
+    return analytics.get(db)
+
+
+def refresh_snapshot(db: Optional[Session] = None) -> AnalyticsSnapshot:
+    """Rebuild the snapshot now (own session when none is given)"""
+    if db is not None:
+        return analytics.refresh(db)
+    db = SessionLocal()
+    try:
+        return analytics.refresh(db)
+    finally:
+        db.close()
+
+
+async def analytics_worker(interval: float = ANALYTICS_REFRESH_SECONDS):
+    """Background task that rebuilds the snapshot every interval seconds"""
+    while True:
+        try:
+            snapshot = await asyncio.to_thread(refresh_snapshot)
+            logger.info(f"📊 Analytics snapshot rebuilt in {snapshot.build_ms:.0f}ms")
+        except Exception as e:
+            logger.error(f"Error rebuilding analytics snapshot: {e}")
+        await asyncio.sleep(interval)
@@ -1,12 +1,15 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 import os
+import time
 import secrets
+import threading
 from database import get_db
 import models
 
@@ -22,6 +25,79 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# Verified access token -> user snapshot, so hot routes skip JWT decode + user query
+PRINCIPAL_CACHE_TTL_SECONDS = 60
+PRINCIPAL_CACHE_MAX_ENTRIES = 10_000
+PRINCIPAL_FIELDS = ("id", "email", "hashed_password", "full_name", "is_active", "is_superuser",
+                    "created_at", "updated_at")
+
+
+class PrincipalCache:
+    """
+    Short-TTL, size-bounded LRU of authenticated principals keyed by access token.
+
+    An entry is served until the earlier of its TTL and the token's own exp,
+    and is dropped as soon as the user's tokens are revoked or the user row
+    changes (invalidate()).
+    """
+
+    def __init__(self, ttl: float = PRINCIPAL_CACHE_TTL_SECONDS, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.time():
+                del self._entries[token]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, token: str, token_exp: Optional[float], principal: Dict[str, Any]):
+        expires_at = time.time() + self.ttl
+        if token_exp is not None:
+            expires_at = min(expires_at, float(token_exp))
+        with self._lock:
+            self._entries[token] = (expires_at, principal)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Optional[int] = None, email: Optional[str] = None) -> int:
+        """Drop every cached token of a user; returns entries removed"""
+        with self._lock:
+            stale = [token for token, (_, p) in self._entries.items()
+                     if (user_id is not None and p["id"] == user_id) or (email is not None and p["email"] == email)]
+            for token in stale:
+                del self._entries[token]
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache()
+
+
+def invalidate_user_principals(user_id: Optional[int] = None, email: Optional[str] = None) -> int:
+    """Call after changing or deleting a user so cached tokens re-read the row"""
+    return principal_cache.invalidate(user_id=user_id, email=email)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -89,6 +165,7 @@ def revoke_all_user_tokens(db: Session, user_id: int) -> None:
         models.RefreshToken.revoked == False
     ).update({"revoked": True})
     db.commit()
+    invalidate_user_principals(user_id=user_id)
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT token"""
@@ -115,6 +192,11 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    principal = principal_cache.get(token)
+    if principal is not None:
+        # Detached copy: callers may read or modify it without touching the cache
+        return models.User(**principal)
+
     payload = decode_access_token(token)
     if payload is None:
         raise credentials_exception
@@ -127,6 +209,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     if user is None:
         raise credentials_exception
 
+    principal_cache.put(token, payload.get("exp"), {f: getattr(user, f) for f in PRINCIPAL_FIELDS})
     return user
 
 async def get_current_active_user(current_user: models.User = Depends(get_current_user)) -> models.User:
@@ -64,18 +64,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Imports
-from database import SessionLocal
+# Batch writer sessions: WAL + BEGIN IMMEDIATE so the API keeps reading while we write
+from database import BatchSessionLocal as SessionLocal
 from models_startup import Startup
-from sqlalchemy import text, event
-from sqlalchemy.pool import Pool
+from sqlalchemy import text
 import os
 
-# Handle JSON parsing errors by configuring SQLAlchemy
-@event.listens_for(Pool, "connect")
-def receive_connect(dbapi_conn, connection_record):
-    """Configure SQLite to handle JSON parsing gracefully"""
-    pass
-
 # Get NVIDIA API config
 NVIDIA_API_KEY = os.getenv("NVIDIA_API_KEY")
 NVIDIA_BASE_URL = os.getenv("NVIDIA_NIM_BASE_URL", "https://integrate.api.nvidia.com/v1")
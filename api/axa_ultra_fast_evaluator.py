@@ -42,6 +42,7 @@ logger = logging.getLogger(__name__)
 from database import SessionLocal
 from models_startup import Startup
 from llm_config import is_nvidia_nim_configured, get_nvidia_nim_model
+from keyword_matcher import KeywordMatcher
 import os
 
 # Get NVIDIA API config
@@ -49,6 +50,19 @@ NVIDIA_API_KEY = os.getenv("NVIDIA_API_KEY")
 NVIDIA_BASE_URL = os.getenv("NVIDIA_NIM_BASE_URL", "https://integrate.api.nvidia.com/v1")
 NVIDIA_MODEL = get_nvidia_nim_model() if hasattr(__builtins__, 'get_nvidia_nim_model') else "deepseek-ai/deepseek-r1"
 
+# Pre-filter keyword sets (compiled once, matched as whole words)
+EXCLUDED_INDUSTRY_MATCHER = KeywordMatcher([
+    'gaming', 'game', 'entertainment', 'food', 'restaurant',
+    'hospitality', 'dating', 'fashion', 'beauty', 'cosmetics',
+    'luxury', 'jewelry', 'travel', 'tourism', 'event'
+])
+RELEVANT_KEYWORD_MATCHER = KeywordMatcher([
+    'ai', 'insurance', 'health', 'enterprise', 'software', 'automation',
+    'agent', 'workflow', 'saas', 'platform', 'analytics', 'data',
+    'fintech', 'insurtech', 'healthtech', 'developer', 'code',
+    'claims', 'underwriting', 'policy', 'risk', 'medical'
+])
+
 
 class CategoryType(Enum):
     """AXA Strategic Categories"""
@@ -150,25 +164,12 @@ class UltraFastEvaluator:
         industry = (startup.primary_industry or '').lower()
         
         # EXCLUDE these industries completely
-        excluded_industries = ['gaming', 'game', 'entertainment', 'food', 'restaurant', 
-                              'hospitality', 'dating', 'fashion', 'beauty', 'cosmetics',
-                              'luxury', 'jewelry', 'travel', 'tourism', 'event']
-        
-        for excl in excluded_industries:
-            if excl in industry or excl in text[:100]:
-                return False
+        if EXCLUDED_INDUSTRY_MATCHER.search(industry) or EXCLUDED_INDUSTRY_MATCHER.search(text[:100]):
+            return False
         
         # INCLUDE if matches any relevant keywords
-        relevant_keywords = [
-            'ai', 'insurance', 'health', 'enterprise', 'software', 'automation',
-            'agent', 'workflow', 'saas', 'platform', 'analytics', 'data',
-            'fintech', 'insurtech', 'healthtech', 'developer', 'code',
-            'claims', 'underwriting', 'policy', 'risk', 'medical'
-        ]
-        
-        for keyword in relevant_keywords:
-            if keyword in text[:300]:
-                return True
+        if RELEVANT_KEYWORD_MATCHER.search(text[:300]):
+            return True
         
         # If no matches and generic, skip
         if 'b2c' in str(startup.business_types).lower() and 'b2b' not in str(startup.business_types).lower():
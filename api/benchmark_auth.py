@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Auth Benchmark - login throughput and per-request auth overhead
+
+- login: authenticate_user (bcrypt verify) + access token, sequential and
+  across a thread pool the way FastAPI runs the sync /auth/login route
+- request: get_current_user with the principal cache cold (JWT decode +
+  user query on every call) and warm (dict lookup)
+
+Runs against a throwaway SQLite database; nothing touches the app DB.
+
+Usage:
+    python benchmark_auth.py
+    python benchmark_auth.py --logins 40 --threads 8 --requests 20000
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import auth
+from benchmark_pipelines import percentile
+
+EMAIL = "bench@example.com"
+PASSWORD = "BenchPassword123!"
+
+
+def bench_logins(factory, logins: int, threads: int) -> dict:
+    def login(_):
+        db = factory()
+        try:
+            started = time.perf_counter()
+            user = auth.authenticate_user(db, EMAIL, PASSWORD)
+            assert user is not None
+            auth.create_access_token({"sub": user.email})
+            return (time.perf_counter() - started) * 1000
+        finally:
+            db.close()
+
+    results = {}
+    for workers in sorted({1, threads}):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            latencies = list(pool.map(login, range(logins)))
+        elapsed = time.perf_counter() - started
+        results[workers] = {
+            "logins_per_second": logins / elapsed,
+            "p50_ms": percentile(latencies, 50),
+            "p99_ms": percentile(latencies, 99),
+        }
+    return results
+
+
+def bench_requests(factory, requests: int) -> dict:
+    token = auth.create_access_token({"sub": EMAIL})
+    db = factory()
+
+    async def run(cold: bool) -> float:
+        auth.principal_cache.clear()
+        started = time.perf_counter()
+        for _ in range(requests):
+            if cold:
+                auth.principal_cache.clear()
+            await auth.get_current_user(token=token, db=db)
+        return (time.perf_counter() - started) / requests * 1e6
+
+    try:
+        cold_us = asyncio.run(run(cold=True))
+        warm_us = asyncio.run(run(cold=False))
+    finally:
+        db.close()
+        auth.principal_cache.clear()
+    return {"cold_us": cold_us, "warm_us": warm_us}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Login throughput and auth overhead on authenticated routes')
+    parser.add_argument('--logins', type=int, default=20, help='bcrypt logins per run (default: 20)')
+    parser.add_argument('--threads', type=int, default=4, help='Thread pool size for the concurrent run')
+    parser.add_argument('--requests', type=int, default=5000, help='get_current_user calls per run')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/auth.db", connect_args={"check_same_thread": False})
+        models.Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+        db = factory()
+        db.add(models.User(email=EMAIL, hashed_password=auth.get_password_hash(PASSWORD), full_name="Bench"))
+        db.commit()
+        db.close()
+
+        print("=" * 60)
+        print("AUTH BENCHMARK")
+        print("=" * 60)
+
+        for workers, r in bench_logins(factory, args.logins, args.threads).items():
+            print(f"Login ({workers} thread{'s' if workers > 1 else ''}): {r['logins_per_second']:.1f} logins/sec, "
+                  f"p50 {r['p50_ms']:.0f}ms, p99 {r['p99_ms']:.0f}ms")
+
+        r = bench_requests(factory, args.requests)
+        print(f"get_current_user cold: {r['cold_us']:.1f}µs/request (JWT decode + user query)")
+        print(f"get_current_user warm: {r['warm_us']:.1f}µs/request (principal cache) "
+              f"- {r['cold_us'] / max(r['warm_us'], 1e-9):.0f}x faster")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
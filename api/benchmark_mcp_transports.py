@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+MCP Transport Benchmark - per-call overhead of each way into the startup tools
+
+- direct: StartupDatabaseMCPTools.registry.call (what the API and the
+  concierges use)
+- http: MCPClient against mcp_startup_server.py --transport http, one pooled
+  connection and one MCP session for every call
+- stdio: the mcp SDK's stdio client against mcp_startup_server.py (skipped
+  when the mcp package is not installed)
+
+Every path runs the same tool against the configured database, so the
+difference between rows is transport overhead.
+
+Usage:
+    python benchmark_mcp_transports.py
+    python benchmark_mcp_transports.py --calls 500 --tool search_startups_by_name --args '{"query": "ai"}'
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+
+from mcp_client import MCPClient, get_startup_tools
+from benchmark_pipelines import percentile
+
+SERVER_SCRIPT = Path(__file__).parent / "mcp_startup_server.py"
+
+
+async def timed_calls(call, calls: int) -> dict:
+    await call()  # warm-up (session handshake, imports, first query)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    return {
+        "calls_per_second": calls / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+async def bench_direct(tool: str, arguments: dict, calls: int) -> dict:
+    registry = get_startup_tools().registry
+    return await timed_calls(lambda: registry.call(tool, arguments), calls)
+
+
+async def bench_http(tool: str, arguments: dict, calls: int, port: int) -> dict:
+    client = MCPClient(config={"port": port})
+    if not client.start_server():
+        raise RuntimeError("could not start the MCP HTTP server")
+    try:
+        for _ in range(100):  # wait for uvicorn to accept connections
+            try:
+                await client.list_tools()
+                break
+            except (httpx.HTTPError, OSError):
+                await asyncio.sleep(0.1)
+        return await timed_calls(lambda: client.call_tool(tool, **arguments), calls)
+    finally:
+        await client.aclose()
+        client.stop_server()
+
+
+async def bench_stdio(tool: str, arguments: dict, calls: int) -> dict:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER_SCRIPT)], cwd=str(SERVER_SCRIPT.parent))
+    async with stdio_client(params) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            return await timed_calls(lambda: session.call_tool(tool, arguments), calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-call overhead of the MCP startup tool transports')
+    parser.add_argument('--calls', type=int, default=200, help='Tool calls per transport (default: 200)')
+    parser.add_argument('--tool', default='get_all_event_organizers', help='Tool to call')
+    parser.add_argument('--args', default='{"limit": 10}', help='Tool arguments as JSON')
+    parser.add_argument('--port', type=int, default=8799, help='Port for the benchmark HTTP server')
+    args = parser.parse_args()
+    arguments = json.loads(args.args)
+
+    print("=" * 60)
+    print("MCP TRANSPORT BENCHMARK")
+    print("=" * 60)
+    print(f"Tool: {args.tool} {arguments}, {args.calls} calls per transport\n")
+
+    runs = [
+        ("direct (registry)", lambda: bench_direct(args.tool, arguments, args.calls)),
+        ("http (MCPClient)", lambda: bench_http(args.tool, arguments, args.calls, args.port)),
+        ("stdio (mcp SDK)", lambda: bench_stdio(args.tool, arguments, args.calls)),
+    ]
+    results = {}
+    for name, run in runs:
+        try:
+            results[name] = r = asyncio.run(run())
+        except ImportError as e:
+            print(f"{name:<20} skipped ({e})")
+            continue
+        print(f"{name:<20} {r['calls_per_second']:>9.0f} calls/sec   p50 {r['p50_ms']:7.3f}ms   p99 {r['p99_ms']:7.3f}ms")
+
+    direct = results.get("direct (registry)")
+    if direct:
+        for name, r in results.items():
+            if r is not direct:
+                print(f"\n{name}: {r['p50_ms'] / max(direct['p50_ms'], 1e-9):.0f}x the direct p50", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
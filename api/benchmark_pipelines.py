@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Suite
+
+Runs the LLM and CB Insights pipelines against mock_api_server.py so
+throughput regressions are caught without network access or credentials.
+
+Pipelines:
+- cbinsights_firmographics: CBInsightsAPITester parallel batched strategy
+- cbinsights_scouting: ConcurrencyTester scouting report requests
+- axa_evaluator: UltraFastEvaluator batched LLM evaluation
+- concierge: llm_completion round trips with the concierge prompt shape
+
+Each pipeline reports items/sec, p50/p99 latency and token throughput.
+
+Usage:
+    python benchmark_pipelines.py
+    python benchmark_pipelines.py --latency-ms 300 --rate-limit 0.05 --output downloads/bench.json
+    python benchmark_pipelines.py --baseline downloads/bench.json --tolerance 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mock_api_server import MockAPIServer, MockServerConfig, MockServerStats
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and latency for one pipeline run"""
+    pipeline: str
+    items: int
+    requests: int
+    errors: int
+    rate_limited: int
+    elapsed_seconds: float
+    items_per_second: float
+    p50_ms: float
+    p99_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    tokens_per_second: float
+
+    def __str__(self) -> str:
+        return f"""
+{self.pipeline}:
+  Items: {self.items} ({self.requests} requests, {self.errors} errors, {self.rate_limited} rate-limited)
+  Time: {self.elapsed_seconds:.2f}s
+  Throughput: {self.items_per_second:.2f} items/sec
+  Latency: p50 {self.p50_ms:.1f}ms, p99 {self.p99_ms:.1f}ms
+  Tokens: {self.prompt_tokens} prompt + {self.completion_tokens} completion ({self.tokens_per_second:.0f} tokens/sec)
+        """
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def build_result(
+    pipeline: str,
+    items: int,
+    latencies_ms: List[float],
+    elapsed: float,
+    before: MockServerStats,
+    after: MockServerStats
+) -> BenchmarkResult:
+    """Combine client-side timings with the server-side counters"""
+    prompt_tokens = after.prompt_tokens - before.prompt_tokens
+    completion_tokens = after.completion_tokens - before.completion_tokens
+    return BenchmarkResult(
+        pipeline=pipeline,
+        items=items,
+        requests=after.requests - before.requests,
+        errors=after.errors - before.errors,
+        rate_limited=after.rate_limited - before.rate_limited,
+        elapsed_seconds=elapsed,
+        items_per_second=items / elapsed if elapsed > 0 else 0,
+        p50_ms=percentile(latencies_ms, 50),
+        p99_ms=percentile(latencies_ms, 99),
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        tokens_per_second=(prompt_tokens + completion_tokens) / elapsed if elapsed > 0 else 0,
+    )
+
+
+def point_clients_at(server: MockAPIServer):
+    """
+    Route every client to the mock server.
+
+    Must run before llm_config / the evaluators are imported, since they read
+    their endpoints from the environment at import time.
+    """
+    os.environ["NVIDIA_NIM_BASE_URL"] = server.llm_base_url
+    os.environ["NVIDIA_API_KEY"] = "mock-nvidia-key"
+    os.environ["CBI_BASE_URL"] = server.base_url
+    os.environ["CBI_CLIENT_ID"] = "mock-client-id"
+    os.environ["CBI_CLIENT_SECRET"] = "mock-client-secret"
+    os.environ.setdefault("LANGCHAIN_TRACING_V2", "false")
+
+
+def make_synthetic_startups(count: int) -> List[Dict[str, Any]]:
+    """Deterministic startup rows shaped like the `startups` table"""
+    industries = ["Enterprise Software", "Insurtech", "Healthtech", "Fintech", "AI"]
+    return [
+        {
+            "id": 100000 + i,
+            "company_name": f"Bench Startup {i}",
+            "primary_industry": industries[i % len(industries)],
+            "business_types": ["B2B"],
+            "company_description": (
+                f"Bench Startup {i} builds AI workflow automation for insurance claims "
+                "and underwriting teams, with an enterprise SaaS platform and analytics."
+            ),
+            "shortDescription": "AI automation platform for enterprise insurance operations",
+        }
+        for i in range(count)
+    ]
+
+
+# ============================================
+# Pipelines
+# ============================================
+
+def bench_cbinsights_firmographics(server: MockAPIServer, orgs: int = 200,
+                                   batch_size: int = 20, workers: int = 5) -> BenchmarkResult:
+    """CBInsightsAPITester.test_parallel_batched against the mock"""
+    from cb_insights_perf_test import CBInsightsAPITester
+
+    tester = CBInsightsAPITester(base_url=server.base_url)
+    if not tester.authorize():
+        raise RuntimeError("Mock CB Insights authorization failed")
+
+    org_ids = list(range(1, orgs + 1))
+    before = server.stats
+    start = time.perf_counter()
+    metrics = tester.test_parallel_batched(org_ids, batch_size=batch_size, max_workers=workers, limit=orgs)
+    elapsed = time.perf_counter() - start
+
+    return build_result("cbinsights_firmographics", metrics.success_count,
+                        tester.latencies_ms, elapsed, before, server.stats)
+
+
+def bench_cbinsights_scouting(server: MockAPIServer, reports: int = 40, concurrency: int = 5) -> BenchmarkResult:
+    """ConcurrencyTester.test_concurrency_level against the mock"""
+    from test_concurrency import ConcurrencyTester
+
+    tester = ConcurrencyTester(base_url=server.base_url)
+    companies = [(i, f"Bench Org {i}") for i in range(1, reports + 1)]
+
+    before = server.stats
+    start = time.perf_counter()
+    result = asyncio.run(tester.test_concurrency_level(concurrency, companies))
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = [s * 1000 for s in result.get("latencies", [])]
+    return build_result("cbinsights_scouting", result.get("successes", 0),
+                        latencies_ms, elapsed, before, server.stats)
+
+
+def bench_axa_evaluator(server: MockAPIServer, startups: int = 60,
+                        workers: int = 10, batch_size: int = 3) -> BenchmarkResult:
+    """UltraFastEvaluator batched evaluation (no database reads)"""
+    import aiohttp
+    from axa_ultra_fast_evaluator import UltraFastEvaluator
+    from models_startup import Startup
+
+    evaluator = UltraFastEvaluator(workers=workers, batch_size=batch_size)
+    rows = [Startup(**row) for row in make_synthetic_startups(startups)]
+    batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+    latencies_ms: List[float] = []
+
+    async def run() -> int:
+        semaphore = asyncio.Semaphore(workers)
+        connector = aiohttp.TCPConnector(limit=workers * 2)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def timed(batch):
+                async with semaphore:
+                    t0 = time.perf_counter()
+                    evaluations = await evaluator._evaluate_startup_batch_async(batch, session)
+                    latencies_ms.append((time.perf_counter() - t0) * 1000)
+                    return len(evaluations)
+            counts = await asyncio.gather(*(timed(b) for b in batches))
+        return sum(counts)
+
+    before = server.stats
+    start = time.perf_counter()
+    try:
+        evaluated = asyncio.run(run())
+    finally:
+        evaluator.close()
+    elapsed = time.perf_counter() - start
+
+    return build_result("axa_evaluator", evaluated, latencies_ms, elapsed, before, server.stats)
+
+
+def bench_concierge(server: MockAPIServer, questions: int = 40, concurrency: int = 8) -> BenchmarkResult:
+    """llm_completion round trips shaped like AIConcierge.answer_question"""
+    from llm_config import llm_completion
+
+    context = "\n".join(
+        f"- {s['company_name']} ({s['primary_industry']}): {s['company_description']}"
+        for s in make_synthetic_startups(5)
+    )
+    latencies_ms: List[float] = []
+
+    async def ask(i: int, semaphore: asyncio.Semaphore) -> bool:
+        messages = [
+            {"role": "system", "content": "You are a helpful AI concierge for Slush 2025, a major startup conference."},
+            {"role": "user", "content": f"Question: Which insurtech startups should I meet? (#{i})\n\nAvailable Context:\n{context}"},
+        ]
+        async with semaphore:
+            t0 = time.perf_counter()
+            try:
+                response = await llm_completion(
+                    messages=messages,
+                    model=None,
+                    temperature=0.7,
+                    max_tokens=2000,
+                    use_nvidia_nim=True,
+                    metadata={"feature": "benchmark"},
+                    num_retries=0,
+                )
+                return bool(response.choices[0].message.content)
+            except Exception as e:
+                logger.warning(f"Concierge call failed: {e}")
+                return False
+            finally:
+                latencies_ms.append((time.perf_counter() - t0) * 1000)
+
+    async def run() -> int:
+        semaphore = asyncio.Semaphore(concurrency)
+        results = await asyncio.gather(*(ask(i, semaphore) for i in range(questions)))
+        return sum(results)
+
+    before = server.stats
+    start = time.perf_counter()
+    answered = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    return build_result("concierge", answered, latencies_ms, elapsed, before, server.stats)
+
+
+PIPELINES: Dict[str, Callable[[MockAPIServer], BenchmarkResult]] = {
+    "cbinsights_firmographics": bench_cbinsights_firmographics,
+    "cbinsights_scouting": bench_cbinsights_scouting,
+    "axa_evaluator": bench_axa_evaluator,
+    "concierge": bench_concierge,
+}
+
+
+def run_benchmarks(config: MockServerConfig, pipelines: Optional[List[str]] = None) -> List[BenchmarkResult]:
+    """Start the mock server, run the selected pipelines, return their results"""
+    results = []
+    with MockAPIServer(config) as server:
+        point_clients_at(server)
+        for name in pipelines or list(PIPELINES):
+            print(f"\n🧪 Benchmarking {name}...")
+            try:
+                result = PIPELINES[name](server)
+            except ImportError as e:
+                print(f"  ⚠️  Skipped {name}: missing dependency ({e})")
+                continue
+            print(result)
+            results.append(result)
+    return results
+
+
+def check_regressions(results: List[BenchmarkResult], baseline: Dict[str, Any],
+                      tolerance: float = 0.2) -> List[str]:
+    """Compare items/sec and p99 against a saved baseline; return failures"""
+    previous = {s["pipeline"]: s for s in baseline.get("pipelines", [])}
+    failures = []
+    for result in results:
+        base = previous.get(result.pipeline)
+        if not base:
+            continue
+        if result.items_per_second < base["items_per_second"] * (1 - tolerance):
+            failures.append(
+                f"{result.pipeline}: {result.items_per_second:.2f} items/sec "
+                f"< baseline {base['items_per_second']:.2f}"
+            )
+        if base["p99_ms"] and result.p99_ms > base["p99_ms"] * (1 + tolerance):
+            failures.append(
+                f"{result.pipeline}: p99 {result.p99_ms:.1f}ms > baseline {base['p99_ms']:.1f}ms"
+            )
+    return failures
+
+
+def print_summary(results: List[BenchmarkResult]):
+    print("\n┌──────────────────────────────┬──────────┬──────────┬──────────┬────────────┐")
+    print("│ Pipeline                     │ Items/s  │ p50 ms   │ p99 ms   │ Tokens/s   │")
+    print("├──────────────────────────────┼──────────┼──────────┼──────────┼────────────┤")
+    for r in results:
+        print(f"│ {r.pipeline[:28].ljust(28)} │ {r.items_per_second:8.2f} │ {r.p50_ms:8.1f} │ "
+              f"{r.p99_ms:8.1f} │ {r.tokens_per_second:10.0f} │")
+    print("└──────────────────────────────┴──────────┴──────────┴──────────┴────────────┘")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline pipeline benchmarks against a local mock API')
+    parser.add_argument('--pipelines', nargs='*', choices=list(PIPELINES), help='Pipelines to run (default: all)')
+    parser.add_argument('--latency-ms', type=float, default=50.0)
+    parser.add_argument('--jitter-ms', type=float, default=10.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--completion-tokens', type=int, default=200)
+    parser.add_argument('--org-payload-bytes', type=int, default=2048)
+    parser.add_argument('--output', type=str, help='Save results as JSON')
+    parser.add_argument('--baseline', type=str, help='Fail if results regress against this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed regression ratio (default: 0.2)')
+    args = parser.parse_args()
+
+    config = MockServerConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit,
+        completion_tokens=args.completion_tokens,
+        org_payload_bytes=args.org_payload_bytes,
+    )
+
+    print("=" * 80)
+    print("OFFLINE PIPELINE BENCHMARKS")
+    print("=" * 80)
+    print(f"Mock latency: {config.latency_ms}ms ± {config.jitter_ms}ms, 429 rate: {config.rate_limit_ratio:.0%}")
+
+    results = run_benchmarks(config, args.pipelines)
+    print_summary(results)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "mock_config": asdict(config),
+        "pipelines": [asdict(r) for r in results],
+    }
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results saved to {output_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        failures = check_regressions(results, baseline, args.tolerance)
+        if failures:
+            print("\n❌ Performance regressions detected:")
+            for failure in failures:
+                print(f"   - {failure}")
+            sys.exit(1)
+        print("\n✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Bulk Idempotent Importer - startups, attendees and Slush events
+
+One framework for every file -> table import:
+- Stream-parse the source (ijson for JSON arrays, csv.DictReader for CSV)
+  so the whole file never sits in memory
+- Map each record to a plain row dict (no ORM objects)
+- Write with INSERT ... ON CONFLICT (natural key) DO UPDATE through
+  executemany, in large batches inside a single transaction
+- Report inserted / updated / skipped counts and throughput
+- Run the spec's after_import step in the same transaction (startups
+  rebuild their topic / use case / tech junction tables)
+- Touch data_version.updatedAt, so HTTP ETags change after rows are
+  rewritten in place
+
+Re-running an import updates rows in place instead of duplicating them, and
+columns the import doesn't provide (CB Insights enrichment, user insights on
+events) are left untouched.
+
+Usage:
+    python bulk_importer.py startups [path/to/slush_full.json]
+    python bulk_importer.py attendees [path/to/slush_people.csv]
+    python bulk_importer.py events [path/to/slush_events_full.json]
+"""
+
+import csv
+import sys
+import json
+import time
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Table, func, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_STARTUPS_FILE = PROJECT_ROOT / "app" / "startup-swipe-schedu" / "startups" / "slush_full.json"
+DEFAULT_ATTENDEES_FILE = PROJECT_ROOT / "downloads" / "slush_people.csv"
+DEFAULT_EVENTS_FILE = PROJECT_ROOT / "scrapper" / "slush_events_data" / "slush_events_full.json"
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+# ============================================
+# Streaming readers
+# ============================================
+
+def iter_json_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the objects of a top-level JSON array one at a time"""
+    with open(path, "rb") as f:
+        if HAS_IJSON:
+            # use_float keeps numbers as float instead of Decimal (not JSON/SQLite friendly)
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            logger.warning("⚠️  ijson not installed - loading the whole file (pip install ijson)")
+            yield from json.load(f)
+
+
+def iter_csv_records(path: Path) -> Iterator[Dict[str, str]]:
+    """Yield CSV rows as dicts (utf-8-sig handles the BOM Excel adds)"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+# ============================================
+# Upsert engine
+# ============================================
+
+@dataclass
+class UpsertSpec:
+    """Target table, its natural key and columns only written on insert"""
+    table: Table
+    key_columns: Sequence[str]
+    insert_only: Sequence[str] = ("created_at",)
+    after_import: Optional[Callable[[Connection], Any]] = None  # Runs in the import transaction
+
+    @property
+    def index_name(self) -> str:
+        return f"ux_{self.table.name}_{'_'.join(self.key_columns)}"
+
+
+@dataclass
+class ImportStats:
+    name: str
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: {self.rows} rows ({self.inserted} inserted, {self.updated} updated, "
+            f"{self.skipped} skipped) in {self.elapsed_seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s, {self.batches} batches)"
+        )
+
+
+def _insert_for(conn: Connection, table: Table):
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise NotImplementedError(f"Upsert not supported for dialect {dialect}")
+    return insert(table)
+
+
+def ensure_conflict_index(conn: Connection, spec: UpsertSpec):
+    """
+    ON CONFLICT needs a unique index on the natural key. Tables created
+    before this importer may hold duplicates, in which case the index can't
+    be built and we say so instead of silently importing more duplicates.
+    """
+    if list(spec.key_columns) == [c.name for c in spec.table.primary_key.columns]:
+        return
+    columns = ", ".join(spec.key_columns)
+    try:
+        conn.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {spec.index_name} ON {spec.table.name} ({columns})"
+        ))
+    except (IntegrityError, OperationalError) as e:
+        raise RuntimeError(
+            f"Cannot create unique index on {spec.table.name}({columns}) - the table has duplicate "
+            f"rows for that key. Remove them before importing. ({e.__class__.__name__})"
+        ) from e
+
+
+def touch_data_version(conn: Connection, now: Optional[datetime] = None):
+    """
+    Set data_version.updatedAt (creating the row if needed). Upserts rewrite
+    rows in place, which the HTTP cache's row count / max id fingerprint
+    can't see; its ETags include this timestamp instead.
+    """
+    import models
+    table = models.DataVersion.__table__
+    now = now or datetime.utcnow()
+    table.create(bind=conn, checkfirst=True)
+    if not conn.execute(update(table).values(updatedAt=now)).rowcount:
+        conn.execute(table.insert().values(id=1, version=now.strftime("%Y-%m-%d"), updatedAt=now))
+
+
+def upsert_rows(
+    conn: Connection,
+    spec: UpsertSpec,
+    rows: Iterable[Optional[Dict[str, Any]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stats: Optional[ImportStats] = None,
+    progress: Optional[Callable[[ImportStats], None]] = None,
+) -> ImportStats:
+    """
+    Upsert rows on an open connection (the caller owns the transaction).
+    None rows count as skipped. Rows repeating a key within one batch are
+    collapsed (last one wins) - PostgreSQL rejects touching a row twice in
+    one statement.
+    """
+    stats = stats or ImportStats(spec.table.name)
+    started = time.time()
+    ensure_conflict_index(conn, spec)
+    count_before = conn.execute(select(func.count()).select_from(spec.table)).scalar()
+
+    insert = _insert_for(conn, spec.table)
+    skip_update = set(spec.key_columns) | set(spec.insert_only)
+    update_columns: Optional[List[str]] = None
+    statement = None
+
+    batch: Dict[tuple, Dict[str, Any]] = {}
+
+    def flush():
+        nonlocal statement, update_columns
+        if not batch:
+            return
+        values = list(batch.values())
+        if statement is None:
+            update_columns = [c for c in values[0] if c not in skip_update]
+            statement = insert.on_conflict_do_update(
+                index_elements=list(spec.key_columns),
+                set_={c: insert.excluded[c] for c in update_columns},
+            )
+        conn.execute(statement, values)
+        stats.batches += 1
+        batch.clear()
+        if progress:
+            progress(stats)
+
+    for row in rows:
+        if row is None:
+            stats.skipped += 1
+            continue
+        stats.rows += 1
+        batch[tuple(row[c] for c in spec.key_columns)] = row
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+
+    count_after = conn.execute(select(func.count()).select_from(spec.table)).scalar()
+    if stats.rows:
+        touch_data_version(conn)
+    stats.inserted += count_after - count_before
+    stats.updated = stats.rows - stats.inserted
+    stats.elapsed_seconds += time.time() - started
+    return stats
+
+
+def run_import(
+    engine: Engine,
+    spec: UpsertSpec,
+    rows: Iterable[Optional[Dict[str, Any]]],
+    name: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ImportStats:
+    """Create the table if needed and upsert everything in one transaction"""
+    spec.table.create(bind=engine, checkfirst=True)
+
+    def report(stats: ImportStats):
+        logger.info(f"  Progress: {stats.rows} rows, {stats.skipped} skipped")
+
+    with engine.begin() as conn:
+        stats = upsert_rows(conn, spec, rows, batch_size=batch_size,
+                            stats=ImportStats(name), progress=report)
+        if spec.after_import:
+            spec.after_import(conn)
+    logger.info(f"✅ {stats.summary()}")
+    return stats
+
+
+# ============================================
+# Row mappers
+# ============================================
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _json_list(value: Any) -> Optional[list]:
+    """Accept a list or a JSON-encoded list string (CSV exports use the latter)"""
+    if isinstance(value, list):
+        return value or None
+    if not value or not isinstance(value, str) or value.strip() in ("[]", ""):
+        return None
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, list) and parsed else None
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def startup_row(record: Dict[str, Any], now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """slush_full.json record -> startups row (JSON columns stay native lists)"""
+    company_name = _clean(record.get("company_name"))
+    if not company_name:
+        return None
+    now = now or datetime.utcnow()
+    return {
+        "company_name": company_name,
+        "company_type": record.get("company_type"),
+        "company_country": record.get("company_country"),
+        "company_city": record.get("company_city"),
+        "website": record.get("website"),
+        "company_linked_in": record.get("company_linked_in"),
+        "company_description": record.get("company_description"),
+        "founding_year": _int(record.get("founding_year")),
+        "primary_industry": record.get("primary_industry"),
+        "secondary_industry": record.get("secondary_industry") or None,
+        "focus_industries": record.get("focus_industries"),
+        "business_types": record.get("business_types") or None,
+        "curated_collections_tags": record.get("curated_collections_tags"),
+        "topics": record.get("topics") or None,
+        "tech": record.get("tech") or None,
+        "employees": record.get("employees"),
+        "shortDescription": record.get("shortDescription"),
+        "profile_link": record.get("profile_link"),
+        # Enrichment fills this in later; only set on first insert
+        "funding_source": "CB Insights API v2",
+        "dateCreated": now,
+        "lastModifiedDate": now,
+    }
+
+
+def generate_attendee_id(name: str, email_or_index: Any) -> str:
+    """Stable attendee ID from name and email/row index"""
+    return hashlib.md5(f"{name}-{email_or_index}".encode()).hexdigest()
+
+
+def attendee_row(record: Dict[str, Any], index: int, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """slush_people.csv row (1-based index) -> attendees row"""
+    name = _clean(record.get("name"))
+    if not name:
+        return None
+    now = now or datetime.utcnow()
+    return {
+        "id": generate_attendee_id(name, index),
+        "name": name,
+        "title": _clean(record.get("title")),
+        "country": _clean(record.get("user_country")),
+        "city": _clean(record.get("user_city")),
+        "linkedin": _clean(record.get("user_linked_in")),
+        "twitter": _clean(record.get("twitter")),
+        "bio": _clean(record.get("user_bio")),
+        "industry": _json_list(record.get("user_industry")),
+        "occupation": _json_list(record.get("user_occupation")),
+        "company_name": _clean(record.get("company_name")),
+        "company_type": _clean(record.get("company_type")),
+        "company_country": _clean(record.get("company_country")),
+        "company_city": _clean(record.get("company_city")),
+        "website": _clean(record.get("website")),
+        "company_linkedin": _clean(record.get("company_linked_in")),
+        "company_description": _clean(record.get("company_description")),
+        "profile_link": _clean(record.get("profile_link")),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _parse_scraped_at(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.utcnow()
+
+
+def event_row(record: Dict[str, Any], now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """Scraped event (or crud event dict) -> slush_events row"""
+    if not record.get("title") or not record.get("organizer"):
+        return None
+    from event_times import parse_event_window
+    now = now or datetime.utcnow()
+    starts_at, ends_at = parse_event_window(record.get("datetime")) or (None, None)
+    return {
+        "title": record["title"],
+        "organizer": record["organizer"],
+        "datetime": record.get("datetime") or "",
+        "starts_at": starts_at,
+        "ends_at": ends_at,
+        "location": record.get("location"),
+        "categories": record.get("categories") or [],
+        "status": record.get("status") or [],
+        "scraped_at": _parse_scraped_at(record.get("scraped_at")),
+        "created_at": record.get("created_at") or now,
+        "updated_at": record.get("updated_at") or now,
+    }
+
+
+# ============================================
+# Specs and entry points
+# ============================================
+
+def startup_spec() -> UpsertSpec:
+    from models_startup import Startup
+    from startup_facets import rebuild_facets
+    return UpsertSpec(Startup.__table__, ("company_name",), insert_only=("dateCreated", "funding_source"),
+                      after_import=rebuild_facets)
+
+
+def attendee_spec() -> UpsertSpec:
+    import models
+    return UpsertSpec(models.Attendee.__table__, ("id",))
+
+
+def event_spec() -> UpsertSpec:
+    import models
+    return UpsertSpec(models.SlushEvent.__table__, ("title", "organizer", "datetime"))
+
+
+def import_startups_file(path: Path = DEFAULT_STARTUPS_FILE, engine: Optional[Engine] = None,
+                         batch_size: int = DEFAULT_BATCH_SIZE) -> ImportStats:
+    if engine is None:
+        from database import batch_engine as engine
+    now = datetime.utcnow()
+    rows = (startup_row(r, now) for r in iter_json_records(Path(path)))
+    return run_import(engine, startup_spec(), rows, "startups", batch_size)
+
+
+def import_attendees_file(path: Path = DEFAULT_ATTENDEES_FILE, engine: Optional[Engine] = None,
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> ImportStats:
+    if engine is None:
+        from database import batch_engine as engine
+    now = datetime.utcnow()
+    rows = (attendee_row(r, i, now) for i, r in enumerate(iter_csv_records(Path(path)), 1))
+    return run_import(engine, attendee_spec(), rows, "attendees", batch_size)
+
+
+def import_events_file(path: Path = DEFAULT_EVENTS_FILE, engine: Optional[Engine] = None,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> ImportStats:
+    if engine is None:
+        from database import batch_engine as engine
+    now = datetime.utcnow()
+    rows = (event_row(r, now) for r in iter_json_records(Path(path)))
+    return run_import(engine, event_spec(), rows, "slush_events", batch_size)
+
+
+IMPORTERS = {
+    "startups": (import_startups_file, DEFAULT_STARTUPS_FILE),
+    "attendees": (import_attendees_file, DEFAULT_ATTENDEES_FILE),
+    "events": (import_events_file, DEFAULT_EVENTS_FILE),
+}
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Bulk idempotent import of startups, attendees and events")
+    parser.add_argument("kind", choices=sorted(IMPORTERS), help="What to import")
+    parser.add_argument("path", nargs="?", help="Source file (defaults to the usual location)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per executemany batch")
+    args = parser.parse_args()
+
+    importer, default_path = IMPORTERS[args.kind]
+    path = Path(args.path) if args.path else default_path
+    if not path.exists():
+        print(f"❌ File not found: {path}")
+        sys.exit(1)
+
+    print(f"📖 Importing {args.kind} from {path}...")
+    stats = importer(path, batch_size=args.batch_size)
+    print(f"\n✅ {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -53,7 +53,8 @@ class PerformanceMetrics:
 class CBInsightsAPITester:
     """Test CB Insights API performance with different strategies"""
     
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 base_url: Optional[str] = None):
         self.client_id = client_id or os.getenv('CBI_CLIENT_ID')
         self.client_secret = client_secret or os.getenv('CBI_CLIENT_SECRET')
         
@@ -63,9 +64,11 @@ class CBInsightsAPITester:
                 "Set CBI_CLIENT_ID and CBI_CLIENT_SECRET environment variables"
             )
         
-        self.base_url = "https://api.cbinsights.com"
+        # CBI_BASE_URL lets the tests run against mock_api_server.py
+        self.base_url = base_url or os.getenv('CBI_BASE_URL', "https://api.cbinsights.com")
         self.token = None
         self.metrics_log = []
+        self.latencies_ms: List[float] = []  # Per-request latency, used by benchmark_pipelines.py
     
     def authorize(self) -> bool:
         """Get authorization token"""
@@ -80,7 +83,7 @@ class CBInsightsAPITester:
             response.raise_for_status()
             
             data = response.json()
-            self.token = data.get('accessToken')
+            self.token = data.get('accessToken') or data.get('token')
             
             if self.token:
                 logger.info("✅ Successfully authorized with CB Insights API")
@@ -102,6 +105,14 @@ class CBInsightsAPITester:
             "Content-Type": "application/json"
         }
     
+    def _post(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST with auth headers, recording the request latency"""
+        start = time.perf_counter()
+        try:
+            return requests.post(url, json=payload, headers=self._get_headers(), timeout=30)
+        finally:
+            self.latencies_ms.append((time.perf_counter() - start) * 1000)
+    
     def load_org_ids(self, csv_path: str) -> List[int]:
         """Load org IDs from CSV file"""
         org_ids = []
@@ -144,9 +155,7 @@ class CBInsightsAPITester:
             try:
                 url = f"{self.base_url}/v2/firmographics"
                 payload = {"orgIds": [org_id]}
-                headers = self._get_headers()
-                
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self._post(url, payload)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -204,9 +213,7 @@ class CBInsightsAPITester:
             try:
                 url = f"{self.base_url}/v2/firmographics"
                 payload = {"orgIds": batch}
-                headers = self._get_headers()
-                
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self._post(url, payload)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -265,9 +272,7 @@ class CBInsightsAPITester:
             try:
                 url = f"{self.base_url}/v2/firmographics"
                 payload = {"orgIds": batch}
-                headers = self._get_headers()
-                
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self._post(url, payload)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -335,9 +340,7 @@ class CBInsightsAPITester:
             try:
                 url = f"{self.base_url}/v2/firmographics"
                 payload = {"orgIds": batch}
-                headers = self._get_headers()
-                
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self._post(url, payload)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -359,9 +362,7 @@ class CBInsightsAPITester:
             try:
                 url = f"{self.base_url}/v2/financialtransactions/fundings"
                 payload = {"orgIds": batch}
-                headers = self._get_headers()
-                
-                response = requests.post(url, json=payload, headers=headers, timeout=30)
+                response = self._post(url, payload)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -0,0 +1,272 @@
+"""
+Conversation Memory for multi-turn feedback / debrief chats
+
+Keeps per-turn prompt size flat over a long session:
+- Stable prefix first: static system prompt + per-session context (startup,
+  meeting-prep topics, question list). It is byte-identical on every turn,
+  so providers with prefix/KV caching reuse it
+- Rolling summary: once the turns outside the recent window pass
+  compact_after_tokens, they are folded into a short summary (previous
+  summary + evicted turns -> new summary), so each compaction costs the same
+  no matter how long the session is. Compaction runs in the background after
+  a reply, never in front of one
+- Per-session token accounting (provider usage when reported, otherwise a
+  chars/4 estimate), including how much of each prompt was reused prefix
+
+Sessions live in an in-process LRU (MemoryStore); after a restart the memory
+is rebuilt from the stored conversation_history on the next turn.
+"""
+
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_RECENT_MESSAGES = 6
+DEFAULT_COMPACT_AFTER_TOKENS = 600
+DEFAULT_SUMMARY_MAX_TOKENS = 250
+MAX_SESSIONS = 500
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a post-meeting debrief conversation.
+Merge the existing summary with the new turns. Keep every concrete fact the analyst shared
+(capabilities, metrics, pricing, people, concerns, next steps) and drop pleasantries.
+Write compact bullet points, no more than {max_words} words in total. Return only the summary."""
+
+Summarizer = Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+
+
+def estimate_tokens(value: str) -> int:
+    return (len(value or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def messages_tokens(messages: List[Dict[str, Any]]) -> int:
+    # ~4 tokens of per-message framing in chat templates
+    return sum(estimate_tokens(str(m.get("content", ""))) + 4 for m in messages)
+
+
+def format_turns(messages: List[Dict[str, Any]]) -> str:
+    return "\n".join(f"{str(m.get('role', 'user')).title()}: {m.get('content', '')}" for m in messages)
+
+
+@dataclass
+class SessionTokenUsage:
+    """Running token totals for one chat session"""
+    session_id: str
+    turns: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0           # Reported by the provider, when it does
+    reused_prefix_tokens: int = 0    # Prefix identical to the previous turn
+    summary_tokens: int = 0          # Spent on compaction calls
+    compactions: int = 0
+    summarized_messages: int = 0
+    last_prompt_tokens: int = 0
+    max_prompt_tokens: int = 0
+    estimated: bool = False
+
+    def record_turn(self, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0,
+                    reused_prefix_tokens: int = 0, estimated: bool = False):
+        self.turns += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cached_tokens += cached_tokens
+        self.reused_prefix_tokens += reused_prefix_tokens
+        self.last_prompt_tokens = prompt_tokens
+        self.max_prompt_tokens = max(self.max_prompt_tokens, prompt_tokens)
+        self.estimated = self.estimated or estimated
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["avg_prompt_tokens"] = round(self.prompt_tokens / self.turns) if self.turns else 0
+        return data
+
+
+def usage_from_response(response: Any, messages: List[Dict[str, Any]], content: str) -> Dict[str, Any]:
+    """Token counts from an OpenAI/LiteLLM response, estimated if it has none"""
+    usage = getattr(response, "usage", None)
+    prompt = getattr(usage, "prompt_tokens", None) if usage is not None else None
+    if not prompt:
+        return {"prompt_tokens": messages_tokens(messages), "completion_tokens": estimate_tokens(content),
+                "cached_tokens": 0, "estimated": True}
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": int(prompt),
+        "completion_tokens": int(getattr(usage, "completion_tokens", 0) or 0),
+        "cached_tokens": int(getattr(details, "cached_tokens", 0) or 0) if details is not None else 0,
+        "estimated": False,
+    }
+
+
+def response_text(response: Any) -> str:
+    if hasattr(response, "choices") and len(response.choices) > 0:
+        return response.choices[0].message.content or ""
+    return str(response)
+
+
+def extractive_summary(previous: str, messages: List[Dict[str, str]], max_tokens: int) -> str:
+    """No-LLM fallback: keep the analyst's own words, newest last, within budget"""
+    lines = [previous] if previous else []
+    lines += [f"- {m.get('content', '')[:240]}" for m in messages if m.get("role") == "user" and m.get("content")]
+    summary = "\n".join(lines)
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    return summary if len(summary) <= max_chars else "…" + summary[-max_chars:]
+
+
+def llm_summarizer(llm_call: Callable[..., Awaitable[str]], max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS,
+                   **llm_kwargs) -> Summarizer:
+    """
+    Build a summarizer around a simple_llm_call_async-style function.
+
+    Falls back to extractive_summary() if the call fails.
+    """
+    system_message = SUMMARY_SYSTEM_PROMPT.format(max_words=int(max_tokens * 0.75))
+
+    async def summarize(previous: str, messages: List[Dict[str, str]]) -> str:
+        prompt = f"EXISTING SUMMARY:\n{previous or '(none)'}\n\nNEW TURNS:\n{format_turns(messages)}"
+        try:
+            summary = await llm_call(prompt=prompt, system_message=system_message, temperature=0.2, **llm_kwargs)
+            return (summary or "").strip() or extractive_summary(previous, messages, max_tokens)
+        except Exception as e:
+            logger.warning(f"Summary call failed, using extractive summary: {e}")
+            return extractive_summary(previous, messages, max_tokens)
+
+    return summarize
+
+
+class ConversationMemory:
+    """Rolling summary + recent window + token accounting for one session"""
+
+    def __init__(
+        self,
+        session_id: str,
+        recent_messages: int = DEFAULT_RECENT_MESSAGES,
+        compact_after_tokens: int = DEFAULT_COMPACT_AFTER_TOKENS,
+    ):
+        self.session_id = session_id
+        self.recent_messages = recent_messages
+        self.compact_after_tokens = compact_after_tokens
+        self.summary = ""
+        self.summarized_count = 0  # Leading history messages folded into the summary
+        self.usage = SessionTokenUsage(session_id)
+        self.last_used = time.time()
+        self._prefix_hash: Optional[str] = None
+        self._compaction: Optional[asyncio.Task] = None
+
+    def _sync(self, history: List[Dict[str, Any]]):
+        if len(history) < self.summarized_count:
+            # History was reset or edited client-side; start over
+            self.summary, self.summarized_count = "", 0
+
+    def pending(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Messages not yet summarized and outside the recent window"""
+        self._sync(history)
+        return list(history[self.summarized_count:max(self.summarized_count, len(history) - self.recent_messages)])
+
+    def needs_compaction(self, history: List[Dict[str, Any]]) -> bool:
+        return messages_tokens(self.pending(history)) >= self.compact_after_tokens
+
+    async def compact(self, history: List[Dict[str, Any]], summarizer: Summarizer) -> bool:
+        """Fold pending turns into the summary; returns True if it did"""
+        if not self.needs_compaction(history):
+            return False
+        evicted = self.pending(history)
+        cutoff = self.summarized_count + len(evicted)
+        summary = await summarizer(self.summary, evicted)
+        self.summary = summary.strip()
+        self.summarized_count = cutoff
+        self.usage.compactions += 1
+        self.usage.summarized_messages += len(evicted)
+        self.usage.summary_tokens += messages_tokens(evicted) + estimate_tokens(self.summary)
+        logger.info(f"🗜️  Session {self.session_id}: folded {len(evicted)} messages into a "
+                    f"{estimate_tokens(self.summary)}-token summary")
+        return True
+
+    def schedule_compaction(self, history: List[Dict[str, Any]], summarizer: Summarizer) -> Optional[asyncio.Task]:
+        """Compact in the background so the next turn, not this one, pays for it"""
+        if self._compaction is not None and not self._compaction.done():
+            return self._compaction
+        if not self.needs_compaction(history):
+            return None
+        snapshot = list(history)
+
+        async def run():
+            try:
+                await self.compact(snapshot, summarizer)
+            except Exception as e:
+                logger.warning(f"Compaction failed for session {self.session_id}: {e}")
+
+        self._compaction = asyncio.get_running_loop().create_task(run())
+        return self._compaction
+
+    def build_messages(self, system_prompt: str, session_context: str, history: List[Dict[str, Any]],
+                       instruction: str) -> List[Dict[str, str]]:
+        """
+        Prompt layout, most stable first:
+        system prompt + session context | summary | unsummarized turns | this turn's instruction
+        """
+        self._sync(history)
+        messages = [{"role": "system", "content": f"{system_prompt}\n\n{session_context}".strip()}]
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of the earlier conversation:\n{self.summary}"})
+        for message in history[self.summarized_count:]:
+            role = message.get("role") if message.get("role") in ("user", "assistant") else "user"
+            if message.get("content"):
+                messages.append({"role": role, "content": str(message["content"])})
+        messages.append({"role": "user", "content": instruction})
+        return messages
+
+    def record(self, messages: List[Dict[str, Any]], usage: Dict[str, Any]):
+        prefix = messages[0]["content"]
+        prefix_hash = hashlib.blake2b(prefix.encode("utf-8"), digest_size=8).hexdigest()
+        reused = estimate_tokens(prefix) if prefix_hash == self._prefix_hash else 0
+        self._prefix_hash = prefix_hash
+        self.usage.record_turn(usage["prompt_tokens"], usage["completion_tokens"], usage.get("cached_tokens", 0),
+                               reused, usage.get("estimated", False))
+        self.last_used = time.time()
+
+    async def complete(self, llm: Callable[..., Awaitable[Any]], messages: List[Dict[str, Any]], **llm_kwargs) -> str:
+        """Run an llm_completion-style call and account for its tokens"""
+        response = await llm(messages=messages, **llm_kwargs)
+        content = response_text(response)
+        self.record(messages, usage_from_response(response, messages, content))
+        return content
+
+
+class MemoryStore:
+    """Process-wide LRU of ConversationMemory objects keyed by session id"""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, **memory_kwargs):
+        self.max_sessions = max_sessions
+        self.memory_kwargs = memory_kwargs
+        self._memories: "OrderedDict[str, ConversationMemory]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Any) -> ConversationMemory:
+        key = str(session_id)
+        with self._lock:
+            memory = self._memories.get(key)
+            if memory is None:
+                memory = self._memories[key] = ConversationMemory(key, **self.memory_kwargs)
+                while len(self._memories) > self.max_sessions:
+                    self._memories.popitem(last=False)
+            else:
+                self._memories.move_to_end(key)
+            return memory
+
+    def peek(self, session_id: Any) -> Optional[ConversationMemory]:
+        with self._lock:
+            return self._memories.get(str(session_id))
+
+    def drop(self, session_id: Any):
+        with self._lock:
+            self._memories.pop(str(session_id), None)
+
+    def __len__(self) -> int:
+        return len(self._memories)
@@ -5,9 +5,12 @@ Uses meeting prep outlines to focus conversation on key areas.
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from llm_config import simple_llm_call_async
+from llm_config import simple_llm_call_async, llm_completion
+from conversation_memory import ConversationMemory, MemoryStore, format_turns, llm_summarizer
 import json
 
+DEBRIEF_MODEL = "qwen/qwen3-next-80b-a3b-instruct"
+
 
 class ConversationalInsightsAgent:
     """
@@ -66,6 +69,10 @@ Return as JSON array with 3 questions: ["question 1", "question 2", "question 3"
             "10": "Startups"
         }
 
+        # Rolling summaries + token usage per debrief session
+        self.memories = MemoryStore()
+        self.summarize = llm_summarizer(simple_llm_call_async, model=DEBRIEF_MODEL)
+
     async def start_debrief(
         self,
         startup_name: str,
@@ -82,29 +89,30 @@ Return as JSON array with 3 questions: ["question 1", "question 2", "question 3"
         conversation_history: List[Dict[str, str]],
         startup_name: str,
         meeting_prep_outline: str,
-        last_user_message: str
+        last_user_message: str,
+        session_id: Optional[str] = None
     ) -> str:
         """
         Generate natural follow-up questions based on the conversation and meeting prep.
+
+        Prompt order is system prompt + startup + prep topics (identical every
+        turn, so the provider can cache it), then the rolling summary, the
+        unsummarized turns and finally this turn's instruction.
         """
-        # Build conversation context
-        recent_context = "\n".join([
-            f"{msg['role'].title()}: {msg['content']}"
-            for msg in conversation_history[-4:] if len(conversation_history) > 0
-        ])
+        memory = self.memories.get(f"debrief:{session_id}") if session_id else ConversationMemory("debrief:transient")
+
+        history = list(conversation_history or [])
+        if last_user_message and not (history and history[-1].get("content") == last_user_message):
+            history.append({"role": "user", "content": last_user_message})
 
         # Extract key questions from meeting prep to guide conversation
         key_topics = self._extract_key_topics(meeting_prep_outline)
-
-        prompt = f"""You're having a casual debrief conversation with a colleague about their {startup_name} meeting.
-
-RECENT CONVERSATION:
-{recent_context}
+        session_context = f"""You're having a casual debrief conversation with a colleague about their {startup_name} meeting.
 
 KEY TOPICS TO EXPLORE (from meeting prep):
-{key_topics}
+{key_topics}"""
 
-Their last comment was: "{last_user_message}"
+        instruction = f"""Their last comment was: "{last_user_message}"
 
 Now, respond as a friendly colleague:
 1. Acknowledge what they said
@@ -116,19 +124,36 @@ Now, respond as a friendly colleague:
 
 Your response should feel like a coffee chat, not an interview. Be brief and natural."""
 
+        messages = memory.build_messages(
+            self.system_prompts["follow_up_questions"], session_context, history[:-1], instruction
+        )
+
         try:
-            response = await simple_llm_call_async(
-                prompt=prompt,
-                model="qwen/qwen3-next-80b-a3b-instruct",
-                system_message=self.system_prompts["follow_up_questions"],
-                temperature=0.8
-            )
+            response = await memory.complete(llm_completion, messages, model=DEBRIEF_MODEL, temperature=0.8)
+            history.append({"role": "assistant", "content": response})
+            memory.schedule_compaction(history, self.summarize)
             return response.strip()
 
         except Exception as e:
             print(f"Error generating follow-up: {e}")
             return "That's interesting! Tell me more about that."
 
+    def session_usage(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Token accounting for a debrief session, if it has had a turn"""
+        memory = self.memories.peek(f"debrief:{session_id}")
+        return memory.usage.to_dict() if memory else None
+
+    def end_session(self, session_id: str):
+        self.memories.drop(f"debrief:{session_id}")
+
+    def _conversation_text(self, conversation_history: List[Dict[str, str]], session_id: Optional[str]) -> str:
+        """Summary + unsummarized turns when the session has a memory, else the full transcript"""
+        memory = self.memories.peek(f"debrief:{session_id}") if session_id else None
+        if memory is None or not memory.summary or len(conversation_history) < memory.summarized_count:
+            return "\n".join(f"{msg['role'].upper()}: {msg['content']}" for msg in conversation_history)
+        recent = format_turns(conversation_history[memory.summarized_count:])
+        return f"EARLIER (summary):\n{memory.summary}\n\nRECENT:\n{recent}"
+
     def _extract_key_topics(self, outline: str) -> str:
         """Extract key talking points and questions from the outline for context"""
         import re
@@ -259,15 +284,13 @@ Return ONLY the JSON array, no other text."""
         self,
         conversation_history: List[Dict[str, str]],
         startup_name: str,
-        meeting_prep_outline: str
+        meeting_prep_outline: str,
+        session_id: Optional[str] = None
     ) -> List[str]:
         """
         Generate exactly 3 focused questions for the debrief.
         """
-        conversation_text = "\n".join([
-            f"{msg['role'].upper()}: {msg['content']}"
-            for msg in conversation_history
-        ])
+        conversation_text = self._conversation_text(conversation_history, session_id)
 
         prompt = f"""Based on this conversation about {startup_name}, generate exactly 3 focused, professional questions for the debrief.
 
@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 import models
 import schemas
-from auth import get_password_hash
+from auth import get_password_hash, invalidate_user_principals
+from bulk_importer import event_row, event_spec, upsert_rows
+from seen_sets import seen_cache, update_seen_set
 
 # User CRUD
 def get_user(db: Session, user_id: int):
@@ -37,6 +39,7 @@ def update_user(db: Session, user_id: int, user_update: schemas.UserUpdate):
         db_user.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(db_user)
+        invalidate_user_principals(user_id=user_id)
     return db_user
 
 def delete_user(db: Session, user_id: int):
@@ -44,6 +47,7 @@ def delete_user(db: Session, user_id: int):
     if db_user:
         db.delete(db_user)
         db.commit()
+        invalidate_user_principals(user_id=user_id)
     return db_user
 
 # Calendar Events CRUD
@@ -111,7 +115,9 @@ def get_votes_by_startup(db: Session, startup_id: str):
 def create_vote(db: Session, vote: schemas.VoteCreate):
     db_vote = models.Vote(**vote.model_dump())
     db.add(db_vote)
+    seen_set = update_seen_set(db, db_vote.userId, db_vote.startupId)
     db.commit()
+    seen_cache.put(db_vote.userId, seen_set)
     db.refresh(db_vote)
     return db_vote
 
@@ -122,7 +128,9 @@ def delete_vote(db: Session, startup_id: str, user_id: str):
     ).first()
     if vote:
         db.delete(vote)
+        seen_set = update_seen_set(db, user_id, startup_id)
         db.commit()
+        seen_cache.put(user_id, seen_set)
         return True
     return False
 
@@ -294,11 +302,10 @@ def create_slush_event(db: Session, event: schemas.SlushEventCreate):
     return db_event
 
 def create_slush_events_bulk(db: Session, events: list):
-    """Bulk insert slush events"""
-    db_events = [models.SlushEvent(**event) for event in events]
-    db.add_all(db_events)
+    """Bulk upsert slush events keyed on (title, organizer, datetime); safe to re-run"""
+    stats = upsert_rows(db.connection(), event_spec(), (event_row(event) for event in events))
     db.commit()
-    return len(db_events)
+    return stats.rows
 
 def delete_all_slush_events(db: Session):
     """Delete all slush events (useful for re-importing)"""
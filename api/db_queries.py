@@ -3,10 +3,15 @@ Database query layer for normalized tables.
 Replaces JSON file reads with SQL queries.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
+from sqlalchemy import DateTime, text, func, bindparam
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
+import logging
+
+from embedding_index import get_startup_index, get_attendee_index
+
+logger = logging.getLogger(__name__)
 
 # ============================================
 # Startup Queries
@@ -208,8 +213,7 @@ def get_funding_stats(db: Session) -> Dict[str, Any]:
             AVG(total_funding) as avg_funding,
             MAX(total_funding) as max_funding,
             MIN(total_funding) as min_funding,
-            SUM(total_funding) as total_capital_raised,
-            COUNT(DISTINCT simplified_round) as unique_round_types
+            SUM(total_funding) as total_capital_raised
         FROM startups
         WHERE total_funding IS NOT NULL
     """)
@@ -255,60 +259,54 @@ def get_funding_by_stage(db: Session) -> Dict[str, Any]:
 # Calendar Event Queries
 # ============================================
 
+def _attach_attendees(db: Session, events: List[Dict]) -> List[Dict]:
+    """Add each event's attendee list (one query for the whole page)"""
+    attendees: Dict[Any, List[str]] = {}
+    if events:
+        query = text("""
+            SELECT event_id, attendee FROM calendar_event_attendees
+            WHERE event_id IN :ids
+            ORDER BY id
+        """).bindparams(bindparam("ids", expanding=True))
+        for event_id, attendee in db.execute(query, {"ids": [e["id"] for e in events]}):
+            attendees.setdefault(event_id, []).append(attendee)
+    for event in events:
+        event["attendees"] = attendees.get(event["id"], [])
+    return events
+
 def get_calendar_events(db: Session, skip: int = 0, limit: int = 100) -> List[Dict]:
     """Get calendar events."""
     query = text("""
-        SELECT 
-            e.*,
-            GROUP_CONCAT(ea.attendee) as attendees
-        FROM calendar_events e
-        LEFT JOIN calendar_event_attendees ea ON e.id = ea.event_id
-        GROUP BY e.id
-        ORDER BY e.start_time
+        SELECT * FROM calendar_events
+        ORDER BY start_time
         LIMIT :limit OFFSET :skip
     """)
     result = db.execute(query, {"limit": limit, "skip": skip})
-    
-    events = []
-    for row in result:
-        event_dict = dict(row._mapping)
-        # Convert attendees string to list
-        if event_dict.get('attendees'):
-            event_dict['attendees'] = event_dict['attendees'].split(',')
-        else:
-            event_dict['attendees'] = []
-        events.append(event_dict)
-    
-    return events
+    return _attach_attendees(db, [dict(row._mapping) for row in result])
 
 def get_events_by_date_range(
     db: Session,
     start_date: str,
     end_date: str
 ) -> List[Dict]:
-    """Get events in date range."""
+    """
+    Get calendar events overlapping a date range.
+
+    ISO dates / datetimes; a date-only end_date includes that whole day.
+    One range scan of the starts_at index.
+    """
+    from event_times import MAX_EVENT_DURATION, parse_when
+    start, end = parse_when(start_date), parse_when(end_date, end_of_day=True)
     query = text("""
-        SELECT 
-            e.*,
-            GROUP_CONCAT(ea.attendee) as attendees
-        FROM calendar_events e
-        LEFT JOIN calendar_event_attendees ea ON e.id = ea.event_id
-        WHERE e.start_time BETWEEN :start_date AND :end_date
-        GROUP BY e.id
-        ORDER BY e.start_time
-    """)
-    result = db.execute(query, {"start_date": start_date, "end_date": end_date})
-    
-    events = []
-    for row in result:
-        event_dict = dict(row._mapping)
-        if event_dict.get('attendees'):
-            event_dict['attendees'] = event_dict['attendees'].split(',')
-        else:
-            event_dict['attendees'] = []
-        events.append(event_dict)
-    
-    return events
+        SELECT * FROM calendar_events
+        WHERE starts_at < :end AND starts_at >= :earliest AND ends_at > :start
+        ORDER BY starts_at
+    """).bindparams(
+        bindparam("start", type_=DateTime), bindparam("end", type_=DateTime),
+        bindparam("earliest", type_=DateTime),
+    )
+    result = db.execute(query, {"start": start, "end": end, "earliest": start - MAX_EVENT_DURATION})
+    return _attach_attendees(db, [dict(row._mapping) for row in result])
 
 # ============================================
 # Rating Queries
@@ -800,7 +798,7 @@ def search_startups_by_axa_category(
                axa_primary_topic, axa_use_cases, axa_can_use_as_provider
         FROM startups
         WHERE axa_primary_topic LIKE :category_pattern
-           OR axa_use_cases LIKE :category_pattern
+           OR id IN (SELECT startup_id FROM startup_use_cases WHERE use_case LIKE :category_pattern)
         ORDER BY axa_overall_score DESC
         LIMIT :limit OFFSET :skip
     """)
@@ -939,12 +937,47 @@ def search_startups_by_location(
     return [dict(row._mapping) for row in result]
 
 
+def get_rows_by_ids(db: Session, table: str, ids: List[Any], scores: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """Fetch rows for ranked ids, keeping the ranking order"""
+    if not ids:
+        return []
+    query = text(f"SELECT * FROM {table} WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+    rows = {str(row._mapping["id"]): dict(row._mapping) for row in db.execute(query, {"ids": list(ids)})}
+    ranked = []
+    for id_ in ids:
+        row = rows.get(str(id_))
+        if row is not None:
+            if scores is not None:
+                row["similarity"] = round(scores[str(id_)], 4)
+            ranked.append(row)
+    return ranked
+
+
+def semantic_search_startups(db: Session, query_text: str, limit: int = 20, min_score: float = 0.05) -> List[Dict]:
+    """Rank startups by embedding similarity of their value prop / product / description"""
+    hits = [(id_, score) for id_, score in get_startup_index(db).search(query_text, k=limit) if score >= min_score]
+    return get_rows_by_ids(db, "startups", [id_ for id_, _ in hits], dict(hits))
+
+
+def semantic_search_attendees(db: Session, query_text: str, limit: int = 20, min_score: float = 0.05) -> List[Dict]:
+    """Rank attendees by embedding similarity of their title / company / bio"""
+    hits = [(id_, score) for id_, score in get_attendee_index(db).search(query_text, k=limit) if score >= min_score]
+    return get_rows_by_ids(db, "attendees", [id_ for id_, _ in hits], dict(hits))
+
+
 def search_startups_by_value_prop(
     db: Session,
     query_text: str,
     limit: int = 100
 ) -> List[Dict]:
     """Search startups by value proposition, problem solved, or target customers"""
+    try:
+        results = semantic_search_startups(db, query_text, limit=limit)
+        if results:
+            return results
+    except Exception as e:
+        logger.warning(f"Semantic value-prop search unavailable, using LIKE: {e}")
+    
     query = text("""
         SELECT * FROM startups 
         WHERE value_proposition LIKE :query
@@ -981,12 +1014,20 @@ def get_similar_startups(
     startup_id: str,
     limit: int = 5
 ) -> List[Dict]:
-    """Find similar startups based on industry, technology, and stage"""
+    """Find similar startups: embedding nearest neighbours, else same industry and stage"""
     # First get the reference startup
     reference = get_startup_by_id(db, startup_id)
     if not reference:
         return []
     
+    try:
+        hits = get_startup_index(db).similar_to(reference["id"], k=limit)
+        if hits:
+            return get_rows_by_ids(db, "startups", [id_ for id_, _ in hits], dict(hits))
+    except Exception as e:
+        logger.warning(f"Semantic similarity unavailable, using attribute match: {e}")
+    
+    startup_id = reference["id"]
     industry = reference.get('primary_industry', '')
     stage = reference.get('funding_stage', '')
     
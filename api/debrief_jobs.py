@@ -0,0 +1,105 @@
+"""
+Debrief insight extraction as a background job
+
+/insights/debrief/complete and /insights/debrief/regenerate-insights only
+save / look up the debrief and enqueue a "debrief_insights" job; a queue
+worker runs the LLM extraction and writes the CategorizedInsight rows.
+
+The write replaces all insights for the session in one transaction, so a
+retried or regenerated job never leaves duplicates behind.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from models import CategorizedInsight, DebriefSession
+from job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+DEBRIEF_INSIGHTS_JOB = "debrief_insights"
+
+Extractor = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+def insight_rows(debrief: DebriefSession, insights: List[Dict[str, Any]]) -> List[CategorizedInsight]:
+    """CategorizedInsight rows for extracted insights; malformed items are skipped"""
+    user_name = debrief.user_id.split('@')[0] if '@' in debrief.user_id else debrief.user_id
+    rows = []
+    for i, insight in enumerate(insights):
+        try:
+            rows.append(CategorizedInsight(
+                meeting_id=debrief.session_id,
+                startup_id=debrief.startup_id,
+                startup_name=debrief.startup_name,
+                user_id=debrief.user_id,
+                user_name=user_name,
+                user_email=debrief.user_id,
+                category=str(insight.get("section", "")),
+                title=insight.get("title", ""),
+                insight=insight.get("insight", ""),
+                insurance_relevance=insight.get("insurance_relevance", ""),
+                metrics=insight.get("metrics", []),
+                tags=insight.get("tags", []),
+                confidence_score=float(insight.get("confidence_score", 0.8)),
+                evidence_source=insight.get("evidence_source", "")
+            ))
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed insight {i + 1} for {debrief.session_id}: {e}")
+    return rows
+
+
+def replace_debrief_insights(db: Session, debrief: DebriefSession, insights: List[Dict[str, Any]]) -> int:
+    """Swap the session's insights for the new set in one transaction; returns rows saved"""
+    rows = insight_rows(debrief, insights)
+    # Row-by-row ORM deletes (a handful per session) so the insight read model sees them
+    for old in db.query(CategorizedInsight).filter_by(meeting_id=debrief.session_id):
+        db.delete(old)
+    db.add_all(rows)
+    db.commit()
+    return len(rows)
+
+
+def register_debrief_jobs(queue: JobQueue, extractor: Optional[Extractor] = None):
+    """Register the debrief_insights handler; extractor defaults to the conversational agent"""
+    if extractor is None:
+        from conversational_insights_agent import conversational_insights_agent
+        extractor = conversational_insights_agent.extract_insights_from_conversation
+
+    @queue.handler(DEBRIEF_INSIGHTS_JOB)
+    async def extract_debrief_insights(payload: Dict[str, Any]) -> Dict[str, Any]:
+        session_id = payload["session_id"]
+        db = queue.session_factory()
+        try:
+            debrief = db.query(DebriefSession).filter_by(session_id=session_id).first()
+            if debrief is None:
+                raise LookupError(f"Debrief session {session_id} not found")
+            startup_name, history = debrief.startup_name, list(debrief.conversation_history or [])
+        finally:
+            db.close()
+
+        # No DB connection is held during the LLM call
+        insights_data = await extractor(
+            startup_name=startup_name,
+            conversation_history=history,
+            meeting_prep_outline=payload.get("meeting_prep_outline", "")
+        )
+        if not insights_data.get("success"):
+            raise RuntimeError(insights_data.get("error") or "Insight extraction failed")
+        if insights_data.get("format") == "text":
+            raise ValueError("Model returned insights that are not valid JSON")
+        insights = insights_data.get("insights") or []
+
+        db = queue.session_factory()
+        try:
+            debrief = db.query(DebriefSession).filter_by(session_id=session_id).first()
+            saved = replace_debrief_insights(db, debrief, insights)
+        finally:
+            db.close()
+
+        logger.info(f"✓ Saved {saved} insights for debrief {session_id}")
+        return {"session_id": session_id, "startup_name": startup_name, "insights_saved": saved, "insights": insights}
+
+    return extract_debrief_insights
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Download/Export Startups - Filter and export startups based on criteria
 
@@ -11,6 +10,9 @@ This script allows you to export startups that match specific rules/filters:
 - By specific fields (e.g., has LinkedIn, has email)
 - Custom combinations of filters
 
+Filters run as SQL against the startups table and rows are streamed to the
+output in chunks (see startup_export.py), so exports run in constant memory.
+
 Usage:
     # Download all startups
     python3 api/download_startups.py --output all_startups.json
@@ -29,17 +31,22 @@ Usage:
     
     # Export to CSV
     python3 api/download_startups.py --output startups.csv --format csv
+    
+    # Line-delimited JSON, or columnar Parquet / Arrow for analytics tools (optional pyarrow, requirements-export.txt)
+    python3 api/download_startups.py --output startups.ndjson
+    python3 api/download_startups.py --has-funding --output funded.parquet --fields id,company_name,total_funding
 """
 
-import json
-import csv
 import argparse
 import sys
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
 import logging
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from startup_export import FORMATS, StartupFilter, detect_format, export_startups, export_statistics
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,91 +56,56 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class StartupFilter:
-    """Filter startups based on various criteria"""
-    
-    def __init__(self):
-        self.filters = []
-    
-    def add_filter(self, name: str, func):
-        """Add a filter function"""
-        self.filters.append((name, func))
-    
-    def apply(self, startups: List[Dict]) -> List[Dict]:
-        """Apply all filters to startups"""
-        filtered = startups
-        for name, func in self.filters:
-            before = len(filtered)
-            filtered = [s for s in filtered if func(s)]
-            after = len(filtered)
-            logger.info(f"Filter '{name}': {before} → {after} startups ({before-after} removed)")
-        return filtered
-
+def build_filter(args) -> StartupFilter:
+    """StartupFilter from the command line options"""
+    filter_chain = StartupFilter()
+    if args.countries:
+        filter_chain.countries(args.countries.split(','))
+    if args.maturity:
+        filter_chain.maturity(args.maturity)
+    if args.has_funding:
+        filter_chain.has_funding()
+    if args.min_funding:
+        filter_chain.min_funding(args.min_funding)
+    if args.has_website:
+        filter_chain.has_website()
+    if args.enriched_only:
+        filter_chain.enriched_only()
+    if args.has_email:
+        filter_chain.has_email()
+    if args.has_linkedin:
+        filter_chain.has_linkedin()
+    if args.min_employees:
+        filter_chain.min_employees(args.min_employees)
+    if args.founded_after:
+        filter_chain.founded_after(args.founded_after)
+    if args.topics:
+        filter_chain.topics(args.topics.split(','))
+    return filter_chain
 
-def load_startups(database_file: str) -> List[Dict]:
-    """Load startups from database"""
-    try:
-        with open(database_file, 'r', encoding='utf-8') as f:
-            startups = json.load(f)
-            logger.info(f"Loaded {len(startups)} startups from {database_file}")
-            return startups
-    except Exception as e:
-        logger.error(f"Failed to load database: {e}")
-        return []
 
+def print_statistics(stats):
+    print("\n" + "="*60)
+    print("STATISTICS")
+    print("="*60)
 
-def export_to_json(startups: List[Dict], output_file: str, pretty: bool = True):
-    """Export startups to JSON file"""
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(startups, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(startups, f, ensure_ascii=False)
-        logger.info(f"Exported {len(startups)} startups to {output_file}")
-    except Exception as e:
-        logger.error(f"Failed to export to JSON: {e}")
+    print(f"\nTop 10 Countries:")
+    for country, count in stats["countries"]:
+        print(f"  {country}: {count}")
 
+    print(f"\nMaturity Stages:")
+    for stage, count in stats["maturity"]:
+        print(f"  {stage}: {count}")
 
-def export_to_csv(startups: List[Dict], output_file: str, fields: Optional[List[str]] = None):
-    """Export startups to CSV file"""
-    if not startups:
-        logger.warning("No startups to export")
-        return
-    
-    # Default fields to export
-    if fields is None:
-        fields = [
-            'id', 'name', 'website', 'shortDescription',
-            'billingCountry', 'billingCity', 'maturity',
-            'employees', 'dateFounded', 'is_enriched',
-            'total_funding', 'valuation', 'last_funding_date'  # CB Insights funding data
-        ]
-    
-    # Add enrichment fields if available
-    sample = startups[0]
-    if sample.get('enrichment'):
-        fields.extend(['enrichment_emails', 'enrichment_linkedin', 'enrichment_phone'])
-    
-    try:
-        with open(output_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
-            writer.writeheader()
-            
-            for startup in startups:
-                # Flatten enrichment data for CSV
-                row = startup.copy()
-                if startup.get('enrichment'):
-                    enrich = startup['enrichment']
-                    row['enrichment_emails'] = ','.join(enrich.get('emails', []))
-                    row['enrichment_linkedin'] = enrich.get('social_media', {}).get('linkedin', '')
-                    row['enrichment_phone'] = ','.join(enrich.get('phone_numbers', []))
-                
-                writer.writerow(row)
-        
-        logger.info(f"Exported {len(startups)} startups to {output_file}")
-    except Exception as e:
-        logger.error(f"Failed to export to CSV: {e}")
+    total = stats["total"]
+    if total > 0:
+        print(f"\nData Completeness:")
+        print(f"  Enriched: {stats['enriched']} ({100*stats['enriched']/total:.1f}%)")
+        print(f"  Has Website: {stats['with_website']} ({100*stats['with_website']/total:.1f}%)")
+        print(f"  Has Funding: {stats['with_funding']} ({100*stats['with_funding']/total:.1f}%)")
+    else:
+        print(f"\nData Completeness: No startups matched filters")
+    print("="*60 + "\n")
 
 
 def main():
@@ -143,15 +115,17 @@ def main():
         epilog=__doc__
     )
     
-    # Input/Output
-    parser.add_argument('--input', default='docs/architecture/ddbb/slush2_extracted.json',
-                        help='Input database file (default: slush2_extracted.json)')
+    # Output
     parser.add_argument('--output', '-o', required=True,
-                        help='Output file (JSON or CSV)')
-    parser.add_argument('--format', choices=['json', 'csv'], default=None,
+                        help='Output file (.json, .ndjson, .csv, .parquet or .arrow)')
+    parser.add_argument('--format', choices=FORMATS, default=None,
                         help='Output format (auto-detected from extension if not specified)')
-    parser.add_argument('--pretty', action='store_true', default=True,
+    parser.add_argument('--fields', type=str,
+                        help='Comma-separated columns to export (default: all; CSV: a summary set)')
+    parser.add_argument('--pretty', action=argparse.BooleanOptionalAction, default=True,
                         help='Pretty print JSON output (default: True)')
+    parser.add_argument('--chunk-size', type=int, default=2000,
+                        help='Rows read and written per chunk (default: 2000)')
     
     # Filtering options
     filter_group = parser.add_argument_group('Filtering Options')
@@ -160,7 +134,7 @@ def main():
     filter_group.add_argument('--maturity', type=str,
                               help='Filter by maturity stage (e.g., scaleup, startup)')
     filter_group.add_argument('--min-funding', type=float,
-                              help='Minimum total funding amount')
+                              help='Minimum total funding amount (millions USD)')
     filter_group.add_argument('--has-funding', action='store_true',
                               help='Only startups with funding > 0')
     filter_group.add_argument('--has-website', action='store_true',
@@ -184,153 +158,30 @@ def main():
     
     args = parser.parse_args()
     
-    # Determine output format
-    if args.format is None:
-        if args.output.endswith('.csv'):
-            args.format = 'csv'
-        else:
-            args.format = 'json'
-    
-    # Load startups
     base_path = Path(__file__).parent.parent
-    input_file = base_path / args.input
-    startups = load_startups(input_file)
-    
-    if not startups:
-        logger.error("No startups loaded. Exiting.")
-        return 1
-    
-    # Build filter chain
-    filter_chain = StartupFilter()
-    
-    if args.countries:
-        countries = [c.strip().upper() for c in args.countries.split(',')]
-        filter_chain.add_filter(
-            f"countries={','.join(countries)}",
-            lambda s: (s.get('billingCountry') or '').upper() in countries
-        )
-    
-    if args.maturity:
-        maturity_lower = args.maturity.lower()
-        filter_chain.add_filter(
-            f"maturity={args.maturity}",
-            lambda s: maturity_lower in s.get('maturity', '').lower()
-        )
-    
-    if args.has_funding:
-        def has_funding_filter(s):
-            funding = s.get('totalFunding', 0)
-            try:
-                return funding and float(funding) > 0
-            except (ValueError, TypeError):
-                return False
-        filter_chain.add_filter("has_funding", has_funding_filter)
-    
-    if args.min_funding:
-        def min_funding_filter(s):
-            funding = s.get('totalFunding', 0)
-            try:
-                return float(funding) >= args.min_funding
-            except (ValueError, TypeError):
-                return False
-        filter_chain.add_filter(f"min_funding={args.min_funding}", min_funding_filter)
-    
-    if args.has_website:
-        filter_chain.add_filter(
-            "has_website",
-            lambda s: s.get('website') and s['website'].strip()
-        )
-    
-    if args.enriched_only:
-        filter_chain.add_filter(
-            "enriched_only",
-            lambda s: s.get('is_enriched', False) or s.get('enrichment')
-        )
-    
-    if args.has_email:
-        filter_chain.add_filter(
-            "has_email",
-            lambda s: s.get('enrichment', {}).get('emails') and len(s['enrichment']['emails']) > 0
-        )
-    
-    if args.has_linkedin:
-        filter_chain.add_filter(
-            "has_linkedin",
-            lambda s: s.get('enrichment', {}).get('social_media', {}).get('linkedin')
-        )
-    
-    if args.founded_after:
-        filter_chain.add_filter(
-            f"founded_after={args.founded_after}",
-            lambda s: s.get('dateFounded') and args.founded_after <= int(s['dateFounded'][:4])
-        )
+    output_path = base_path / args.output
+    fmt = args.format or detect_format(output_path)
+    fields = [f.strip() for f in args.fields.split(',') if f.strip()] if args.fields else None
     
-    if args.topics:
-        topics = [t.strip().lower() for t in args.topics.split(',')]
-        filter_chain.add_filter(
-            f"topics={','.join(topics)}",
-            lambda s: any(
-                any(topic in str(t).lower() for topic in topics)
-                for t in s.get('topics', [])
-            )
-        )
+    from database import batch_engine
     
-    # Apply filters
+    filter_chain = build_filter(args)
     logger.info(f"Applying {len(filter_chain.filters)} filter(s)...")
-    filtered_startups = filter_chain.apply(startups)
+    with batch_engine.connect() as conn:
+        funnel = filter_chain.explain(conn)
+        if args.stats:
+            print_statistics(export_statistics(conn, filter_chain))
+    if funnel:
+        logger.info(f"Final result: {funnel[-1][1]} startups")
     
-    logger.info(f"Final result: {len(filtered_startups)} startups")
-    
-    # Show statistics if requested
-    if args.stats:
-        print("\n" + "="*60)
-        print("STATISTICS")
-        print("="*60)
-        
-        # Country distribution
-        countries = {}
-        for s in filtered_startups:
-            country = s.get('billingCountry', 'Unknown')
-            countries[country] = countries.get(country, 0) + 1
-        print(f"\nTop 10 Countries:")
-        for country, count in sorted(countries.items(), key=lambda x: x[1], reverse=True)[:10]:
-            print(f"  {country}: {count}")
-        
-        # Maturity distribution
-        maturity = {}
-        for s in filtered_startups:
-            mat = s.get('maturity', 'Unknown')
-            maturity[mat] = maturity.get(mat, 0) + 1
-        print(f"\nMaturity Stages:")
-        for stage, count in sorted(maturity.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {stage}: {count}")
-        
-        # Enrichment stats
-        enriched = sum(1 for s in filtered_startups if s.get('is_enriched') or s.get('enrichment'))
-        with_website = sum(1 for s in filtered_startups if s.get('website'))
-        with_funding = sum(1 for s in filtered_startups if s.get('totalFunding') and 
-                          (isinstance(s['totalFunding'], (int, float)) and s['totalFunding'] > 0))
-        
-        total = len(filtered_startups)
-        if total > 0:
-            print(f"\nData Completeness:")
-            print(f"  Enriched: {enriched} ({100*enriched/total:.1f}%)")
-            print(f"  Has Website: {with_website} ({100*with_website/total:.1f}%)")
-            print(f"  Has Funding: {with_funding} ({100*with_funding/total:.1f}%)")
-        else:
-            print(f"\nData Completeness: No startups matched filters")
-        print("="*60 + "\n")
-    
-    # Export results
-    output_path = base_path / args.output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    if args.format == 'csv':
-        export_to_csv(filtered_startups, output_path)
-    else:
-        export_to_json(filtered_startups, output_path, args.pretty)
+    try:
+        stats = export_startups(output_path, filter_chain, fmt=fmt, fields=fields,
+                                chunk_size=args.chunk_size, engine=batch_engine, pretty=args.pretty)
+    except (ValueError, RuntimeError) as e:
+        logger.error(f"Export failed: {e}")
+        return 1
     
-    logger.info(f"✓ Successfully exported {len(filtered_startups)} startups to {args.output}")
+    logger.info(f"✓ Successfully exported {stats.rows} startups to {args.output}")
     return 0
 
 
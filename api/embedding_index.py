@@ -0,0 +1,519 @@
+"""
+Embedding Index for semantic startup and attendee search
+
+- EmbeddingProvider abstraction:
+    NvidiaNIMEmbeddingProvider  - NVIDIA_NIM embedding model (nemoretriever)
+    HashingEmbeddingProvider    - deterministic local fallback (feature-hashed
+                                  unigrams + bigrams), no network, no model
+- EmbeddingIndex: L2-normalized float32 vectors in a memory-mapped matrix
+  (<name>.f32) plus a small JSON sidecar (ids, text fingerprints, provider)
+- refresh() re-embeds only rows whose text changed, appends new rows, and
+  frees slots of deleted rows for reuse
+- Indexes served to requests are refreshed on a background thread (and by
+  embedding_index_worker() from app startup), never on the request path
+- search() is a chunked matrix-vector product + argpartition top-k, so a
+  query over ~10k startups takes a few milliseconds
+
+Startup vectors cover value_proposition, core_product and
+company_description; attendee vectors cover title, company and bio.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path("/tmp/embedding_index") if os.getenv("RENDER") else \
+    Path(__file__).parent.parent / "embedding_index"
+INDEX_DIR = Path(os.getenv("EMBEDDING_INDEX_DIR", DEFAULT_INDEX_DIR))
+
+SEARCH_CHUNK_ROWS = 65536  # Rows scored per matmul; bounds temporary memory
+EMBED_BATCH_SIZE = 64
+REFRESH_INTERVAL_SECONDS = 300
+
+
+# ============================================
+# Embedding providers
+# ============================================
+
+class EmbeddingProvider:
+    """Turns texts into L2-normalized float32 vectors"""
+
+    name = "base"
+    dim = 0
+
+    def embed(self, texts: Sequence[str], input_type: str = "passage") -> np.ndarray:
+        raise NotImplementedError
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the their "
+    "this to we with our they you your which who into using use based".split()
+)
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Feature-hashing bag of words (unigrams + bigrams, sublinear tf, signed
+    buckets). Deterministic across processes, so it works offline and in tests.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    @staticmethod
+    def tokenize(value: str) -> List[str]:
+        tokens = [t for t in TOKEN_RE.findall((value or "").lower()) if t not in STOPWORDS and len(t) > 1]
+        # Light stemming so "insurer"/"insurers", "claim"/"claims" share buckets
+        return [t[:-1] if len(t) > 4 and t.endswith("s") else t for t in tokens]
+
+    def _features(self, value: str) -> Dict[str, float]:
+        tokens = self.tokenize(value)
+        counts: Dict[str, float] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for left, right in zip(tokens, tokens[1:]):
+            bigram = f"{left} {right}"
+            counts[bigram] = counts.get(bigram, 0) + 0.5
+        return counts
+
+    def embed(self, texts: Sequence[str], input_type: str = "passage") -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, value in enumerate(texts):
+            for feature, count in self._features(value).items():
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dim
+                sign = 1.0 if digest[4] & 1 else -1.0
+                vectors[row, bucket] += sign * (1.0 + np.log(count))
+        return self.normalize(vectors)
+
+
+class NvidiaNIMEmbeddingProvider(EmbeddingProvider):
+    """NVIDIA NIM /embeddings endpoint (OpenAI-compatible, with input_type)"""
+
+    def __init__(self, api_key: str, base_url: str, model: str, dim: Optional[int] = None, timeout: float = 30.0):
+        import httpx
+
+        self.model = model
+        self.name = f"nim:{model}"
+        self.dim = dim or 0
+        self._client = httpx.Client(
+            base_url=base_url.rstrip("/"),
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+        )
+
+    def embed(self, texts: Sequence[str], input_type: str = "passage") -> np.ndarray:
+        vectors = []
+        for start in range(0, len(texts), EMBED_BATCH_SIZE):
+            batch = [t[:8000] or " " for t in texts[start:start + EMBED_BATCH_SIZE]]
+            response = self._client.post("/embeddings", json={
+                "model": self.model,
+                "input": batch,
+                "input_type": input_type,
+                "encoding_format": "float",
+                "truncate": "END",
+            })
+            response.raise_for_status()
+            data = sorted(response.json()["data"], key=lambda item: item["index"])
+            vectors.extend(item["embedding"] for item in data)
+        matrix = self.normalize(np.array(vectors, dtype=np.float32).reshape(len(texts), -1))
+        self.dim = matrix.shape[1]
+        return matrix
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """
+    NIM embeddings when NVIDIA_API_KEY is set, otherwise the hashing fallback.
+    EMBEDDING_PROVIDER=hashing forces the local provider.
+    """
+    api_key = os.getenv("NVIDIA_API_KEY")
+    if api_key and os.getenv("EMBEDDING_PROVIDER", "nim").lower() != "hashing":
+        return NvidiaNIMEmbeddingProvider(
+            api_key=api_key,
+            base_url=os.getenv("NVIDIA_NIM_BASE_URL", "https://integrate.api.nvidia.com/v1"),
+            model=os.getenv("NVIDIA_EMBEDDING_MODEL", "nvidia/llama-3.2-nemoretriever-300m-embed-v2"),
+            dim=int(os.getenv("NVIDIA_EMBEDDING_DIM", "0")) or None,
+        )
+    return HashingEmbeddingProvider(int(os.getenv("EMBEDDING_DIM", "512")))
+
+
+# ============================================
+# Memory-mapped index
+# ============================================
+
+def fingerprint(value: str) -> str:
+    return hashlib.md5(value.encode("utf-8")).hexdigest()[:16]
+
+
+class EmbeddingIndex:
+    """
+    Memory-mapped float32 matrix of unit vectors with an id -> row map.
+
+    Files: <directory>/<name>.f32 (capacity x dim) and <name>.meta.json.
+    The sidecar is rewritten atomically after the matrix is flushed; after a
+    crash mid-refresh the stale fingerprints just cause those rows to be
+    re-embedded on the next refresh.
+    """
+
+    def __init__(self, name: str, provider: EmbeddingProvider, directory: Optional[Path] = None):
+        self.name = name
+        self.provider = provider
+        self.directory = Path(directory or INDEX_DIR)
+        self.matrix_path = self.directory / f"{name}.f32"
+        self.meta_path = self.directory / f"{name}.meta.json"
+        self.dim = provider.dim
+        self.capacity = 0
+        self.row_of: Dict[str, int] = {}
+        self.fingerprints: Dict[str, str] = {}
+        self.free_rows: List[int] = []
+        self.ids: List[Optional[str]] = []  # Row -> id (None for free rows)
+        self.matrix: Optional[np.memmap] = None
+        self.refreshed_at = 0.0
+        self._lock = threading.RLock()  # Guards the matrix and row maps for readers
+        self._refresh_lock = threading.Lock()  # One refresh at a time
+        self._load()
+
+    # ---------- persistence ----------
+
+    def _load(self):
+        if not (self.meta_path.exists() and self.matrix_path.exists()):
+            return
+        with open(self.meta_path, "r") as f:
+            meta = json.load(f)
+        if meta.get("provider") != self.provider.name or (self.dim and meta.get("dim") != self.dim):
+            logger.info(f"Embedding index {self.name}: provider changed, rebuilding")
+            return
+        self.dim = meta["dim"]
+        self.capacity = meta["capacity"]
+        self.ids = meta["ids"]
+        self.fingerprints = meta["fingerprints"]
+        self.row_of = {id_: row for row, id_ in enumerate(self.ids) if id_ is not None}
+        self.free_rows = [row for row, id_ in enumerate(self.ids) if id_ is None]
+        self.matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    def _save_meta(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "provider": self.provider.name,
+                "dim": self.dim,
+                "capacity": self.capacity,
+                "ids": self.ids,
+                "fingerprints": self.fingerprints,
+            }, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _ensure_capacity(self, rows_needed: int):
+        if rows_needed <= self.capacity and self.matrix is not None:
+            return
+        new_capacity = max(1024, self.capacity * 2)
+        while new_capacity < rows_needed:
+            new_capacity *= 2
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.matrix_path.with_suffix(".f32.tmp")
+        grown = np.memmap(tmp_path, dtype=np.float32, mode="w+", shape=(new_capacity, self.dim))
+        if self.matrix is not None and self.capacity:
+            grown[:self.capacity] = self.matrix[:self.capacity]
+        grown.flush()
+        del grown
+        self.matrix = None
+        os.replace(tmp_path, self.matrix_path)
+        self.capacity = new_capacity
+        self.matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    # ---------- updates ----------
+
+    def refresh(self, records: Iterable[Tuple[Any, str]]) -> Dict[str, int]:
+        """
+        Sync the index with (id, text) records: embed new and changed texts,
+        drop ids that disappeared. Unchanged rows cost one hash each.
+
+        Embedding runs outside the search lock, so queries keep being served
+        from the current vectors while a refresh is in progress.
+        """
+        with self._refresh_lock:
+            started = time.time()
+            seen = set()  # Ids with non-empty text
+            pending: List[Tuple[str, str, str]] = []  # (id, text, fingerprint)
+            for raw_id, value in records:
+                value = (value or "").strip()
+                if not value:
+                    continue
+                id_ = str(raw_id)
+                seen.add(id_)
+                fp = fingerprint(value)
+                if self.fingerprints.get(id_) != fp:
+                    pending.append((id_, value, fp))
+
+            # Deleted rows and rows whose text was cleared
+            removed = [id_ for id_ in self.row_of if id_ not in seen]
+            with self._lock:
+                for id_ in removed:
+                    row = self.row_of.pop(id_)
+                    self.fingerprints.pop(id_, None)
+                    self.ids[row] = None
+                    self.matrix[row] = 0.0
+                    self.free_rows.append(row)
+
+            added = updated = 0
+            for start in range(0, len(pending), EMBED_BATCH_SIZE * 4):
+                batch = pending[start:start + EMBED_BATCH_SIZE * 4]
+                vectors = self.provider.embed([value for _, value, _ in batch], input_type="passage")
+                with self._lock:
+                    if not self.dim:
+                        self.dim = vectors.shape[1]
+                    new_ids = sum(1 for id_, _, _ in batch if id_ not in self.row_of)
+                    self._ensure_capacity(len(self.ids) + max(0, new_ids - len(self.free_rows)))
+                    for (id_, _, fp), vector in zip(batch, vectors):
+                        if id_ in self.row_of:
+                            row = self.row_of[id_]
+                            updated += 1
+                        else:
+                            if self.free_rows:
+                                row = self.free_rows.pop()
+                            else:
+                                row = len(self.ids)
+                                self.ids.append(None)
+                            self.row_of[id_] = row
+                            self.ids[row] = id_
+                            added += 1
+                        self.matrix[row] = vector
+                        self.fingerprints[id_] = fp
+
+            if pending or removed:
+                with self._lock:
+                    self.matrix.flush()
+                    self._save_meta()
+            self.refreshed_at = time.time()
+            stats = {"added": added, "updated": updated, "removed": len(removed),
+                     "size": len(self.row_of), "seconds": round(time.time() - started, 3)}
+            if pending or removed:
+                logger.info(f"✓ Embedding index {self.name} refreshed: {stats}")
+            return stats
+
+    # ---------- queries ----------
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def vector(self, id_: Any) -> Optional[np.ndarray]:
+        row = self.row_of.get(str(id_))
+        return None if row is None else np.array(self.matrix[row])
+
+    def search_vector(self, query: np.ndarray, k: int = 10, exclude: Iterable[Any] = ()) -> List[Tuple[str, float]]:
+        """Top-k (id, cosine) for a unit query vector"""
+        with self._lock:
+            used = len(self.ids)
+            if not used or self.matrix is None:
+                return []
+            exclude_rows = {self.row_of[str(e)] for e in exclude if str(e) in self.row_of}
+            query = np.asarray(query, dtype=np.float32).reshape(-1)
+            want = k + len(exclude_rows)
+
+            best_rows: List[np.ndarray] = []
+            best_scores: List[np.ndarray] = []
+            for start in range(0, used, SEARCH_CHUNK_ROWS):
+                scores = self.matrix[start:min(used, start + SEARCH_CHUNK_ROWS)] @ query
+                if len(scores) > want:
+                    top = np.argpartition(-scores, want)[:want]
+                else:
+                    top = np.arange(len(scores))
+                best_rows.append(top + start)
+                best_scores.append(scores[top])
+
+            rows = np.concatenate(best_rows)
+            scores = np.concatenate(best_scores)
+            results = []
+            for i in np.argsort(-scores):
+                row = int(rows[i])
+                id_ = self.ids[row]
+                if id_ is None or row in exclude_rows:
+                    continue
+                results.append((id_, float(scores[i])))
+                if len(results) >= k:
+                    break
+            return results
+
+    def search(self, query_text: str, k: int = 10, exclude: Iterable[Any] = ()) -> List[Tuple[str, float]]:
+        query = self.provider.embed([query_text], input_type="query")[0]
+        return self.search_vector(query, k=k, exclude=exclude)
+
+    def similar_to(self, id_: Any, k: int = 10) -> List[Tuple[str, float]]:
+        vector = self.vector(id_)
+        if vector is None:
+            return []
+        return self.search_vector(vector, k=k, exclude=[id_])
+
+
+# ============================================
+# Startup / attendee indexes over the DB
+# ============================================
+
+STARTUP_TEXT_SQL = """
+    SELECT id, value_proposition, core_product, company_description, shortDescription
+    FROM startups
+"""
+
+ATTENDEE_TEXT_SQL = """
+    SELECT id, title, company_name, bio
+    FROM attendees
+"""
+
+
+def startup_text(row: Dict[str, Any]) -> str:
+    parts = [row.get("value_proposition"), row.get("core_product"), row.get("company_description")]
+    if not any(parts):
+        parts = [row.get("shortDescription")]
+    return "\n".join(p for p in parts if p)
+
+
+def attendee_text(row: Dict[str, Any]) -> str:
+    return "\n".join(p for p in (row.get("title"), row.get("company_name"), row.get("bio")) if p)
+
+
+INDEX_SOURCES = {
+    "startups": (STARTUP_TEXT_SQL, startup_text),
+    "attendees": (ATTENDEE_TEXT_SQL, attendee_text),
+}
+
+_indexes: Dict[str, EmbeddingIndex] = {}
+_refreshing: Dict[str, threading.Thread] = {}
+_indexes_lock = threading.Lock()
+
+
+def _index(name: str) -> EmbeddingIndex:
+    with _indexes_lock:
+        index = _indexes.get(name)
+        if index is None:
+            index = _indexes[name] = EmbeddingIndex(name, get_embedding_provider())
+        return index
+
+
+def refresh_index(db: Session, name: str) -> Dict[str, int]:
+    """Sync one index with the DB now, on the calling thread"""
+    sql, to_text = INDEX_SOURCES[name]
+    rows = db.execute(text(sql))
+    return _index(name).refresh((row.id, to_text(row._mapping)) for row in rows)
+
+
+def _refresh_in_background(name: str, bind):
+    db = Session(bind=bind)
+    try:
+        refresh_index(db, name)
+    except Exception as e:
+        logger.error(f"Error refreshing embedding index {name}: {e}")
+    finally:
+        db.close()
+        with _indexes_lock:
+            _refreshing.pop(name, None)
+
+
+def _get_index(db: Session, name: str, max_age: float) -> EmbeddingIndex:
+    """
+    The cached index as it is now. When it is older than max_age (or was
+    never built) a refresh starts on a background thread with its own
+    session; until it finishes, callers keep getting the last good vectors
+    (or an empty index, and their non-semantic fallback).
+    """
+    index = _index(name)
+    with _indexes_lock:
+        if time.time() - index.refreshed_at <= max_age or name in _refreshing:
+            return index
+        thread = _refreshing[name] = threading.Thread(
+            target=_refresh_in_background, args=(name, db.get_bind()),
+            name=f"embedding-index-{name}", daemon=True,
+        )
+    thread.start()
+    return index
+
+
+def get_startup_index(db: Session, max_age: float = REFRESH_INTERVAL_SECONDS) -> EmbeddingIndex:
+    """Process-wide startup index; refreshed in the background once older than max_age seconds"""
+    return _get_index(db, "startups", max_age)
+
+
+def get_attendee_index(db: Session, max_age: float = REFRESH_INTERVAL_SECONDS) -> EmbeddingIndex:
+    """Process-wide attendee index over title / company / bio"""
+    return _get_index(db, "attendees", max_age)
+
+
+def refresh_indexes(db: Optional[Session] = None) -> Dict[str, Dict[str, int]]:
+    """Sync every index with the DB now (own session when none is given)"""
+    if db is None:
+        from database import SessionLocal
+        with SessionLocal() as session:
+            return refresh_indexes(session)
+    stats = {}
+    for name in INDEX_SOURCES:
+        try:
+            stats[name] = refresh_index(db, name)
+        except Exception as e:
+            logger.error(f"Error refreshing embedding index {name}: {e}")
+    return stats
+
+
+async def embedding_index_worker(interval: float = REFRESH_INTERVAL_SECONDS):
+    """Background task that builds the indexes at startup and keeps them fresh"""
+    while True:
+        await asyncio.to_thread(refresh_indexes)
+        await asyncio.sleep(interval)
+
+
+def reset_indexes():
+    """Forget cached indexes (tests, or after switching provider)"""
+    for thread in list(_refreshing.values()):
+        thread.join()
+    with _indexes_lock:
+        _indexes.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Build / refresh the embedding indexes")
+    parser.add_argument("--query", help="Run a test query against the startup index")
+    args = parser.parse_args()
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        refresh_indexes(db)
+        startups, attendees = _index("startups"), _index("attendees")
+        print(f"✅ startups: {len(startups)} vectors, attendees: {len(attendees)} vectors "
+              f"({startups.provider.name}, dim {startups.dim})")
+        if args.query:
+            started = time.perf_counter()
+            hits = startups.search(args.query, k=10)
+            print(f"\n🔍 '{args.query}' ({(time.perf_counter() - started) * 1000:.1f}ms)")
+            for id_, score in hits:
+                print(f"  {score:.3f}  startup {id_}")
+    finally:
+        db.close()
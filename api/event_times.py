@@ -0,0 +1,340 @@
+"""
+Event Times - parsed UTC timestamps and interval queries for event tables
+
+Slush side events are scraped with free-form local times
+("Nov 20, 10:00 AM – 12:00 PM", Helsinki time), and date questions used to
+be answered with ILIKE over that string. Both event tables now carry
+starts_at / ends_at in naive UTC, starts_at indexed, so schedule views and
+"what's on at 3pm" become index range scans:
+
+- parse_event_window() turns a scraped string into (starts_at, ends_at)
+- install_event_time_hooks() keeps the columns in sync on ORM writes;
+  bulk_importer.event_row() fills them on the Core upsert path
+- ensure_event_times() adds the columns / indexes to an existing database
+  and backfills rows written before they existed
+- events_between() / events_at() / next_events() / events_by_day() are the
+  interval queries; search_events_by_date() answers free-form date questions
+
+Naive datetimes passed to the query helpers are UTC. Dates and times
+parsed from text ("Nov 19", "3pm", "2025-11-19") are event-local.
+
+    python event_times.py            # backfill
+    python event_times.py "Nov 19 3pm"
+"""
+
+import os
+import re
+import sys
+import logging
+import argparse
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Query, Session
+
+from models import CalendarEvent, SlushEvent
+
+logger = logging.getLogger(__name__)
+
+try:
+    from zoneinfo import ZoneInfo
+    EVENT_TIMEZONE = ZoneInfo(os.getenv("EVENT_TIMEZONE", "Europe/Helsinki"))
+except Exception:  # No tz database in the image; Slush is in November (EET)
+    EVENT_TIMEZONE = timezone(timedelta(hours=2), "EET")
+
+EVENT_YEAR = int(os.getenv("EVENT_YEAR", "2025"))  # Scraped dates carry no year
+DEFAULT_EVENT_DURATION = timedelta(hours=1)  # When only a start time is listed
+# Lower bound for overlap scans: an event overlapping a window starts at
+# most this long before it, so the starts_at index bounds both sides
+MAX_EVENT_DURATION = timedelta(hours=36)
+DAY_PARTS = {"morning": (6, 12), "afternoon": (12, 17), "evening": (17, 24), "tonight": (17, 24)}
+
+_MONTHS = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+_RANGE = re.compile(r"\s*[–—]\s*|\s+-\s+|\s+to\s+")
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MONTH_DAY = re.compile(r"\b([a-z]{3})[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b(?!:)")
+_DAY_MONTH = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([a-z]{3})[a-z]*\b")
+_TIME_12H = re.compile(r"(?<![\d:])(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\b")
+_TIME_24H = re.compile(r"(?<![\d:])(\d{1,2}):(\d{2})(?!\d)")
+
+
+# ============================================
+# Parsing
+# ============================================
+
+def local_to_utc(value: datetime) -> datetime:
+    """Naive event-local datetime -> naive UTC"""
+    return value.replace(tzinfo=EVENT_TIMEZONE).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def utc_to_local(value: datetime) -> datetime:
+    """Naive UTC datetime -> naive event-local"""
+    return value.replace(tzinfo=timezone.utc).astimezone(EVENT_TIMEZONE).replace(tzinfo=None)
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Naive UTC for any datetime; naive input is taken to be UTC already"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _find_date(text: str, year: int = EVENT_YEAR) -> Optional[date]:
+    match = _ISO_DATE.search(text)
+    if match:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    for pattern, month_group, day_group in ((_MONTH_DAY, 1, 2), (_DAY_MONTH, 2, 1)):
+        for match in pattern.finditer(text):
+            month = _MONTHS.get(match.group(month_group))
+            if month:
+                try:
+                    return date(year, month, int(match.group(day_group)))
+                except ValueError:
+                    return None
+    return None
+
+
+def _find_time(text: str) -> Optional[time]:
+    match = _TIME_12H.search(text)
+    if match:
+        hour, minute = int(match.group(1)) % 12, int(match.group(2) or 0)
+        if match.group(3) == "p":
+            hour += 12
+    else:
+        match = _TIME_24H.search(text)
+        if not match:
+            return None
+        hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    return time(hour, minute)
+
+
+def parse_event_window(value: Optional[str], year: int = EVENT_YEAR) -> Optional[Tuple[datetime, datetime]]:
+    """
+    (starts_at, ends_at) in naive UTC for a scraped event time string
+
+    Handles "Nov 20, 10:00 AM – 12:00 PM", ranges spanning days
+    ("Nov 19, 10:00 PM – Nov 20, 2:00 AM"), end times past midnight, a
+    missing end time (DEFAULT_EVENT_DURATION) and a missing time (all day).
+    Returns None when no date can be found.
+    """
+    if not value:
+        return None
+    parts = _RANGE.split(value.strip().lower(), maxsplit=1)
+    start_day = _find_date(parts[0], year)
+    if start_day is None:
+        return None
+    start_time = _find_time(parts[0])
+    if start_time is None:
+        start = datetime.combine(start_day, time())
+        return local_to_utc(start), local_to_utc(start + timedelta(days=1))
+
+    start = datetime.combine(start_day, start_time)
+    end_time = _find_time(parts[1]) if len(parts) > 1 else None
+    if end_time is None:
+        end = start + DEFAULT_EVENT_DURATION
+    else:
+        end_day = _find_date(parts[1], year)
+        end = datetime.combine(end_day or start_day, end_time)
+        if end <= start and end_day is None:
+            end += timedelta(days=1)
+    return local_to_utc(start), local_to_utc(end)
+
+
+def parse_date_query(query: str, now: Optional[datetime] = None,
+                     year: int = EVENT_YEAR) -> Optional[Tuple[datetime, datetime]]:
+    """
+    UTC window for a free-form date question
+
+    "Nov 19" / "19 November" / "2025-11-19" / "today" -> that local day;
+    with a time ("Nov 19 3pm", "at 15:00") -> the instant (start == end);
+    with a day part ("tomorrow evening") -> that part of the day. A time
+    without a date is taken as today. Returns None if nothing parses.
+    """
+    text = " ".join(str(query).lower().split())
+    local_now = utc_to_local(now or datetime.utcnow())
+    day = _find_date(text, year)
+    right_now = re.search(r"\bnow\b", text) is not None
+    if day is None:
+        if "tomorrow" in text:
+            day = local_now.date() + timedelta(days=1)
+        elif "today" in text or "tonight" in text or right_now:
+            day = local_now.date()
+
+    if right_now and day == local_now.date():
+        moment = local_to_utc(local_now.replace(second=0, microsecond=0))
+        return moment, moment
+
+    at = _find_time(text)
+    if at is not None:
+        moment = local_to_utc(datetime.combine(day or local_now.date(), at))
+        return moment, moment
+    if day is None:
+        return None
+
+    for part, (first_hour, last_hour) in DAY_PARTS.items():
+        if part in text:
+            start = datetime.combine(day, time(first_hour))
+            return local_to_utc(start), local_to_utc(start + timedelta(hours=last_hour - first_hour))
+    start = datetime.combine(day, time())
+    return local_to_utc(start), local_to_utc(start + timedelta(days=1))
+
+
+def parse_when(value: str, end_of_day: bool = False) -> datetime:
+    """
+    Naive UTC for an API parameter: ISO datetime (naive = event-local) or a
+    date (its local midnight; the following midnight with end_of_day)
+    """
+    value = value.strip()
+    if len(value) == 10:
+        day = date.fromisoformat(value)
+        return local_to_utc(datetime.combine(day + timedelta(days=1 if end_of_day else 0), time()))
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return as_utc(parsed) if parsed.tzinfo else local_to_utc(parsed)
+
+
+# ============================================
+# Keeping the columns in sync
+# ============================================
+
+def set_event_window(target: Any):
+    """Fill starts_at / ends_at from the row's own time fields"""
+    if isinstance(target, SlushEvent):
+        window = parse_event_window(target.datetime)
+        target.starts_at, target.ends_at = window or (None, None)
+    elif isinstance(target, CalendarEvent):
+        target.starts_at, target.ends_at = as_utc(target.start_time), as_utc(target.end_time)
+
+
+def _before_write(mapper, connection, target):
+    set_event_window(target)
+
+
+def install_event_time_hooks():
+    """Keep starts_at / ends_at in sync on every ORM insert / update in this process (idempotent)"""
+    for model in (SlushEvent, CalendarEvent):
+        for name in ("before_insert", "before_update"):
+            if not event.contains(model, name, _before_write):
+                event.listen(model, name, _before_write)
+
+
+def ensure_event_times(db: Session) -> Dict[str, int]:
+    """
+    Add starts_at / ends_at (and the starts_at index) to tables created
+    before they existed, then backfill rows that have no starts_at yet
+
+    Returns:
+        Rows backfilled per table (tables with nothing to do are omitted)
+    """
+    bind = db.get_bind()
+    for model in (SlushEvent, CalendarEvent):
+        table = model.__table__
+        existing = {column["name"] for column in inspect(bind).get_columns(table.name)}
+        for name in ("starts_at", "ends_at"):
+            if name not in existing:
+                db.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} DATETIME"))
+        db.commit()
+        for index in table.indexes:
+            if "starts_at" in index.columns:
+                index.create(bind=bind, checkfirst=True)
+
+    filled = {}
+    for model in (SlushEvent, CalendarEvent):
+        rows = db.query(model).filter(model.starts_at.is_(None)).all()
+        count = 0
+        for row in rows:
+            set_event_window(row)
+            count += row.starts_at is not None
+        db.commit()
+        if count:
+            filled[model.__tablename__] = count
+    if filled:
+        logger.info(f"🕒 Backfilled event times {filled}")
+    return filled
+
+
+# ============================================
+# Interval queries
+# ============================================
+
+def overlapping(query: Query, model: Any, start: datetime, end: datetime) -> Query:
+    """
+    Restrict query to rows of model overlapping [start, end) - or on at
+    that instant when start == end - earliest first
+    """
+    starts_before_end = model.starts_at <= end if start == end else model.starts_at < end
+    return query.filter(
+        starts_before_end,
+        model.starts_at >= start - MAX_EVENT_DURATION,
+        model.ends_at > start,
+    ).order_by(model.starts_at, model.id)
+
+
+def events_between(db: Session, start: datetime, end: datetime, model: Any = SlushEvent,
+                   limit: Optional[int] = None) -> List[Any]:
+    """Events overlapping [start, end) (naive UTC), earliest first"""
+    query = overlapping(db.query(model), model, start, end)
+    return query.limit(limit).all() if limit else query.all()
+
+
+def events_at(db: Session, moment: datetime, model: Any = SlushEvent, limit: Optional[int] = None) -> List[Any]:
+    """Events running at a moment (naive UTC)"""
+    return events_between(db, moment, moment, model, limit)
+
+
+def next_events(db: Session, after: Optional[datetime] = None, n: int = 5, model: Any = SlushEvent) -> List[Any]:
+    """The next n events starting at or after a moment (default: now)"""
+    after = after or datetime.utcnow()
+    return (db.query(model).filter(model.starts_at >= after)
+            .order_by(model.starts_at, model.id).limit(n).all())
+
+
+def events_by_day(db: Session, start: datetime, end: datetime, model: Any = SlushEvent) -> "OrderedDict[date, List[Any]]":
+    """Events overlapping [start, end) bucketed by the local day they start on"""
+    days: "OrderedDict[date, List[Any]]" = OrderedDict()
+    for row in events_between(db, start, end, model):
+        days.setdefault(utc_to_local(row.starts_at).date(), []).append(row)
+    return days
+
+
+def search_events_by_date(db: Session, date_query: str, limit: int = 10,
+                          now: Optional[datetime] = None) -> List[SlushEvent]:
+    """
+    Slush events matching a free-form date question ("Nov 19", "3pm",
+    "tomorrow evening"); falls back to substring search of the scraped
+    string when the question has no recognizable date or time
+    """
+    window = parse_date_query(date_query, now)
+    if window is not None:
+        return events_between(db, window[0], window[1], SlushEvent, limit)
+    return (db.query(SlushEvent).filter(SlushEvent.datetime.ilike(f"%{date_query}%"))
+            .order_by(SlushEvent.starts_at, SlushEvent.id).limit(limit).all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill event start/end times, or try a date question")
+    parser.add_argument("query", nargs="?", help='Date question to answer, e.g. "Nov 19 3pm"')
+    parser.add_argument("--limit", type=int, default=20, help="Events to list (default: 20)")
+    args = parser.parse_args()
+
+    from database import SessionLocal
+    db = SessionLocal()
+    try:
+        filled = ensure_event_times(db)
+        print(f"✓ Backfilled {sum(filled.values())} event(s) {filled or ''}")
+        if args.query:
+            window = parse_date_query(args.query)
+            print(f"🕒 {args.query!r} -> {window}")
+            for row in search_events_by_date(db, args.query, args.limit):
+                print(f"  {row.datetime} - {row.title} ({row.organizer})")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,6 +31,11 @@ from datetime import datetime
 from collections import Counter, defaultdict
 import re
 
+try:
+    from api.keyword_matcher import KeywordGroups, KeywordMatcher
+except ImportError:
+    from keyword_matcher import KeywordGroups, KeywordMatcher
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -136,6 +141,11 @@ CONSUMER_EXCLUSIONS = [
     'retail consumer', 'shopping app', 'fashion marketplace'
 ]
 
+# All agentic categories matched in a single scan of a startup's text
+AGENTIC_KEYWORD_GROUPS = KeywordGroups(AGENTIC_AI_KEYWORDS)
+ENTERPRISE_MATCHER = KeywordMatcher(ENTERPRISE_INDICATORS)
+CONSUMER_EXCLUSION_MATCHER = KeywordMatcher(CONSUMER_EXCLUSIONS)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -241,11 +251,10 @@ def detect_agentic_signals(startup: Dict) -> Dict:
     detected_categories = defaultdict(list)
     total_matches = 0
     
-    for category, keywords in AGENTIC_AI_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in search_text:
-                detected_categories[category].append(keyword)
-                total_matches += 1
+    for category, keywords in AGENTIC_KEYWORD_GROUPS.match(search_text).items():
+        if keywords:
+            detected_categories[category].extend(keywords)
+            total_matches += len(keywords)
     
     # Calculate category scores
     category_scores = {}
@@ -277,8 +286,8 @@ def is_enterprise_focused(startup: Dict) -> Tuple[bool, int]:
     """Check if startup is B2B/enterprise focused"""
     search_text = get_search_text(startup)
     
-    enterprise_count = sum(1 for ind in ENTERPRISE_INDICATORS if ind in search_text)
-    consumer_count = sum(1 for exc in CONSUMER_EXCLUSIONS if exc in search_text)
+    enterprise_count = ENTERPRISE_MATCHER.count(search_text)
+    consumer_count = CONSUMER_EXCLUSION_MATCHER.count(search_text)
     
     # Strong enterprise signals
     if enterprise_count >= 3:
@@ -25,6 +25,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    from api.keyword_matcher import KeywordGroups, KeywordMatcher, compile_keywords
+except ImportError:
+    from keyword_matcher import KeywordGroups, KeywordMatcher, compile_keywords
+
 # Try to import LLM tools
 try:
     from api.llm_config import llm_completion_sync, is_nvidia_nim_configured, get_nvidia_nim_model
@@ -118,6 +123,10 @@ EXCLUSION_KEYWORDS = [
     'influencer platform', 'creator platform', 'content creator'
 ]
 
+# Category keywords and B2B indicators, matched in a single scan of a startup's text
+AGENTIC_KEYWORD_GROUPS = KeywordGroups({**AGENTIC_AI_KEYWORDS, 'b2b_indicators': B2B_INDICATORS})
+EXCLUSION_MATCHER = KeywordMatcher(EXCLUSION_KEYWORDS)
+
 
 # ============================================================================
 # SCORING & MATCHING
@@ -128,13 +137,7 @@ def text_search(text: str, keywords: List[str]) -> Tuple[int, List[str]]:
     if not text:
         return 0, []
     
-    text_lower = text.lower()
-    matched = []
-    
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            matched.append(keyword)
-    
+    matched = compile_keywords(keywords).findall(text)
     return len(matched), matched
 
 
@@ -161,21 +164,23 @@ def is_agentic_b2b_solution(startup: Dict, use_llm: bool = False) -> Tuple[bool,
     search_text = get_search_text(startup)
     
     # Quick exclusions
-    for exclusion in EXCLUSION_KEYWORDS:
-        if exclusion in search_text.lower():
-            return False, 0, {'reason': f'Excluded: {exclusion}'}
+    exclusion = EXCLUSION_MATCHER.first(search_text)
+    if exclusion:
+        return False, 0, {'reason': f'Excluded: {exclusion}'}
     
     # Score each category
     scores = {}
     all_matched_keywords = []
+    hits = AGENTIC_KEYWORD_GROUPS.match(search_text)
     
-    for category, keywords in AGENTIC_AI_KEYWORDS.items():
-        count, matched = text_search(search_text, keywords)
-        scores[category] = count
+    for category in AGENTIC_AI_KEYWORDS:
+        matched = hits[category]
+        scores[category] = len(matched)
         all_matched_keywords.extend(matched)
     
     # B2B check
-    b2b_count, b2b_matched = text_search(search_text, B2B_INDICATORS)
+    b2b_matched = hits['b2b_indicators']
+    b2b_count = len(b2b_matched)
     scores['b2b_indicators'] = b2b_count
     
     # Scoring logic
@@ -27,6 +27,7 @@ Usage:
 
 import json
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
@@ -35,6 +36,7 @@ import logging
 import asyncio
 import concurrent.futures
 import time
+from functools import lru_cache
 
 # Setup logging
 logging.basicConfig(
@@ -44,24 +46,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    from api.keyword_matcher import KeywordGroups, KeywordMatcher, compile_keywords
+    from api.filter_cache import RateLimiter
+except ImportError:
+    from keyword_matcher import KeywordGroups, KeywordMatcher, compile_keywords
+    from filter_cache import RateLimiter
+
 # Try to import MCP and LLM tools
 try:
-    from api.mcp_client import StartupDatabaseMCPTools
+    from api.mcp_client import get_startup_tools
     HAS_MCP = True
 except ImportError:
     try:
-        from mcp_client import StartupDatabaseMCPTools
+        from mcp_client import get_startup_tools
         HAS_MCP = True
     except ImportError:
         HAS_MCP = False
         logger.warning("MCP client not available - will use local filtering only")
 
 try:
-    from api.llm_config import llm_completion_sync, is_nvidia_nim_configured, get_nvidia_nim_model
+    from api.llm_config import llm_completion, llm_completion_sync, is_nvidia_nim_configured, get_nvidia_nim_model
     HAS_LLM = True
 except ImportError:
     try:
-        from llm_config import llm_completion_sync, is_nvidia_nim_configured, get_nvidia_nim_model
+        from llm_config import llm_completion, llm_completion_sync, is_nvidia_nim_configured, get_nvidia_nim_model
         HAS_LLM = True
     except ImportError:
         HAS_LLM = False
@@ -70,6 +79,11 @@ except ImportError:
 # Global MCP tools instance
 MCP_TOOLS = None
 
+# Phase 1 runs in chunks across a process pool; phase 2 shares one LLM rate limit
+LOCAL_SCORING_CHUNK_SIZE = 250
+LLM_MAX_PARALLEL = 8
+LLM_REQUESTS_PER_MINUTE = 40
+
 
 # ============================================================================
 # KEYWORD DEFINITIONS (Same as original, enhanced)
@@ -177,6 +191,60 @@ AXA_PROVIDER_EXCLUSIONS = {
     ]
 }
 
+# Rule 2 is for non-insurance providers; these send a startup to Rule 3 instead
+INSURANCE_SPECIFIC_KEYWORDS = ['insurance', 'insurtech', 'claims', 'underwriting']
+
+# Obvious B2C / consumer companies (can_be_axa_provider first pass)
+PROVIDER_HARD_EXCLUSIONS = [
+    'dating app', 'dating platform', 'matchmaking app',
+    'food delivery', 'restaurant delivery', 'meal delivery',
+    'social network', 'social media platform', 'influencer platform',
+    'consumer marketplace', 'e-commerce platform', 'online shopping',
+    'mobile game', 'gaming platform', 'game developer',
+    'music streaming', 'video streaming', 'entertainment platform',
+    'consumer app', 'b2c only', 'direct to consumer only'
+]
+PROVIDER_CONSUMER_SIGNALS = ['b2c', 'consumer', 'marketplace', 'p2p', 'social']
+PROVIDER_ENTERPRISE_SIGNALS = ['enterprise', 'b2b', 'saas', 'platform', 'api', 'infrastructure',
+                               'automation', 'analytics', 'security', 'compliance']
+
+# Hard exclusions applied before any scoring (should_exclude)
+CRITICAL_EXCLUSIONS = [
+    # Consumer apps
+    'b2c app', 'consumer app only', 'mobile app for consumers',
+    # Social & Dating
+    'dating app', 'dating platform', 'matchmaking service',
+    'social network', 'social media app', 'influencer platform',
+    # Food & Delivery
+    'food delivery app', 'restaurant delivery', 'meal kit delivery',
+    'grocery delivery app', 'food ordering app',
+    # Entertainment & Gaming
+    'mobile game', 'gaming app', 'video game', 'esports platform',
+    'streaming service', 'music app', 'video platform',
+    # E-commerce & Marketplaces (pure consumer)
+    'consumer marketplace', 'online shopping app', 'retail app',
+    'fashion marketplace', 'beauty products'
+]
+CONSUMER_ONLY_INDICATORS = [
+    'b2c', 'consumer', 'marketplace', 'retail', 'shopping',
+    'gaming', 'entertainment', 'social network', 'dating'
+]
+ENTERPRISE_INDICATORS = [
+    'b2b', 'enterprise', 'saas', 'platform', 'api',
+    'infrastructure', 'developer', 'automation', 'analytics'
+]
+
+# Every rule's keyword lists, matched in a single scan of a startup's text
+RULE_KEYWORD_GROUPS = KeywordGroups({
+    **{f"rule_{n}.{tier}": keywords[tier]
+       for n, keywords in enumerate([RULE_1_KEYWORDS, RULE_2_KEYWORDS, RULE_3_KEYWORDS,
+                                     RULE_4_KEYWORDS, RULE_5_KEYWORDS], 1)
+       for tier in ('primary', 'secondary')},
+    'insurance_specific': INSURANCE_SPECIFIC_KEYWORDS,
+})
+PROVIDER_HARD_EXCLUSION_MATCHER = KeywordMatcher(PROVIDER_HARD_EXCLUSIONS)
+CRITICAL_EXCLUSION_MATCHER = KeywordMatcher(CRITICAL_EXCLUSIONS)
+
 
 # ============================================================================
 # FUNDING & SIZE SCORING (NEW - Enhanced)
@@ -346,9 +414,7 @@ def text_search(text: str, keywords: List[str]) -> int:
     """Search for keywords in text, return count of matches"""
     if not text:
         return 0
-    text_lower = text.lower()
-    count = sum(1 for keyword in keywords if keyword.lower() in text_lower)
-    return count
+    return compile_keywords(keywords).count(text)
 
 
 def get_search_text(startup: Dict) -> str:
@@ -356,6 +422,12 @@ def get_search_text(startup: Dict) -> str:
     return f"{startup.get('company_description', '')} {startup.get('shortDescription', '')} {' '.join(startup.get('topics', []) or [])}"
 
 
+@lru_cache(maxsize=4096)
+def rule_keyword_hits(search_text: str) -> Dict[str, List[str]]:
+    """Matched keywords per rule list; all five rules share one scan of the text"""
+    return RULE_KEYWORD_GROUPS.match(search_text)
+
+
 # ============================================================================
 # MCP ENRICHMENT (Enhanced with database queries)
 # ============================================================================
@@ -367,8 +439,7 @@ async def enrich_startup_with_mcp(startup: Dict, use_mcp: bool = False) -> Dict:
     Attempts to:
     - Get verified funding amounts
     - Retrieve current employee counts
-    - Access company enrichment data
-    - Fetch growth metrics
+    - Access company enrichment data (team, tech stack, social media)
     """
     
     if not use_mcp or not HAS_MCP or MCP_TOOLS is None:
@@ -380,39 +451,35 @@ async def enrich_startup_with_mcp(startup: Dict, use_mcp: bool = False) -> Dict:
             return startup
         
         # Query MCP for enriched data
-        enrichment_data = await MCP_TOOLS._get_enrichment_data(company_name)
+        enrichment_data = await MCP_TOOLS._get_startup_enrichment_data(company_name=company_name)
         
-        if enrichment_data:
-            startup['mcp_enriched'] = enrichment_data
-            
-            # Update funding if we found better data
-            if enrichment_data.get('total_funding'):
+        if enrichment_data.get('success'):
+            startup['mcp_enriched'] = {k: v for k, v in enrichment_data.items() if k != 'success'}
+        
+        # Also try direct detail lookup
+        details = await MCP_TOOLS._get_startup_details(company_name=company_name)
+        record = details.get('startup') if details.get('success') else None
+        
+        if record:
+            # Update funding if the database has it
+            if record.get('totalFunding') is not None:
                 try:
-                    verified_funding = float(enrichment_data['total_funding'])
-                    startup['totalFunding'] = verified_funding
+                    startup['totalFunding'] = float(record['totalFunding'])
                     startup['funding_verified'] = True
                 except (ValueError, TypeError):
                     pass
             
-            # Add insights if available
-            if enrichment_data.get('insights'):
-                startup['company_insights'] = enrichment_data['insights']
-        
-        # Also try direct detail lookup
-        details = await MCP_TOOLS._get_startup_details(company_name)
-        
-        if details:
             # Update with more accurate employee data
-            if details.get('employees'):
+            if record.get('employees'):
                 try:
-                    emp_count = int(details['employees'])
+                    emp_count = int(record['employees'])
                     startup['employee_count_verified'] = emp_count
                 except (ValueError, TypeError):
                     pass
             
             # Update website if missing
-            if not startup.get('website') and details.get('website'):
-                startup['website'] = details['website']
+            if not startup.get('website') and record.get('website'):
+                startup['website'] = record['website']
     
     except Exception as e:
         logger.debug(f"MCP enrichment failed for {startup.get('company_name')}: {e}")
@@ -430,7 +497,7 @@ def init_mcp_tools() -> bool:
         return False
     
     try:
-        MCP_TOOLS = StartupDatabaseMCPTools()
+        MCP_TOOLS = get_startup_tools()
         logger.info("MCP tools initialized")
         return True
     except Exception as e:
@@ -442,12 +509,44 @@ def init_mcp_tools() -> bool:
 # RULE MATCHING (Enhanced with LLM analysis)
 # ============================================================================
 
+def rule_1_llm_prompt(startup: Dict) -> str:
+    """Prompt asking the LLM to confirm a Rule 1 keyword match"""
+    return f"""Assess if this startup matches "Agentic Platform Enablers" (AI infrastructure, MLOps, agent orchestration, observability):
+            
+Company: {startup.get('company_name', 'Unknown')}
+Description: {startup.get('company_description', '')[:500]}
+Website: {startup.get('website', 'N/A')}
+
+Respond ONLY with JSON: {{"matches": true/false, "confidence": 0-100}}"""
+
+
+def parse_rule_1_llm_response(response, matches: bool, confidence: int) -> Tuple[bool, int]:
+    """(matches, confidence) from the LLM's JSON answer; the keyword result if there is none"""
+    if response and hasattr(response, 'choices'):
+        content = response.choices[0].message.content
+        
+        # Extract JSON from response (may be wrapped in markdown code blocks)
+        json_str = content.strip()
+        if json_str.startswith('```'):
+            # Remove markdown code blocks
+            json_str = json_str.split('```')[1]
+            if json_str.startswith('json\n'):
+                json_str = json_str[5:]
+            json_str = json_str.split('```')[0]
+        
+        result = json.loads(json_str)
+        confidence = int(result.get('confidence', confidence))
+        matches = result.get('matches', matches)
+    return matches, confidence
+
+
 def matches_rule_1(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, List[str]]:
     """Rule 1: Agentic Platform Enablers"""
     search_text = get_search_text(startup)
+    hits = rule_keyword_hits(search_text)
     
-    primary_matches = text_search(search_text, RULE_1_KEYWORDS['primary'])
-    secondary_matches = text_search(search_text, RULE_1_KEYWORDS['secondary'])
+    primary_matches = len(hits['rule_1.primary'])
+    secondary_matches = len(hits['rule_1.secondary'])
     
     # Base matching
     matches = primary_matches >= 1 or secondary_matches >= 2
@@ -457,45 +556,17 @@ def matches_rule_1(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, Lis
     if use_llm and HAS_LLM and matches:
         try:
             model = get_nvidia_nim_model() if is_nvidia_nim_configured() else None
-            prompt = f"""Assess if this startup matches "Agentic Platform Enablers" (AI infrastructure, MLOps, agent orchestration, observability):
-            
-Company: {startup.get('company_name', 'Unknown')}
-Description: {startup.get('company_description', '')[:500]}
-Website: {startup.get('website', 'N/A')}
-
-Respond ONLY with JSON: {{"matches": true/false, "confidence": 0-100}}"""
-            
             response = llm_completion_sync(
-                [{"role": "user", "content": prompt}],
+                [{"role": "user", "content": rule_1_llm_prompt(startup)}],
                 model=model
             )
-            
-            if response and hasattr(response, 'choices'):
-                content = response.choices[0].message.content
-                
-                # Extract JSON from response (may be wrapped in markdown code blocks)
-                json_str = content.strip()
-                if json_str.startswith('```'):
-                    # Remove markdown code blocks
-                    json_str = json_str.split('```')[1]
-                    if json_str.startswith('json\n'):
-                        json_str = json_str[5:]
-                    json_str = json_str.split('```')[0]
-                
-                result = json.loads(json_str)
-                old_confidence = confidence
-                confidence = int(result.get('confidence', confidence))
-                matches = result.get('matches', matches)
-                
-                logger.debug(f"{startup.get('company_name')} - Rule 1: confidence {old_confidence}->{confidence}")
+            old_confidence = confidence
+            matches, confidence = parse_rule_1_llm_response(response, matches, confidence)
+            logger.debug(f"{startup.get('company_name')} - Rule 1: confidence {old_confidence}->{confidence}")
         except Exception as e:
             logger.debug(f"LLM assessment failed for Rule 1: {e}")
     
-    matched_keywords = []
-    text_lower = search_text.lower()
-    for kw in RULE_1_KEYWORDS['primary']:
-        if kw in text_lower:
-            matched_keywords.append(kw)
+    matched_keywords = hits['rule_1.primary']
     
     return matches, confidence, matched_keywords[:5]
 
@@ -503,22 +574,19 @@ Respond ONLY with JSON: {{"matches": true/false, "confidence": 0-100}}"""
 def matches_rule_2(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, List[str]]:
     """Rule 2: Agentic Service Providers (Non-Insurance)"""
     search_text = get_search_text(startup)
+    hits = rule_keyword_hits(search_text)
     
     # Exclude if insurance-specific
-    if text_search(search_text, ['insurance', 'insurtech', 'claims', 'underwriting']) > 0:
+    if hits['insurance_specific']:
         return False, 0, []
     
-    primary_matches = text_search(search_text, RULE_2_KEYWORDS['primary'])
-    secondary_matches = text_search(search_text, RULE_2_KEYWORDS['secondary'])
+    primary_matches = len(hits['rule_2.primary'])
+    secondary_matches = len(hits['rule_2.secondary'])
     
     matches = primary_matches >= 1 or secondary_matches >= 3
     confidence = min(100, (primary_matches * 25) + (secondary_matches * 8))
     
-    matched_keywords = []
-    text_lower = search_text.lower()
-    for kw in RULE_2_KEYWORDS['primary']:
-        if kw in text_lower:
-            matched_keywords.append(kw)
+    matched_keywords = hits['rule_2.primary']
     
     return matches, confidence, matched_keywords[:5]
 
@@ -526,18 +594,15 @@ def matches_rule_2(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, Lis
 def matches_rule_3(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, List[str]]:
     """Rule 3: Insurance-Specific Solutions"""
     search_text = get_search_text(startup)
+    hits = rule_keyword_hits(search_text)
     
-    primary_matches = text_search(search_text, RULE_3_KEYWORDS['primary'])
-    secondary_matches = text_search(search_text, RULE_3_KEYWORDS['secondary'])
+    primary_matches = len(hits['rule_3.primary'])
+    secondary_matches = len(hits['rule_3.secondary'])
     
     matches = primary_matches >= 1 or secondary_matches >= 2
     confidence = min(100, (primary_matches * 35) + (secondary_matches * 12))
     
-    matched_keywords = []
-    text_lower = search_text.lower()
-    for kw in RULE_3_KEYWORDS['primary']:
-        if kw in text_lower:
-            matched_keywords.append(kw)
+    matched_keywords = hits['rule_3.primary']
     
     return matches, confidence, matched_keywords[:5]
 
@@ -545,18 +610,15 @@ def matches_rule_3(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, Lis
 def matches_rule_4(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, List[str]]:
     """Rule 4: Health Innovations (Insurance Applicable)"""
     search_text = get_search_text(startup)
+    hits = rule_keyword_hits(search_text)
     
-    primary_matches = text_search(search_text, RULE_4_KEYWORDS['primary'])
-    secondary_matches = text_search(search_text, RULE_4_KEYWORDS['secondary'])
+    primary_matches = len(hits['rule_4.primary'])
+    secondary_matches = len(hits['rule_4.secondary'])
     
     matches = primary_matches >= 1 or secondary_matches >= 2
     confidence = min(100, (primary_matches * 30) + (secondary_matches * 10))
     
-    matched_keywords = []
-    text_lower = search_text.lower()
-    for kw in RULE_4_KEYWORDS['primary']:
-        if kw in text_lower:
-            matched_keywords.append(kw)
+    matched_keywords = hits['rule_4.primary']
     
     return matches, confidence, matched_keywords[:5]
 
@@ -564,63 +626,42 @@ def matches_rule_4(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, Lis
 def matches_rule_5(startup: Dict, use_llm: bool = False) -> Tuple[bool, int, List[str]]:
     """Rule 5: Development & Legacy Modernization"""
     search_text = get_search_text(startup)
+    hits = rule_keyword_hits(search_text)
     
-    primary_matches = text_search(search_text, RULE_5_KEYWORDS['primary'])
-    secondary_matches = text_search(search_text, RULE_5_KEYWORDS['secondary'])
+    primary_matches = len(hits['rule_5.primary'])
+    secondary_matches = len(hits['rule_5.secondary'])
     
     matches = primary_matches >= 1 or secondary_matches >= 3
     confidence = min(100, (primary_matches * 30) + (secondary_matches * 10))
     
-    matched_keywords = []
-    text_lower = search_text.lower()
-    for kw in RULE_5_KEYWORDS['primary']:
-        if kw in text_lower:
-            matched_keywords.append(kw)
+    matched_keywords = hits['rule_5.primary']
     
     return matches, confidence, matched_keywords[:5]
 
 
-def can_be_axa_provider(startup: Dict, use_llm: bool = False) -> Tuple[bool, str]:
+def provider_keyword_verdict(startup: Dict, use_llm: bool = False) -> Optional[Tuple[bool, str]]:
     """
-    Check if a startup can potentially be used as a provider for AXA
-    
-    Uses NVIDIA NIM (DeepSeek-R1) for intelligent B2B viability assessment.
+    Keyword part of can_be_axa_provider
     
     Returns:
-        (is_viable_provider, reason)
+        (is_viable_provider, reason), or None when the LLM should decide
     """
     company_name = startup.get('company_name', startup.get('name', 'Unknown'))
     description = startup.get('company_description', startup.get('description', ''))
     industry = startup.get('primary_industry', '')
-    business_types = startup.get('business_types', '')
     topics = startup.get('topics', [])
-    website = startup.get('website', '')
     
     # First pass: Hard exclusions (obvious B2C/consumer)
     search_text = f"{company_name} {description} {industry} {' '.join(topics)}".lower()
     
-    hard_exclusions = [
-        'dating app', 'dating platform', 'matchmaking app',
-        'food delivery', 'restaurant delivery', 'meal delivery',
-        'social network', 'social media platform', 'influencer platform',
-        'consumer marketplace', 'e-commerce platform', 'online shopping',
-        'mobile game', 'gaming platform', 'game developer',
-        'music streaming', 'video streaming', 'entertainment platform',
-        'consumer app', 'b2c only', 'direct to consumer only'
-    ]
-    
-    for exclusion in hard_exclusions:
-        if exclusion in search_text:
-            return False, f"Hard exclusion: {exclusion}"
+    exclusion = PROVIDER_HARD_EXCLUSION_MATCHER.first(search_text)
+    if exclusion:
+        return False, f"Hard exclusion: {exclusion}"
     
     if not use_llm or not HAS_LLM:
         # Without LLM, use stricter keyword-based filtering
-        consumer_signals = ['b2c', 'consumer', 'marketplace', 'p2p', 'social']
-        consumer_count = sum(1 for sig in consumer_signals if sig in search_text)
-        
-        enterprise_signals = ['enterprise', 'b2b', 'saas', 'platform', 'api', 'infrastructure', 
-                             'automation', 'analytics', 'security', 'compliance']
-        enterprise_count = sum(1 for sig in enterprise_signals if sig in search_text)
+        consumer_count = text_search(search_text, PROVIDER_CONSUMER_SIGNALS)
+        enterprise_count = text_search(search_text, PROVIDER_ENTERPRISE_SIGNALS)
         
         # Must have enterprise signals or very few consumer signals
         if enterprise_count >= 2 or consumer_count == 0:
@@ -630,9 +671,19 @@ def can_be_axa_provider(startup: Dict, use_llm: bool = False) -> Tuple[bool, str
         
         return True, "Neutral - needs LLM assessment"
     
-    # Use NVIDIA NIM for intelligent assessment
-    try:
-        assessment_prompt = f"""You are an expert analyst evaluating B2B technology vendors for AXA, a global insurance corporation with 140,000+ employees.
+    return None
+
+
+def provider_llm_prompt(startup: Dict) -> str:
+    """B2B viability prompt for the provider assessment"""
+    company_name = startup.get('company_name', startup.get('name', 'Unknown'))
+    description = startup.get('company_description', startup.get('description', ''))
+    industry = startup.get('primary_industry', '')
+    business_types = startup.get('business_types', '')
+    topics = startup.get('topics', [])
+    website = startup.get('website', '')
+    
+    return f"""You are an expert analyst evaluating B2B technology vendors for AXA, a global insurance corporation with 140,000+ employees.
 
 STARTUP TO EVALUATE:
 Company: {company_name}
@@ -675,84 +726,106 @@ Format exactly as:
 DECISION: [VIABLE or NOT_VIABLE]
 CONFIDENCE: [number]
 REASON: [explanation]"""
+
+
+def parse_provider_llm_response(response, company_name: str) -> Tuple[bool, str]:
+    """(is_viable_provider, reason) from the LLM's DECISION / CONFIDENCE / REASON answer"""
+    # Extract and parse response
+    if response and hasattr(response, 'choices'):
+        message = response.choices[0].message
+        content = message.content if message.content else ""
         
+        # DeepSeek-R1 may put reasoning separate
+        if hasattr(message, 'reasoning_content') and message.reasoning_content:
+            reasoning = message.reasoning_content
+            # Use reasoning if content is empty
+            if not content:
+                content = reasoning
+        
+        if not content:
+            logger.warning(f"Empty LLM response for {company_name} - defaulting to NOT VIABLE")
+            return False, "LLM returned empty response - conservative exclusion"
+    else:
+        logger.warning(f"Invalid LLM response structure for {company_name}")
+        return False, "LLM error - conservative exclusion"
+    
+    # Parse structured response
+    lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
+    decision = None
+    confidence = 0
+    reason = "LLM assessment"
+    
+    for line in lines:
+        if 'DECISION:' in line.upper():
+            decision_text = line.split(':', 1)[1].strip().upper()
+            decision = 'VIABLE' in decision_text and 'NOT' not in decision_text
+        elif 'CONFIDENCE:' in line.upper():
+            try:
+                conf_str = line.split(':', 1)[1].strip()
+                # Extract just the number
+                confidence = int(''.join(filter(str.isdigit, conf_str)))
+            except Exception as e:
+                logger.debug(f"Failed to parse confidence: {e}")
+                confidence = 50
+        elif 'REASON:' in line.upper():
+            reason = line.split(':', 1)[1].strip()
+    
+    # Validation and decision logic
+    if decision is None:
+        # Try to infer from content
+        content_lower = content.lower()
+        if 'not viable' in content_lower or 'not_viable' in content_lower:
+            decision = False
+            confidence = 75
+        elif 'viable' in content_lower:
+            decision = True
+            confidence = 70
+        else:
+            # No clear decision - be conservative
+            logger.warning(f"Could not parse decision for {company_name}, defaulting to NOT VIABLE")
+            return False, f"LLM unclear - excluded for safety. Response: {content[:100]}"
+    
+    # Apply confidence thresholds
+    if decision and confidence >= 70:
+        return True, reason
+    elif not decision and confidence >= 70:
+        return False, reason
+    elif not decision and confidence >= 50:
+        # Moderately confident NOT viable - exclude
+        return False, f"{reason} (moderate confidence exclusion)"
+    elif decision and confidence < 50:
+        # Low confidence viable - be conservative, exclude
+        return False, f"Low confidence match - {reason}"
+    else:
+        # Ambiguous - default to exclusion for quality
+        return False, f"Uncertain assessment (conf={confidence}) - {reason}"
+
+
+def can_be_axa_provider(startup: Dict, use_llm: bool = False) -> Tuple[bool, str]:
+    """
+    Check if a startup can potentially be used as a provider for AXA
+    
+    Uses NVIDIA NIM (DeepSeek-R1) for intelligent B2B viability assessment.
+    
+    Returns:
+        (is_viable_provider, reason)
+    """
+    verdict = provider_keyword_verdict(startup, use_llm=use_llm)
+    if verdict is not None:
+        return verdict
+    
+    company_name = startup.get('company_name', startup.get('name', 'Unknown'))
+    
+    # Use NVIDIA NIM for intelligent assessment
+    try:
         model = get_nvidia_nim_model() if is_nvidia_nim_configured() else None
         response = llm_completion_sync(
-            [{"role": "user", "content": assessment_prompt}],
+            [{"role": "user", "content": provider_llm_prompt(startup)}],
             model=model,
             max_tokens=300,
             temperature=0.3  # Lower temperature for more consistent evaluation
         )
-        
-        # Extract and parse response
-        if response and hasattr(response, 'choices'):
-            message = response.choices[0].message
-            content = message.content if message.content else ""
-            
-            # DeepSeek-R1 may put reasoning separate
-            if hasattr(message, 'reasoning_content') and message.reasoning_content:
-                reasoning = message.reasoning_content
-                # Use reasoning if content is empty
-                if not content:
-                    content = reasoning
-            
-            if not content:
-                logger.warning(f"Empty LLM response for {company_name} - defaulting to NOT VIABLE")
-                return False, "LLM returned empty response - conservative exclusion"
-        else:
-            logger.warning(f"Invalid LLM response structure for {company_name}")
-            return False, "LLM error - conservative exclusion"
-        
-        # Parse structured response
-        lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
-        decision = None
-        confidence = 0
-        reason = "LLM assessment"
-        
-        for line in lines:
-            if 'DECISION:' in line.upper():
-                decision_text = line.split(':', 1)[1].strip().upper()
-                decision = 'VIABLE' in decision_text and 'NOT' not in decision_text
-            elif 'CONFIDENCE:' in line.upper():
-                try:
-                    conf_str = line.split(':', 1)[1].strip()
-                    # Extract just the number
-                    confidence = int(''.join(filter(str.isdigit, conf_str)))
-                except Exception as e:
-                    logger.debug(f"Failed to parse confidence: {e}")
-                    confidence = 50
-            elif 'REASON:' in line.upper():
-                reason = line.split(':', 1)[1].strip()
-        
-        # Validation and decision logic
-        if decision is None:
-            # Try to infer from content
-            content_lower = content.lower()
-            if 'not viable' in content_lower or 'not_viable' in content_lower:
-                decision = False
-                confidence = 75
-            elif 'viable' in content_lower:
-                decision = True
-                confidence = 70
-            else:
-                # No clear decision - be conservative
-                logger.warning(f"Could not parse decision for {company_name}, defaulting to NOT VIABLE")
-                return False, f"LLM unclear - excluded for safety. Response: {content[:100]}"
-        
-        # Apply confidence thresholds
-        if decision and confidence >= 70:
-            return True, reason
-        elif not decision and confidence >= 70:
-            return False, reason
-        elif not decision and confidence >= 50:
-            # Moderately confident NOT viable - exclude
-            return False, f"{reason} (moderate confidence exclusion)"
-        elif decision and confidence < 50:
-            # Low confidence viable - be conservative, exclude
-            return False, f"Low confidence match - {reason}"
-        else:
-            # Ambiguous - default to exclusion for quality
-            return False, f"Uncertain assessment (conf={confidence}) - {reason}"
+        return parse_provider_llm_response(response, company_name)
         
     except Exception as e:
         logger.warning(f"LLM provider assessment failed for {company_name}: {e}")
@@ -774,27 +847,10 @@ def should_exclude(startup: Dict, use_llm: bool = False) -> bool:
     company_name = startup.get('company_name', '').lower()
     
     # Hard exclusions - obvious consumer/B2C companies
-    critical_exclusions = [
-        # Consumer apps
-        'b2c app', 'consumer app only', 'mobile app for consumers',
-        # Social & Dating
-        'dating app', 'dating platform', 'matchmaking service',
-        'social network', 'social media app', 'influencer platform',
-        # Food & Delivery
-        'food delivery app', 'restaurant delivery', 'meal kit delivery',
-        'grocery delivery app', 'food ordering app',
-        # Entertainment & Gaming
-        'mobile game', 'gaming app', 'video game', 'esports platform',
-        'streaming service', 'music app', 'video platform',
-        # E-commerce & Marketplaces (pure consumer)
-        'consumer marketplace', 'online shopping app', 'retail app',
-        'fashion marketplace', 'beauty products'
-    ]
-    
-    for exclusion in critical_exclusions:
-        if exclusion in search_text or exclusion in company_name:
-            logger.debug(f"Hard exclusion: {startup.get('company_name')} - {exclusion}")
-            return True
+    exclusion = CRITICAL_EXCLUSION_MATCHER.first(search_text) or CRITICAL_EXCLUSION_MATCHER.first(company_name)
+    if exclusion:
+        logger.debug(f"Hard exclusion: {startup.get('company_name')} - {exclusion}")
+        return True
     
     # Use LLM for intelligent provider viability assessment
     if use_llm:
@@ -805,18 +861,8 @@ def should_exclude(startup: Dict, use_llm: bool = False) -> bool:
         return False
     else:
         # Without LLM, use more conservative keyword-based exclusion
-        consumer_only_indicators = [
-            'b2c', 'consumer', 'marketplace', 'retail', 'shopping',
-            'gaming', 'entertainment', 'social network', 'dating'
-        ]
-        
-        enterprise_indicators = [
-            'b2b', 'enterprise', 'saas', 'platform', 'api',
-            'infrastructure', 'developer', 'automation', 'analytics'
-        ]
-        
-        consumer_count = sum(1 for ind in consumer_only_indicators if ind in search_text)
-        enterprise_count = sum(1 for ind in enterprise_indicators if ind in search_text)
+        consumer_count = text_search(search_text, CONSUMER_ONLY_INDICATORS)
+        enterprise_count = text_search(search_text, ENTERPRISE_INDICATORS)
         
         # Exclude if strong consumer signals and no enterprise signals
         if consumer_count >= 3 and enterprise_count == 0:
@@ -831,7 +877,8 @@ def should_exclude(startup: Dict, use_llm: bool = False) -> bool:
 # ENHANCED SCORING
 # ============================================================================
 
-def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False) -> Dict:
+def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False,
+                                 llm_assessment: Optional[Dict] = None) -> Dict:
     """
     Calculate comprehensive AXA priority score with funding and size emphasis
     
@@ -843,8 +890,15 @@ def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False) -> Dict:
     - Maturity: 0-10 points
     
     Total: 0-125 points (normalized to 0-100)
+    
+    llm_assessment: LLM verdicts already fetched by assess_startup_llm
+    ({'rule_1': (matches, confidence), 'provider': (viable, reason)});
+    when given, no LLM call is made here
     """
     
+    if llm_assessment is not None:
+        use_llm = True
+    
     # Check hard exclusions only (not LLM)
     if should_exclude(startup, use_llm=False):
         return {
@@ -878,7 +932,9 @@ def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False) -> Dict:
     }
     
     for rule_name, (rule_func, base_score) in rules.items():
-        matches, confidence, keywords = rule_func(startup, use_llm=use_llm)
+        matches, confidence, keywords = rule_func(startup, use_llm=use_llm and llm_assessment is None)
+        if rule_func is matches_rule_1 and llm_assessment and llm_assessment.get('rule_1'):
+            matches, confidence = llm_assessment['rule_1']
         if matches:
             rule_matches.append(rule_name)
             score = int(base_score * (confidence / 100))
@@ -902,7 +958,10 @@ def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False) -> Dict:
     llm_adjustment = 0
     if use_llm and len(rule_matches) > 0:
         # Only use LLM for edge cases that already have some rule matches
-        can_be_provider, reason = can_be_axa_provider(startup, use_llm=True)
+        if llm_assessment is not None and 'provider' in llm_assessment:
+            can_be_provider, reason = llm_assessment['provider']
+        else:
+            can_be_provider, reason = can_be_axa_provider(startup, use_llm=True)
         if can_be_provider:
             llm_adjustment = 15  # Bonus for LLM confirmation
         else:
@@ -955,12 +1014,134 @@ def calculate_axa_score_enhanced(startup: Dict, use_llm: bool = False) -> Dict:
     }
 
 
+# ============================================================================
+# PARALLEL EXECUTION
+# ============================================================================
+
+def _score_chunk(chunk: List[Dict]) -> List[Dict]:
+    """Local (no LLM) scores for one chunk; runs in a worker process"""
+    return [calculate_axa_score_enhanced(startup, use_llm=False) for startup in chunk]
+
+
+def score_startups_local(startups: List[Dict], workers: Optional[int] = None,
+                         chunk_size: int = LOCAL_SCORING_CHUNK_SIZE) -> List[Dict]:
+    """Local scores for every startup, in input order
+    
+    Scoring is CPU-bound (keyword scans, funding / employee parsing), so with
+    more than one worker the startups are split into chunks and scored
+    across a process pool.
+    
+    Args:
+        startups: List of startup dictionaries
+        workers: Worker processes (default: all cores; 1 scores in-process)
+        chunk_size: Startups sent to a worker at a time
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [startups[i:i + chunk_size] for i in range(0, len(startups), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        return [scoring for chunk in chunks for scoring in _score_chunk(chunk)]
+    
+    scorings = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for i, chunk_scorings in enumerate(pool.map(_score_chunk, chunks), 1):
+            scorings.extend(chunk_scorings)
+            if i % max(1, len(chunks) // 5) == 0:
+                logger.info(f"  Scored {len(scorings)}/{len(startups)} startups")
+    return scorings
+
+
+async def _rate_limited(limiter: RateLimiter):
+    """Wait for a token from the limiter shared by every LLM request"""
+    while not limiter.acquire():
+        await asyncio.sleep(limiter.wait_time())
+
+
+async def assess_startup_llm(startup: Dict, limiter: RateLimiter) -> Dict:
+    """LLM verdicts for one startup (Rule 1 confirmation and provider viability)
+    
+    Returns:
+        llm_assessment for calculate_axa_score_enhanced
+    """
+    model = get_nvidia_nim_model() if is_nvidia_nim_configured() else None
+    company_name = startup.get('company_name', startup.get('name', 'Unknown'))
+    assessment = {}
+    
+    rule_1_matches, rule_1_confidence, _ = matches_rule_1(startup, use_llm=False)
+    if rule_1_matches:
+        try:
+            await _rate_limited(limiter)
+            response = await llm_completion([{"role": "user", "content": rule_1_llm_prompt(startup)}], model=model)
+            assessment['rule_1'] = parse_rule_1_llm_response(response, rule_1_matches, rule_1_confidence)
+        except Exception as e:
+            logger.debug(f"LLM assessment failed for Rule 1: {e}")
+    
+    verdict = provider_keyword_verdict(startup, use_llm=True)
+    if verdict is None:
+        try:
+            await _rate_limited(limiter)
+            response = await llm_completion(
+                [{"role": "user", "content": provider_llm_prompt(startup)}],
+                model=model,
+                max_tokens=300,
+                temperature=0.3
+            )
+            verdict = parse_provider_llm_response(response, company_name)
+        except Exception as e:
+            logger.warning(f"LLM provider assessment failed for {company_name}: {e}")
+            verdict = (False, "LLM assessment error - excluded for quality control")
+    assessment['provider'] = verdict
+    return assessment
+
+
+async def validate_candidates_async(candidates: List[Dict], max_parallel: int = LLM_MAX_PARALLEL,
+                                    requests_per_minute: int = LLM_REQUESTS_PER_MINUTE) -> List[Dict]:
+    """Re-score candidates with LLM verdicts, max_parallel at a time under one shared rate limit"""
+    limiter = RateLimiter(calls=requests_per_minute, period=60.0)
+    semaphore = asyncio.Semaphore(max_parallel)
+    start_time = time.time()
+    completed = 0
+    
+    async def validate(startup: Dict) -> Dict:
+        nonlocal completed
+        async with semaphore:
+            try:
+                assessment = await assess_startup_llm(startup, limiter)
+                startup['axa_scoring'] = calculate_axa_score_enhanced(startup, llm_assessment=assessment)
+            except Exception as e:
+                logger.debug(f"LLM validation failed for {startup.get('company_name', 'Unknown')}: {e}")
+        completed += 1
+        if completed % max(1, len(candidates) // 5) == 0:
+            elapsed = time.time() - start_time
+            rate = completed / elapsed if elapsed > 0 else 0
+            remaining = (len(candidates) - completed) / rate if rate > 0 else 0
+            logger.info(f"    {completed}/{len(candidates)} ({100*completed/len(candidates):.0f}%) - "
+                        f"Rate: {rate:.1f}/sec, ETA: {remaining:.0f}s")
+        return startup
+    
+    return list(await asyncio.gather(*(validate(c) for c in candidates)))
+
+
+async def enrich_startups_with_mcp(startups: List[Dict], max_parallel: int = 10) -> List[Dict]:
+    """MCP enrichment for every startup, max_parallel at a time"""
+    semaphore = asyncio.Semaphore(max_parallel)
+    
+    async def enrich(startup: Dict) -> Dict:
+        async with semaphore:
+            return await enrich_startup_with_mcp(startup, use_mcp=True)
+    
+    return list(await asyncio.gather(*(enrich(s) for s in startups)))
+
+
 def filter_startups_enhanced(startups: List[Dict], min_score: int = 50, 
                             use_llm: bool = False,
                             use_mcp: bool = False,
                             specific_rule: Optional[int] = None,
                             batch_size: int = 5,
-                            max_parallel_llm: int = 3) -> Tuple[List[Dict], Dict]:
+                            max_parallel_llm: int = LLM_MAX_PARALLEL,
+                            workers: Optional[int] = None,
+                            chunk_size: int = LOCAL_SCORING_CHUNK_SIZE,
+                            llm_requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+                            timings: Optional[Dict[str, float]] = None) -> Tuple[List[Dict], Dict]:
     """Filter and score startups with enhanced criteria and batch LLM processing
     
     Args:
@@ -969,42 +1150,35 @@ def filter_startups_enhanced(startups: List[Dict], min_score: int = 50,
         use_llm: Enable NVIDIA NIM analysis
         use_mcp: Enable MCP enrichment
         specific_rule: Filter by specific rule
-        batch_size: Number of startups to process before LLM batch
+        batch_size: Unused (kept for callers passing it)
         max_parallel_llm: Max concurrent LLM requests
+        workers: Processes for local scoring (default: all cores)
+        chunk_size: Startups per process-pool task
+        llm_requests_per_minute: Rate limit shared by all LLM requests
+        timings: Optional dict filled with seconds per phase
     """
     
     filtered = []
     excluded = {'score_too_low': 0, 'excluded_keywords': 0, 'no_rules': 0}
+    timings = {} if timings is None else timings
+    started = time.perf_counter()
     
     # Initialize MCP if needed
-    if use_mcp:
-        init_mcp_tools()
+    if use_mcp and init_mcp_tools():
+        phase_start = time.perf_counter()
+        logger.info("Phase 0: MCP enrichment...")
+        startups = asyncio.run(enrich_startups_with_mcp(startups))
+        timings['mcp_enrichment'] = time.perf_counter() - phase_start
     
     # Phase 1: Quick local scoring for all startups
-    logger.info("Phase 1: Local scoring...")
-    candidates = []
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"Phase 1: Local scoring ({workers} worker{'s' if workers > 1 else ''})...")
+    phase_start = time.perf_counter()
+    scorings = score_startups_local(startups, workers=workers, chunk_size=chunk_size)
+    timings['local_scoring'] = time.perf_counter() - phase_start
     
-    for i, startup in enumerate(startups):
-        if i % 500 == 0 and i > 0:
-            logger.info(f"  Processed {i}/{len(startups)} startups")
-        
-        # MCP enrichment (optional)
-        if use_mcp and MCP_TOOLS:
-            try:
-                enrichment = MCP_TOOLS._get_enrichment_data(startup.get('company_name', ''))
-                if enrichment:
-                    startup['mcp_enriched'] = enrichment
-                    if enrichment.get('total_funding'):
-                        try:
-                            startup['totalFunding'] = float(enrichment['total_funding'])
-                        except:
-                            pass
-            except Exception as e:
-                logger.debug(f"MCP enrichment failed: {e}")
-        
-        # Quick local scoring (no LLM)
-        scoring = calculate_axa_score_enhanced(startup, use_llm=False)
-        
+    candidates = []
+    for startup, scoring in zip(startups, scorings):
         # Apply basic filters
         if scoring['tier'] == 'Excluded':
             excluded['excluded_keywords'] += 1
@@ -1031,7 +1205,10 @@ def filter_startups_enhanced(startups: List[Dict], min_score: int = 50,
     # Phase 2: Batch LLM analysis for high-value candidates (if enabled)
     if use_llm and len(candidates) > 0:
         logger.info("Phase 2: LLM-enhanced validation...")
-        filtered = batch_llm_validation(candidates, max_parallel=max_parallel_llm)
+        phase_start = time.perf_counter()
+        filtered = batch_llm_validation(candidates, max_parallel=max_parallel_llm,
+                                        requests_per_minute=llm_requests_per_minute)
+        timings['llm_validation'] = time.perf_counter() - phase_start
     else:
         filtered = candidates
     
@@ -1041,51 +1218,27 @@ def filter_startups_enhanced(startups: List[Dict], min_score: int = 50,
         x['axa_scoring'].get('funding', {}).get('amount_millions', 0)
     ), reverse=True)
     
+    timings['total'] = time.perf_counter() - started
+    logger.info("Timing: " + " | ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items()))
+    
     return filtered, excluded
 
 
-def batch_llm_validation(candidates: List[Dict], max_parallel: int = 3) -> List[Dict]:
+def batch_llm_validation(candidates: List[Dict], max_parallel: int = LLM_MAX_PARALLEL,
+                         requests_per_minute: int = LLM_REQUESTS_PER_MINUTE) -> List[Dict]:
     """Validate candidates using batch LLM processing
     
-    Uses concurrent requests to speed up validation
+    Runs the async LLM requests concurrently under a shared rate limit
     """
     
     if not HAS_LLM or not candidates:
         return candidates
     
-    logger.info(f"  Validating {len(candidates)} candidates with LLM (max {max_parallel} parallel)...")
-    
-    def validate_startup(startup):
-        """Re-score a startup using LLM for rule validation"""
-        try:
-            scoring = calculate_axa_score_enhanced(startup, use_llm=True)
-            startup['axa_scoring'] = scoring
-            return startup
-        except Exception as e:
-            logger.debug(f"LLM validation failed for {startup.get('company_name', 'Unknown')}: {e}")
-            return startup
+    logger.info(f"  Validating {len(candidates)} candidates with LLM "
+                f"(max {max_parallel} parallel, {requests_per_minute} requests/min)...")
     
     start_time = time.time()
-    validated = []
-    
-    # Use ThreadPoolExecutor for parallel LLM calls
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
-        # Submit all tasks
-        futures = {executor.submit(validate_startup, c): c for c in candidates}
-        
-        # Process as they complete
-        completed = 0
-        for future in concurrent.futures.as_completed(futures):
-            validated.append(future.result())
-            completed += 1
-            
-            if completed % max(1, len(candidates) // 5) == 0:
-                elapsed = time.time() - start_time
-                rate = completed / elapsed if elapsed > 0 else 0
-                remaining = (len(candidates) - completed) / rate if rate > 0 else 0
-                logger.info(f"    {completed}/{len(candidates)} ({100*completed/len(candidates):.0f}%) - "
-                           f"Rate: {rate:.1f}/sec, ETA: {remaining:.0f}s")
-    
+    validated = asyncio.run(validate_candidates_async(candidates, max_parallel, requests_per_minute))
     elapsed = time.time() - start_time
     logger.info(f"  LLM validation complete ({elapsed:.1f}s, {len(candidates)/elapsed:.1f} startups/sec)")
     
@@ -1123,6 +1276,14 @@ def main():
                         help='Show statistics')
     parser.add_argument('--csv', action='store_true',
                         help='Also export CSV summary')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processes for local scoring (default: all cores)')
+    parser.add_argument('--chunk-size', type=int, default=LOCAL_SCORING_CHUNK_SIZE,
+                        help=f'Startups per scoring task (default: {LOCAL_SCORING_CHUNK_SIZE})')
+    parser.add_argument('--llm-parallel', type=int, default=LLM_MAX_PARALLEL,
+                        help=f'Concurrent LLM requests (default: {LLM_MAX_PARALLEL})')
+    parser.add_argument('--llm-rpm', type=int, default=LLM_REQUESTS_PER_MINUTE,
+                        help=f'LLM requests per minute across all workers (default: {LLM_REQUESTS_PER_MINUTE})')
     
     args = parser.parse_args()
     
@@ -1158,11 +1319,17 @@ def main():
     if use_mcp:
         logger.info("  + MCP enrichment enabled")
     
+    timings = {}
     filtered, excluded = filter_startups_enhanced(
         startups, 
         args.min_score, 
         use_llm=use_llm,
-        use_mcp=use_mcp
+        use_mcp=use_mcp,
+        max_parallel_llm=args.llm_parallel,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        llm_requests_per_minute=args.llm_rpm,
+        timings=timings
     )
     
     logger.info(f"Filtered to {len(filtered)} startups ({100*len(filtered)/len(startups):.1f}%)")
@@ -1213,6 +1380,11 @@ def main():
         print(f"  10+ employees: {size_10_plus}/{len(filtered)} ({100*size_10_plus/len(filtered):.1f}%)")
         print(f"  50+ employees: {size_50_plus}/{len(filtered)} ({100*size_50_plus/len(filtered):.1f}%)")
         
+        # Phase timing
+        print(f"\n⏱️  TIMING:")
+        for phase, seconds in timings.items():
+            print(f"  {phase}: {seconds:.2f}s")
+        
         # Top 10
         print(f"\n🏆 TOP 10 STARTUPS BY SCORE:")
         for i, s in enumerate(filtered[:10], 1):
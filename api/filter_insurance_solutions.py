@@ -12,6 +12,8 @@ from datetime import datetime
 import os
 from pathlib import Path
 
+from keyword_matcher import KeywordGroups
+
 # LLM Integration
 from litellm import completion
 
@@ -114,6 +116,16 @@ class InsuranceSolutionFilter:
         'insurance', 'insurtech', 'financial services', 'fintech',
         'healthcare', 'healthtech', 'banking', 'risk management'
     ]
+
+    TECH_SIGNALS = ['ai', 'machine learning', 'artificial intelligence', 'automation', 'nlp', 'computer vision']
+    
+    # Every keyword list above, matched in a single scan of a startup's text
+    KEYWORD_GROUPS = KeywordGroups({
+        **{f"{category}.{tier}": config[tier]
+           for category, config in CATEGORY_KEYWORDS.items() for tier in ('primary', 'secondary')},
+        'industry': INDUSTRY_SIGNALS,
+        'tech': TECH_SIGNALS,
+    })
     
     TIERS = {
         4: {'min': 60, 'label': 'Core Insurance Solution'},
@@ -152,23 +164,14 @@ class InsuranceSolutionFilter:
             ' '.join(startup.get('tags', []))
         ]
         combined_text = ' '.join(text_fields).lower()
+        hits = self.KEYWORD_GROUPS.match(combined_text)
         
         # Score each category
         for category, config in self.CATEGORY_KEYWORDS.items():
-            cat_score = 0
-            matched = []
-            
-            # Primary keywords
-            for kw in config['primary']:
-                if kw.lower() in combined_text:
-                    cat_score += 8 * config['weight']
-                    matched.append(kw)
-            
-            # Secondary keywords
-            for kw in config['secondary']:
-                if kw.lower() in combined_text:
-                    cat_score += 2.5 * config['weight']
-                    matched.append(kw)
+            primary = hits[f"{category}.primary"]
+            secondary = hits[f"{category}.secondary"]
+            cat_score = (8 * len(primary) + 2.5 * len(secondary)) * config['weight']
+            matched = primary + secondary
             
             if cat_score > 0:
                 score_data['category_scores'][category] = round(cat_score, 1)
@@ -178,14 +181,12 @@ class InsuranceSolutionFilter:
             score_data['total_score'] += cat_score
         
         # Industry bonus
-        for industry_signal in self.INDUSTRY_SIGNALS:
-            if industry_signal in combined_text:
-                score_data['total_score'] += 5
-                score_data['reasoning'].append(f"Industry match: {industry_signal}")
+        for industry_signal in hits['industry']:
+            score_data['total_score'] += 5
+            score_data['reasoning'].append(f"Industry match: {industry_signal}")
         
         # Technology signals
-        tech_signals = ['ai', 'machine learning', 'artificial intelligence', 'automation', 'nlp', 'computer vision']
-        tech_count = sum(1 for sig in tech_signals if sig in combined_text)
+        tech_count = len(hits['tech'])
         if tech_count >= 2:
             score_data['total_score'] += 10
             score_data['reasoning'].append(f"Strong AI/ML signals ({tech_count} found)")
@@ -2,20 +2,219 @@
 Google Maps API Integration
 
 This module provides integration with Google Maps API for location and directions.
+
+Slush venues are a small, fixed set of places, so the same routes and
+places are asked for again and again. Responses are cached by their
+normalized request (endpoints + travel mode) with a per-kind TTL: an
+in-process LRU in front of the maps_cache table, so cached routes survive
+restarts and are shared by every worker. All requests go through one
+pooled aiohttp session, and identical lookups in flight share one request.
+
+Venue-to-venue routes can be fetched ahead of time:
+    python google_maps_integration.py --limit 30 --modes walking transit
 """
 
 import os
+import re
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
 import aiohttp
-from typing import Dict, Any, List, Optional, Tuple
-from urllib.parse import quote
+from sqlalchemy.exc import IntegrityError
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays fresh, per kind (transit follows timetables)
+CACHE_TTL_SECONDS = {
+    "directions": 7 * 24 * 3600,
+    "directions:transit": 24 * 3600,
+    "place": 30 * 24 * 3600,
+    "nearby": 24 * 3600,
+}
+MEMORY_CACHE_ENTRIES = 2048
+MAX_CONNECTIONS = 20
+REQUEST_TIMEOUT_SECONDS = 15
+
+
+def normalize_location(location: str) -> str:
+    """
+    Cache key form of an address / place name / "lat,lng"
+
+    Case, repeated whitespace, spacing around commas and surrounding
+    punctuation are ignored; coordinates are rounded to ~1m.
+    """
+    text = " ".join(str(location).split()).strip(" .;").casefold()
+    coords = re.fullmatch(r"(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)", text)
+    if coords:
+        return f"{float(coords.group(1)):.5f},{float(coords.group(2)):.5f}"
+    return re.sub(r"\s*,\s*", ", ", text)
+
+
+def route_key(origin: str, destination: str, mode: str = "walking", alternatives: bool = True) -> str:
+    return "|".join([mode.lower(), normalize_location(origin), normalize_location(destination),
+                     "alt" if alternatives else "single"])
+
+
+class MapsCache:
+    """Two-level TTL cache: in-process LRU in front of the maps_cache table"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None,
+                 ttl: Optional[Dict[str, int]] = None, max_entries: int = MEMORY_CACHE_ENTRIES):
+        """
+        Args:
+            session_factory: Returns a SQLAlchemy session; None keeps the cache in memory only
+            ttl: Seconds per kind (defaults to CACHE_TTL_SECONDS)
+            max_entries: In-process LRU bound
+        """
+        self.session_factory = session_factory
+        self.ttl = {**CACHE_TTL_SECONDS, **(ttl or {})}
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, kind: str, key: str = "") -> int:
+        mode = key.split("|", 1)[0]
+        return self.ttl.get(f"{kind}:{mode}", self.ttl.get(kind, 3600))
+
+    def _remember(self, kind: str, key: str, expires: float, payload: Dict[str, Any]):
+        self._memory[(kind, key)] = (expires, payload)
+        self._memory.move_to_end((kind, key))
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._memory.get((kind, key))
+        if entry is not None:
+            if entry[0] > time.time():
+                self._memory.move_to_end((kind, key))
+                self.hits += 1
+                return entry[1]
+            del self._memory[(kind, key)]
+
+        if self.session_factory is not None:
+            try:
+                db = self.session_factory()
+                try:
+                    row = db.query(models.MapsCacheEntry).filter_by(kind=kind, key=key).first()
+                    if row is not None and row.expires_at > datetime.utcnow():
+                        expires = time.time() + (row.expires_at - datetime.utcnow()).total_seconds()
+                        self._remember(kind, key, expires, row.payload)
+                        self.hits += 1
+                        return row.payload
+                finally:
+                    db.close()
+            except Exception as e:
+                logger.warning(f"Maps cache read failed: {e}")
+
+        self.misses += 1
+        return None
+
+    def put(self, kind: str, key: str, payload: Dict[str, Any]):
+        ttl = self.ttl_for(kind, key)
+        self._remember(kind, key, time.time() + ttl, payload)
+        if self.session_factory is None:
+            return
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        try:
+            db = self.session_factory()
+            try:
+                for attempt in range(2):
+                    row = db.query(models.MapsCacheEntry).filter_by(kind=kind, key=key).first()
+                    if row is None:
+                        db.add(models.MapsCacheEntry(kind=kind, key=key, payload=payload, expires_at=expires_at))
+                    else:
+                        row.payload, row.fetched_at, row.expires_at = payload, datetime.utcnow(), expires_at
+                    try:
+                        db.commit()
+                        break
+                    except IntegrityError:
+                        db.rollback()  # Another worker stored it first; update theirs
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"Maps cache write failed: {e}")
+
+    def clear(self):
+        self._memory.clear()
+        self.hits = self.misses = 0
+
+
+def _app_session():
+    from database import SessionLocal
+    return SessionLocal()
+
 
 class GoogleMapsAPI:
     """Google Maps API client for directions and location services"""
-    
-    def __init__(self, api_key: Optional[str] = None):
+
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[MapsCache] = None):
         self.api_key = api_key or os.getenv("GOOGLE_MAPS_API_KEY")
         self.base_url = "https://maps.googleapis.com/maps/api"
-    
+        self.cache = cache or MapsCache()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    async def _client(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session (recreated if the event loop changed)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET a Maps endpoint; non-200 answers come back as {"error": ...}"""
+        session = await self._client()
+        async with session.get(url, params={**params, "key": self.api_key}) as response:
+            if response.status == 200:
+                return await response.json()
+            return {"error": f"API error: {response.status}"}
+
+    async def _cached(self, kind: str, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Cached response for (kind, key), fetching it once if missing; concurrent
+        callers for the same key share the fetch. Errors are never cached.
+        """
+        cached = self.cache.get(kind, key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get((kind, key))
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[(kind, key)] = future
+        try:
+            try:
+                result = await fetch()
+            except Exception as e:
+                result = {"error": str(e)}
+            if "error" not in result and result.get("status", "OK") in ("OK", "ZERO_RESULTS"):
+                self.cache.put(kind, key, result)
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[(kind, key)]
+
     async def get_directions(
         self,
         origin: str,
@@ -25,13 +224,13 @@ class GoogleMapsAPI:
     ) -> Dict[str, Any]:
         """
         Get directions from origin to destination
-        
+
         Args:
             origin: Starting location (address or place name)
             destination: Destination (address or place name)
             mode: Travel mode (walking, driving, transit, bicycling)
             alternatives: Whether to include alternative routes
-            
+
         Returns:
             Directions data with routes, duration, and distance
         """
@@ -40,74 +239,51 @@ class GoogleMapsAPI:
                 "error": "Google Maps API key not configured",
                 "text_directions": f"Navigate from {origin} to {destination}"
             }
-        
-        url = f"{self.base_url}/directions/json"
+
         params = {
             "origin": origin,
             "destination": destination,
             "mode": mode,
             "alternatives": str(alternatives).lower(),
-            "key": self.api_key
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {"error": f"API error: {response.status}"}
-        except Exception as e:
-            return {"error": str(e)}
-    
+        return await self._cached(
+            "directions", route_key(origin, destination, mode, alternatives),
+            lambda: self._get_json(f"{self.base_url}/directions/json", params)
+        )
+
     async def get_place_details(self, place_name: str) -> Dict[str, Any]:
         """
         Get details about a place
-        
+
         Args:
             place_name: Name of the place
-            
+
         Returns:
             Place details including address, coordinates, etc.
         """
         if not self.api_key:
             return {"error": "Google Maps API key not configured"}
-        
-        # First, find the place
-        search_url = f"{self.base_url}/place/findplacefromtext/json"
-        search_params = {
-            "input": place_name,
-            "inputtype": "textquery",
-            "fields": "place_id,name,formatted_address,geometry",
-            "key": self.api_key
-        }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, params=search_params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("candidates"):
-                            place = data["candidates"][0]
-                            
-                            # Get detailed information
-                            details_url = f"{self.base_url}/place/details/json"
-                            details_params = {
-                                "place_id": place["place_id"],
-                                "fields": "name,formatted_address,geometry,opening_hours,website,formatted_phone_number",
-                                "key": self.api_key
-                            }
-                            
-                            async with session.get(details_url, params=details_params) as details_response:
-                                if details_response.status == 200:
-                                    return await details_response.json()
-                        
-                        return {"error": "Place not found"}
-                    else:
-                        return {"error": f"API error: {response.status}"}
-        except Exception as e:
-            return {"error": str(e)}
-    
+
+        async def fetch() -> Dict[str, Any]:
+            # First, find the place
+            data = await self._get_json(f"{self.base_url}/place/findplacefromtext/json", {
+                "input": place_name,
+                "inputtype": "textquery",
+                "fields": "place_id,name,formatted_address,geometry",
+            })
+            if "error" in data:
+                return data
+            if not data.get("candidates"):
+                return {"error": "Place not found"}
+
+            # Get detailed information
+            return await self._get_json(f"{self.base_url}/place/details/json", {
+                "place_id": data["candidates"][0]["place_id"],
+                "fields": "name,formatted_address,geometry,opening_hours,website,formatted_phone_number",
+            })
+
+        return await self._cached("place", normalize_location(place_name), fetch)
+
     async def get_travel_time(
         self,
         origin: str,
@@ -116,44 +292,44 @@ class GoogleMapsAPI:
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Get estimated travel time and distance
-        
+
         Args:
             origin: Starting location
             destination: Destination
             mode: Travel mode
-            
+
         Returns:
             Tuple of (duration_text, distance_text)
         """
         directions = await self.get_directions(origin, destination, mode)
-        
+
         if "error" in directions or "routes" not in directions or not directions["routes"]:
             return None, None
-        
+
         route = directions["routes"][0]
         leg = route["legs"][0]
-        
+
         return leg.get("duration", {}).get("text"), leg.get("distance", {}).get("text")
-    
+
     def format_directions_text(self, directions_data: Dict[str, Any]) -> str:
         """
         Format directions data into readable text
-        
+
         Args:
             directions_data: Raw directions data from API
-            
+
         Returns:
             Formatted text directions
         """
         if "error" in directions_data:
             return f"Unable to get directions: {directions_data['error']}"
-        
+
         if "routes" not in directions_data or not directions_data["routes"]:
             return "No routes found"
-        
+
         route = directions_data["routes"][0]
         leg = route["legs"][0]
-        
+
         # Build formatted directions
         lines = []
         lines.append(f"📍 From: {leg['start_address']}")
@@ -162,18 +338,18 @@ class GoogleMapsAPI:
         lines.append(f"📏 Distance: {leg['distance']['text']}")
         lines.append("")
         lines.append("🚶 Directions:")
-        
+
         for i, step in enumerate(leg["steps"], 1):
             # Remove HTML tags from instructions
             instruction = step["html_instructions"]
             instruction = instruction.replace("<b>", "").replace("</b>", "")
             instruction = instruction.replace("<div>", " ").replace("</div>", "")
             instruction = instruction.replace("&nbsp;", " ")
-            
+
             lines.append(f"{i}. {instruction} ({step['duration']['text']})")
-        
+
         return "\n".join(lines)
-    
+
     async def get_nearby_places(
         self,
         location: str,
@@ -182,46 +358,129 @@ class GoogleMapsAPI:
     ) -> List[Dict[str, Any]]:
         """
         Find nearby places of a certain type
-        
+
         Args:
             location: Center location
             place_type: Type of places (restaurant, cafe, etc.)
             radius: Search radius in meters
-            
+
         Returns:
             List of nearby places
         """
         if not self.api_key:
             return []
-        
+
         # First get coordinates of location
         place_details = await self.get_place_details(location)
-        
+
         if "error" in place_details or "result" not in place_details:
             return []
-        
+
         coords = place_details["result"]["geometry"]["location"]
-        location_str = f"{coords['lat']},{coords['lng']}"
-        
-        url = f"{self.base_url}/place/nearbysearch/json"
         params = {
-            "location": location_str,
+            "location": f"{coords['lat']},{coords['lng']}",
             "radius": radius,
             "type": place_type,
-            "key": self.api_key
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get("results", [])
-                    else:
-                        return []
-        except Exception as e:
-            return []
+        data = await self._cached(
+            "nearby", f"{place_type}|{radius}|{normalize_location(params['location'])}",
+            lambda: self._get_json(f"{self.base_url}/place/nearbysearch/json", params)
+        )
+        return data.get("results", [])
+
+    async def precompute_routes(
+        self,
+        venues: List[str],
+        modes: Tuple[str, ...] = ("walking",),
+        concurrency: int = 5
+    ) -> Dict[str, int]:
+        """
+        Fetch and cache directions between every ordered pair of venues
+
+        Args:
+            venues: Venue addresses / names
+            modes: Travel modes to cache
+            concurrency: Requests in flight at once
+
+        Returns:
+            Counts of routes already cached, fetched and failed
+        """
+        stats = {"cached": 0, "fetched": 0, "failed": 0}
+        unique: Dict[str, str] = {}
+        for venue in venues:
+            unique.setdefault(normalize_location(venue), venue)
+        venues = list(unique.values())
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm(origin: str, destination: str, mode: str):
+            if self.cache.get("directions", route_key(origin, destination, mode)) is not None:
+                stats["cached"] += 1
+                return
+            async with semaphore:
+                result = await self.get_directions(origin, destination, mode)
+            stats["failed" if "error" in result or result.get("status") not in (None, "OK") else "fetched"] += 1
+
+        await asyncio.gather(*(
+            warm(origin, destination, mode)
+            for mode in modes for origin in venues for destination in venues if origin != destination
+        ))
+        return stats
+
+
+def venue_locations(db, limit: int = 30) -> List[str]:
+    """Distinct side-event locations, busiest first"""
+    from sqlalchemy import func
+    rows = (
+        db.query(models.SlushEvent.location, func.count(models.SlushEvent.id))
+        .filter(models.SlushEvent.location.isnot(None), models.SlushEvent.location != "")
+        .group_by(models.SlushEvent.location)
+        .order_by(func.count(models.SlushEvent.id).desc())
+        .limit(limit)
+        .all()
+    )
+    venues, seen = [], set()
+    for location, _count in rows:
+        if normalize_location(location) not in seen:
+            seen.add(normalize_location(location))
+            venues.append(location)
+    return venues
 
 
 # Singleton instance
-google_maps_api = GoogleMapsAPI()
+google_maps_api = GoogleMapsAPI(cache=MapsCache(session_factory=_app_session))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute venue-to-venue directions into the maps cache')
+    parser.add_argument('--limit', type=int, default=30, help='Busiest event locations to include (default: 30)')
+    parser.add_argument('--venue', action='append', default=[], help='Extra venue (repeatable)')
+    parser.add_argument('--modes', nargs='+', default=['walking'], help='Travel modes (default: walking)')
+    parser.add_argument('--concurrency', type=int, default=5, help='Requests in flight (default: 5)')
+    args = parser.parse_args()
+
+    if not google_maps_api.api_key:
+        print("❌ GOOGLE_MAPS_API_KEY is not set")
+        return 1
+
+    db = _app_session()
+    try:
+        venues = args.venue + venue_locations(db, args.limit)
+    finally:
+        db.close()
+
+    async def run():
+        try:
+            return await google_maps_api.precompute_routes(venues, tuple(args.modes), args.concurrency)
+        finally:
+            await google_maps_api.aclose()
+
+    print(f"🗺️  Precomputing routes between {len(venues)} venues ({', '.join(args.modes)})...")
+    started = time.time()
+    stats = asyncio.run(run())
+    print(f"✓ {stats['fetched']} fetched, {stats['cached']} already cached, {stats['failed']} failed "
+          f"({time.time() - started:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+HTTP caching for read-heavy JSON endpoints
+
+The startup list, topics tree and Slush events are large and change only
+when data is imported or edited. HTTPCacheMiddleware gives each configured
+route:
+
+- a weak ETag derived from the data version of the tables it reads
+  (row count, max id, max updated_at, the data_version row, plus an
+  in-process counter bumped when ORM writes commit), the path and the
+  query string - computed *before* the handler runs, so a matching
+  If-None-Match is answered with 304 without building the body. It is
+  weak because the same tag covers the gzip and identity encodings
+- a per-route Cache-Control header (personalised routes get private,
+  no-store), and Vary: Accept-Encoding since bodies are gzip-compressed by
+  GZipMiddleware above COMPRESS_MIN_BYTES
+
+Table fingerprints are cached for VERSION_TTL_SECONDS; ORM writes in this
+process invalidate them as soon as they commit. bulk_importer upserts
+(which rewrite rows in place, e.g. startups, which have no updated_at)
+touch data_version.updatedAt in the import transaction; other scripts that
+edit rows in place should bump the data_version row (POST /data-version/).
+"""
+
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 6
+VERSION_TTL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control for a route, and the tables its response is built from (none = no ETag)"""
+    cache_control: str
+    tables: Tuple[str, ...] = ()
+
+
+# Routes not listed here pass through untouched (apart from compression)
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "/startups/all": CachePolicy("public, max-age=60, stale-while-revalidate=600", ("startups",)),
+    "/topics-usecases/topics": CachePolicy("public, max-age=300, stale-while-revalidate=3600", ("topics", "use_cases")),
+    "/topics-usecases/quick-list": CachePolicy("public, max-age=300, stale-while-revalidate=3600", ("topics",)),
+    "/api/slush-events": CachePolicy("public, max-age=60, stale-while-revalidate=600", ("slush_events",)),
+    # ETag / 304 handled by the insight read model itself
+    "/insights/categorized/all": CachePolicy("no-cache"),
+    # Per-user and partly random: compress only, never store
+    "/startups/phase1": CachePolicy("private, no-store"),
+    "/startups/phase2": CachePolicy("private, no-store"),
+}
+
+
+class DataVersions:
+    """Cheap per-table version fingerprints, cached briefly and bumped on ORM writes"""
+
+    def __init__(self, engine: Engine, ttl: float = VERSION_TTL_SECONDS):
+        self.engine = engine
+        self.ttl = ttl
+        self._writes: Dict[str, int] = {}
+        self._cached: Dict[str, Tuple[float, Tuple[Any, ...]]] = {}
+        self._columns: Dict[str, Optional[List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def install_hooks(self):
+        """Bump table versions when an ORM transaction in this process commits (idempotent)"""
+        for name, hook in (("after_flush", self._after_flush), ("after_commit", self._after_commit),
+                           ("after_rollback", self._after_rollback)):
+            if not event.contains(Session, name, hook):
+                event.listen(Session, name, hook)
+
+    def _after_flush(self, session: Session, flush_context):
+        tables = session.info.setdefault("http_cache_tables", set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            table = getattr(obj, "__tablename__", None)
+            if table:
+                tables.add(table)
+
+    def _after_commit(self, session: Session):
+        tables = session.info.pop("http_cache_tables", None)
+        if tables:
+            self.bump(tables)
+
+    def _after_rollback(self, session: Session):
+        session.info.pop("http_cache_tables", None)
+
+    def bump(self, tables: Iterable[str]):
+        with self._lock:
+            for table in tables:
+                self._writes[table] = self._writes.get(table, 0) + 1
+                self._cached.pop(table, None)
+
+    def _fingerprint_sql(self, conn, table: str) -> Optional[str]:
+        if table not in self._columns:
+            try:
+                self._columns[table] = [c["name"] for c in inspect(conn).get_columns(table)]
+            except Exception:
+                self._columns[table] = None
+        columns = self._columns[table]
+        if not columns:
+            return None
+        parts = ["COUNT(*)"]
+        parts += [f"MAX({c})" for c in ("id", "updated_at") if c in columns]
+        return f"SELECT {', '.join(parts)} FROM {table}"
+
+    def fingerprint(self, tables: Iterable[str]) -> Tuple[Any, ...]:
+        """(data_version, per-table (writes, db fingerprint)...) for the given tables"""
+        now = time.time()
+        result: List[Any] = []
+        missing = []
+        with self._lock:
+            for table in ("data_version",) + tuple(tables):
+                cached = self._cached.get(table)
+                if cached is None or now - cached[0] > self.ttl:
+                    missing.append(table)
+        if missing:
+            with self.engine.connect() as conn:
+                fresh = {}
+                for table in missing:
+                    if table == "data_version":
+                        try:
+                            row = conn.execute(text("SELECT version, updatedAt FROM data_version LIMIT 1")).first()
+                            fresh[table] = tuple(row) if row else (None, None)
+                        except Exception:
+                            fresh[table] = (None, None)
+                        continue
+                    sql = self._fingerprint_sql(conn, table)
+                    fresh[table] = tuple(conn.execute(text(sql)).one()) if sql else ()
+            with self._lock:
+                for table, value in fresh.items():
+                    self._cached[table] = (now, value)
+        with self._lock:
+            for table in ("data_version",) + tuple(tables):
+                result.append((table, self._writes.get(table, 0), self._cached.get(table, (0, ()))[1]))
+        return tuple(result)
+
+    def etag(self, path: str, query: str, tables: Iterable[str]) -> str:
+        key = repr((path, query, self.fingerprint(tables))).encode("utf-8")
+        return f'W/"{hashlib.blake2b(key, digest_size=12).hexdigest()}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires"""
+    if not if_none_match:
+        return False
+    candidates = [_opaque(c.strip()) for c in if_none_match.split(",")]
+    return "*" in candidates or _opaque(etag) in candidates
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware: ETag / 304 and Cache-Control for the routes in CACHE_POLICIES"""
+
+    def __init__(self, app, versions: DataVersions, policies: Optional[Dict[str, CachePolicy]] = None):
+        self.app = app
+        self.versions = versions
+        self.policies = CACHE_POLICIES if policies is None else policies
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        policy = self.policies.get(scope["path"].rstrip("/") or "/")
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = None
+        if policy.tables:
+            try:
+                etag = await run_in_threadpool(
+                    self.versions.etag, scope["path"], scope.get("query_string", b"").decode("latin-1"), policy.tables
+                )
+            except Exception as e:
+                logger.warning(f"Could not compute ETag for {scope['path']}: {e}")
+            if etag and etag_matches(Headers(scope=scope).get("if-none-match", ""), etag):
+                await send({"type": "http.response.start", "status": 304, "headers": [
+                    (b"etag", etag.encode()),
+                    (b"cache-control", policy.cache_control.encode()),
+                    (b"vary", b"Accept-Encoding"),
+                ]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                headers = MutableHeaders(scope=message)
+                if etag and "etag" not in headers:
+                    headers["ETag"] = etag
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = policy.cache_control
+                headers.add_vary_header("Accept-Encoding")
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,378 @@
+"""
+Hybrid Retrieval for concierge context building
+
+Combines two rankings over the live startups table:
+- BM25Index: in-memory inverted index (company name weighted double, plus
+  value proposition, product, description, industry) - catches exact names
+  and jargon that embeddings blur
+- EmbeddingIndex (embedding_index.py) - catches paraphrases and synonyms
+
+The two lists are merged with reciprocal-rank fusion (score = sum of
+1 / (k + rank)), which needs no score calibration between BM25 and cosine.
+Vector hits below MIN_VECTOR_SCORE are dropped first: a nearest neighbour
+always exists, so without the floor an unrelated query would still return
+startups and callers could never fall back to "no match".
+
+pack_startup_context() then fills a fixed token budget with the best
+startups first, so prompts carry the most relevant companies and nothing
+else.
+"""
+
+import math
+import asyncio
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from embedding_index import HashingEmbeddingProvider, REFRESH_INTERVAL_SECONDS, get_startup_index
+from db_queries import get_rows_by_ids
+
+logger = logging.getLogger(__name__)
+
+RRF_K = 60
+MIN_VECTOR_SCORE = 0.05  # Same cosine floor as db_queries.semantic_search_startups
+DEFAULT_CANDIDATES = 50
+DEFAULT_TOKEN_BUDGET = 1500
+CHARS_PER_TOKEN = 4  # Rough estimate for English prose; good enough for budgeting
+
+BM25_TEXT_SQL = """
+    SELECT id, company_name, value_proposition, core_product, company_description,
+           shortDescription, primary_industry
+    FROM startups
+"""
+
+tokenize = HashingEmbeddingProvider.tokenize
+
+
+# ============================================
+# BM25
+# ============================================
+
+def bm25_document(row: Dict[str, Any]) -> List[str]:
+    """Tokens for one startup; the company name counts twice"""
+    name = row.get("company_name") or ""
+    parts = [name, name, row.get("value_proposition"), row.get("core_product"),
+             row.get("company_description") or row.get("shortDescription"), row.get("primary_industry")]
+    return tokenize(" ".join(p for p in parts if p))
+
+
+class BM25Index:
+    """Okapi BM25 over an in-memory inverted index"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.avg_length = 0.0
+        self.refreshed_at = 0.0
+
+    def build(self, documents: Iterable[Tuple[Any, Sequence[str]]]) -> "BM25Index":
+        postings: Dict[str, Dict[str, int]] = {}
+        lengths: Dict[str, int] = {}
+        for id_, tokens in documents:
+            doc_id = str(id_)
+            lengths[doc_id] = len(tokens)
+            for token in tokens:
+                postings.setdefault(token, {})
+                postings[token][doc_id] = postings[token].get(doc_id, 0) + 1
+        self.postings = postings
+        self.doc_lengths = lengths
+        self.avg_length = sum(lengths.values()) / len(lengths) if lengths else 0.0
+        self.refreshed_at = time.time()
+        return self
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def idf(self, token: str) -> float:
+        df = len(self.postings.get(token, ()))
+        return math.log(1 + (len(self.doc_lengths) - df + 0.5) / (df + 0.5))
+
+    def search(self, query_text: str, k: int = 10) -> List[Tuple[str, float]]:
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(query_text)):
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self.idf(token)
+            for doc_id, tf in postings.items():
+                norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / (self.avg_length or 1)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return sorted(scores.items(), key=lambda item: -item[1])[:k]
+
+
+_bm25 = BM25Index()
+_bm25_refreshing: Optional[threading.Thread] = None
+_bm25_lock = threading.Lock()
+
+
+def refresh_bm25_index(db: Optional[Session] = None) -> BM25Index:
+    """Rebuild the BM25 index from the DB now, then swap it in (own session when none is given)"""
+    global _bm25
+    if db is None:
+        from database import SessionLocal
+        with SessionLocal() as session:
+            return refresh_bm25_index(session)
+    rows = db.execute(text(BM25_TEXT_SQL))
+    index = BM25Index().build((row.id, bm25_document(row._mapping)) for row in rows)
+    with _bm25_lock:
+        _bm25 = index
+    logger.info(f"📚 BM25 index built over {len(index)} startups")
+    return index
+
+
+def _refresh_bm25_in_background(bind):
+    global _bm25_refreshing
+    db = Session(bind=bind)
+    try:
+        refresh_bm25_index(db)
+    except Exception as e:
+        logger.error(f"Error refreshing BM25 index: {e}")
+    finally:
+        db.close()
+        with _bm25_lock:
+            _bm25_refreshing = None
+
+
+def get_bm25_index(db: Session, max_age: float = REFRESH_INTERVAL_SECONDS) -> BM25Index:
+    """
+    Process-wide BM25 index as it is now. Once it is older than max_age
+    seconds a rebuild starts on a background thread with its own session,
+    and callers keep the previous index (empty before the first build)
+    until the new one is swapped in - same contract as get_startup_index.
+    """
+    global _bm25_refreshing
+    with _bm25_lock:
+        index = _bm25
+        if time.time() - index.refreshed_at <= max_age or _bm25_refreshing is not None:
+            return index
+        thread = _bm25_refreshing = threading.Thread(
+            target=_refresh_bm25_in_background, args=(db.get_bind(),),
+            name="bm25-index", daemon=True,
+        )
+    thread.start()
+    return index
+
+
+async def bm25_index_worker(interval: float = REFRESH_INTERVAL_SECONDS):
+    """Background task that builds the BM25 index at startup and keeps it fresh"""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_bm25_index)
+        except Exception as e:
+            logger.error(f"Error refreshing BM25 index: {e}")
+        await asyncio.sleep(interval)
+
+
+def reset_bm25_index():
+    """Forget the cached BM25 index (tests, or after a bulk import)"""
+    global _bm25
+    thread = _bm25_refreshing
+    if thread is not None:
+        thread.join()
+    with _bm25_lock:
+        _bm25 = BM25Index()
+
+
+# ============================================
+# Fusion
+# ============================================
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Tuple[Any, float]]],
+    k: int = RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Merge ranked (id, score) lists; only the rank positions matter.
+
+    Args:
+        rankings: One list per retriever, best first
+        k: Damping constant - larger values flatten the head of each list
+        weights: Optional per-retriever weight (default 1.0 each)
+
+    Returns:
+        (id, fused_score) sorted best first
+    """
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, (id_, _) in enumerate(ranking, start=1):
+            fused[str(id_)] = fused.get(str(id_), 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
+
+
+class HybridRetriever:
+    """BM25 + embedding retrieval over the startups table, fused with RRF"""
+
+    def __init__(
+        self,
+        db: Session,
+        candidates: int = DEFAULT_CANDIDATES,
+        weights: Tuple[float, float] = (1.0, 1.0),
+        min_vector_score: float = MIN_VECTOR_SCORE,
+    ):
+        self.db = db
+        self.candidates = candidates
+        self.weights = weights
+        self.min_vector_score = min_vector_score
+
+    def rank(self, query: str) -> Tuple[List[Tuple[str, float]], Dict[str, Dict[str, int]]]:
+        """Fused ranking plus each id's position in the lexical / vector lists"""
+        lexical = get_bm25_index(self.db).search(query, k=self.candidates)
+        try:
+            vector = [(id_, score) for id_, score in get_startup_index(self.db).search(query, k=self.candidates)
+                      if score >= self.min_vector_score]
+        except Exception as e:
+            logger.warning(f"Vector retrieval unavailable, using BM25 only: {e}")
+            vector = []
+
+        positions: Dict[str, Dict[str, int]] = {}
+        for source, ranking in (("bm25_rank", lexical), ("vector_rank", vector)):
+            for rank, (id_, _) in enumerate(ranking, start=1):
+                positions.setdefault(str(id_), {})[source] = rank
+        return reciprocal_rank_fusion([lexical, vector], weights=self.weights), positions
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Startup rows, best first, with retrieval_score and per-source ranks"""
+        fused, positions = self.rank(query)
+        fused = fused[:limit]
+        rows = get_rows_by_ids(self.db, "startups", [id_ for id_, _ in fused])
+        scores = dict(fused)
+        for row in rows:
+            row["retrieval_score"] = round(scores[str(row["id"])], 5)
+            row.update(positions.get(str(row["id"]), {}))
+        return rows
+
+
+# ============================================
+# Token-budgeted context packing
+# ============================================
+
+def estimate_tokens(value: str) -> int:
+    return math.ceil(len(value) / CHARS_PER_TOKEN)
+
+
+def _clip(value: Any, max_chars: int) -> str:
+    value = " ".join(str(value or "").split())
+    return value if len(value) <= max_chars else value[:max_chars - 1].rstrip() + "…"
+
+
+def startup_block(startup: Dict[str, Any]) -> str:
+    """Compact multi-line summary of one startup for a prompt"""
+    lines = [f"- **{startup.get('company_name')}**"]
+    summary = startup.get("value_proposition") or startup.get("shortDescription") or startup.get("company_description")
+    if summary:
+        lines.append(f"  Description: {_clip(summary, 300)}")
+    if startup.get("core_product"):
+        lines.append(f"  Product: {_clip(startup['core_product'], 200)}")
+    if startup.get("primary_industry"):
+        lines.append(f"  Industry: {startup['primary_industry']}")
+    if startup.get("total_funding"):
+        lines.append(f"  Total Funding: ${startup['total_funding']}M (CB Insights)")
+    details = [f"{label}: {startup[key]}" for key, label in
+               (("funding_stage", "Stage"), ("employees", "Employees"), ("company_country", "Country"))
+               if startup.get(key)]
+    if details:
+        lines.append(f"  {' | '.join(details)}")
+    if startup.get("website"):
+        lines.append(f"  Website: {startup['website']}")
+    return "\n".join(lines)
+
+
+def startup_line(startup: Dict[str, Any]) -> str:
+    """One-line fallback when the full block doesn't fit"""
+    summary = startup.get("value_proposition") or startup.get("shortDescription") or ""
+    return f"- **{startup.get('company_name')}**: {_clip(summary, 120)}"
+
+
+@dataclass
+class PackedContext:
+    text: str
+    tokens: int
+    included: List[str] = field(default_factory=list)
+    abbreviated: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+
+
+def pack_startup_context(
+    startups: Sequence[Dict[str, Any]],
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    header: str = "Found these startups (most relevant first):\n",
+) -> PackedContext:
+    """
+    Fill a token budget with startups in rank order.
+
+    Each startup gets its full block if it fits, otherwise a one-line
+    summary; once even that doesn't fit, the rest are dropped.
+    """
+    parts = [header]
+    used = estimate_tokens(header)
+    packed = PackedContext(text="", tokens=0)
+
+    for startup in startups:
+        name = str(startup.get("company_name"))
+        if packed.dropped:
+            packed.dropped.append(name)
+            continue
+        for block, bucket in ((startup_block(startup), packed.included), (startup_line(startup), packed.abbreviated)):
+            cost = estimate_tokens(block) + 1  # newline separator
+            if used + cost <= token_budget:
+                parts.append(block)
+                used += cost
+                bucket.append(name)
+                break
+        else:
+            packed.dropped.append(name)
+
+    packed.text = "\n".join(parts)
+    packed.tokens = used
+    return packed
+
+
+def retrieve_startup_context(
+    db: Session,
+    query: str,
+    limit: int = 10,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+) -> Tuple[List[Dict[str, Any]], PackedContext]:
+    """Hybrid search + packing in one call; returns (ranked rows, packed context)"""
+    startups = HybridRetriever(db).search(query, limit=limit)
+    return startups, pack_startup_context(startups, token_budget=token_budget)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Try hybrid startup retrieval")
+    parser.add_argument("query")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--budget", type=int, default=DEFAULT_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        startups, packed = retrieve_startup_context(db, args.query, args.limit, args.budget)
+        print(f"🔍 '{args.query}' ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        for s in startups:
+            print(f"  {s['retrieval_score']:.4f}  bm25={s.get('bm25_rank', '-'):>3}  "
+                  f"vec={s.get('vector_rank', '-'):>3}  {s['company_name']}")
+        print(f"\n📦 {packed.tokens}/{args.budget} tokens, {len(packed.included)} full, "
+              f"{len(packed.abbreviated)} abbreviated, {len(packed.dropped)} dropped\n")
+        print(packed.text)
+    finally:
+        db.close()
@@ -66,10 +66,10 @@ def import_events_from_json(json_file_path: str, db: Session, clear_existing: bo
         }
         events_to_insert.append(event_dict)
     
-    # Bulk insert
-    print(f"Inserting {len(events_to_insert)} events into database...")
+    # Bulk upsert (re-importing the same file updates rows in place)
+    print(f"Upserting {len(events_to_insert)} events into database...")
     inserted_count = crud.create_slush_events_bulk(db, events_to_insert)
-    print(f"✅ Successfully inserted {inserted_count} events")
+    print(f"✅ Successfully upserted {inserted_count} events")
     
     return inserted_count
 
@@ -0,0 +1,289 @@
+"""
+Insight Read Model - pre-grouped, paginated insight cards
+
+The insights page and whitepaper view used to load every CategorizedInsight
+/ MeetingInsight row and group them in Python on each request. Instead:
+
+- insight_cards holds one pre-rendered Idea dict per insight, indexed by
+  (feed, category, created_ms, source_id) so a page is one index range scan
+- insight_feed_versions holds a version counter + count per category; the
+  ETag of any view is derived from those few rows, so an unchanged view is
+  answered with 304 without reading a single card
+- A Session after_flush hook keeps both tables in sync inside the same
+  transaction as the insert / edit / move / delete that caused the change
+
+Feeds: "categorized" (CategorizedInsight, categories "1"-"10") and
+"meeting" (MeetingInsight, shown as category "10" Startups ideas).
+"""
+
+import json
+import time
+import base64
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, event, func, insert, inspect, or_, select, text, update
+from sqlalchemy.orm import Session
+
+from models import CategorizedInsight, InsightCard, InsightFeedVersion, MeetingInsight
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = [str(i) for i in range(1, 11)]
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+REBUILD_BATCH_SIZE = 500
+
+# Columns that used to sit on slush_events; older meeting_insights tables lack them
+MEETING_INSIGHT_COLUMNS = ("insight", "tags", "rating", "followUp", "structured_qa", "timestamp")
+
+
+# ============================================
+# Card rendering
+# ============================================
+
+def _millis(value: Optional[datetime]) -> int:
+    return int((value or datetime.utcnow()).timestamp() * 1000)
+
+
+def categorized_card(insight: CategorizedInsight) -> Dict[str, Any]:
+    """Idea-format dict for a whitepaper insight (InsightsView)"""
+    return {
+        "id": f"insight_{insight.id}",
+        "name": insight.startup_name,
+        "title": insight.title,
+        "category": insight.category,
+        "description": insight.insight,  # Use 'insight' field as description
+        "tags": insight.tags or [],
+        "timestamp": _millis(insight.created_at),
+        "confidence": insight.confidence_score,
+        "meetingId": insight.meeting_id,
+        "userName": insight.user_name,
+        "userEmail": insight.user_email,
+        "insuranceRelevance": insight.insurance_relevance,
+        "metrics": insight.metrics or [],
+        "isEdited": bool(insight.is_edited),
+        "evidenceSource": insight.evidence_source
+    }
+
+
+def meeting_card(insight: MeetingInsight) -> Dict[str, Any]:
+    """Idea-format dict for a legacy meeting insight - always category 10 (Startups)"""
+    return {
+        "id": f"insight_{insight.id}",
+        "name": insight.startupName,
+        "title": f"Meeting with {insight.startupName}",
+        "category": "10",
+        "description": insight.insight or "",
+        "tags": insight.tags or [],
+        "timestamp": _millis(insight.timestamp),
+        "rating": insight.rating,
+        "meetingId": insight.meetingId,
+        "userId": insight.userId
+    }
+
+
+# feed name -> (source model, card builder, category getter, created_at getter)
+FEEDS = {
+    "categorized": (CategorizedInsight, categorized_card, lambda i: i.category, lambda i: i.created_at),
+    "meeting": (MeetingInsight, meeting_card, lambda i: "10", lambda i: i.timestamp),
+}
+FEED_BY_MODEL = {model: feed for feed, (model, *_rest) in FEEDS.items()}
+
+
+# ============================================
+# Write side
+# ============================================
+
+def _bump(conn, deltas: Dict[Tuple[str, str], int]):
+    for (feed, category), delta in deltas.items():
+        updated = conn.execute(
+            update(InsightFeedVersion)
+            .where(InsightFeedVersion.feed == feed, InsightFeedVersion.category == category)
+            .values(version=InsightFeedVersion.version + 1, count=InsightFeedVersion.count + delta,
+                    updated_at=datetime.utcnow())
+        ).rowcount
+        if not updated:
+            conn.execute(insert(InsightFeedVersion).values(
+                feed=feed, category=category, version=1, count=max(delta, 0), updated_at=datetime.utcnow()
+            ))
+
+
+def apply_changes(conn, changes: Iterable[Tuple[str, Any, bool]]):
+    """Upsert / remove cards for (feed, instance, deleted) and bump affected categories"""
+    deltas: Dict[Tuple[str, str], int] = {}
+    for feed, obj, deleted in changes:
+        _, render, category_of, created_of = FEEDS[feed]
+        old_category = conn.execute(
+            select(InsightCard.category).where(InsightCard.feed == feed, InsightCard.source_id == obj.id)
+        ).scalar()
+        if old_category is not None:
+            conn.execute(delete(InsightCard).where(InsightCard.feed == feed, InsightCard.source_id == obj.id))
+            deltas[(feed, old_category)] = deltas.get((feed, old_category), 0) - 1
+        if deleted:
+            continue
+        category = category_of(obj)
+        if not category:
+            continue
+        conn.execute(insert(InsightCard).values(
+            feed=feed, source_id=obj.id, category=category,
+            created_ms=_millis(created_of(obj)), card=render(obj)
+        ))
+        deltas[(feed, category)] = deltas.get((feed, category), 0) + 1
+    _bump(conn, deltas)
+
+
+def _after_flush(session: Session, flush_context):
+    changes = []
+    for obj in list(session.new) + list(session.dirty):
+        feed = FEED_BY_MODEL.get(type(obj))
+        if feed and (obj in session.new or session.is_modified(obj, include_collections=False)):
+            changes.append((feed, obj, False))
+    for obj in session.deleted:
+        feed = FEED_BY_MODEL.get(type(obj))
+        if feed:
+            changes.append((feed, obj, True))
+    if changes:
+        apply_changes(session.connection(), changes)
+
+
+def install_read_model_hooks():
+    """Keep insight_cards in sync for every ORM flush in this process (idempotent)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def rebuild_read_model(db: Session, feeds: Iterable[str] = tuple(FEEDS)) -> Dict[str, int]:
+    """Re-render every card from the source tables (backfill / repair); returns cards per feed"""
+    conn = db.connection()
+    built = {}
+    for feed in feeds:
+        model, render, category_of, created_of = FEEDS[feed]
+        conn.execute(delete(InsightCard).where(InsightCard.feed == feed))
+        old_versions = dict(conn.execute(
+            select(InsightFeedVersion.category, InsightFeedVersion.version).where(InsightFeedVersion.feed == feed)
+        ).all())
+        conn.execute(delete(InsightFeedVersion).where(InsightFeedVersion.feed == feed))
+
+        counts: Dict[str, int] = {}
+        batch = []
+        for obj in db.query(model).yield_per(REBUILD_BATCH_SIZE):
+            category = category_of(obj)
+            if not category:
+                continue
+            batch.append({"feed": feed, "source_id": obj.id, "category": category,
+                          "created_ms": _millis(created_of(obj)), "card": render(obj)})
+            counts[category] = counts.get(category, 0) + 1
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                conn.execute(insert(InsightCard), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(InsightCard), batch)
+        for category in set(counts) | set(old_versions):
+            conn.execute(insert(InsightFeedVersion).values(
+                feed=feed, category=category, version=old_versions.get(category, 0) + 1,
+                count=counts.get(category, 0), updated_at=datetime.utcnow()
+            ))
+        built[feed] = sum(counts.values())
+    db.commit()
+    return built
+
+
+def ensure_meeting_insight_columns(db: Session) -> List[str]:
+    """Add the MeetingInsight note columns to tables created before they existed; returns columns added"""
+    bind = db.get_bind()
+    table = MeetingInsight.__table__
+    existing = {column["name"] for column in inspect(bind).get_columns(table.name)}
+    added = [name for name in MEETING_INSIGHT_COLUMNS if name not in existing]
+    for name in added:
+        column_type = table.c[name].type.compile(dialect=bind.dialect)
+        db.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{name}" {column_type}'))
+    db.commit()
+    if added:
+        logger.info(f"🗂️  Added {added} to {table.name}")
+    return added
+
+
+def ensure_read_model(db: Session) -> Dict[str, int]:
+    """Rebuild any feed whose card count disagrees with its source table (e.g. rows written by scripts)"""
+    ensure_meeting_insight_columns(db)
+    stale = []
+    for feed, (model, *_rest) in FEEDS.items():
+        cards = db.query(func.coalesce(func.sum(InsightFeedVersion.count), 0)).filter(
+            InsightFeedVersion.feed == feed).scalar()
+        if int(cards) != db.query(func.count(model.id)).scalar():
+            stale.append(feed)
+    if not stale:
+        return {}
+    started = time.perf_counter()
+    built = rebuild_read_model(db, stale)
+    logger.info(f"🗂️  Rebuilt insight read model {built} in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return built
+
+
+# ============================================
+# Read side
+# ============================================
+
+def feed_versions(db: Session, feed: str) -> Dict[str, Tuple[int, int]]:
+    """category -> (version, count)"""
+    rows = db.query(InsightFeedVersion.category, InsightFeedVersion.version, InsightFeedVersion.count).filter(
+        InsightFeedVersion.feed == feed).all()
+    return {category: (version, count) for category, version, count in rows}
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(json.dumps(parts, sort_keys=True, default=str).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def encode_cursor(created_ms: int, source_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_ms}:{source_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_ms, source_id = raw.split(":")
+        return int(created_ms), int(source_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def read_page(
+    db: Session,
+    feed: str,
+    category: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Newest-first cards of one category after cursor.
+
+    Returns:
+        (cards, next_cursor) - next_cursor is None on the last page
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = db.query(InsightCard.card, InsightCard.created_ms, InsightCard.source_id).filter(
+        InsightCard.feed == feed, InsightCard.category == category)
+    if cursor:
+        created_ms, source_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            InsightCard.created_ms < created_ms,
+            and_(InsightCard.created_ms == created_ms, InsightCard.source_id < source_id)
+        ))
+    rows = query.order_by(InsightCard.created_ms.desc(), InsightCard.source_id.desc()).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1].created_ms, rows[limit - 1].source_id) if len(rows) > limit else None
+    return [row.card for row in rows[:limit]], next_cursor
+
+
+def read_sections(db: Session, feed: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Every card of a feed grouped by category (all CATEGORIES present), newest first"""
+    sections: Dict[str, List[Dict[str, Any]]] = {category: [] for category in CATEGORIES}
+    rows = db.query(InsightCard.card, InsightCard.category).filter(InsightCard.feed == feed).order_by(
+        InsightCard.category, InsightCard.created_ms.desc(), InsightCard.source_id.desc())
+    for row in rows:
+        sections.setdefault(row.category, []).append(row.card)
+    return sections
@@ -0,0 +1,265 @@
+"""
+Persistent Background Job Queue (SQLite-backed)
+
+Slow work that a request shouldn't wait for - LLM insight extraction after a
+debrief, regenerating insights - goes through the background_jobs table:
+
+- enqueue_job() inserts a row and returns at once; the caller hands the job
+  id back to the client, which polls GET /jobs/{job_id}
+- JobQueue runs N asyncio worker tasks in the API process (bounded
+  concurrency); each claims the oldest due job with a conditional UPDATE so
+  two workers never run the same job
+- Failures are retried with exponential backoff up to max_attempts, then
+  the job is marked failed with the last error
+- Jobs left "running" by a crashed process are re-queued once their lease
+  (STALE_LOCK_SECONDS) expires
+
+Handlers are async functions payload -> result dict, registered per kind:
+
+    @job_queue.handler("debrief_insights")
+    async def extract(payload): ...
+"""
+
+import os
+import uuid
+import socket
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+POLL_INTERVAL_SECONDS = 2.0
+RETRY_BASE_SECONDS = 10.0
+STALE_LOCK_SECONDS = 5 * 60  # Longest expected job; older leases belong to dead workers
+ACTIVE_STATUSES = ("queued", "running")
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def job_to_dict(job: BackgroundJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "retry_at": job.run_after.isoformat() if job.status == "queued" and job.attempts and job.run_after else None,
+    }
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: Dict[str, Any],
+    dedupe_key: Optional[str] = None,
+    max_attempts: int = 3,
+) -> BackgroundJob:
+    """
+    Add a job (committed). With dedupe_key, an already queued/running job
+    for the same key is returned instead of adding a duplicate.
+    """
+    if dedupe_key:
+        existing = db.query(BackgroundJob).filter(
+            BackgroundJob.dedupe_key == dedupe_key,
+            BackgroundJob.status.in_(ACTIVE_STATUSES)
+        ).first()
+        if existing:
+            return existing
+
+    job = BackgroundJob(
+        id=uuid.uuid4().hex,
+        kind=kind,
+        status="queued",
+        dedupe_key=dedupe_key,
+        payload=payload,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=datetime.utcnow(),
+    )
+    db.add(job)
+    db.commit()
+    return job
+
+
+def get_job(db: Session, job_id: str) -> Optional[BackgroundJob]:
+    return db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+
+
+def claim_next_job(db: Session, worker_id: str, kinds: Optional[List[str]] = None) -> Optional[BackgroundJob]:
+    """Atomically move the oldest due queued job to running; None if nothing is due"""
+    now = datetime.utcnow()
+    query = db.query(BackgroundJob.id).filter(BackgroundJob.status == "queued", BackgroundJob.run_after <= now)
+    if kinds:
+        query = query.filter(BackgroundJob.kind.in_(kinds))
+    for (job_id,) in query.order_by(BackgroundJob.run_after, BackgroundJob.created_at).limit(5):
+        claimed = db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status == "queued")
+            .values(status="running", locked_by=worker_id, locked_at=now,
+                    attempts=BackgroundJob.attempts + 1, updated_at=now)
+        ).rowcount
+        db.commit()
+        if claimed:
+            return get_job(db, job_id)
+    db.commit()
+    return None
+
+
+def finish_job(db: Session, job_id: str, result: Optional[Dict[str, Any]] = None):
+    job = get_job(db, job_id)
+    job.status = "succeeded"
+    job.result = result
+    job.error = None
+    job.finished_at = datetime.utcnow()
+    job.locked_by = None
+    db.commit()
+
+
+def fail_job(db: Session, job_id: str, error: str) -> str:
+    """Re-queue with backoff, or mark failed once attempts are used up; returns the new status"""
+    job = get_job(db, job_id)
+    job.error = error[:2000]
+    job.locked_by = None
+    if job.attempts < job.max_attempts:
+        job.status = "queued"
+        job.run_after = datetime.utcnow() + timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (job.attempts - 1))
+    else:
+        job.status = "failed"
+        job.finished_at = datetime.utcnow()
+    db.commit()
+    return job.status
+
+
+def requeue_stale_jobs(db: Session, older_than_seconds: float = STALE_LOCK_SECONDS) -> int:
+    """Put "running" jobs whose worker lease is older than older_than_seconds back in the queue"""
+    cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+    count = db.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.status == "running", BackgroundJob.locked_at < cutoff)
+        .values(status="queued", locked_by=None, run_after=datetime.utcnow())
+    ).rowcount
+    db.commit()
+    return count
+
+
+class JobQueue:
+    """Worker pool that drains background_jobs inside the running event loop"""
+
+    def __init__(self, session_factory: Callable[[], Session], workers: int = DEFAULT_WORKERS,
+                 poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.handlers: Dict[str, JobHandler] = {}
+        self.host_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def handler(self, kind: str):
+        """Decorator registering the async handler for a job kind"""
+        def register(func: JobHandler) -> JobHandler:
+            self.handlers[kind] = func
+            return func
+        return register
+
+    def enqueue(self, db: Session, kind: str, payload: Dict[str, Any], **kwargs) -> BackgroundJob:
+        """enqueue_job() plus an immediate wake-up of an idle worker"""
+        if kind not in self.handlers:
+            raise ValueError(f"No handler registered for job kind {kind!r}")
+        job = enqueue_job(db, kind, payload, **kwargs)
+        self.notify()
+        return job
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+
+    def start(self):
+        """Start worker tasks on the current event loop (call from app startup)"""
+        if self.running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        db = self.session_factory()
+        try:
+            recovered = requeue_stale_jobs(db)
+            if recovered:
+                logger.info(f"♻️  Re-queued {recovered} interrupted background jobs")
+        finally:
+            db.close()
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._worker(f"{self.host_id}:{i}")) for i in range(self.workers)]
+        logger.info(f"🧵 Job queue started with {self.workers} workers ({', '.join(sorted(self.handlers))})")
+
+    async def stop(self):
+        self._stopping = True
+        self.notify()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_once(self, worker_id: Optional[str] = None) -> Optional[str]:
+        """Claim and run one due job; returns its final status, or None if idle"""
+        worker_id = worker_id or f"{self.host_id}:inline"
+        db = self.session_factory()
+        try:
+            job = claim_next_job(db, worker_id, kinds=list(self.handlers))
+            if job is None:
+                return None
+            job_id, kind, payload, attempt = job.id, job.kind, dict(job.payload or {}), job.attempts
+        finally:
+            db.close()
+
+        logger.info(f"▶️  Job {job_id} ({kind}) attempt {attempt} on {worker_id}")
+        try:
+            result = await self.handlers[kind](payload)
+        except Exception as e:
+            db = self.session_factory()
+            try:
+                status = fail_job(db, job_id, f"{type(e).__name__}: {e}")
+            finally:
+                db.close()
+            logger.warning(f"⚠️  Job {job_id} ({kind}) failed on attempt {attempt}: {e} -> {status}")
+            return status
+
+        db = self.session_factory()
+        try:
+            finish_job(db, job_id, result)
+        finally:
+            db.close()
+        logger.info(f"✅ Job {job_id} ({kind}) succeeded")
+        return "succeeded"
+
+    async def _worker(self, worker_id: str):
+        while not self._stopping:
+            self._wakeup.clear()  # Before claiming, so an enqueue during the claim isn't missed
+            try:
+                status = await self.run_once(worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {worker_id} error: {e}")
+                status = None
+            if status is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,154 @@
+"""
+Compiled multi-keyword matching for the rule-based startup filters
+
+The AXA / agentic / insurance filters all ask the same question - which of
+these keyword lists occur in this startup's text - and used to answer it
+with one `keyword in text` scan per keyword. KeywordMatcher compiles a
+keyword set once into a single regex (a trie of alternations, so a position
+costs one walk down the trie rather than one attempt per keyword) and
+returns every hit in one pass over the text.
+
+Matching is case-insensitive and whole-word: a keyword must start and end
+on a word boundary, optionally followed by a plural "s"/"es" ("claim"
+matches "claims", "api" no longer matches "capital", "ai" no longer matches
+"email"). Overlapping keywords are all reported - "agent orchestration"
+also yields "agent" and "orchestration" when those are keywords too.
+
+    matcher = KeywordMatcher(["insurance", "claims", "ai platform"])
+    matcher.findall("An AI platform for insurance claims")   # keyword order
+    matcher.count(text); matcher.first(text); matcher.search(text)
+
+KeywordGroups scans once for several named lists (e.g. each rule's
+primary / secondary keywords) and splits the hits per group.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+PLURAL_SUFFIX = r"(?:e?s)?"
+
+
+def _normalize(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """Lower-cased, stripped, de-duplicated keywords in first-seen order"""
+    seen = {}
+    for keyword in keywords:
+        keyword = " ".join(str(keyword).lower().split())
+        if keyword:
+            seen.setdefault(keyword, None)
+    return tuple(seen)
+
+
+def _trie_pattern(keywords: Sequence[str]) -> str:
+    """
+    Regex alternation shaped like a trie: shared prefixes are matched once,
+    and longer keywords are tried before their prefixes
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if ends_here else group
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """A keyword set compiled once; findall() returns every hit in one pass"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = _normalize(keywords)
+        self._order = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._pattern = None
+        if self.keywords:
+            # A leading \b (rather than a lookbehind) lets the regex engine skip
+            # ahead to plausible first characters
+            start = r"\b" if all(re.match(r"\w", keyword) for keyword in self.keywords) else r"(?<!\w)"
+            self._pattern = re.compile(start + "(" + _trie_pattern(self.keywords) + ")" + PLURAL_SUFFIX + r"(?!\w)")
+        # At one position the regex reports only the longest keyword; every
+        # shorter keyword that occurs inside it at word boundaries is implied
+        self._implied: Dict[str, Tuple[str, ...]] = {}
+        whole_word = {
+            keyword: re.compile(r"(?<!\w)" + re.escape(keyword) + PLURAL_SUFFIX + r"(?!\w)")
+            for keyword in self.keywords
+        }
+        for keyword in self.keywords:
+            inner = tuple(
+                other for other in self.keywords
+                if len(other) < len(keyword) and whole_word[other].search(keyword)
+            )
+            if inner:
+                self._implied[keyword] = inner
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def hits(self, text: Optional[str]) -> Set[str]:
+        """Set of keywords occurring in text"""
+        if not text or self._pattern is None:
+            return set()
+        text = text.lower()
+        found: Set[str] = set()
+        match = self._pattern.search(text)
+        while match:
+            keyword = match.group(1)
+            if keyword not in found:
+                found.add(keyword)
+                found.update(self._implied.get(keyword, ()))
+            # Resume just after the match start, so overlapping keywords are found too
+            match = self._pattern.search(text, match.start() + 1)
+        return found
+
+    def findall(self, text: Optional[str], limit: Optional[int] = None) -> List[str]:
+        """Keywords occurring in text, in the order they were given"""
+        found = sorted(self.hits(text), key=self._order.__getitem__)
+        return found[:limit] if limit is not None else found
+
+    def count(self, text: Optional[str]) -> int:
+        """Number of distinct keywords occurring in text"""
+        return len(self.hits(text))
+
+    def first(self, text: Optional[str]) -> Optional[str]:
+        """First keyword (in the given order) occurring in text, or None"""
+        found = self.findall(text, limit=1)
+        return found[0] if found else None
+
+    def search(self, text: Optional[str]) -> bool:
+        """True if any keyword occurs in text"""
+        if not text or self._pattern is None:
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+
+class KeywordGroups:
+    """Several named keyword lists matched with a single scan of the text"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups = {name: _normalize(keywords) for name, keywords in groups.items()}
+        self.matcher = KeywordMatcher(keyword for keywords in self.groups.values() for keyword in keywords)
+
+    def match(self, text: Optional[str]) -> Dict[str, List[str]]:
+        """{group: keywords of that group occurring in text (in the group's order)}"""
+        found = self.matcher.hits(text)
+        return {name: [keyword for keyword in keywords if keyword in found] for name, keywords in self.groups.items()}
+
+
+@lru_cache(maxsize=256)
+def _compiled(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def compile_keywords(keywords: Iterable[str]) -> KeywordMatcher:
+    """Shared compiled matcher for a keyword list (compiled once per distinct list)"""
+    return _compiled(tuple(keywords))
@@ -1,5 +1,6 @@
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
@@ -34,7 +35,7 @@ import models
 import models_startup
 import schemas
 import crud
-from database import engine, get_db, SessionLocal
+from database import engine, get_db, SessionLocal, BatchSessionLocal, get_engine_stats
 from llm_config import simple_llm_call_async, llm_completion
 from auth import (
     authenticate_user,
@@ -52,13 +53,24 @@ from qwen_agentic_concierge import create_qwen_concierge  # Legacy Qwen Agentic
 from qwen_enhanced_concierge import create_enhanced_qwen_concierge  # Enhanced with proper function calling
 from qwen_agent_enhanced_concierge import create_qwen_agent_concierge  # NEW: Production Qwen-Agent with LangSmith
 from insights_agent import create_insights_agent  # AI-powered insights generation
-# from notification_service import NotificationService, notification_worker
+from notification_service import NotificationService, notification_worker
 from pathlib import Path
 from startup_prioritization import prioritizer
 from meeting_feedback_llm import feedback_assistant
 from whitepaper_insights_agent import whitepaper_agent
 from conversational_insights_agent import conversational_insights_agent
 import db_queries
+from hybrid_retrieval import DEFAULT_TOKEN_BUDGET, bm25_index_worker, retrieve_startup_context
+from startup_catalog import get_startup_catalog
+from job_queue import JobQueue, get_job, job_to_dict
+from debrief_jobs import DEBRIEF_INSIGHTS_JOB, register_debrief_jobs
+import insight_read_model
+import event_times
+import analytics_snapshot
+import startup_facets
+import seen_sets
+import embedding_index
+from http_cache import COMPRESS_LEVEL, COMPRESS_MIN_BYTES, DataVersions, HTTPCacheMiddleware
 from routes_phase_endpoints import router as phase_router
 from routes_topics_usecases import router as topics_router
 
@@ -73,6 +85,13 @@ except Exception as e:
 
 app = FastAPI(title="Startup Swiper API", version="1.0.0")
 
+# Conditional GET + Cache-Control for read-heavy routes, then compression.
+# Added before CORS so CORS stays outermost and also covers 304s.
+http_data_versions = DataVersions(engine)
+http_data_versions.install_hooks()
+app.add_middleware(HTTPCacheMiddleware, versions=http_data_versions)
+app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES, compresslevel=COMPRESS_LEVEL)
+
 # CORS middleware - add FIRST before any routes
 app.add_middleware(
     CORSMiddleware,
@@ -87,17 +106,20 @@ app.add_middleware(
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+# The catch-all Exception handler runs outside CORSMiddleware, so it needs these itself
+CORS_ERROR_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request, exc):
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": str(exc.detail)},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Credentials": "true",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
-        }
+        headers=CORS_ERROR_HEADERS
     )
 
 @app.exception_handler(Exception)
@@ -105,12 +127,7 @@ async def general_exception_handler(request, exc):
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Credentials": "true",
-            "Access-Control-Allow-Methods": "*",
-            "Access-Control-Allow-Headers": "*",
-        }
+        headers=CORS_ERROR_HEADERS
     )
 
 # Include Phase 1 & 2 endpoints
@@ -124,13 +141,43 @@ def get_all_startups_from_db(db: Session, skip: int = 0, limit: int = 10000):
     """Get startups from database instead of JSON."""
     return db_queries.get_all_startups(db, skip=skip, limit=limit)
 
-# Initialize notification service
-# notification_service = NotificationService()  # Temporarily disabled - install pywebpush first
+# Insight cards are kept in sync with every insight insert / edit / move / delete
+insight_read_model.install_read_model_hooks()
+
+# Event starts_at / ends_at (UTC, indexed) follow every event insert / edit
+event_times.install_event_time_hooks()
+
+# startup_topics / startup_use_cases / startup_tech follow every startup insert / edit / delete
+startup_facets.install_facet_hooks()
+
+# Background jobs (LLM insight extraction) run on a small worker pool
+job_queue = JobQueue(BatchSessionLocal)
+register_debrief_jobs(job_queue)
+
+# Post-meeting insight reminders; the worker only runs when VAPID keys are configured
+notification_service = NotificationService()
+notification_task: Optional[asyncio.Task] = None
+
+# Dashboard stats are served from a columnar snapshot rebuilt in the background
+analytics_task: Optional[asyncio.Task] = None
+
+# Embedding indexes are built and refreshed off the request path
+embedding_task: Optional[asyncio.Task] = None
+bm25_task: Optional[asyncio.Task] = None
+
+# Schema upgrades / backfills run at startup, each in its own session
+STARTUP_INITIALIZERS = (
+    ("insight read model", insight_read_model.ensure_read_model),
+    ("event times", event_times.ensure_event_times),
+    ("startup facets", startup_facets.ensure_startup_facets),
+    ("seen sets", seen_sets.ensure_seen_sets),
+)
 
 # Startup event - ensure database is initialized
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on app startup"""
+    """Initialize database on app startup; a failing step is logged and the rest still run"""
+    import traceback
     try:
         # Ensure tables exist
         models.Base.metadata.create_all(bind=engine)
@@ -144,11 +191,51 @@ async def startup_event():
             print(f"✓ Database ready with {startup_count} startups")
         finally:
             db.close()
-            
     except Exception as e:
-        print(f"⚠️  Error during startup initialization: {e}")
-        import traceback
+        print(f"⚠️  Error during database initialization: {e}")
         traceback.print_exc()
+    
+    for name, initialize in STARTUP_INITIALIZERS:
+        db = SessionLocal()
+        try:
+            initialize(db)
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️  Error initializing {name}: {e}")
+            traceback.print_exc()
+        finally:
+            db.close()
+    
+    try:
+        job_queue.start()
+    except Exception as e:
+        print(f"⚠️  Error starting job queue: {e}")
+        traceback.print_exc()
+    
+    global analytics_task
+    analytics_task = asyncio.create_task(analytics_snapshot.analytics_worker())
+    
+    global embedding_task
+    embedding_task = asyncio.create_task(embedding_index.embedding_index_worker())
+    
+    global bm25_task
+    bm25_task = asyncio.create_task(bm25_index_worker())
+    
+    global notification_task
+    if notification_service.dispatcher.ready:
+        notification_task = asyncio.create_task(notification_worker(notification_service))
+        print(f"✓ Notification worker started")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers; unfinished jobs are picked up after restart"""
+    for task in (notification_task, analytics_task, embedding_task, bm25_task):
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    await job_queue.stop()
+    from google_maps_integration import google_maps_api
+    await google_maps_api.aclose()
 
 # LLM Request/Response Models
 class LLMRequest(BaseModel):
@@ -192,6 +279,11 @@ async def health_check(db: Session = Depends(get_db)):
         "startups_loaded": startup_count
     }
 
+@app.get("/health/db")
+async def database_health(current_user: models.User = Depends(get_current_active_user)):
+    """Per-connection SQLite stats (queries, writes, lock errors) for each engine role (requires authentication)"""
+    return get_engine_stats()
+
 # LLM Endpoints
 @app.post("/llm/simple", response_model=LLMResponse)
 async def llm_simple_call(request: LLMRequest):
@@ -744,18 +836,55 @@ async def search_startups(query: str, limit: int = 10, db: Session = Depends(get
     """
     Search for startups by name, description, or category
     """
-    concierge = create_concierge(db)
-    results = concierge.startup_loader.search_startups(query, limit)
+    results = [r.to_dict() for r in get_startup_catalog(db).search(query, limit)]
     
     return {"results": results, "count": len(results)}
 
+@app.get("/concierge/retrieve")
+async def retrieve_startups(
+    query: str,
+    limit: int = 10,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    db: Session = Depends(get_db)
+):
+    """
+    Hybrid (BM25 + embedding, RRF-fused) startup retrieval plus the packed
+    prompt context the concierge would use for this query
+    """
+    # BM25 / embedding index builds and the ranking itself are blocking work
+    startups, packed = await asyncio.to_thread(
+        retrieve_startup_context, db, query, limit=min(limit, 50), token_budget=token_budget
+    )
+    results = [
+        {
+            "id": s["id"],
+            "company_name": s["company_name"],
+            "score": s["retrieval_score"],
+            "bm25_rank": s.get("bm25_rank"),
+            "vector_rank": s.get("vector_rank"),
+            "value_proposition": s.get("value_proposition"),
+            "primary_industry": s.get("primary_industry"),
+        }
+        for s in startups
+    ]
+    return {
+        "query": query,
+        "results": results,
+        "count": len(results),
+        "context": packed.text,
+        "context_tokens": packed.tokens,
+        "token_budget": token_budget,
+        "included": packed.included,
+        "abbreviated": packed.abbreviated,
+        "dropped": packed.dropped,
+    }
+
 @app.get("/concierge/startup-categories")
 async def get_startup_by_category(category: str, limit: int = 10, db: Session = Depends(get_db)):
     """
     Get startups in a specific category
     """
-    concierge = create_concierge(db)
-    results = concierge.startup_loader.get_startups_by_category(category, limit)
+    results = [r.to_dict() for r in get_startup_catalog(db).in_category(category, limit)]
     
     return {"results": results, "count": len(results), "category": category}
 
@@ -823,16 +952,15 @@ def get_prioritized_startups(
     # Get all startups from DB
     all_startups = db_queries.get_all_startups(db, skip=0, limit=10000)
     
-    # Get user's voting history if user_id provided
-    user_votes = []
-    if user_id:
-        all_votes = crud.get_votes(db, skip=0, limit=1000)
-        user_votes = [v for v in all_votes if str(v.userId) == str(user_id)]
+    # User's voting history from their seen bitmaps (all of it, not just the first 1000 votes overall)
+    seen = seen_sets.get_seen_set(db, user_id)
+    user_votes = [{"startupId": startup_id, "interested": seen.is_interested(startup_id)}
+                  for startup_id in seen.ids()]
 
     # Get prioritized list
     prioritized = prioritizer.prioritize_startups(
         all_startups,
-        user_votes=[{"startupId": v.startupId, "interested": v.interested} for v in user_votes],
+        user_votes=user_votes,
         limit=limit,
         min_score=min_score
     )
@@ -1090,11 +1218,23 @@ def get_startup_enrichment(startup_id: str, db: Session = Depends(get_db)):
 @app.get("/startups/enrichment/stats")
 def get_enrichment_stats(db: Session = Depends(get_db)):
     """
-    Get enrichment statistics
+    Get enrichment statistics (from the analytics snapshot)
     """
-    stats = db_queries.get_enrichment_stats(db)
-    
-    return stats
+    return analytics_snapshot.get_snapshot(db).enrichment
+
+@app.get("/api/analytics/snapshot")
+def get_analytics_snapshot(db: Session = Depends(get_db)):
+    """All dashboard aggregates: enrichment, funding, funding by stage, AXA tiers, startups, Slush events"""
+    return analytics_snapshot.get_snapshot(db).to_dict()
+
+@app.post("/api/analytics/refresh")
+def refresh_analytics_snapshot(
+    current_user: models.User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Rebuild the analytics snapshot now instead of waiting for the worker"""
+    snapshot = analytics_snapshot.refresh_snapshot(db)
+    return {"built_at": snapshot.built_at.isoformat(), "build_ms": round(snapshot.build_ms, 1)}
 
 @app.post("/startups/enrichment/by-name")
 async def get_startups_by_enriched_field(
@@ -1238,112 +1378,91 @@ async def get_meeting_insights(meeting_id: str, db: Session = Depends(get_db)):
     ).all()
     return insights
 
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 if the client already has this version of the view"""
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
+def _insight_page(db: Session, request: Request, response: Response, feed: str, category: str,
+                  limit: int, cursor: Optional[str]):
+    """One cursor page of a category from the insight read model, with ETag / 304"""
+    version, _ = insight_read_model.feed_versions(db, feed).get(category, (0, 0))
+    etag = insight_read_model.make_etag(feed, category, version, limit, cursor)
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
+    try:
+        cards, next_cursor = insight_read_model.read_page(db, feed, category, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return cards
+
+
 @app.get("/insights/as-ideas")
-async def get_insights_as_ideas(db: Session = Depends(get_db)):
+async def get_insights_as_ideas(
+    request: Request,
+    response: Response,
+    limit: int = insight_read_model.DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """
-    Get all meeting insights formatted as Idea objects for the Insights page
-    - Converts meeting_insights to category '10' (Startups) ideas
+    Get meeting insights formatted as Idea objects for the Insights page
+    - Meeting insights are category '10' (Startups) ideas, newest first
+    - Cursor-paginated: pass the X-Next-Cursor response header as ?cursor=
     - Compatible with InsightsView component
     """
-    insights = db.query(models.MeetingInsight).all()
-    
-    ideas = []
-    for insight in insights:
-        # Convert meeting insight to Idea format
-        idea = {
-            "id": f"insight_{insight.id}",
-            "name": insight.startupName,
-            "title": f"Meeting with {insight.startupName}",
-            "category": "10",  # Category 10: Startups
-            "description": insight.insight or "",
-            "tags": insight.tags or [],
-            "timestamp": int(insight.timestamp.timestamp() * 1000) if insight.timestamp else 0,
-            "rating": insight.rating,
-            "meetingId": insight.meetingId,
-            "userId": insight.userId
-        }
-        ideas.append(idea)
-    
-    return ideas
+    return _insight_page(db, request, response, "meeting", "10", limit, cursor)
 
 @app.get("/insights/categorized/all")
-async def get_all_categorized_insights(db: Session = Depends(get_db)):
+async def get_all_categorized_insights(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
     """
-    Get all categorized insights grouped by category
+    Get categorized insights grouped by category
     Perfect for populating all 10 whitepaper sections at once
-    """
-    insights = db.query(models.CategorizedInsight).order_by(
-        models.CategorizedInsight.created_at.desc()
-    ).all()
-    
-    # Group by category
-    by_category = {}
-    for i in range(1, 11):
-        by_category[str(i)] = []
-    
-    for insight in insights:
-        if insight.category in by_category:
-            by_category[insight.category].append({
-                "id": f"insight_{insight.id}",
-                "name": insight.startup_name,
-                "title": insight.title,
-                "category": insight.category,
-                "description": insight.insight,  # Use 'insight' field as description
-                "tags": insight.tags or [],
-                "timestamp": int(insight.created_at.timestamp() * 1000),
-                "confidence": insight.confidence_score,
-                "meetingId": insight.meeting_id,
-                "userName": insight.user_name,
-                "userEmail": insight.user_email,
-                "insuranceRelevance": insight.insurance_relevance,
-                "metrics": insight.metrics or [],
-                "isEdited": insight.is_edited,
-                "evidenceSource": insight.evidence_source
-            })
-    
-    return by_category
+    - Complete sections, newest first, read in one query from the
+      pre-grouped insight cards (no per-row JSON parsing)
+    - For incremental loading use the cursor-paginated
+      /insights/categorized/category/{id}
+    - ETag / If-None-Match -> 304 when nothing changed
+    """
+    versions = insight_read_model.feed_versions(db, "categorized")
+    etag = insight_read_model.make_etag("categorized", sorted(versions.items()))
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return insight_read_model.read_sections(db, "categorized")
 
 @app.get("/insights/categorized/category/{category_id}")
 async def get_insights_by_category(
     category_id: str,
-    limit: int = 50,
-    offset: int = 0,
+    request: Request,
+    response: Response,
+    limit: int = insight_read_model.DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get insights for a specific category
+    Get insights for a specific category, newest first
     Returns in Idea format compatible with InsightsView
+    - Cursor-paginated: pass the X-Next-Cursor response header as ?cursor=
     """
-    if category_id not in [str(i) for i in range(1, 11)]:
+    if category_id not in insight_read_model.CATEGORIES:
         raise HTTPException(status_code=400, detail="Invalid category. Must be 1-10")
     
-    insights = db.query(models.CategorizedInsight).filter(
-        models.CategorizedInsight.category == category_id
-    ).order_by(
-        models.CategorizedInsight.created_at.desc()
-    ).offset(offset).limit(limit).all()
-    
-    ideas = []
-    for insight in insights:
-        idea = {
-            "id": f"insight_{insight.id}",
-            "name": insight.startup_name,
-            "title": insight.title,
-            "category": insight.category,
-            "description": insight.insight,
-            "tags": insight.tags or [],
-            "timestamp": int(insight.created_at.timestamp() * 1000),
-            "confidence": insight.confidence_score,
-            "meetingId": insight.meeting_id,
-            "userName": insight.user_name,
-            "userEmail": insight.user_email,
-            "insuranceRelevance": insight.insurance_relevance,
-            "metrics": insight.metrics or [],
-            "isEdited": insight.is_edited
-        }
-        ideas.append(idea)
-    
-    return ideas
+    return _insight_page(db, request, response, "categorized", category_id, limit, cursor)
 
 @app.put("/insights/categorized/{insight_id}/edit")
 async def edit_categorized_insight(
@@ -1587,7 +1706,10 @@ async def chat_feedback(
         message=message_data.message,
         conversation_history=session.conversation_history,
         current_question=current_question,
-        is_first_message=False
+        is_first_message=False,
+        session_id=session.id,
+        startup_name=session.startupName,
+        questions=questions
     )
 
     # Add assistant response to history
@@ -1711,6 +1833,7 @@ async def chat_feedback(
             categories_populated = []
 
         db.commit()
+        feedback_assistant.memories.drop(f"feedback:{session.id}")
 
         return schemas.FeedbackChatResponse(
             response=f"{response_data['response']}\n\n{completion_message}",
@@ -1724,7 +1847,8 @@ async def chat_feedback(
             session_id=session.id,
             completed=True,
             insights_created=insights_created,
-            categories_populated=categories_populated
+            categories_populated=categories_populated,
+            usage=response_data.get("usage")
         )
 
     # Move to next question
@@ -1754,7 +1878,8 @@ async def chat_feedback(
             "answered": next_idx
         },
         session_id=session.id,
-        completed=False
+        completed=False,
+        usage=response_data.get("usage")
     )
 
 @app.get("/feedback/session/{session_id}", response_model=schemas.FeedbackSession)
@@ -2178,13 +2303,15 @@ async def debrief_conversation(
             conversation_history=request.conversation_history,
             startup_name=request.startup_name,
             meeting_prep_outline=request.meeting_prep_outline,
-            last_user_message=request.user_message
+            last_user_message=request.user_message,
+            session_id=request.session_id
         )
         
         return {
             "success": True,
             "message": response,
-            "session_id": request.session_id
+            "session_id": request.session_id,
+            "usage": conversational_insights_agent.session_usage(request.session_id)
         }
         
     except Exception as e:
@@ -2207,7 +2334,8 @@ async def generate_debrief_questions(
         questions = await conversational_insights_agent.generate_three_questions(
             conversation_history=request.conversation_history,
             startup_name=request.startup_name,
-            meeting_prep_outline=request.meeting_prep_outline
+            meeting_prep_outline=request.meeting_prep_outline,
+            session_id=request.session_id
         )
         
         return {
@@ -2231,18 +2359,13 @@ async def complete_debrief(
 ):
     """
     Complete debrief with analyst ratings and feedback.
-    SAVES DEBRIEF DATA FIRST, then extracts insights asynchronously.
-    If insights extraction fails, the debrief data is already safely stored and can be regenerated.
+    Saves the debrief, then queues insight extraction and returns immediately.
+    Poll GET /jobs/{job_id} for the extracted insights.
     """
     try:
-        from models import DebriefSession, CategorizedInsight
+        from models import DebriefSession
         
-        print(f"[DebreefComplete] Starting debrief for {request.startup_name}")
-        print(f"[DebreefComplete] User: {request.user_id}, Startup ID: {request.startup_id}")
-        print(f"[DebreefComplete] Messages count: {len(request.conversation_history)}")
-        
-        # STEP 1: Save debrief session to database FIRST (this is critical)
-        # This ensures we don't lose the conversation data even if insights extraction fails
+        # Save the debrief first - the conversation is never lost, even if extraction fails
         debrief_session = DebriefSession(
             session_id=request.session_id,
             startup_id=request.startup_id,
@@ -2255,79 +2378,29 @@ async def complete_debrief(
             completed_at=datetime.utcnow()
         )
         db.add(debrief_session)
-        db.flush()  # Flush to get debrief_session.id
         db.commit()
+        conversational_insights_agent.end_session(request.session_id)
         
-        print(f"[DebreefComplete] ✓ Debrief session saved successfully")
-        
-        # STEP 2: Extract insights (this can fail without losing the debrief data)
-        saved_count = 0
-        insights_extraction_success = False
-        insights_data = {"insights": [], "success": False}
-        
-        try:
-            insights_data = await conversational_insights_agent.extract_insights_from_conversation(
-                startup_name=request.startup_name,
-                conversation_history=request.conversation_history,
-                meeting_prep_outline=request.meeting_prep_outline
-            )
-            
-            print(f"[DebreefComplete] Extraction result: {insights_data}")
-            
-            # Save extracted insights to CategorizedInsight table
-            insights_list = insights_data.get("insights", [])
-            print(f"[DebreefComplete] Insights list type: {type(insights_list)}, length: {len(insights_list) if isinstance(insights_list, list) else 'N/A'}")
-            
-            if isinstance(insights_list, list) and len(insights_list) > 0:
-                for i, insight in enumerate(insights_list):
-                    try:
-                        print(f"[DebreefComplete] Processing insight {i+1}: {insight}")
-                        categorized_insight = CategorizedInsight(
-                            meeting_id=request.session_id,
-                            startup_id=request.startup_id,
-                            startup_name=request.startup_name,
-                            user_id=request.user_id,
-                            user_name=request.user_id.split('@')[0] if '@' in request.user_id else request.user_id,
-                            user_email=request.user_id,
-                            category=str(insight.get("section", "")),
-                            title=insight.get("title", ""),
-                            insight=insight.get("insight", ""),
-                            insurance_relevance=insight.get("insurance_relevance", ""),
-                            metrics=insight.get("metrics", []),
-                            tags=insight.get("tags", []),
-                            confidence_score=float(insight.get("confidence_score", 0.8)),
-                            evidence_source=insight.get("evidence_source", "")
-                        )
-                        db.add(categorized_insight)
-                        saved_count += 1
-                    except Exception as e:
-                        print(f"[DebreefComplete] Error saving insight {i+1}: {e}")
-            
-            db.commit()
-            insights_extraction_success = True
-            print(f"[DebreefComplete] ✓ Saved {saved_count} insights to database")
-            
-        except Exception as e:
-            print(f"[DebreefComplete] ⚠️ Insights extraction failed: {e}")
-            print(f"[DebreefComplete] BUT debrief data is safely stored! Insights can be regenerated later.")
-            import traceback
-            traceback.print_exc()
+        job = job_queue.enqueue(
+            db, DEBRIEF_INSIGHTS_JOB,
+            {"session_id": request.session_id, "meeting_prep_outline": request.meeting_prep_outline},
+            dedupe_key=f"debrief:{request.session_id}"
+        )
+        logger.info(f"Debrief {request.session_id} saved ({len(request.conversation_history)} messages), job {job.id}")
         
-        # STEP 3: Return success - debrief is saved regardless of insights extraction
         return {
             "success": True,
             "session_id": request.session_id,
             "startup_name": request.startup_name,
-            "insights_saved": saved_count,
-            "insights_extraction_success": insights_extraction_success,
-            "insights": insights_data.get("insights", []),
-            "message": f"✓ Debrief completed and saved! {saved_count} insights extracted." if insights_extraction_success else f"✓ Debrief saved! {saved_count} insights extracted. (Insights can be regenerated if needed)"
+            "job_id": job.id,
+            "job_status": job.status,
+            "insights_saved": 0,
+            "insights": [],
+            "message": "✓ Debrief saved! Insights are being extracted in the background."
         }
         
     except Exception as e:
-        print(f"[DebreefComplete] Error completing debrief: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Error completing debrief {request.session_id}: {e}")
         return {
             "success": False,
             "error": str(e)
@@ -2341,89 +2414,55 @@ async def regenerate_insights(
 ):
     """
     Regenerate insights for an existing debrief session.
-    Used when initial insights extraction failed.
-    Retrieves the debrief from database and re-runs insights extraction.
+    Used when initial insights extraction failed. Queues a new extraction
+    job (or returns the one already pending) - poll GET /jobs/{job_id}.
     """
     try:
-        from models import DebriefSession, CategorizedInsight
+        from models import DebriefSession
         
         session_id = request.get("session_id")
         if not session_id:
             return {"success": False, "error": "session_id is required"}
         
-        print(f"[RegenerateInsights] Regenerating insights for session: {session_id}")
-        
-        # Get the existing debrief session
         debrief = db.query(DebriefSession).filter_by(session_id=session_id).first()
         if not debrief:
             return {"success": False, "error": f"Debrief session {session_id} not found"}
         
-        print(f"[RegenerateInsights] Found debrief: {debrief.startup_name}")
-        
-        # Delete any previous insights for this session
-        db.query(CategorizedInsight).filter_by(meeting_id=session_id).delete()
-        db.commit()
-        print(f"[RegenerateInsights] Cleared previous insights")
-        
-        # Extract insights again
-        insights_data = await conversational_insights_agent.extract_insights_from_conversation(
-            startup_name=debrief.startup_name,
-            conversation_history=debrief.conversation_history,
-            meeting_prep_outline=request.get("meeting_prep_outline", "")
+        job = job_queue.enqueue(
+            db, DEBRIEF_INSIGHTS_JOB,
+            {"session_id": session_id, "meeting_prep_outline": request.get("meeting_prep_outline", "")},
+            dedupe_key=f"debrief:{session_id}"
         )
         
-        print(f"[RegenerateInsights] Extraction result: {insights_data}")
-        
-        saved_count = 0
-        insights_list = insights_data.get("insights", [])
-        
-        if isinstance(insights_list, list) and len(insights_list) > 0:
-            for i, insight in enumerate(insights_list):
-                try:
-                    print(f"[RegenerateInsights] Processing insight {i+1}: {insight}")
-                    categorized_insight = CategorizedInsight(
-                        meeting_id=debrief.session_id,
-                        startup_id=debrief.startup_id,
-                        startup_name=debrief.startup_name,
-                        user_id=debrief.user_id,
-                        user_name=debrief.user_id.split('@')[0] if '@' in debrief.user_id else debrief.user_id,
-                        user_email=debrief.user_id,
-                        category=str(insight.get("section", "")),
-                        title=insight.get("title", ""),
-                        insight=insight.get("insight", ""),
-                        insurance_relevance=insight.get("insurance_relevance", ""),
-                        metrics=insight.get("metrics", []),
-                        tags=insight.get("tags", []),
-                        confidence_score=float(insight.get("confidence_score", 0.8)),
-                        evidence_source=insight.get("evidence_source", "")
-                    )
-                    db.add(categorized_insight)
-                    saved_count += 1
-                except Exception as e:
-                    print(f"[RegenerateInsights] Error saving insight {i+1}: {e}")
-        
-        db.commit()
-        print(f"[RegenerateInsights] ✓ Saved {saved_count} insights to database")
-        
         return {
             "success": True,
             "session_id": session_id,
             "startup_name": debrief.startup_name,
-            "insights_saved": saved_count,
-            "insights": insights_data.get("insights", []),
-            "message": f"✓ Successfully regenerated {saved_count} insights"
+            "job_id": job.id,
+            "job_status": job.status,
+            "message": "✓ Insight regeneration queued"
         }
         
     except Exception as e:
-        print(f"[RegenerateInsights] Error regenerating insights: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Error regenerating insights: {e}")
         return {
             "success": False,
             "error": str(e)
         }
 
 
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str, db: Session = Depends(get_db)):
+    """
+    Status of a background job: queued, running, succeeded (with result)
+    or failed (with the last error). Retried jobs show retry_at.
+    """
+    job = get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_to_dict(job)
+
+
 # ============================================
 # Utility Endpoints for Normalized DB
 # ============================================
@@ -2522,6 +2561,55 @@ def get_slush_events_api(
     else:
         return crud.get_slush_events(db, skip=skip, limit=limit)
 
+@app.get("/api/slush-events/schedule")
+def get_slush_event_schedule_api(start: str, end: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Slush events overlapping a period, bucketed by (Helsinki) day
+
+    - **start** / **end**: ISO dates or datetimes; a date-only end includes that day (default: start's day)
+    """
+    try:
+        window_start = event_times.parse_when(start)
+        window_end = event_times.parse_when(end or start[:10], end_of_day=True)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    days = event_times.events_by_day(db, window_start, window_end)
+    return {
+        "days": [
+            {"date": day.isoformat(), "count": len(events),
+             "events": [schemas.SlushEvent.model_validate(e) for e in events]}
+            for day, events in days.items()
+        ],
+        "count": sum(len(events) for events in days.values()),
+    }
+
+@app.get("/api/slush-events/happening", response_model=List[schemas.SlushEvent])
+def get_slush_events_happening_api(at: Optional[str] = None, limit: int = 50, db: Session = Depends(get_db)):
+    """
+    Slush events running at a moment
+
+    - **at**: ISO datetime or a question like "Nov 19 3pm" (default: now)
+    """
+    if not at:
+        return event_times.events_at(db, datetime.utcnow(), limit=limit)
+    try:
+        moment = event_times.parse_when(at)
+    except ValueError:
+        window = event_times.parse_date_query(at)
+        if window is None:
+            raise HTTPException(status_code=400, detail=f"Unrecognized time: {at}")
+        return event_times.events_between(db, window[0], window[1], limit=limit)
+    return event_times.events_at(db, moment, limit=limit)
+
+@app.get("/api/slush-events/upcoming", response_model=List[schemas.SlushEvent])
+def get_slush_events_upcoming_api(after: Optional[str] = None, limit: int = 10, db: Session = Depends(get_db)):
+    """Next Slush events starting at or after a moment (ISO datetime, default: now)"""
+    try:
+        moment = event_times.parse_when(after) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return event_times.next_events(db, moment, n=limit)
+
 @app.get("/api/slush-events/{event_id}", response_model=schemas.SlushEvent)
 def get_slush_event_api(event_id: int, db: Session = Depends(get_db)):
     """Get a specific Slush event by ID"""
@@ -2532,30 +2620,8 @@ def get_slush_event_api(event_id: int, db: Session = Depends(get_db)):
 
 @app.get("/api/slush-events/stats/summary")
 def get_slush_events_stats(db: Session = Depends(get_db)):
-    """Get statistics about Slush events"""
-    from sqlalchemy import func
-    
-    total_events = db.query(func.count(models.SlushEvent.id)).scalar()
-    
-    # Top organizers
-    top_organizers = db.query(
-        models.SlushEvent.organizer,
-        func.count(models.SlushEvent.id).label('count')
-    ).group_by(models.SlushEvent.organizer).order_by(func.count(models.SlushEvent.id).desc()).limit(10).all()
-    
-    # Events by status (flatten JSON arrays)
-    events_with_status = db.query(models.SlushEvent.status).filter(models.SlushEvent.status.isnot(None)).all()
-    status_counts = {}
-    for (status_json,) in events_with_status:
-        if status_json:
-            for status in status_json:
-                status_counts[status] = status_counts.get(status, 0) + 1
-    
-    return {
-        "total_events": total_events,
-        "top_organizers": [{"organizer": org, "count": count} for org, count in top_organizers],
-        "status_counts": status_counts
-    }
+    """Get statistics about Slush events (from the analytics snapshot)"""
+    return analytics_snapshot.get_snapshot(db).slush_events
 
 if __name__ == "__main__":
     import uvicorn
@@ -6,37 +6,124 @@ particularly for extracting startup information from the database when needed.
 
 The MCP client allows the LLM to use tool calls that query the database,
 making the AI concierge more intelligent and context-aware.
+
+One implementation, three ways in:
+- In-process: StartupDatabaseMCPTools.registry maps tool name -> coroutine;
+  the API, the concierges and the Qwen tools call it directly (a dict
+  lookup, no serialization)
+- Streamable HTTP (SSE): mcp_startup_server.py --transport http serves the
+  same registry; MCPClient keeps one pooled HTTP connection and MCP
+  session open across calls
+- stdio: mcp_startup_server.py (default) for desktop MCP hosts
+
+benchmark_mcp_transports.py compares the per-call overhead of each path.
 """
 
 import json
+import itertools
 import subprocess
 import os
 import sys
-from typing import Any, Optional, Dict, List
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Dict, List
 from pathlib import Path
 import logging
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+MCP_PROTOCOL_VERSION = "2025-06-18"
+DEFAULT_HTTP_PORT = 8765
+DEFAULT_HTTP_TIMEOUT = 30.0
+
+ToolFunc = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+class MCPError(RuntimeError):
+    """JSON-RPC error returned by an MCP server"""
+
+
+@dataclass
+class RegisteredTool:
+    name: str
+    description: str
+    parameters: Dict[str, Any]
+    func: ToolFunc
+
+    def definition(self) -> Dict[str, Any]:
+        """OpenAI-style function definition (LiteLLM / Qwen / Claude tool calling)"""
+        return {
+            "type": "function",
+            "function": {"name": self.name, "description": self.description, "parameters": self.parameters}
+        }
+
+
+class ToolRegistry:
+    """Tool name -> coroutine; the single dispatch point for every transport"""
+
+    def __init__(self):
+        self.tools: Dict[str, RegisteredTool] = {}
+
+    def register(self, name: str, func: ToolFunc, description: str = "", parameters: Optional[Dict[str, Any]] = None):
+        self.tools[name] = RegisteredTool(name, description, parameters or {"type": "object", "properties": {}}, func)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tools
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def definitions(self) -> List[Dict[str, Any]]:
+        return [tool.definition() for tool in self.tools.values()]
+
+    async def call(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a tool; unknown tools and exceptions come back as {"success": False, "error": ...}"""
+        tool = self.tools.get(name)
+        if tool is None:
+            return {"success": False, "error": f"Unknown tool: {name}"}
+        try:
+            return await tool.func(**(arguments or {}))
+        except Exception as e:
+            logger.error(f"Error calling tool {name}: {e}")
+            return {"success": False, "error": str(e)}
+
 
 class MCPClient:
-    """Client for interacting with MCP servers"""
-    
+    """
+    Client for an MCP server over Streamable HTTP
+
+    One httpx.AsyncClient (keep-alive pool) and one MCP session are reused
+    for every call; the session is (re)initialized lazily. start_server()
+    launches mcp_startup_server.py in HTTP mode when no server is running.
+    """
+
     def __init__(self, server_type: str = "startup_db", config: Optional[Dict[str, Any]] = None):
         """
         Initialize MCP Client
         
         Args:
             server_type: Type of server ("startup_db", "web", etc.)
-            config: Configuration dictionary for the server
+            config: Configuration dictionary (url, host, port, timeout, max_connections)
         """
         self.server_type = server_type
         self.config = config or {}
         self.process = None
         self._startup_tool_cache = {}
+        port = self.config.get("port", DEFAULT_HTTP_PORT)
+        self.url = self.config.get("url") or f"http://{self.config.get('host', '127.0.0.1')}:{port}/mcp/"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._owns_client = True
+        self._session_id: Optional[str] = None
+        self._initialized = False
+        self._ids = itertools.count(1)
+        if "client" in self.config:
+            self._client = self.config["client"]
+            self._owns_client = False
     
     def start_server(self) -> bool:
-        """Start the MCP server process"""
+        """Start the MCP server process (HTTP transport) in the background"""
         try:
             api_dir = Path(__file__).parent
             
@@ -47,16 +134,18 @@ class MCPClient:
                     logger.error(f"MCP server script not found: {script}")
                     return False
                 
-                # Start the server process
+                port = str(self.config.get("port", DEFAULT_HTTP_PORT))
+                # The server talks HTTP, so its stdio isn't read; never leave unread pipes
                 self.process = subprocess.Popen(
-                    [sys.executable, str(script)],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    [sys.executable, str(script), "--transport", "http", "--port", port],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     cwd=str(api_dir),
                     env={**os.environ, "PYTHONPATH": str(api_dir)}
                 )
                 
-                logger.info(f"Started MCP {self.server_type} server (PID: {self.process.pid})")
+                logger.info(f"Started MCP {self.server_type} server on port {port} (PID: {self.process.pid})")
                 return True
             
             return False
@@ -76,6 +165,96 @@ class MCPClient:
                 logger.error(f"Error stopping MCP server: {e}")
                 if self.process.poll() is None:
                     self.process.kill()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            max_connections = self.config.get("max_connections", 10)
+            self._client = httpx.AsyncClient(
+                timeout=self.config.get("timeout", DEFAULT_HTTP_TIMEOUT),
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            )
+        return self._client
+    
+    async def aclose(self):
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+        self._initialized = False
+        self._session_id = None
+    
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+        if self._session_id:
+            headers["Mcp-Session-Id"] = self._session_id
+        if self._initialized:
+            headers["MCP-Protocol-Version"] = MCP_PROTOCOL_VERSION
+        return headers
+    
+    @staticmethod
+    def _parse_response(response: httpx.Response, request_id: int) -> Dict[str, Any]:
+        """JSON-RPC response from a JSON body or an SSE stream of messages"""
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            for line in response.text.splitlines():
+                if line.startswith("data:"):
+                    message = json.loads(line[5:].strip())
+                    if message.get("id") == request_id:
+                        return message
+            raise MCPError(f"No response for request {request_id} in event stream")
+        return response.json()
+    
+    async def _rpc(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        request_id = next(self._ids)
+        response = await self.client.post(
+            self.url, headers=self._headers(),
+            json={"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        )
+        if response.status_code == 404 and self._session_id:
+            raise MCPError("MCP session expired")
+        response.raise_for_status()
+        if "mcp-session-id" in response.headers:
+            self._session_id = response.headers["mcp-session-id"]
+        message = self._parse_response(response, request_id)
+        if "error" in message:
+            raise MCPError(message["error"].get("message", str(message["error"])))
+        return message.get("result", {})
+    
+    async def initialize(self):
+        self._session_id, self._initialized = None, False
+        await self._rpc("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "startup-swiper-api", "version": "1.0.0"},
+        })
+        self._initialized = True
+        response = await self.client.post(
+            self.url, headers=self._headers(), json={"jsonrpc": "2.0", "method": "notifications/initialized"}
+        )
+        response.raise_for_status()
+    
+    async def _request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if not self._initialized:
+            await self.initialize()
+        try:
+            return await self._rpc(method, params)
+        except MCPError as e:
+            if "session expired" not in str(e):
+                raise
+            await self.initialize()  # Server restarted; open a new session once
+            return await self._rpc(method, params)
+    
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        result = await self._request("tools/list")
+        return result.get("tools", [])
+    
+    async def call_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
+        """Call a tool on the server; returns the same dict the in-process registry would"""
+        result = await self._request("tools/call", {"name": tool_name, "arguments": kwargs})
+        text = "".join(c.get("text", "") for c in result.get("content", []) if c.get("type") == "text")
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return {"success": not result.get("isError", False), "text": text}
 
 
 class StartupDatabaseMCPTools:
@@ -87,8 +266,12 @@ class StartupDatabaseMCPTools:
     """
     
     def __init__(self):
-        self.mcp_client = MCPClient("startup_db")
         self.tools_definition = self._get_tools_definition()
+        self.registry = ToolRegistry()
+        for definition in self.tools_definition:
+            function = definition["function"]
+            self.registry.register(function["name"], getattr(self, f"_{function['name']}"),
+                                   function.get("description", ""), function.get("parameters"))
     
     def _get_tools_definition(self) -> List[Dict[str, Any]]:
         """Get the list of available tools for LLM function calling"""
@@ -316,13 +499,13 @@ class StartupDatabaseMCPTools:
                 "type": "function",
                 "function": {
                     "name": "search_events_by_date",
-                    "description": "Search for Slush events by date (e.g., 'Nov 19', 'Nov 20', 'November 19')",
+                    "description": "Search for Slush events on a date or running at a time (e.g., 'Nov 19', 'Nov 20 3pm', 'tomorrow evening', 'now')",
                     "parameters": {
                         "type": "object",
                         "properties": {
                             "date_query": {
                                 "type": "string",
-                                "description": "Date string to search for (e.g., 'Nov 19', 'Nov 20')"
+                                "description": "Date or time to search for (e.g., 'Nov 19', 'Nov 19 15:00')"
                             },
                             "limit": {
                                 "type": "integer",
@@ -370,6 +553,114 @@ class StartupDatabaseMCPTools:
                         }
                     }
                 }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "search_attendees_by_name",
+                    "description": "Search Slush attendees by name. Returns matching attendees with basic info.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Attendee name or partial name to search for"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of results",
+                                "default": 10
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "search_attendees_by_company",
+                    "description": "Search attendees by company name.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "company_name": {
+                                "type": "string",
+                                "description": "Company name to search for"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of results",
+                                "default": 10
+                            }
+                        },
+                        "required": ["company_name"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "search_attendees_by_country",
+                    "description": "Search attendees by country.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "country": {
+                                "type": "string",
+                                "description": "Country name or code (e.g., Finland, FI, USA)"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of results",
+                                "default": 20
+                            }
+                        },
+                        "required": ["country"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "search_attendees_by_occupation",
+                    "description": "Search attendees by occupation (e.g., CEO, Investor, Developer).",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "occupation": {
+                                "type": "string",
+                                "description": "Occupation type (e.g., CEO, founder, investor, developer)"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum number of results",
+                                "default": 10
+                            }
+                        },
+                        "required": ["occupation"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_attendee_details",
+                    "description": "Get detailed information about a specific attendee.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "attendee_id": {
+                                "type": "string",
+                                "description": "Attendee unique ID"
+                            },
+                            "name": {
+                                "type": "string",
+                                "description": "Attendee name (use if ID not available)"
+                            }
+                        }
+                    }
+                }
             }
         ]
     
@@ -393,50 +684,9 @@ class StartupDatabaseMCPTools:
         Returns:
             Result dictionary with tool output
         """
-        try:
-            # For now, we'll mock the tool calls since MCP integration is async
-            # In production, these would call the actual MCP server
-            
-            if tool_name == "search_startups_by_name":
-                return await self._search_startups_by_name(**kwargs)
-            elif tool_name == "search_startups_by_industry":
-                return await self._search_startups_by_industry(**kwargs)
-            elif tool_name == "get_startup_details":
-                return await self._get_startup_details(**kwargs)
-            elif tool_name == "search_startups_by_funding":
-                return await self._search_startups_by_funding(**kwargs)
-            elif tool_name == "search_startups_by_location":
-                return await self._search_startups_by_location(**kwargs)
-            elif tool_name == "get_startup_enrichment_data":
-                return await self._get_startup_enrichment_data(**kwargs)
-            elif tool_name == "get_top_startups_by_funding":
-                return await self._get_top_startups_by_funding(**kwargs)
-            elif tool_name == "search_events":
-                return await self._search_events(**kwargs)
-            elif tool_name == "search_events_by_organizer":
-                return await self._search_events_by_organizer(**kwargs)
-            elif tool_name == "search_events_by_category":
-                return await self._search_events_by_category(**kwargs)
-            elif tool_name == "search_events_by_date":
-                return await self._search_events_by_date(**kwargs)
-            elif tool_name == "get_event_details":
-                return await self._get_event_details(**kwargs)
-            elif tool_name == "get_all_event_organizers":
-                return await self._get_all_event_organizers(**kwargs)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown tool: {tool_name}"
-                }
-        
-        except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return await self.registry.call(tool_name, kwargs)
     
-    # Direct database access methods (bypassing MCP for now)
+    # Tool implementations (shared by the in-process registry and the MCP server)
     async def _search_startups_by_name(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """Search startups by name"""
         from database import SessionLocal
@@ -551,8 +801,8 @@ class StartupDatabaseMCPTools:
                     "founded": startup.founding_year,
                     "location": f"{startup.company_city}, {startup.company_country}",
                     "industry": startup.primary_industry,
-                    "totalFunding": startup.totalFunding,
-                    "stage": startup.currentInvestmentStage,
+                    "totalFunding": startup.total_funding,
+                    "stage": startup.funding_stage,
                     "employees": startup.employees,
                     "linkedIn": startup.company_linked_in,
                     "logo": startup.logoUrl
@@ -861,14 +1111,11 @@ class StartupDatabaseMCPTools:
     async def _search_events_by_date(self, date_query: str, limit: int = 10) -> Dict[str, Any]:
         """Search events by date"""
         from database import SessionLocal
-        from models import SlushEvent
+        from event_times import search_events_by_date
         
         try:
             db = SessionLocal()
-            events = db.query(SlushEvent)\
-                .filter(SlushEvent.datetime.ilike(f"%{date_query}%"))\
-                .limit(limit)\
-                .all()
+            events = search_events_by_date(db, date_query, limit)
             
             results = [
                 {
@@ -876,6 +1123,7 @@ class StartupDatabaseMCPTools:
                     "title": e.title,
                     "organizer": e.organizer,
                     "datetime": e.datetime,
+                    "starts_at": e.starts_at.isoformat() + "Z" if e.starts_at else None,
                     "location": e.location,
                     "categories": e.categories,
                     "status": e.status
@@ -985,3 +1233,96 @@ class StartupDatabaseMCPTools:
                 "success": False,
                 "error": str(e)
             }
+    
+    async def _search_attendees(self, query_func: Callable, value: str, limit: int, label: str) -> Dict[str, Any]:
+        from database import SessionLocal
+        
+        try:
+            db = SessionLocal()
+            try:
+                results = query_func(db, value, limit)
+            finally:
+                db.close()
+            
+            return {
+                "success": True,
+                "count": len(results),
+                "results": results
+            }
+        
+        except Exception as e:
+            logger.error(f"Error searching attendees by {label}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    async def _search_attendees_by_name(self, name: str, limit: int = 10) -> Dict[str, Any]:
+        """Search attendees by name"""
+        from db_queries import search_attendees_by_name
+        return await self._search_attendees(search_attendees_by_name, name, limit, "name")
+    
+    async def _search_attendees_by_company(self, company_name: str, limit: int = 10) -> Dict[str, Any]:
+        """Search attendees by company"""
+        from db_queries import search_attendees_by_company
+        return await self._search_attendees(search_attendees_by_company, company_name, limit, "company")
+    
+    async def _search_attendees_by_country(self, country: str, limit: int = 20) -> Dict[str, Any]:
+        """Search attendees by country"""
+        from db_queries import search_attendees_by_country
+        return await self._search_attendees(search_attendees_by_country, country, limit, "country")
+    
+    async def _search_attendees_by_occupation(self, occupation: str, limit: int = 10) -> Dict[str, Any]:
+        """Search attendees by occupation"""
+        from db_queries import search_attendees_by_occupation
+        return await self._search_attendees(search_attendees_by_occupation, occupation, limit, "occupation")
+    
+    async def _get_attendee_details(self, attendee_id: Optional[str] = None,
+                                    name: Optional[str] = None) -> Dict[str, Any]:
+        """Get attendee details by ID or name"""
+        from database import SessionLocal
+        from db_queries import get_attendee_by_id, search_attendees_by_name
+        
+        try:
+            db = SessionLocal()
+            try:
+                attendee = None
+                if attendee_id:
+                    attendee = get_attendee_by_id(db, attendee_id)
+                elif name:
+                    matches = search_attendees_by_name(db, name, 1)
+                    attendee = matches[0] if matches else None
+            finally:
+                db.close()
+            
+            if not attendee:
+                return {
+                    "success": False,
+                    "error": "Attendee not found"
+                }
+            
+            return {
+                "success": True,
+                "attendee": attendee
+            }
+        
+        except Exception as e:
+            logger.error(f"Error getting attendee details: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+
+_startup_tools: Optional[StartupDatabaseMCPTools] = None
+_startup_tools_lock = threading.Lock()
+
+
+def get_startup_tools() -> StartupDatabaseMCPTools:
+    """Process-wide tool set; its registry is what every transport dispatches to"""
+    global _startup_tools
+    if _startup_tools is None:
+        with _startup_tools_lock:
+            if _startup_tools is None:
+                _startup_tools = StartupDatabaseMCPTools()
+    return _startup_tools
@@ -4,9 +4,12 @@ Generates contextual questions and guides users through insights collection
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from llm_config import simple_llm_call_async
+from llm_config import simple_llm_call_async, llm_completion
+from conversation_memory import ConversationMemory, MemoryStore, llm_summarizer
 import json
 
+FEEDBACK_MODEL = "qwen/qwen3-next-80b-a3b-instruct"
+
 
 class MeetingFeedbackAssistant:
     """
@@ -52,6 +55,9 @@ Return format:
   "suggestions": ["optional", "clarifying", "questions"]
 }"""
         }
+        # Per-session summaries + token usage for /feedback/chat
+        self.memories = MemoryStore()
+        self.summarize = llm_summarizer(simple_llm_call_async, model=FEEDBACK_MODEL)
 
     async def generate_questions(
         self,
@@ -134,18 +140,18 @@ Return as JSON array:
         message: str,
         conversation_history: List[Dict[str, str]],
         current_question: Dict[str, Any],
-        is_first_message: bool = False
+        is_first_message: bool = False,
+        session_id: Optional[Any] = None,
+        startup_name: str = "",
+        questions: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Process a turn in the feedback conversation
-        """
-        # Build conversation context
-        messages = []
-        for msg in conversation_history[-6:]:  # Last 6 messages for context
-            messages.append(f"{msg['role']}: {msg['content']}")
-
-        context = "\n".join(messages)
 
+        The prompt starts with the same system prompt + session context on
+        every turn (cache-friendly prefix); older turns are summarized in the
+        background once they pass the memory's token threshold.
+        """
         if is_first_message:
             # First message - greet and ask first question
             return {
@@ -155,31 +161,33 @@ Return as JSON array:
                 "completed": False
             }
 
-        # User provided an answer - acknowledge and decide next step
-        prompt = f"""The user just answered this question:
-**Question**: {current_question['question']}
-**Their answer**: {message}
+        memory = self.memories.get(f"feedback:{session_id}") if session_id is not None \
+            else ConversationMemory("feedback:transient")
 
-Conversation so far:
-{context}
+        # User provided an answer (the last user message) - acknowledge and decide next step
+        instruction = f"""The user just answered this question:
+**Question**: {current_question['question']}
 
 Acknowledge their answer briefly (1 sentence) and indicate we're moving to the next question.
 Keep it warm and conversational."""
+        messages = memory.build_messages(
+            self.system_prompts["conversation_guide"],
+            self._session_context(startup_name, questions),
+            conversation_history or [{"role": "user", "content": message}],
+            instruction
+        )
 
         try:
-            response = await simple_llm_call_async(
-                prompt=prompt,
-                model="qwen/qwen3-next-80b-a3b-instruct",
-                system_message=self.system_prompts["conversation_guide"],
-                temperature=0.7
-            )
+            response = await memory.complete(llm_completion, messages, model=FEEDBACK_MODEL, temperature=0.7)
+            memory.schedule_compaction(conversation_history, self.summarize)
 
             return {
                 "response": response.strip(),
                 "question_id": current_question['id'],
                 "user_answer": message,
                 "waiting_for_answer": False,
-                "completed": False
+                "completed": False,
+                "usage": memory.usage.to_dict()
             }
 
         except Exception as e:
@@ -189,9 +197,18 @@ Keep it warm and conversational."""
                 "question_id": current_question['id'],
                 "user_answer": message,
                 "waiting_for_answer": False,
-                "completed": False
+                "completed": False,
+                "usage": memory.usage.to_dict()
             }
 
+    def _session_context(self, startup_name: str, questions: Optional[List[Dict[str, Any]]]) -> str:
+        """Per-session part of the stable prompt prefix - must not change between turns"""
+        lines = [f"Meeting with: {startup_name}"] if startup_name else []
+        if questions:
+            lines.append("Pre-defined questions:")
+            lines += [f"{i}. {q['question']}" for i, q in enumerate(questions, start=1)]
+        return "\n".join(lines)
+
     async def generate_completion_summary(
         self,
         startup_name: str,
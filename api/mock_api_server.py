@@ -0,0 +1,455 @@
+"""
+Local Mock API Server for Offline Benchmarks
+
+Stand-in for the two external APIs our pipelines depend on:
+- NVIDIA NIM chat completions (OpenAI-compatible, under /v1)
+- CB Insights v2 (authorize, firmographics, fundings, organizations,
+  scouting reports, ChatCBI)
+
+Latency, jitter, 429 rate and payload sizes are configurable so the
+evaluators, concierge and enrichment clients can be benchmarked without
+network access. Point the clients at it with:
+
+    NVIDIA_NIM_BASE_URL=http://127.0.0.1:8765/v1
+    CBI_BASE_URL=http://127.0.0.1:8765
+
+Usage:
+    python mock_api_server.py --port 8765 --latency-ms 300 --rate-limit 0.05
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import argparse
+import logging
+from dataclasses import dataclass, field, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FILLER = (
+    "Mock response generated by the offline benchmark server for "
+    "throughput measurement only. "
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)"""
+    return max(1, len(text) // 4) if text else 0
+
+
+def _filler(chars: int) -> str:
+    """Deterministic filler text of roughly `chars` characters"""
+    if chars <= 0:
+        return ""
+    repeats = chars // len(FILLER) + 1
+    return (FILLER * repeats)[:chars]
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour knobs for the mock server"""
+    latency_ms: float = 50.0  # Base latency added to every request
+    jitter_ms: float = 10.0  # Uniform +/- jitter on top of the base latency
+    rate_limit_ratio: float = 0.0  # Fraction of requests answered with 429
+    retry_after_seconds: int = 1  # Retry-After header sent with 429s
+    completion_tokens: int = 200  # Size of each chat completion
+    tokens_per_second: float = 0.0  # Simulated generation speed (0 = instant)
+    tool_calls_per_turn: int = 0  # Tool calls returned when the request offers tools
+    org_payload_bytes: int = 2048  # Padding per CB Insights org record
+    report_payload_bytes: int = 16384  # Size of a scouting report body
+    seed: int = 42
+
+
+@dataclass
+class MockServerStats:
+    """Counters collected while the server is running"""
+    requests: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    bytes_sent: int = 0
+    by_path: Dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> "MockServerStats":
+        return MockServerStats(**{**asdict(self), "by_path": dict(self.by_path)})
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the mock NIM / CB Insights handlers"""
+
+    server: "_MockHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("mock-api: " + format, *args)
+
+    # ---------- plumbing ----------
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return {}
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(bytes_sent=len(body))
+
+    def _simulate_latency(self, extra_seconds: float = 0.0):
+        config = self.server.config
+        jitter = self.server.uniform(-config.jitter_ms, config.jitter_ms)
+        delay = max(0.0, (config.latency_ms + jitter) / 1000.0) + extra_seconds
+        if delay:
+            time.sleep(delay)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        body = self._read_json() if method == "POST" else {}
+        self.server.record(path=path)
+
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "stats": asdict(self.server.stats)})
+            return
+
+        if self.server.should_rate_limit():
+            self._simulate_latency()
+            self.server.record(rate_limited=1)
+            self._send_json(
+                429,
+                {"error": "Too Many Requests (mock)"},
+                {"Retry-After": str(self.server.config.retry_after_seconds)},
+            )
+            return
+
+        routes = {
+            "/v1/chat/completions": self._chat_completions,
+            "/chat/completions": self._chat_completions,
+            "/v2/authorize": self._cbi_authorize,
+            "/v2/firmographics": self._cbi_firmographics,
+            "/v2/financialtransactions/fundings": self._cbi_fundings,
+            "/v2/organizations": self._cbi_organizations,
+            "/v2/chatcbi": self._cbi_chat,
+        }
+        handler = routes.get(path)
+        if handler is None:
+            match = re.fullmatch(r"/v2/organizations/(\d+)/scoutingreport", path)
+            if match:
+                self._simulate_latency()
+                self._cbi_scouting_report(int(match.group(1)))
+                return
+            self.server.record(errors=1)
+            self._send_json(404, {"error": f"Unknown mock endpoint: {path}"})
+            return
+
+        try:
+            handler(body)
+        except Exception as e:
+            logger.exception("mock-api handler failed")
+            self.server.record(errors=1)
+            self._send_json(500, {"error": str(e)})
+
+    # ---------- NVIDIA NIM ----------
+
+    def _chat_completions(self, body: Dict[str, Any]):
+        config = self.server.config
+        messages = body.get("messages") or []
+        prompt_text = "\n".join(
+            m.get("content") or "" for m in messages if isinstance(m.get("content"), str)
+        )
+        prompt_tokens = estimate_tokens(prompt_text)
+
+        message: Dict[str, Any] = {"role": "assistant"}
+        finish_reason = "stop"
+        tools = body.get("tools") or []
+        last_role = messages[-1].get("role") if messages else None
+
+        if tools and config.tool_calls_per_turn and last_role != "tool":
+            calls = []
+            for i, tool in enumerate(tools[: config.tool_calls_per_turn]):
+                name = (tool.get("function") or {}).get("name", f"tool_{i}")
+                calls.append({
+                    "id": f"call_mock_{i}",
+                    "type": "function",
+                    "function": {"name": name, "arguments": "{}"},
+                })
+            message["content"] = None
+            message["tool_calls"] = calls
+            finish_reason = "tool_calls"
+            completion_tokens = 20 * len(calls)
+        else:
+            content = self._build_completion(prompt_text, config.completion_tokens)
+            message["content"] = content
+            completion_tokens = estimate_tokens(content)
+
+        generation_seconds = (
+            completion_tokens / config.tokens_per_second if config.tokens_per_second else 0.0
+        )
+        self._simulate_latency(generation_seconds)
+        self.server.record(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{self.server.next_id()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock-model"),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    @staticmethod
+    def _build_completion(prompt_text: str, completion_tokens: int) -> str:
+        """Answer in the shape the caller expects (evaluator JSON array or prose)"""
+        startups = re.findall(r"^STARTUP \d+: (.+)$", prompt_text, re.MULTILINE)
+        target_chars = completion_tokens * 4
+        if not startups:
+            return _filler(target_chars)
+
+        per_startup = max(40, target_chars // len(startups) - 120)
+        results = [
+            {
+                "startup_name": name.strip(),
+                "evaluations": [{
+                    "category": "workflow_automation",
+                    "matches": True,
+                    "confidence": 70,
+                    "reasoning": _filler(per_startup),
+                }],
+            }
+            for name in startups
+        ]
+        return json.dumps(results)
+
+    # ---------- CB Insights ----------
+
+    def _cbi_authorize(self, body: Dict[str, Any]):
+        self._simulate_latency()
+        token = f"mock-token-{self.server.next_id()}"
+        self._send_json(200, {"token": token, "accessToken": token, "expiresIn": 3600})
+
+    def _org_record(self, org_id: int) -> Dict[str, Any]:
+        return {
+            "orgId": org_id,
+            "name": f"Mock Org {org_id}",
+            "url": f"https://mock-org-{org_id}.example.com",
+            "description": _filler(self.server.config.org_payload_bytes),
+            "foundedYear": 2015 + org_id % 9,
+            "employeeCount": 10 + org_id % 500,
+            "totalFunding": float(org_id % 100),
+        }
+
+    def _cbi_firmographics(self, body: Dict[str, Any]):
+        self._simulate_latency()
+        org_ids = body.get("orgIds") or []
+        self._send_json(200, {"orgs": [self._org_record(int(i)) for i in org_ids]})
+
+    def _cbi_fundings(self, body: Dict[str, Any]):
+        self._simulate_latency()
+        org_ids = body.get("orgIds") or []
+        orgs = [
+            {
+                "orgId": int(org_id),
+                "fundings": [
+                    {"round": stage, "amount": 1.5 * (n + 1), "date": f"202{n}-01-01"}
+                    for n, stage in enumerate(["Seed", "Series A", "Series B"])
+                ],
+            }
+            for org_id in org_ids
+        ]
+        self._send_json(200, {"orgs": orgs})
+
+    def _cbi_organizations(self, body: Dict[str, Any]):
+        self._simulate_latency()
+        names = body.get("names") or body.get("orgNames") or []
+        org_ids = body.get("orgIds") or []
+        orgs = [self._org_record(int(i)) for i in org_ids]
+        orgs += [
+            {**self._org_record(1000 + n), "name": name}
+            for n, name in enumerate(names)
+        ]
+        self._send_json(200, {"orgs": orgs})
+
+    def _cbi_scouting_report(self, org_id: int):
+        self._send_json(200, {
+            "orgId": org_id,
+            "title": f"Scouting report for Mock Org {org_id}",
+            "content": _filler(self.server.config.report_payload_bytes),
+        })
+
+    def _cbi_chat(self, body: Dict[str, Any]):
+        config = self.server.config
+        content = _filler(config.completion_tokens * 4)
+        generation_seconds = (
+            config.completion_tokens / config.tokens_per_second if config.tokens_per_second else 0.0
+        )
+        self._simulate_latency(generation_seconds)
+        self._send_json(200, {
+            "message": content,
+            "chatID": f"mock-chat-{self.server.next_id()}",
+            "sources": [],
+        })
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config: MockServerConfig):
+        super().__init__(address, _MockRequestHandler)
+        self.config = config
+        self.stats = MockServerStats()
+        self._lock = threading.Lock()
+        self._random = random.Random(config.seed)
+        self._counter = 0
+
+    def uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    def should_rate_limit(self) -> bool:
+        if self.config.rate_limit_ratio <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.config.rate_limit_ratio
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._counter += 1
+            return self._counter
+
+    def record(self, path: Optional[str] = None, **counters: int):
+        with self._lock:
+            if path is not None:
+                self.stats.requests += 1
+                self.stats.by_path[path] = self.stats.by_path.get(path, 0) + 1
+            for name, value in counters.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+
+class MockAPIServer:
+    """
+    Threaded local server that mimics NVIDIA NIM and CB Insights
+
+    Example:
+        with MockAPIServer(MockServerConfig(latency_ms=200)) as server:
+            os.environ["NVIDIA_NIM_BASE_URL"] = server.llm_base_url
+            ...
+            print(server.stats)
+    """
+
+    def __init__(self, config: Optional[MockServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockServerConfig()
+        self._httpd = _MockHTTPServer((host, port), self.config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        """Base URL for CB Insights clients (paths start with /v2)"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def llm_base_url(self) -> str:
+        """Base URL for OpenAI-compatible clients (NVIDIA_NIM_BASE_URL)"""
+        return f"{self.base_url}/v1"
+
+    @property
+    def stats(self) -> MockServerStats:
+        with self._httpd._lock:
+            return self._httpd.stats.snapshot()
+
+    def reset_stats(self):
+        with self._httpd._lock:
+            self._httpd.stats = MockServerStats()
+
+    def start(self) -> "MockAPIServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="mock-api-server", daemon=True
+            )
+            self._thread.start()
+            logger.info(f"Mock API server listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock NVIDIA NIM + CB Insights server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--completion-tokens", type=int, default=200)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--tool-calls", type=int, default=0, help="Tool calls returned per turn when tools are offered")
+    parser.add_argument("--org-payload-bytes", type=int, default=2048)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    config = MockServerConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit,
+        completion_tokens=args.completion_tokens,
+        tokens_per_second=args.tokens_per_second,
+        tool_calls_per_turn=args.tool_calls,
+        org_payload_bytes=args.org_payload_bytes,
+    )
+    server = MockAPIServer(config, host=args.host, port=args.port)
+    print(f"🧪 Mock API server on {server.base_url}")
+    print(f"   NVIDIA_NIM_BASE_URL={server.llm_base_url}")
+    print(f"   CBI_BASE_URL={server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
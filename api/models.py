@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Float
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, JSON, Text, Float, Index, UniqueConstraint, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime as dt
 
@@ -39,6 +39,15 @@ class CalendarEvent(Base):
     link = Column(String)
     is_fixed = Column(Boolean, default=True)
     highlight = Column(Boolean)
+    starts_at = Column(DateTime, index=True)  # UTC, maintained by event_times
+    ends_at = Column(DateTime)
+
+class CalendarEventAttendee(Base):
+    __tablename__ = "calendar_event_attendees"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(String, nullable=False, index=True)
+    attendee = Column(String, nullable=False)
 
 class LinkedInChatMessage(Base):
     __tablename__ = "linkedin_chat_messages"
@@ -60,7 +69,7 @@ class Vote(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     startupId = Column(String, name="startup_id", nullable=False, index=True)
-    userId = Column(String, name="user_id", nullable=False)
+    userId = Column(String, name="user_id", nullable=False, index=True)
     userName = Column(String, name="user_name", nullable=False)
     interested = Column(Boolean, nullable=False)
     timestamp = Column(DateTime, default=dt.utcnow)
@@ -148,6 +157,13 @@ class MeetingInsight(Base):
     userId = Column(String, nullable=False, index=True)
     startupId = Column(String, nullable=True)
     startupName = Column(String, nullable=True)
+    # Optional fields for user insights/notes
+    insight = Column(Text, nullable=True)
+    tags = Column(JSON, nullable=True)  # Array of insight tags/categories
+    rating = Column(Integer, nullable=True)  # Optional rating 1-5
+    followUp = Column(Boolean, default=False)  # Whether user wants to follow up
+    structured_qa = Column(JSON, nullable=True)  # Structured Q&A pairs for editing
+    timestamp = Column(DateTime, nullable=True)
 
 class SlushEvent(Base):
     __tablename__ = "slush_events"
@@ -155,20 +171,15 @@ class SlushEvent(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, index=True)
     organizer = Column(String, nullable=False, index=True)
-    datetime = Column(String, nullable=False)
+    datetime = Column(String, nullable=False)  # As scraped, e.g. "Nov 20, 10:00 AM – 12:00 PM" (Helsinki time)
+    starts_at = Column(DateTime, nullable=True, index=True)  # UTC, parsed from datetime by event_times
+    ends_at = Column(DateTime, nullable=True)
     location = Column(String, nullable=True)
     categories = Column(JSON, nullable=True)  # List of category tags
     status = Column(JSON, nullable=True)  # List of status tags (e.g., "Signature Side Event", "Closed")
     scraped_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=dt.utcnow)
     updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
-    # Optional fields for user insights/notes
-    insight = Column(Text, nullable=True)
-    tags = Column(JSON, nullable=True)  # Array of insight tags/categories
-    rating = Column(Integer, nullable=True)  # Optional rating 1-5
-    followUp = Column(Boolean, default=False)  # Whether user wants to follow up
-    structured_qa = Column(JSON, nullable=True)  # Structured Q&A pairs for editing
-    timestamp = Column(DateTime, nullable=True)
 
 class FeedbackSession(Base):
     __tablename__ = "feedback_sessions"
@@ -201,6 +212,9 @@ class NotificationQueue(Base):
     insightSubmitted = Column(Boolean, default=False)
     createdAt = Column(DateTime, default=dt.utcnow)
 
+    # Due-reminder scan: unsent rows by scheduledFor
+    __table_args__ = (Index("ix_notification_queue_due", "sent", "scheduledFor"),)
+
 class PushSubscription(Base):
     __tablename__ = "push_subscriptions"
     
@@ -341,3 +355,100 @@ class DebriefSession(Base):
     created_at = Column(DateTime, default=dt.utcnow)
     updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
     completed_at = Column(DateTime, nullable=True)
+
+
+class BackgroundJob(Base):
+    """
+    Persistent job queue entry (see job_queue.py).
+    Jobs survive restarts: queued rows are picked up again and running rows
+    whose worker died are re-queued on startup.
+    """
+    __tablename__ = "background_jobs"
+    
+    id = Column(String, primary_key=True)  # uuid4 hex
+    kind = Column(String, nullable=False, index=True)  # e.g. "debrief_insights"
+    status = Column(String, nullable=False, default="queued", index=True)  # queued, running, succeeded, failed
+    dedupe_key = Column(String, index=True, nullable=True)  # At most one queued/running job per key
+    
+    payload = Column(JSON)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    # Retries
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    run_after = Column(DateTime, default=dt.utcnow, index=True)  # Backoff: not before this time
+    
+    # Worker lease
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=dt.utcnow)
+    updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class InsightCard(Base):
+    """
+    Materialized read model for the insights / whitepaper views.
+    One pre-rendered card per CategorizedInsight ("categorized" feed) or
+    MeetingInsight ("meeting" feed), kept in sync on flush by
+    insight_read_model.py and paged by (category, created_ms, source_id).
+    """
+    __tablename__ = "insight_cards"
+    __table_args__ = (
+        UniqueConstraint("feed", "source_id", name="uq_insight_cards_source"),
+        Index("ix_insight_cards_page", "feed", "category", "created_ms", "source_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    feed = Column(String, nullable=False)  # categorized, meeting
+    source_id = Column(Integer, nullable=False)  # Row id in the source table
+    category = Column(String, nullable=False)  # "1" through "10"
+    created_ms = Column(BigInteger, nullable=False)  # Sort key (newest first)
+    card = Column(JSON, nullable=False)  # Idea-shaped dict served as-is
+
+
+class InsightFeedVersion(Base):
+    """Per-category change counter + row count for an insight feed (drives ETags)"""
+    __tablename__ = "insight_feed_versions"
+    
+    feed = Column(String, primary_key=True)
+    category = Column(String, primary_key=True)
+    version = Column(Integer, default=0)
+    count = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
+
+
+class MapsCacheEntry(Base):
+    """
+    Cached Google Maps response (directions, place details, nearby search),
+    keyed by the normalized request. Read through google_maps_integration.MapsCache.
+    """
+    __tablename__ = "maps_cache"
+    __table_args__ = (
+        UniqueConstraint("kind", "key", name="uq_maps_cache_kind_key"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # directions, place, nearby
+    key = Column(String, nullable=False)  # e.g. "walking|messukeskus|kamppi"
+    payload = Column(JSON, nullable=False)  # Raw API response
+    fetched_at = Column(DateTime, default=dt.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+class UserSeenSet(Base):
+    """
+    Per-user bitmaps over startup ids (bit n = startup n): every startup the
+    user voted on, and the ones voted interested. Maintained by seen_sets.py
+    alongside crud.create_vote / delete_vote.
+    """
+    __tablename__ = "user_seen_sets"
+    
+    user_id = Column(String, primary_key=True)
+    seen = Column(LargeBinary, nullable=False)  # Little-endian bitmap
+    interested = Column(LargeBinary, nullable=False)
+    version = Column(Integer, default=1, nullable=False)  # Bumped on every change
+    updated_at = Column(DateTime, default=dt.utcnow, onupdate=dt.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Text, Float, ForeignKey, Index
 from datetime import datetime
 from models import Base  # Import the shared Base class
 
@@ -265,3 +265,35 @@ class FundingRound(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+
+# ============================================
+# Facet junction tables
+# ============================================
+# One row per (startup, value) of the JSON array columns the swipe filters
+# and facet counts use; kept in sync with startups by startup_facets.py.
+
+class StartupTopic(Base):
+    """Startup.topics, one row per topic"""
+    __tablename__ = "startup_topics"
+    __table_args__ = (Index("ix_startup_topics_topic", "topic", "startup_id"),)
+
+    startup_id = Column(Integer, ForeignKey('startups.id', ondelete="CASCADE"), primary_key=True)
+    topic = Column(String, primary_key=True)
+
+
+class StartupUseCase(Base):
+    """Startup.axa_use_cases, one row per use case"""
+    __tablename__ = "startup_use_cases"
+    __table_args__ = (Index("ix_startup_use_cases_use_case", "use_case", "startup_id"),)
+
+    startup_id = Column(Integer, ForeignKey('startups.id', ondelete="CASCADE"), primary_key=True)
+    use_case = Column(String, primary_key=True)
+
+
+class StartupTech(Base):
+    """Startup.tech, one row per technology tag"""
+    __tablename__ = "startup_tech"
+    __table_args__ = (Index("ix_startup_tech_tech", "tech", "startup_id"),)
+
+    startup_id = Column(Integer, ForeignKey('startups.id', ondelete="CASCADE"), primary_key=True)
+    tech = Column(String, primary_key=True)
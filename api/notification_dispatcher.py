@@ -0,0 +1,274 @@
+"""
+Batched Web Push Dispatcher for post-meeting insight reminders
+
+send_pending_notifications used to do, per due notification, one meeting
+query, one subscription query, a blocking webpush() call and a commit. The
+dispatcher instead works a batch at a time:
+
+- one joined query for due notifications + their meeting titles, one IN
+  query for every active subscription of those users
+- pushes go out concurrently (bounded by a semaphore) over one pooled
+  httpx.AsyncClient, so connections to the push services are reused
+- VAPID Authorization headers are signed once per push-service origin and
+  reused until shortly before they expire
+- sent flags, lastUsed stamps and dead subscriptions (404 / 410) are
+  written with a single commit per batch
+
+The request builder (payload encryption + VAPID) is injectable; the default
+one needs pywebpush / py-vapid and only imports them on first use.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy.orm import Session
+
+from models import CalendarEvent, NotificationQueue, PushSubscription
+
+logger = logging.getLogger(__name__)
+
+VAPID_PRIVATE_KEY = os.getenv("VAPID_PRIVATE_KEY", "")
+VAPID_PUBLIC_KEY = os.getenv("VAPID_PUBLIC_KEY", "")
+VAPID_CLAIMS = {
+    "sub": "mailto:support@slush2025.com"
+}
+
+DISPATCH_CONCURRENCY = 50
+DISPATCH_BATCH_SIZE = 200
+PUSH_TIMEOUT_SECONDS = 10.0
+PUSH_TTL_SECONDS = 60 * 60  # A reminder older than an hour isn't worth delivering
+VAPID_TOKEN_SECONDS = 12 * 60 * 60
+GONE_STATUSES = (404, 410)
+
+# (subscription, payload bytes) -> (url, headers, body)
+RequestBuilder = Callable[[PushSubscription, bytes], Tuple[str, Dict[str, str], bytes]]
+
+
+def push_configured() -> bool:
+    return bool(VAPID_PRIVATE_KEY and VAPID_PUBLIC_KEY)
+
+
+def insight_reminder_payload(notification: NotificationQueue, meeting_title: Optional[str]) -> Dict[str, Any]:
+    """Notification shown by the service worker for one meeting"""
+    return {
+        "title": "🎯 Share Your Insight",
+        "body": f"How was {meeting_title or 'your meeting'}? Share one key insight!",
+        "icon": "/icon-192.png",
+        "badge": "/badge-72.png",
+        "tag": f"meeting-insight-{notification.meetingId}",
+        "requireInteraction": True,
+        "data": {
+            "meetingId": notification.meetingId,
+            "url": f"/?view=insights&meeting={notification.meetingId}",
+            "action": "submit-insight"
+        },
+        "actions": [
+            {
+                "action": "submit",
+                "title": "Share Insight"
+            },
+            {
+                "action": "dismiss",
+                "title": "Later"
+            }
+        ]
+    }
+
+
+class WebPushRequestBuilder:
+    """aes128gcm-encrypted body + VAPID headers, signed once per push service origin"""
+
+    def __init__(self, private_key: str = VAPID_PRIVATE_KEY, claims: Optional[Dict[str, Any]] = None,
+                 ttl: int = PUSH_TTL_SECONDS):
+        from pywebpush import WebPusher
+        from py_vapid import Vapid
+
+        self._pusher = WebPusher
+        self._vapid = Vapid.from_string(private_key=private_key)
+        self.claims = dict(claims or VAPID_CLAIMS)
+        self.ttl = ttl
+        self._headers: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+    def vapid_headers(self, endpoint: str) -> Dict[str, str]:
+        url = urlparse(endpoint)
+        audience = f"{url.scheme}://{url.netloc}"
+        cached = self._headers.get(audience)
+        if cached and cached[0] - time.time() > 60 * 60:
+            return cached[1]
+        expires = int(time.time()) + VAPID_TOKEN_SECONDS
+        headers = self._vapid.sign({**self.claims, "aud": audience, "exp": expires})
+        self._headers[audience] = (expires, headers)
+        return headers
+
+    def __call__(self, subscription: PushSubscription, payload: bytes) -> Tuple[str, Dict[str, str], bytes]:
+        info = {"endpoint": subscription.endpoint, "keys": {"p256dh": subscription.p256dh, "auth": subscription.auth}}
+        body = self._pusher(info).encode(payload, content_encoding="aes128gcm")["body"]
+        headers = {
+            **self.vapid_headers(subscription.endpoint),
+            "content-encoding": "aes128gcm",
+            "content-type": "application/octet-stream",
+            "ttl": str(self.ttl),
+            "urgency": "high",
+        }
+        return subscription.endpoint, headers, body
+
+
+@dataclass
+class DispatchStats:
+    due: int = 0
+    sent: int = 0
+    pushes: int = 0
+    failed_pushes: int = 0
+    pruned_subscriptions: int = 0
+    no_subscription: int = 0
+    batches: int = 0
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class NotificationDispatcher:
+    """Sends due NotificationQueue rows in batches over a pooled HTTP client"""
+
+    def __init__(
+        self,
+        build_request: Optional[RequestBuilder] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        concurrency: int = DISPATCH_CONCURRENCY,
+        batch_size: int = DISPATCH_BATCH_SIZE,
+    ):
+        self._build_request = build_request
+        self._client = client
+        self._owns_client = client is None
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+
+    @property
+    def ready(self) -> bool:
+        """True when pushes can be built (VAPID keys set, or a builder was injected)"""
+        return self._build_request is not None or push_configured()
+
+    @property
+    def build_request(self) -> RequestBuilder:
+        if self._build_request is None:
+            self._build_request = WebPushRequestBuilder()
+        return self._build_request
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=PUSH_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    def load_due(
+        self, db: Session, now: datetime, after_id: int = 0
+    ) -> Tuple[List[Tuple[NotificationQueue, Optional[str]]], Dict[str, List[PushSubscription]]]:
+        """One batch of due notifications with meeting titles, plus the users' active subscriptions"""
+        due = db.query(NotificationQueue, CalendarEvent.title).outerjoin(
+            CalendarEvent, CalendarEvent.id == NotificationQueue.meetingId
+        ).filter(
+            NotificationQueue.sent == False,
+            NotificationQueue.dismissed == False,
+            NotificationQueue.insightSubmitted == False,
+            NotificationQueue.scheduledFor <= now,
+            NotificationQueue.id > after_id
+        ).order_by(NotificationQueue.id).limit(self.batch_size).all()
+
+        subscriptions: Dict[str, List[PushSubscription]] = {}
+        user_ids = {notification.userId for notification, _ in due}
+        if user_ids:
+            for subscription in db.query(PushSubscription).filter(
+                PushSubscription.userId.in_(user_ids),
+                PushSubscription.active == True
+            ):
+                subscriptions.setdefault(subscription.userId, []).append(subscription)
+        return due, subscriptions
+
+    async def _push(self, semaphore: asyncio.Semaphore, subscription: PushSubscription, payload: bytes) -> Optional[int]:
+        async with semaphore:
+            try:
+                url, headers, body = self.build_request(subscription, payload)
+                response = await self.client.post(url, headers=headers, content=body)
+                return response.status_code
+            except Exception as e:
+                logger.warning(f"Push to subscription {subscription.id} failed: {e}")
+                return None
+
+    async def dispatch(self, db: Session, now: Optional[datetime] = None) -> DispatchStats:
+        """Send everything due at `now`; returns per-tick stats"""
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        stats = DispatchStats()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        after_id = 0
+
+        while True:
+            due, subscriptions = self.load_due(db, now, after_id)
+            if not due:
+                break
+            stats.batches += 1
+            stats.due += len(due)
+            after_id = due[-1][0].id
+
+            sends = []  # (notification, subscription, coroutine)
+            for notification, title in due:
+                targets = subscriptions.get(notification.userId, [])
+                if not targets:
+                    stats.no_subscription += 1
+                    continue
+                payload = json.dumps(insight_reminder_payload(notification, title)).encode("utf-8")
+                sends += [(notification, s, self._push(semaphore, s, payload)) for s in targets]
+
+            statuses = await asyncio.gather(*(coro for _, _, coro in sends))
+
+            sent_at = datetime.utcnow()
+            delivered = set()
+            for (notification, subscription, _), status in zip(sends, statuses):
+                stats.pushes += 1
+                if status is not None and 200 <= status < 300:
+                    subscription.lastUsed = sent_at
+                    delivered.add(notification.id)
+                    continue
+                stats.failed_pushes += 1
+                if status in GONE_STATUSES and subscription.active:
+                    subscription.active = False
+                    stats.pruned_subscriptions += 1
+            for notification, _ in due:
+                if notification.id in delivered:
+                    notification.sent = True
+                    notification.sentAt = sent_at
+            stats.sent += len(delivered)
+            db.commit()
+
+            if len(due) < self.batch_size:
+                break
+
+        stats.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        return stats
+
+
+def next_due_at(db: Session, now: Optional[datetime] = None) -> Optional[datetime]:
+    """scheduledFor of the next reminder after now, so the worker can wake exactly then"""
+    return db.query(NotificationQueue.scheduledFor).filter(
+        NotificationQueue.sent == False,
+        NotificationQueue.dismissed == False,
+        NotificationQueue.insightSubmitted == False,
+        NotificationQueue.scheduledFor > (now or datetime.utcnow())
+    ).order_by(NotificationQueue.scheduledFor).limit(1).scalar()
@@ -3,31 +3,29 @@ Notification Service for Post-Meeting Insights
 Handles scheduling, sending, and tracking of push notifications
 """
 import asyncio
-import json
+import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
-from pywebpush import webpush, WebPushException
-import os
 from dotenv import load_dotenv
 
 from models import NotificationQueue, PushSubscription, MeetingInsight, CalendarEvent
 from database import SessionLocal
+from notification_dispatcher import NotificationDispatcher, DispatchStats, next_due_at
 
 load_dotenv()
 
-# VAPID keys for web push (generate these for production)
-VAPID_PRIVATE_KEY = os.getenv("VAPID_PRIVATE_KEY", "")
-VAPID_PUBLIC_KEY = os.getenv("VAPID_PUBLIC_KEY", "")
-VAPID_CLAIMS = {
-    "sub": "mailto:support@slush2025.com"
-}
+logger = logging.getLogger(__name__)
+
+WORKER_POLL_SECONDS = 60
 
 class NotificationService:
     """Service to manage post-meeting insight notifications"""
     
-    def __init__(self):
+    def __init__(self, dispatcher: Optional[NotificationDispatcher] = None):
         self.notification_delay_minutes = 5  # Send notification 5 minutes after meeting ends
+        self.dispatcher = dispatcher or NotificationDispatcher()
+        self.last_dispatch: Optional[DispatchStats] = None
     
     async def schedule_meeting_insight_notification(
         self,
@@ -84,123 +82,18 @@ class NotificationService:
         Check for pending notifications and send them if it's time
         Should be called periodically (e.g., every minute)
         
-        Returns:
-            Number of notifications sent
-        """
-        now = datetime.utcnow()
-        
-        # Find notifications that should be sent
-        pending = db.query(NotificationQueue).filter(
-            NotificationQueue.sent == False,
-            NotificationQueue.dismissed == False,
-            NotificationQueue.insightSubmitted == False,
-            NotificationQueue.scheduledFor <= now
-        ).all()
-        
-        sent_count = 0
-        
-        for notification in pending:
-            # Get meeting details
-            meeting = db.query(CalendarEvent).filter(
-                CalendarEvent.id == int(notification.meetingId) if notification.meetingId.isdigit() else -1
-            ).first()
-            
-            meeting_title = meeting.title if meeting else "your meeting"
-            
-            # Get user's push subscriptions
-            subscriptions = db.query(PushSubscription).filter(
-                PushSubscription.userId == notification.userId,
-                PushSubscription.active == True
-            ).all()
-            
-            if subscriptions:
-                # Send push notification to all user's devices
-                success = await self._send_push_notification(
-                    subscriptions=subscriptions,
-                    notification_data={
-                        "title": "🎯 Share Your Insight",
-                        "body": f"How was {meeting_title}? Share one key insight!",
-                        "icon": "/icon-192.png",
-                        "badge": "/badge-72.png",
-                        "tag": f"meeting-insight-{notification.meetingId}",
-                        "requireInteraction": True,
-                        "data": {
-                            "meetingId": notification.meetingId,
-                            "url": f"/?view=insights&meeting={notification.meetingId}",
-                            "action": "submit-insight"
-                        },
-                        "actions": [
-                            {
-                                "action": "submit",
-                                "title": "Share Insight"
-                            },
-                            {
-                                "action": "dismiss",
-                                "title": "Later"
-                            }
-                        ]
-                    }
-                )
-                
-                if success:
-                    notification.sent = True
-                    notification.sentAt = datetime.utcnow()
-                    sent_count += 1
-            
-            db.commit()
+        Due reminders are loaded and pushed in batches by the dispatcher
+        (bulk queries, concurrent sends, one commit per batch).
         
-        return sent_count
-    
-    async def _send_push_notification(
-        self,
-        subscriptions: List[PushSubscription],
-        notification_data: Dict[str, Any]
-    ) -> bool:
-        """
-        Send a push notification to multiple subscriptions
-        
-        Args:
-            subscriptions: List of push subscriptions
-            notification_data: Notification payload
-            
         Returns:
-            True if at least one notification was sent successfully
+            Number of notifications sent
         """
-        if not VAPID_PRIVATE_KEY or not VAPID_PUBLIC_KEY:
-            print("Warning: VAPID keys not configured. Push notifications disabled.")
-            return False
-        
-        success = False
+        if not self.dispatcher.ready:
+            logger.warning("VAPID keys not configured. Push notifications disabled.")
+            return 0
         
-        for subscription in subscriptions:
-            try:
-                subscription_info = {
-                    "endpoint": subscription.endpoint,
-                    "keys": {
-                        "p256dh": subscription.p256dh,
-                        "auth": subscription.auth
-                    }
-                }
-                
-                webpush(
-                    subscription_info=subscription_info,
-                    data=json.dumps(notification_data),
-                    vapid_private_key=VAPID_PRIVATE_KEY,
-                    vapid_claims=VAPID_CLAIMS
-                )
-                
-                subscription.lastUsed = datetime.utcnow()
-                success = True
-                
-            except WebPushException as e:
-                print(f"Failed to send push notification: {e}")
-                if e.response and e.response.status_code == 410:
-                    # Subscription expired
-                    subscription.active = False
-            except Exception as e:
-                print(f"Error sending push notification: {e}")
-        
-        return success
+        self.last_dispatch = await self.dispatcher.dispatch(db)
+        return self.last_dispatch.sent
     
     async def dismiss_notification(
         self,
@@ -382,22 +275,36 @@ class NotificationService:
 
 
 # Background task to send notifications periodically
-async def notification_worker():
+async def notification_worker(service: Optional[NotificationService] = None,
+                              poll_seconds: float = WORKER_POLL_SECONDS):
     """
-    Background worker that checks for pending notifications every minute
+    Background worker that sends due notifications
     Should be run as a separate async task
+    
+    Wakes every poll_seconds, or earlier when the next reminder comes due,
+    so reminders go out on time rather than up to a minute late.
     """
-    service = NotificationService()
+    service = service or NotificationService()
     
-    while True:
-        try:
+    try:
+        while True:
+            delay = poll_seconds
             db = SessionLocal()
-            sent_count = await service.send_pending_notifications(db)
-            if sent_count > 0:
-                print(f"Sent {sent_count} insight reminder notifications")
-            db.close()
-        except Exception as e:
-            print(f"Error in notification worker: {e}")
-        
-        # Wait 1 minute before checking again
-        await asyncio.sleep(60)
+            try:
+                sent_count = await service.send_pending_notifications(db)
+                if sent_count > 0:
+                    stats = service.last_dispatch
+                    logger.info(f"🔔 Sent {sent_count} insight reminder notifications "
+                                f"({stats.pushes} pushes, {stats.pruned_subscriptions} dead subscriptions pruned) "
+                                f"in {stats.duration_ms:.0f}ms")
+                upcoming = next_due_at(db)
+                if upcoming is not None:
+                    delay = min(poll_seconds, max((upcoming - datetime.utcnow()).total_seconds(), 0.5))
+            except Exception as e:
+                logger.error(f"Error in notification worker: {e}")
+            finally:
+                db.close()
+            
+            await asyncio.sleep(delay)
+    finally:
+        await service.dispatcher.aclose()
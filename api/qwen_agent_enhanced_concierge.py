@@ -464,7 +464,7 @@ class SearchEventsByOrganizer(BaseTool):
 class SearchEventsByDate(BaseTool):
     """Find events happening on specific dates"""
     
-    description = 'Find events happening on a specific date (e.g., "Nov 19", "Nov 20", "November 19").'
+    description = 'Find events happening on a date or at a time (e.g., "Nov 19", "Nov 20 3pm", "tomorrow evening", "now").'
     parameters = [
         {
             'name': 'date_query',
@@ -486,7 +486,7 @@ class SearchEventsByDate(BaseTool):
     
     @traceable(name="search_events_by_date", tags=["tool", "database", "events"])
     def call(self, params: Dict[str, Any], **kwargs) -> str:
-        from models import SlushEvent
+        from event_times import search_events_by_date
         
         if isinstance(params, str):
             import json
@@ -496,9 +496,7 @@ class SearchEventsByDate(BaseTool):
         limit = params.get('limit', 10)
         
         try:
-            events = self.db.query(SlushEvent).filter(
-                SlushEvent.datetime.ilike(f"%{date_query}%")
-            ).limit(limit).all()
+            events = search_events_by_date(self.db, date_query, limit)
             
             if not events:
                 return f"Not finding events for '{date_query}'. Maybe try 'Nov 19' or 'Nov 20'?"
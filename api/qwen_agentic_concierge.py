@@ -136,7 +136,7 @@ class ToolRegistry:
                 'function': self._search_events_by_organizer
             },
             'search_events_by_date': {
-                'description': 'Find events happening on a specific date (e.g., "Nov 19", "Nov 20", "November 19").',
+                'description': 'Find events happening on a date or at a time (e.g., "Nov 19", "Nov 20 3pm", "tomorrow evening", "now").',
                 'parameters': {
                     'date_query': 'Date string to search for',
                     'limit': 'Maximum results (default: 10)'
@@ -421,12 +421,10 @@ Optimized query:"""
     @traceable(name="search_events_by_date", tags=["tool", "database", "events"])
     def _search_events_by_date(self, date_query: str, limit: int = 10) -> str:
         """Search Slush events by date"""
-        from models import SlushEvent
+        from event_times import search_events_by_date
         
         try:
-            events = self.db.query(SlushEvent).filter(
-                SlushEvent.datetime.ilike(f"%{date_query}%")
-            ).limit(limit).all()
+            events = search_events_by_date(self.db, date_query, limit)
             
             if not events:
                 return f"No events found for '{date_query}'"
@@ -43,6 +43,7 @@ from database import SessionLocal
 import db_queries
 from cb_insights_integration import cb_chat
 from llm_config import llm_completion
+from tool_runner import execute_tool_calls, assistant_tool_call_message
 
 logger = logging.getLogger(__name__)
 
@@ -317,6 +318,11 @@ class ToolExecutor:
         }
         
         if tool_name not in tool_map:
+            # Anything else the MCP server exposes runs in-process on the shared registry
+            from mcp_client import get_startup_tools
+            registry = get_startup_tools().registry
+            if tool_name in registry:
+                return json.dumps(await registry.call(tool_name, parameters), default=str)
             return f"Error: Unknown tool '{tool_name}'"
         
         try:
@@ -330,6 +336,14 @@ class ToolExecutor:
         except Exception as e:
             logger.error(f"Tool execution error ({tool_name}): {e}")
             return f"Tool execution error: {str(e)}"
+    
+    async def execute_tool_isolated(self, tool_name: str, parameters: Dict[str, Any]) -> str:
+        """Execute a tool on its own DB session, so parallel calls never share one"""
+        db = SessionLocal()
+        try:
+            return await ToolExecutor(db).execute_tool(tool_name, parameters)
+        finally:
+            db.close()
 
 
 # ====================
@@ -408,41 +422,11 @@ Remember: You're helping attendees make valuable connections at Slush 2025! 🚀
             logger.info(f"Iteration {iteration}: Model requested {len(message.tool_calls)} tool call(s)")
             
             # Add assistant message with tool calls
-            messages.append({
-                "role": "assistant",
-                "content": message.content or "",
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    }
-                    for tc in message.tool_calls
-                ]
-            })
+            messages.append(assistant_tool_call_message(message))
             
-            # Execute each tool call
-            for tool_call in message.tool_calls:
-                tool_name = tool_call.function.name
-                try:
-                    parameters = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError:
-                    parameters = {}
-                
-                logger.info(f"Executing tool: {tool_name} with {parameters}")
-                result = await self.tools.execute_tool(tool_name, parameters)
-                logger.info(f"Tool result: {result[:200]}...")
-                
-                # Add tool result
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": tool_name,
-                    "content": result
-                })
+            # Independent calls run concurrently; results keep the requested order
+            results = await execute_tool_calls(message.tool_calls, self.tools.execute_tool_isolated)
+            messages.extend(result.to_message() for result in results)
             
             # Continue to next iteration
             return "", messages, False
@@ -10,12 +10,14 @@ import json
 from typing import List, Optional, Set
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, case, func, or_
 from datetime import datetime
 
 from database import get_db
+from analytics_snapshot import get_snapshot
+from seen_sets import get_seen_set
+from startup_facets import FACETS, facet_column, facet_counts, facet_values_for, has_facet, top_per_value
 from models_startup import Startup
-from models import Vote
 
 router = APIRouter(prefix="/startups", tags=["startups"])
 
@@ -96,27 +98,56 @@ def startup_to_dict(startup: Startup) -> dict:
     }
 
 
+GRADE_SCORES = {
+    'A+': 100,
+    'A': 90,
+    'B+': 80,
+    'B': 70,
+    'C+': 60,
+    'C': 50
+}
+
+# grade_to_score() as a SQL expression, for ORDER BY
+GRADE_SCORE_SQL = case(GRADE_SCORES, value=Startup.axa_grade, else_=0)
+
+# Phase 1 reads ranked startups this many at a time until it has enough unseen ones
+PHASE1_PAGE_SIZE = 50
+
+# Phase 2 candidate tiers, tried in order until one has unseen startups
+CANDIDATE_TIERS = [
+    ("Tier 2: High", Startup.axa_priority_tier.like('%Tier 2%')),
+    ("Tier 3: Medium", Startup.axa_priority_tier.like('%Tier 3%')),
+    ("Tier 4: Low", Startup.axa_priority_tier.like('%Tier 4%')),
+    ("Unrated", Startup.axa_priority_tier.is_(None)),
+]
+
+
+def _topic_text():
+    return func.lower(facet_column("topics"))
+
+
+# Phase 1 "Agentic" startups: any topic mentioning agentic, or both AI and agent
+AGENTIC_TOPIC = has_facet("topics", or_(
+    _topic_text().contains("agentic"),
+    and_(_topic_text().contains("ai"), _topic_text().contains("agent")),
+))
+
+
 def grade_to_score(grade: str) -> float:
     """
     Convert AXA letter grade to numeric score
     A+ = 100, A = 90, B+ = 80, B = 70, C+ = 60, C = 50, None/Other = 0
     """
-    grade_map = {
-        'A+': 100,
-        'A': 90,
-        'B+': 80,
-        'B': 70,
-        'C+': 60,
-        'C': 50
-    }
-    return grade_map.get(grade, 0)
+    return GRADE_SCORES.get(grade, 0)
 
 
 def calculate_recommendation_score(
     candidate: Startup,
     preference_topics: Set[str],
     preference_maturity: dict,
-    preference_use_cases: Set[str]
+    preference_use_cases: Set[str],
+    candidate_topics: Optional[Set[str]] = None,
+    candidate_use_cases: Optional[Set[str]] = None
 ) -> float:
     """
     Score a startup candidate based on quality and user preferences
@@ -130,6 +161,9 @@ def calculate_recommendation_score(
     
     Final score = grade_score * 100 + preference_bonus
     This ensures highest quality startups always ranked first
+
+    candidate_topics / candidate_use_cases skip parsing the JSON columns
+    when the caller already has them (from the facet tables)
     """
     # Foundation: AXA grade (most important)
     grade_score = grade_to_score(candidate.axa_grade)
@@ -139,12 +173,14 @@ def calculate_recommendation_score(
     preference_bonus = 0
     
     # Topic matching
-    candidate_topics = set(parse_array(candidate.topics))
+    if candidate_topics is None:
+        candidate_topics = set(parse_array(candidate.topics))
     topic_matches = len(candidate_topics & preference_topics)
     preference_bonus += topic_matches * 20
     
     # Use case matching
-    candidate_use_cases = set(parse_array(candidate.axa_use_cases))
+    if candidate_use_cases is None:
+        candidate_use_cases = set(parse_array(candidate.axa_use_cases))
     use_case_matches = len(candidate_use_cases & preference_use_cases)
     preference_bonus += use_case_matches * 10
     
@@ -177,47 +213,29 @@ def get_phase1_startups(
         "phase_transition_at": 20
     }
     """
-    import random
-    
-    # Get user's voted IDs
-    user_votes = db.query(Vote).filter(Vote.userId == user_id).all()
-    voted_ids = {v.startupId for v in user_votes}
-    
-    # Get all startups, excluding voted ones
-    query = db.query(Startup)
-    if voted_ids:
-        query = query.filter(~Startup.id.in_(voted_ids))
-    
-    all_startups = query.all()
-    
-    if not all_startups:
+    # Startups the user has voted on (bitmap, no Vote rows loaded)
+    seen = get_seen_set(db, user_id)
+    
+    def top_unseen(topic_filter, n: int = 10) -> List[Startup]:
+        """Top n unseen by axa_grade (highest first: A+ > A > B+ > B > C+ > C), read a page at a time"""
+        ranked = db.query(Startup).filter(topic_filter).order_by(GRADE_SCORE_SQL.desc(), Startup.id)
+        found: List[Startup] = []
+        offset = 0
+        while len(found) < n:
+            page = ranked.offset(offset).limit(PHASE1_PAGE_SIZE).all()
+            found += [s for s in page if s.id not in seen]
+            if len(page) < PHASE1_PAGE_SIZE:
+                break
+            offset += PHASE1_PAGE_SIZE
+        return found[:n]
+    
+    # Top 10 Agentic and top 10 from other topics; the topic test runs on startup_topics
+    agentic_sorted = top_unseen(AGENTIC_TOPIC)
+    other_sorted = top_unseen(~AGENTIC_TOPIC)
+    
+    if not agentic_sorted and not other_sorted:
         raise HTTPException(status_code=404, detail="No startups available")
     
-    # Separate Agentic from others
-    agentic_startups = []
-    other_startups = []
-    
-    for startup in all_startups:
-        topics = parse_array(startup.topics)
-        if any('agentic' in t.lower() or 'ai' in t.lower() and 'agent' in t.lower() for t in topics):
-            agentic_startups.append(startup)
-        else:
-            other_startups.append(startup)
-    
-    # Get top 10 Agentic by axa_grade (highest first: A+ > A > B+ > B > C+ > C)
-    agentic_sorted = sorted(
-        agentic_startups,
-        key=lambda s: grade_to_score(s.axa_grade),
-        reverse=True
-    )[:10]
-    
-    # Get 10 other topics, sorted by axa_grade (highest first: A+ > A > B+ > B > C+ > C)
-    other_sorted = sorted(
-        other_startups,
-        key=lambda s: grade_to_score(s.axa_grade),
-        reverse=True
-    )[:10]
-    
     result = agentic_sorted + other_sorted
     
     return {
@@ -273,77 +291,56 @@ def get_phase2_startups(
         except ValueError:
             pass
     
-    # Add user's voted IDs to excluded
-    user_votes = db.query(Vote).filter(Vote.userId == user_id).all()
-    for vote in user_votes:
-        excluded_ids.add(vote.startupId)
+    # Startups the user has voted on, and those voted interested (bitmaps, no Vote rows loaded)
+    seen = get_seen_set(db, user_id)
     
     # Get user's interested startups to extract preferences
-    interested_votes = [v for v in user_votes if v.interested]
+    interested_ids = seen.interested_ids()
     interested_startups = []
     
-    if interested_votes:
-        interested_ids = {v.startupId for v in interested_votes}
+    if interested_ids:
         interested_startups = db.query(Startup).filter(
             Startup.id.in_(interested_ids)
         ).all()
     
-    # Extract preference signals
+    # Extract preference signals (topics / use cases from the facet tables)
     preference_topics = set()
     preference_maturity = {}
     preference_use_cases = set()
     
+    if interested_startups:
+        interested = Startup.id.in_(interested_ids)
+        for topics in facet_values_for(db, "topics", interested).values():
+            preference_topics.update(topics)
+        for use_cases in facet_values_for(db, "use_cases", interested).values():
+            preference_use_cases.update(use_cases)
+    
     for startup in interested_startups:
-        # Topics
-        topics = parse_array(startup.topics)
-        preference_topics.update(topics)
-        
-        # Maturity
         if startup.maturity:
             preference_maturity[startup.maturity] = \
                 preference_maturity.get(startup.maturity, 0) + 1
-        
-        # Use cases
-        use_cases = parse_array(startup.axa_use_cases)
-        preference_use_cases.update(use_cases)
     
-    # Get all unseen Tier 2 startups, or fallback to Tier 3 if Tier 2 is exhausted
-    unseen_startups = db.query(Startup).filter(
-        and_(
-            Startup.axa_priority_tier.like('%Tier 2%'),
-            ~Startup.id.in_(excluded_ids) if excluded_ids else True
-        )
-    ).all()
+    # Get all unseen Tier 2 startups, falling back to Tier 3, Tier 4 and finally unrated ones
+    unseen_startups = []
+    for tier_used, tier_filter in CANDIDATE_TIERS:
+        tier_startups = db.query(Startup).filter(tier_filter).order_by(Startup.id).all()
+        unseen_startups = [s for s in tier_startups if s.id not in seen and s.id not in excluded_ids]
+        if unseen_startups:
+            break
     
-    # If no Tier 2 available, fallback to Tier 3
     if not unseen_startups:
-        unseen_startups = db.query(Startup).filter(
-            and_(
-                Startup.axa_priority_tier.like('%Tier 3%'),
-                ~Startup.id.in_(excluded_ids) if excluded_ids else True
-            )
-        ).all()
-    
-    # Final fallback to Tier 4 if needed
-    if not unseen_startups:
-        unseen_startups = db.query(Startup).filter(
-            and_(
-                Startup.axa_priority_tier.like('%Tier 4%'),
-                ~Startup.id.in_(excluded_ids) if excluded_ids else True
-            )
-        ).all()
+        raise HTTPException(status_code=404, detail="No more startups available")
     
-    # Last resort fallback to unrated startups
-    if not unseen_startups:
-        unseen_startups = db.query(Startup).filter(
-            and_(
-                Startup.axa_priority_tier == None,
-                ~Startup.id.in_(excluded_ids) if excluded_ids else True
-            )
-        ).all()
+    candidates = [tier_filter]
+    by_id = {s.id: s for s in unseen_startups}
+    by_grade = (GRADE_SCORE_SQL.desc(),)
     
-    if not unseen_startups:
-        raise HTTPException(status_code=404, detail="No more startups available")
+    def leaders(facet: str, skip: List[Startup]) -> List[Startup]:
+        """Highest graded unseen candidate per facet value (values in sorted order), ignoring skip"""
+        skip_ids = {s.id for s in skip}
+        hidden = lambda startup_id: startup_id not in by_id or startup_id in skip_ids  # Seen / excluded / skip
+        return [by_id[startup_id] for _, startup_id in
+                top_per_value(db, facet, *candidates, order_by=by_grade, skip=hidden)]
     
     # Score candidates (if user has preferences)
     if interested_startups:
@@ -351,13 +348,17 @@ def get_phase2_startups(
         pref_count = max(1, int(limit * 0.5))
         
         # 1. GET PREFERENCE-BASED (50%): Highest scored matches to user preferences
+        candidate_topics = facet_values_for(db, "topics", *candidates)
+        candidate_use_cases = facet_values_for(db, "use_cases", *candidates)
         scored = []
         for candidate in unseen_startups:
             score = calculate_recommendation_score(
                 candidate,
                 preference_topics,
                 preference_maturity,
-                preference_use_cases
+                preference_use_cases,
+                set(candidate_topics.get(candidate.id, ())),
+                set(candidate_use_cases.get(candidate.id, ()))
             )
             scored.append((candidate, score))
         
@@ -373,39 +374,15 @@ def get_phase2_startups(
             # Group remaining startups by different dimensions for variety
             diverse_pool = []
             
-            # Group by topic - pick top scored from each unique topic
-            topics_seen = {}
-            for startup in remaining:
-                topics = parse_array(startup.topics)
-                for topic in topics:
-                    if topic not in topics_seen:
-                        topics_seen[topic] = []
-                    topics_seen[topic].append(startup)
-            
-            # Sort each topic group by score, take top 1 from each
-            for topic in sorted(topics_seen.keys()):
-                group = topics_seen[topic]
-                # Sort by axa_grade (highest first: A+ > A > B+ > B > C+ > C)
-                group.sort(key=lambda s: grade_to_score(s.axa_grade), reverse=True)
-                if group and group[0] not in diverse_pool:
-                    diverse_pool.append(group[0])
-            
-            # If we need more variety, add high-scoring startups from different use cases
-            use_cases_seen = {}
-            for startup in remaining:
-                if startup not in diverse_pool:
-                    use_cases = parse_array(startup.axa_use_cases)
-                    for uc in use_cases:
-                        if uc not in use_cases_seen:
-                            use_cases_seen[uc] = []
-                        use_cases_seen[uc].append(startup)
+            # Top graded startup of each unique topic
+            for leader in leaders("topics", preference_based):
+                if leader not in diverse_pool:
+                    diverse_pool.append(leader)
             
-            # Sort each use case group by score, take top 1 from each
-            for uc in sorted(use_cases_seen.keys()):
-                group = use_cases_seen[uc]
-                group.sort(key=lambda s: grade_to_score(s.axa_grade), reverse=True)
-                if group and group[0] not in diverse_pool and len(diverse_pool) < pref_count:
-                    diverse_pool.append(group[0])
+            # If we need more variety, add the top graded startup of each use case
+            for leader in leaders("use_cases", preference_based + diverse_pool):
+                if leader not in diverse_pool and len(diverse_pool) < pref_count:
+                    diverse_pool.append(leader)
             
             # If still need more, add from different maturity levels
             maturity_seen = {}
@@ -437,22 +414,11 @@ def get_phase2_startups(
         pref_count = max(1, int(limit * 0.5))
         preference_based = unseen_sorted[:pref_count]
         
-        # For diverse, group by topic and take top from each
+        # For diverse, take the top graded startup of each topic
         diverse_pool = []
-        topics_seen = {}
-        for startup in unseen_startups:
-            if startup not in preference_based:
-                topics = parse_array(startup.topics)
-                for topic in topics:
-                    if topic not in topics_seen:
-                        topics_seen[topic] = []
-                    topics_seen[topic].append(startup)
-        
-        for topic in sorted(topics_seen.keys()):
-            group = topics_seen[topic]
-            group.sort(key=lambda s: grade_to_score(s.axa_grade), reverse=True)
-            if group and group[0] not in diverse_pool and len(diverse_pool) < pref_count:
-                diverse_pool.append(group[0])
+        for leader in leaders("topics", preference_based):
+            if leader not in diverse_pool and len(diverse_pool) < pref_count:
+                diverse_pool.append(leader)
         
         if len(diverse_pool) < pref_count:
             remaining_sorted = [s for s in unseen_sorted if s not in preference_based and s not in diverse_pool]
@@ -463,31 +429,6 @@ def get_phase2_startups(
     # Combine and return
     result = preference_based + diverse
     
-    # Determine which tier was used
-    tier_used = "Tier 2: High"
-    if not db.query(Startup).filter(
-        and_(
-            Startup.axa_priority_tier.like('%Tier 2%'),
-            ~Startup.id.in_(excluded_ids) if excluded_ids else True
-        )
-    ).count():
-        if db.query(Startup).filter(
-            and_(
-                Startup.axa_priority_tier.like('%Tier 3%'),
-                ~Startup.id.in_(excluded_ids) if excluded_ids else True
-            )
-        ).count():
-            tier_used = "Tier 3: Medium"
-        elif db.query(Startup).filter(
-            and_(
-                Startup.axa_priority_tier.like('%Tier 4%'),
-                ~Startup.id.in_(excluded_ids) if excluded_ids else True
-            )
-        ).count():
-            tier_used = "Tier 4: Low"
-        else:
-            tier_used = "Unrated"
-    
     return {
         "startups": [startup_to_dict(s) for s in result[:limit]],
         "phase": 2,
@@ -505,39 +446,31 @@ def get_phase2_startups(
     }
 
 
-@router.get("/stats")
-def get_startup_stats(db: Session = Depends(get_db)) -> dict:
-    """Get overall startup statistics"""
-    
-    total = db.query(Startup).count()
-    tier2 = db.query(Startup).filter(
-        Startup.axa_priority_tier.like('%Tier 2%')
-    ).count()
-    
-    # Use cases distribution
-    tier2_startups = db.query(Startup).filter(
-        Startup.axa_priority_tier.like('%Tier 2%')
-    ).all()
-    
-    use_cases_count = {}
-    for startup in tier2_startups:
-        use_cases = parse_array(startup.axa_use_cases)
-        for use_case in use_cases:
-            use_cases_count[use_case] = use_cases_count.get(use_case, 0) + 1
-    
+@router.get("/facets")
+def get_startup_facets(
+    facet: str = Query("topics", description="topics, use_cases or tech"),
+    tier: Optional[str] = Query(None, description="Only startups whose AXA tier contains this, e.g. 'Tier 2'"),
+    topic: Optional[str] = Query(None, description="Only startups with this topic"),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+) -> dict:
+    """Number of startups per topic / use case / tech value (one GROUP BY on the facet table)"""
+    if facet not in FACETS:
+        raise HTTPException(status_code=400, detail=f"facet must be one of {', '.join(FACETS)}")
+    where = []
+    if tier:
+        where.append(Startup.axa_priority_tier.like(f"%{tier}%"))
+    if topic:
+        where.append(has_facet("topics", facet_column("topics") == topic))
+    counts = facet_counts(db, facet, *where, limit=limit)
     return {
-        "total_startups": total,
-        "tier2_startups": tier2,
-        "use_cases_distribution": use_cases_count,
-        "data_completeness": {
-            "have_extracted_product": db.query(Startup).filter(
-                Startup.extracted_product.isnot(None)
-            ).count(),
-            "have_extracted_market": db.query(Startup).filter(
-                Startup.extracted_market.isnot(None)
-            ).count(),
-            "have_funding": db.query(Startup).filter(
-                Startup.total_funding.isnot(None)
-            ).count()
-        }
+        "facet": facet,
+        "values": [{"value": value, "count": count} for value, count in counts],
+        "count": len(counts)
     }
+
+
+@router.get("/stats")
+def get_startup_stats(db: Session = Depends(get_db)) -> dict:
+    """Get overall startup statistics (from the analytics snapshot)"""
+    return get_snapshot(db).startups
@@ -1,7 +1,19 @@
 """
 Topics and Use Cases API endpoints for hierarchical filtering.
+
+The taxonomy almost never changes, so the whole tree is built with one
+joined query and kept in a process cache. The cache re-checks a cheap
+fingerprint of the two tables (row counts, max ids, max updated_at and the
+data_version row) at most every TOPICS_VERSION_TTL_SECONDS, so rows added by
+database_scripts/01_create_topics_use_cases.py or edited by an admin show up
+without a restart. POST /topics-usecases/refresh drops the cache at once.
 """
 
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from database import get_db
@@ -9,12 +21,104 @@ from sqlalchemy import text
 
 router = APIRouter(prefix="/topics-usecases", tags=["topics-usecases"])
 
+TOPICS_VERSION_TTL_SECONDS = 5.0
+
+TOPICS_TREE_SQL = text("""
+    SELECT t.id, t.name, u.id, u.name
+    FROM topics t
+    LEFT JOIN use_cases u ON u.topic_id = t.id
+    ORDER BY t.order_index, t.id, u.order_index, u.id
+""")
+
+TOPICS_FINGERPRINT_SQL = text("""
+    SELECT
+        (SELECT COUNT(*) FROM topics), (SELECT MAX(id) FROM topics), (SELECT MAX(updated_at) FROM topics),
+        (SELECT COUNT(*) FROM use_cases), (SELECT MAX(id) FROM use_cases), (SELECT MAX(updated_at) FROM use_cases)
+""")
+
+
+@dataclass
+class TopicsTree:
+    """The topics / use cases tree, with the views the endpoints serve"""
+    topics: List[Dict[str, Any]]
+    by_id: Dict[int, Dict[str, Any]] = field(init=False)
+    names: List[str] = field(init=False)
+    total_use_cases: int = field(init=False)
+
+    def __post_init__(self):
+        self.by_id = {topic["id"]: topic for topic in self.topics}
+        self.names = [topic["name"] for topic in self.topics]
+        self.total_use_cases = sum(len(topic["use_cases"]) for topic in self.topics)
+
+
+def load_topics_tree(db: Session) -> TopicsTree:
+    """Build the tree with a single joined query"""
+    topics: Dict[int, Dict[str, Any]] = {}
+    for topic_id, topic_name, uc_id, uc_name in db.execute(TOPICS_TREE_SQL):
+        topic = topics.get(topic_id)
+        if topic is None:
+            topic = topics[topic_id] = {"id": topic_id, "name": topic_name, "use_cases": []}
+        if uc_id is not None:
+            topic["use_cases"].append({"id": uc_id, "name": uc_name})
+    return TopicsTree(list(topics.values()))
+
+
+def topics_fingerprint(db: Session) -> Tuple[Any, ...]:
+    """Changes whenever a topic / use case is added, removed or touched, or data_version is bumped"""
+    fingerprint = tuple(db.execute(TOPICS_FINGERPRINT_SQL).one())
+    try:
+        version = db.execute(text("SELECT version FROM data_version LIMIT 1")).scalar()
+    except Exception:
+        db.rollback()
+        version = None
+    return fingerprint + (version,)
+
+
+class TopicsCache:
+    """Process-wide cache of the topics tree, revalidated against topics_fingerprint()"""
+
+    def __init__(self, ttl: float = TOPICS_VERSION_TTL_SECONDS):
+        self.ttl = ttl
+        self._tree: Optional[TopicsTree] = None
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> TopicsTree:
+        now = time.monotonic()
+        with self._lock:
+            if self._tree is not None and now - self._checked < self.ttl:
+                return self._tree
+
+        fingerprint = topics_fingerprint(db)
+        with self._lock:
+            if self._tree is not None and fingerprint == self._fingerprint:
+                self._checked = now
+                return self._tree
+
+        tree = load_topics_tree(db)
+        with self._lock:
+            self._tree, self._fingerprint, self._checked = tree, fingerprint, now
+        return tree
+
+    def invalidate(self):
+        with self._lock:
+            self._tree = None
+
+
+topics_cache = TopicsCache()
+
+
+def invalidate_topics_cache():
+    """Drop the cached tree (call after editing topics / use_cases in this process)"""
+    topics_cache.invalidate()
+
 
 @router.get("/topics")
 def get_all_topics(db: Session = Depends(get_db)):
     """
     Get all topics with their associated use cases.
-    
+
     Returns:
     {
         "topics": [
@@ -22,7 +126,7 @@ def get_all_topics(db: Session = Depends(get_db)):
                 "id": 1,
                 "name": "AI - Software development",
                 "use_cases": [
-                    {"id": 1, "name": "Code Generation", "order_index": 1},
+                    {"id": 1, "name": "Code Generation"},
                     ...
                 ]
             },
@@ -31,36 +135,13 @@ def get_all_topics(db: Session = Depends(get_db)):
     }
     """
     try:
-        # Get all topics ordered by order_index
-        topics_result = db.execute(text(
-            "SELECT id, name FROM topics ORDER BY order_index"
-        )).fetchall()
-        
-        topics_with_usecases = []
-        
-        for topic_id, topic_name in topics_result:
-            # Get use cases for this topic
-            usecases_result = db.execute(text(
-                "SELECT id, name FROM use_cases WHERE topic_id = :topic_id ORDER BY order_index"
-            ), {"topic_id": topic_id}).fetchall()
-            
-            use_cases = [
-                {"id": uc_id, "name": uc_name}
-                for uc_id, uc_name in usecases_result
-            ]
-            
-            topics_with_usecases.append({
-                "id": topic_id,
-                "name": topic_name,
-                "use_cases": use_cases
-            })
-        
+        tree = topics_cache.get(db)
         return {
-            "topics": topics_with_usecases,
-            "total_topics": len(topics_with_usecases),
-            "total_use_cases": sum(len(t["use_cases"]) for t in topics_with_usecases)
+            "topics": tree.topics,
+            "total_topics": len(tree.topics),
+            "total_use_cases": tree.total_use_cases
         }
-    
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -72,7 +153,7 @@ def get_all_topics(db: Session = Depends(get_db)):
 def get_use_cases_for_topic(topic_id: int, db: Session = Depends(get_db)):
     """
     Get use cases for a specific topic.
-    
+
     Returns:
     {
         "topic_id": 1,
@@ -84,69 +165,54 @@ def get_use_cases_for_topic(topic_id: int, db: Session = Depends(get_db)):
     }
     """
     try:
-        # Verify topic exists
-        topic_result = db.execute(text(
-            "SELECT id, name FROM topics WHERE id = :topic_id"
-        ), {"topic_id": topic_id}).fetchone()
-        
-        if not topic_result:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Topic {topic_id} not found"
-            )
-        
-        topic_id, topic_name = topic_result
-        
-        # Get use cases for this topic
-        usecases_result = db.execute(text(
-            "SELECT id, name FROM use_cases WHERE topic_id = :topic_id ORDER BY order_index"
-        ), {"topic_id": topic_id}).fetchall()
-        
-        use_cases = [
-            {"id": uc_id, "name": uc_name}
-            for uc_id, uc_name in usecases_result
-        ]
-        
-        return {
-            "topic_id": topic_id,
-            "topic_name": topic_name,
-            "use_cases": use_cases,
-            "count": len(use_cases)
-        }
-    
-    except HTTPException:
-        raise
+        topic = topics_cache.get(db).by_id.get(topic_id)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching use cases: {str(e)}"
         )
 
+    if topic is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Topic {topic_id} not found"
+        )
+
+    return {
+        "topic_id": topic["id"],
+        "topic_name": topic["name"],
+        "use_cases": topic["use_cases"],
+        "count": len(topic["use_cases"])
+    }
+
 
 @router.get("/quick-list")
 def get_quick_list(db: Session = Depends(get_db)):
     """
     Get a quick list of just topic names for filtering dropdown.
-    
+
     Returns:
     {
         "topics": ["AI - Software development", "AI - Agentic", ...]
     }
     """
     try:
-        topics_result = db.execute(text(
-            "SELECT name FROM topics ORDER BY order_index"
-        )).fetchall()
-        
-        topics = [topic[0] for topic in topics_result]
-        
+        names = topics_cache.get(db).names
         return {
-            "topics": topics,
-            "count": len(topics)
+            "topics": names,
+            "count": len(names)
         }
-    
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching quick list: {str(e)}"
         )
+
+
+@router.post("/refresh")
+def refresh_topics(db: Session = Depends(get_db)):
+    """Reload the topics tree now (after editing the tables outside this process)"""
+    invalidate_topics_cache()
+    tree = topics_cache.get(db)
+    return {"total_topics": len(tree.topics), "total_use_cases": tree.total_use_cases}
@@ -317,6 +317,7 @@ class FeedbackChatResponse(BaseModel):
     completed: bool
     insights_created: Optional[int] = 0
     categories_populated: Optional[List[str]] = []
+    usage: Optional[Dict[str, Any]] = None  # Per-session token accounting
 
 # Notification Queue schemas
 class NotificationQueueBase(BaseModel):
@@ -373,6 +374,8 @@ class SlushEventCreate(SlushEventBase):
 
 class SlushEvent(SlushEventBase):
     id: int
+    starts_at: Optional[datetime] = None  # UTC
+    ends_at: Optional[datetime] = None
     scraped_at: datetime
     created_at: datetime
     updated_at: datetime
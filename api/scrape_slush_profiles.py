@@ -30,6 +30,14 @@ from selenium.common.exceptions import (
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
 
+from slush_scraper_pool import (
+    BrowserPool,
+    ScrapeCheckpoint,
+    wait_for_page_ready,
+    wait_for_url_change,
+    throughput_summary,
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -101,7 +109,9 @@ class SlushProfileScraper:
             self.driver = webdriver.Chrome(options=chrome_options)
             logger.info("✅ Chrome WebDriver initialized with default driver")
         
-        self.driver.implicitly_wait(5)
+        # No implicit wait: pages are gated by explicit readiness conditions, and
+        # an implicit wait would stall every optional selector that doesn't match
+        self.driver.implicitly_wait(0)
     
     def login(self) -> bool:
         """
@@ -119,7 +129,6 @@ class SlushProfileScraper:
             
             # Go to login page
             self.driver.get("https://platform.slush.org/")
-            time.sleep(3)
             self.take_screenshot("01_login_page")
             
             # Look for login button or form
@@ -133,7 +142,6 @@ class SlushProfileScraper:
                     email_input.clear()
                     email_input.send_keys(self.email)
                     logger.info(f"✅ Entered email: {self.email}")
-                    time.sleep(1)
                     
                     # Find password input
                     password_input = self.wait_for_element(By.CSS_SELECTOR, "input[type='password'], input[name='password']", timeout=5)
@@ -141,11 +149,11 @@ class SlushProfileScraper:
                         password_input.clear()
                         password_input.send_keys(self.password)
                         logger.info("✅ Entered password")
-                        time.sleep(1)
                         
                         self.take_screenshot("02_credentials_entered")
                         
                         # Find and click submit button
+                        login_url = self.driver.current_url
                         submit_selectors = [
                             "button[type='submit']",
                             "button:contains('Log in')",
@@ -166,7 +174,8 @@ class SlushProfileScraper:
                                 continue
                         
                         # Wait for redirect after login
-                        time.sleep(5)
+                        wait_for_url_change(self.driver, login_url, timeout=15)
+                        wait_for_page_ready(self.driver)
                         self.take_screenshot("03_after_login")
                         
                         # Check if login was successful
@@ -253,7 +262,7 @@ class SlushProfileScraper:
                     logger.warning("⚠️  Proceeding without login - data may be limited")
             
             self.driver.get(profile_url)
-            time.sleep(3)  # Wait for page load
+            wait_for_page_ready(self.driver, "h1", timeout=self.wait_timeout)
             self.take_screenshot("profile_loaded")
             
             # Initialize data dictionary
@@ -569,12 +578,24 @@ def update_database(db_path: str, startup_id: int, scraped_data: Dict[str, Any])
     conn.close()
 
 
+def _summarize_scrape(profile: Dict[str, Any], scraped_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': profile['id'],
+        'company_name': profile['company_name'],
+        'success': scraped_data['success'],
+        'fields_extracted': len([k for k in scraped_data.keys() if k not in ['profile_url', 'scraped_at', 'success', 'error']])
+    }
+
+
 def scrape_slush_profiles(
     db_path: str = "startup_swiper.db",
     limit: Optional[int] = None,
     headless: bool = True,
     screenshots: bool = False,
-    delay: float = 2.0
+    delay: float = 2.0,
+    workers: int = 1,
+    checkpoint_path: Optional[str] = "downloads/slush_profile_checkpoint.json",
+    resume: bool = False
 ) -> Dict[str, Any]:
     """
     Scrape Slush profiles and update database
@@ -584,7 +605,10 @@ def scrape_slush_profiles(
         limit: Maximum number of profiles to scrape
         headless: Run browser in headless mode
         screenshots: Save screenshots for debugging
-        delay: Delay between requests in seconds
+        delay: Delay between requests in seconds (per browser worker)
+        workers: Number of parallel browser sessions sharing one login
+        checkpoint_path: Per-URL checkpoint file written during the run (None disables)
+        resume: Skip URLs already recorded in checkpoint_path by an interrupted run
         
     Returns:
         Summary dictionary
@@ -595,16 +619,20 @@ def scrape_slush_profiles(
     
     # Get profiles from database
     profiles = get_profiles_from_db(db_path, limit)
-    logger.info(f"Found {len(profiles)} profiles to scrape")
+    logger.info(f"Found {len(profiles)} profiles")
+    
+    checkpoint = ScrapeCheckpoint(Path(checkpoint_path), resume=resume) if checkpoint_path else None
+    if checkpoint and resume:
+        pending_urls = set(checkpoint.pending(p['profile_link'] for p in profiles))
+        skipped = len(profiles) - len(pending_urls)
+        profiles = [p for p in profiles if p['profile_link'] in pending_urls]
+        if skipped:
+            logger.info(f"⏭️  Resuming: skipping {skipped} profiles already in checkpoint")
     
     if not profiles:
-        logger.warning("No profiles found with Slush profile links")
+        logger.warning("No profiles left to scrape")
         return {'total': 0, 'success': 0, 'failed': 0}
     
-    # Initialize scraper
-    scraper = SlushProfileScraper(headless=headless, screenshots=screenshots)
-    scraper.setup_driver()
-    
     # Scrape profiles
     results = {
         'total': len(profiles),
@@ -612,40 +640,69 @@ def scrape_slush_profiles(
         'failed': 0,
         'scraped_data': []
     }
+    started = time.time()
+    
+    def record(profile: Dict[str, Any], scraped_data: Dict[str, Any]):
+        """Runs on the calling thread only, so SQLite sees a single writer"""
+        if isinstance(scraped_data, Exception):
+            scraped_data = {
+                'profile_url': profile['profile_link'],
+                'scraped_at': datetime.now().isoformat(),
+                'success': False,
+                'error': str(scraped_data)
+            }
+        
+        try:
+            update_database(db_path, profile['id'], scraped_data)
+            logger.info(f"✅ Database updated for ID {profile['id']}")
+        except Exception as e:
+            logger.error(f"❌ Failed to update database: {e}")
+        
+        if checkpoint:
+            checkpoint.mark(profile['profile_link'], scraped_data['success'], scraped_data.get('error'))
+        
+        if scraped_data['success']:
+            results['success'] += 1
+        else:
+            results['failed'] += 1
+        results['scraped_data'].append(_summarize_scrape(profile, scraped_data))
+    
+    def make_scraper() -> SlushProfileScraper:
+        scraper = SlushProfileScraper(headless=headless, screenshots=screenshots)
+        scraper.setup_driver()
+        return scraper
     
     try:
-        for i, profile in enumerate(profiles, 1):
-            logger.info(f"\n[{i}/{len(profiles)}] Processing: {profile['company_name']}")
+        if workers > 1:
+            logger.info(f"🚀 Parallel mode: {workers} browser sessions sharing one login")
             
-            # Scrape profile
-            scraped_data = scraper.scrape_profile(profile['profile_link'])
+            def scrape(scraper: SlushProfileScraper, profile: Dict[str, Any]) -> Dict[str, Any]:
+                scraped_data = scraper.scrape_profile(profile['profile_link'])
+                if delay:
+                    time.sleep(delay)  # Politeness delay, per worker
+                return scraped_data
             
-            # Update database
+            with BrowserPool(make_scraper, size=workers, login=SlushProfileScraper.login) as pool:
+                if pool.session.is_captured:
+                    for scraper in pool.workers:
+                        scraper.logged_in = True  # Cookies come from the shared session
+                pool.map(profiles, scrape, on_result=record)
+        else:
+            scraper = make_scraper()
             try:
-                update_database(db_path, profile['id'], scraped_data)
-                logger.info(f"✅ Database updated for ID {profile['id']}")
-            except Exception as e:
-                logger.error(f"❌ Failed to update database: {e}")
-            
-            # Track results
-            if scraped_data['success']:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
-            
-            results['scraped_data'].append({
-                'id': profile['id'],
-                'company_name': profile['company_name'],
-                'success': scraped_data['success'],
-                'fields_extracted': len([k for k in scraped_data.keys() if k not in ['profile_url', 'scraped_at', 'success', 'error']])
-            })
-            
-            # Rate limiting
-            if i < len(profiles):
-                time.sleep(delay)
+                for i, profile in enumerate(profiles, 1):
+                    logger.info(f"\n[{i}/{len(profiles)}] Processing: {profile['company_name']}")
+                    record(profile, scraper.scrape_profile(profile['profile_link']))
+                    
+                    # Rate limiting
+                    if i < len(profiles):
+                        time.sleep(delay)
+            finally:
+                scraper.close()
     
     finally:
-        scraper.close()
+        if checkpoint:
+            checkpoint.flush()
     
     # Print summary
     logger.info("\n" + "="*70)
@@ -655,6 +712,7 @@ def scrape_slush_profiles(
     logger.info(f"Successfully scraped: {results['success']}")
     logger.info(f"Failed: {results['failed']}")
     logger.info(f"Success rate: {100*results['success']/results['total']:.1f}%")
+    logger.info(f"Throughput: {throughput_summary(results['total'], started)}")
     
     return results
 
@@ -697,6 +755,22 @@ def main():
         action='store_true',
         help='Test mode: scrape only 1 profile with screenshots'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Parallel browser sessions sharing one login (default: 1)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        default='downloads/slush_profile_checkpoint.json',
+        help='Per-URL checkpoint file written during the run'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip profiles already recorded in the checkpoint by an interrupted run'
+    )
     
     args = parser.parse_args()
     
@@ -705,6 +779,7 @@ def main():
         args.limit = 1
         args.screenshots = True
         args.visible = True
+        args.workers = 1
         logger.info("🧪 Running in TEST mode")
     
     # Run scraper
@@ -713,7 +788,10 @@ def main():
         limit=args.limit,
         headless=not args.visible,
         screenshots=args.screenshots,
-        delay=args.delay
+        delay=args.delay,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume
     )
     
     # Save results
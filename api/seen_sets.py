@@ -0,0 +1,268 @@
+"""
+Seen Sets - per-user bitmaps of the startups a user has voted on
+
+The swipe endpoints need "has this user already voted on startup X" for
+every candidate. Instead of loading the user's Vote rows on each call and
+shipping them into a NOT IN (...) list:
+
+- SeenSet holds two bitmaps over startup ids, as plain Python ints: every
+  startup voted on, and the ones voted interested. Membership is a shift
+  and a mask; 5,000 startups fit in 625 bytes
+- user_seen_sets persists them, one row per user, written in the same
+  transaction as the vote by crud.create_vote / delete_vote
+- seen_cache keeps recently used users in memory and revalidates against
+  the row's version at most every SEEN_CACHE_TTL_SECONDS, so a vote taken
+  by another worker shows up within seconds
+- A user with no row yet is built from the votes table (indexed on
+  user_id); the row is written on their next vote
+
+Vote.startupId is a string supplied by the client; ids that aren't
+integers, or are above MAX(startups.id), can't match a startups row and
+are left out of the bitmaps (a bit at position 10^10 alone would be a
+1.25 GB int).
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models import UserSeenSet, Vote
+from models_startup import Startup
+
+logger = logging.getLogger(__name__)
+
+SEEN_CACHE_TTL_SECONDS = 2.0
+SEEN_CACHE_MAX_USERS = 5000
+
+
+def _startup_id(value: Any) -> Optional[int]:
+    try:
+        startup_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return startup_id if startup_id >= 0 else None
+
+
+def _bits(value: int) -> List[int]:
+    """Positions of the set bits, ascending"""
+    ids = []
+    while value:
+        low = value & -value
+        ids.append(low.bit_length() - 1)
+        value ^= low
+    return ids
+
+
+def _to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def _from_bytes(data: Optional[bytes]) -> int:
+    return int.from_bytes(data or b"", "little")
+
+
+# ============================================
+# Bitmaps
+# ============================================
+
+class SeenSet:
+    """Startups a user voted on (and voted interested), as bitmaps over startup ids"""
+    __slots__ = ("seen", "interested", "version")
+
+    def __init__(self, seen: int = 0, interested: int = 0, version: int = 0):
+        self.seen = seen
+        self.interested = interested
+        self.version = version
+
+    @classmethod
+    def from_votes(cls, votes: Iterable[Tuple[Any, bool]], version: int = 0,
+                   max_id: Optional[int] = None) -> "SeenSet":
+        """From (startupId, interested) pairs, skipping ids above max_id"""
+        seen_set = cls(version=version)
+        for startup_id, interested in votes:
+            startup_id = _startup_id(startup_id)
+            if startup_id is not None and (max_id is None or startup_id <= max_id):
+                seen_set.seen |= 1 << startup_id
+                if interested:
+                    seen_set.interested |= 1 << startup_id
+        return seen_set
+
+    @classmethod
+    def from_row(cls, row: UserSeenSet) -> "SeenSet":
+        return cls(_from_bytes(row.seen), _from_bytes(row.interested), row.version)
+
+    def __contains__(self, startup_id: Any) -> bool:
+        startup_id = _startup_id(startup_id)
+        return startup_id is not None and bool(self.seen >> startup_id & 1)
+
+    def __len__(self) -> int:
+        return bin(self.seen).count("1")
+
+    def is_interested(self, startup_id: Any) -> bool:
+        startup_id = _startup_id(startup_id)
+        return startup_id is not None and bool(self.interested >> startup_id & 1)
+
+    def ids(self) -> List[int]:
+        return _bits(self.seen)
+
+    def interested_ids(self) -> List[int]:
+        return _bits(self.interested)
+
+    def set(self, startup_id: int, seen: bool, interested: bool):
+        bit = 1 << startup_id
+        self.seen = self.seen | bit if seen else self.seen & ~bit
+        self.interested = self.interested | bit if interested else self.interested & ~bit
+
+
+# ============================================
+# Persistence
+# ============================================
+
+def max_startup_id(db: Session) -> int:
+    """Highest startup id; bits above it can never match a startup"""
+    return db.execute(select(func.max(Startup.id))).scalar() or 0
+
+
+def votes_seen_set(db: Session, user_id: str, version: int = 0) -> SeenSet:
+    """Build a user's SeenSet from the votes table"""
+    votes = db.execute(select(Vote.startupId, Vote.interested).where(Vote.userId == user_id))
+    return SeenSet.from_votes(votes, version, max_id=max_startup_id(db))
+
+
+def update_seen_set(db: Session, user_id: str, startup_id: str) -> SeenSet:
+    """
+    Re-derive one startup's bits from the user's remaining votes on it, after
+    a vote was added or deleted in this session; the caller commits
+    """
+    db.flush()
+    row = db.get(UserSeenSet, user_id)
+    if row is None:
+        seen_set = votes_seen_set(db, user_id, version=1)
+        db.add(UserSeenSet(user_id=user_id, seen=_to_bytes(seen_set.seen),
+                           interested=_to_bytes(seen_set.interested), version=1))
+        return seen_set
+
+    seen_set = SeenSet.from_row(row)
+    numeric_id = _startup_id(startup_id)
+    if numeric_id is not None and numeric_id <= max_startup_id(db):
+        votes = db.execute(select(Vote.interested).where(
+            Vote.userId == user_id, Vote.startupId == startup_id
+        )).scalars().all()
+        seen_set.set(numeric_id, bool(votes), any(votes))
+    seen_set.version = row.version = row.version + 1
+    row.seen, row.interested = _to_bytes(seen_set.seen), _to_bytes(seen_set.interested)
+    return seen_set
+
+
+def rebuild_seen_sets(db: Session) -> int:
+    """Rewrite every user's row from the votes table (backfill / repair); returns users written"""
+    db.query(UserSeenSet).delete()
+    users = [user_id for (user_id,) in db.execute(select(Vote.userId).distinct())]
+    for user_id in users:
+        seen_set = votes_seen_set(db, user_id)
+        db.add(UserSeenSet(user_id=user_id, seen=_to_bytes(seen_set.seen),
+                           interested=_to_bytes(seen_set.interested), version=1))
+    db.commit()
+    seen_cache.clear()
+    return len(users)
+
+
+def ensure_seen_sets(db: Session):
+    """Create user_seen_sets and the votes.user_id index on databases created before them"""
+    bind = db.get_bind()
+    UserSeenSet.__table__.create(bind=bind, checkfirst=True)
+    for index in Vote.__table__.indexes:
+        if "user_id" in index.columns:
+            index.create(bind=bind, checkfirst=True)
+
+
+# ============================================
+# Cache
+# ============================================
+
+class SeenSetCache:
+    """Recently used users' SeenSets, revalidated against user_seen_sets.version"""
+
+    def __init__(self, max_users: int = SEEN_CACHE_MAX_USERS, ttl: float = SEEN_CACHE_TTL_SECONDS):
+        self.max_users = max_users
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[SeenSet, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: str) -> SeenSet:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._entries.move_to_end(user_id)
+                return entry[0]
+
+        version = db.execute(select(UserSeenSet.version).where(UserSeenSet.user_id == user_id)).scalar()
+        if entry is not None and (version or 0) == entry[0].version:
+            seen_set = entry[0]
+        elif version is None:
+            seen_set = votes_seen_set(db, user_id)
+        else:
+            seen_set = SeenSet.from_row(db.get(UserSeenSet, user_id))
+        self.put(user_id, seen_set, now)
+        return seen_set
+
+    def put(self, user_id: str, seen_set: SeenSet, checked: Optional[float] = None):
+        with self._lock:
+            self._entries[user_id] = (seen_set, time.monotonic() if checked is None else checked)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+seen_cache = SeenSetCache()
+
+
+def get_seen_set(db: Session, user_id: Optional[str]) -> SeenSet:
+    """The user's SeenSet (empty for no user)"""
+    if not user_id:
+        return SeenSet()
+    return seen_cache.get(db, str(user_id))
+
+
+def main():
+    import argparse
+    from database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Maintain the per-user seen bitmaps")
+    parser.add_argument("--rebuild", action="store_true", help="Rewrite every user's bitmaps from the votes table")
+    parser.add_argument("--user", help="Print one user's seen / interested counts")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ensure_seen_sets(db)
+        if args.rebuild:
+            print(f"✅ Rebuilt seen sets for {rebuild_seen_sets(db)} users")
+        if args.user:
+            seen_set = get_seen_set(db, args.user)
+            print(f"👤 {args.user}: {len(seen_set)} seen, {len(seen_set.interested_ids())} interested")
+        if not (args.rebuild or args.user):
+            users = db.execute(select(func.count()).select_from(UserSeenSet)).scalar()
+            print(f"📊 {users} users have stored seen sets")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Parallel Browser Pool for Slush Scrapers
+
+Building blocks for running several headless browser sessions side by side:
+- SharedLoginSession: log in once, copy the cookie jar into every worker browser
+- BrowserPool: N worker browsers pulling URLs from a shared queue
+- ScrapeCheckpoint: per-URL JSON checkpoint so interrupted runs resume
+- wait_for_page_ready / wait_for_url_change: explicit readiness
+  conditions that replace fixed time.sleep() waits
+"""
+
+import os
+import json
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+SLUSH_BASE_URL = "https://platform.slush.org/"
+
+W = TypeVar("W")  # Worker type (a scraper instance that owns a driver)
+
+
+# ============================================
+# Readiness conditions
+# ============================================
+
+def wait_for_page_ready(driver, selector: Optional[str] = None, timeout: float = 10) -> bool:
+    """
+    Wait until the document has finished loading and, optionally, until
+    `selector` is present. Returns False on timeout instead of raising.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        if selector:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        return True
+    except TimeoutException:
+        logger.debug(f"Timeout waiting for page ready (selector={selector})")
+        return False
+
+
+def wait_for_url_change(driver, old_url: str, timeout: float = 15) -> bool:
+    """Wait for a navigation away from `old_url` (e.g. the login redirect)"""
+    try:
+        WebDriverWait(driver, timeout).until(EC.url_changes(old_url))
+        return True
+    except TimeoutException:
+        return False
+
+
+# ============================================
+# Shared login cookie jar
+# ============================================
+
+class SharedLoginSession:
+    """Log in once and share the resulting cookies with every worker browser"""
+
+    # Keys WebDriver accepts in add_cookie()
+    COOKIE_KEYS = {"name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite"}
+
+    def __init__(self, base_url: str = SLUSH_BASE_URL):
+        self.base_url = base_url
+        self.cookies: List[Dict[str, Any]] = []
+
+    @property
+    def is_captured(self) -> bool:
+        return bool(self.cookies)
+
+    def capture(self, driver) -> int:
+        """Copy the cookie jar from a logged-in driver"""
+        self.cookies = [self._clean(c) for c in driver.get_cookies()]
+        logger.info(f"✅ Captured {len(self.cookies)} login cookies")
+        return len(self.cookies)
+
+    def apply(self, driver) -> bool:
+        """Load the shared cookies into another driver (must visit the domain first)"""
+        if not self.cookies:
+            return False
+        driver.get(self.base_url)
+        wait_for_page_ready(driver, timeout=10)
+        driver.delete_all_cookies()
+        applied = 0
+        for cookie in self.cookies:
+            try:
+                driver.add_cookie(cookie)
+                applied += 1
+            except WebDriverException as e:
+                logger.debug(f"Could not add cookie {cookie.get('name')}: {e}")
+        return applied > 0
+
+    def save(self, path: Path):
+        with open(path, "w") as f:
+            json.dump(self.cookies, f)
+
+    def load(self, path: Path) -> bool:
+        if not Path(path).exists():
+            return False
+        with open(path, "r") as f:
+            self.cookies = [self._clean(c) for c in json.load(f)]
+        return self.is_captured
+
+    @classmethod
+    def _clean(cls, cookie: Dict[str, Any]) -> Dict[str, Any]:
+        cleaned = {k: v for k, v in cookie.items() if k in cls.COOKIE_KEYS}
+        if "expiry" in cleaned:
+            cleaned["expiry"] = int(cleaned["expiry"])
+        if cleaned.get("sameSite") not in (None, "Strict", "Lax", "None"):
+            cleaned.pop("sameSite")
+        return cleaned
+
+
+# ============================================
+# Per-URL checkpoint
+# ============================================
+
+class ScrapeCheckpoint:
+    """
+    Thread-safe per-URL checkpoint stored as JSON:
+        {"<url>": {"success": bool, "attempts": int, "scraped_at": str, "error": str?}}
+
+    An existing file is only loaded with resume=True; otherwise the run
+    starts empty and overwrites it on the first flush.
+    """
+
+    def __init__(self, path: Path, flush_every: int = 10, max_attempts: int = 3, resume: bool = True):
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if resume and self.path.exists():
+            with open(self.path, "r") as f:
+                self.entries = json.load(f)
+            logger.info(f"✓ Checkpoint: {len(self.entries)} URLs already processed")
+
+    def is_done(self, url: str) -> bool:
+        entry = self.entries.get(url)
+        if not entry:
+            return False
+        return entry.get("success") or entry.get("attempts", 0) >= self.max_attempts
+
+    def pending(self, urls: Iterable[str]) -> List[str]:
+        """URLs that still need scraping (not done, not out of retries)"""
+        with self._lock:
+            return [u for u in urls if not self.is_done(u)]
+
+    def mark(self, url: str, success: bool, error: Optional[str] = None):
+        with self._lock:
+            entry = self.entries.setdefault(url, {"attempts": 0})
+            entry["attempts"] += 1
+            entry["success"] = success
+            entry["scraped_at"] = datetime.now().isoformat()
+            if error:
+                entry["error"] = error
+            else:
+                entry.pop("error", None)
+            self._dirty += 1
+            if self._dirty >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)  # Atomic, so a crash never leaves a torn file
+        self._dirty = 0
+
+
+# ============================================
+# Browser pool
+# ============================================
+
+class BrowserPool:
+    """
+    Run a task over many URLs with N browser workers in parallel.
+
+    `worker_factory` builds one worker (typically a scraper with its own
+    driver). `login` is called on the first worker; its cookies are then
+    copied into the others via `get_driver`, so the site sees one login.
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable[[], W],
+        size: int = 4,
+        get_driver: Callable[[W], Any] = lambda w: w.driver,
+        login: Optional[Callable[[W], bool]] = None,
+        close: Callable[[W], None] = lambda w: w.close(),
+        session: Optional[SharedLoginSession] = None,
+    ):
+        self.worker_factory = worker_factory
+        self.size = max(1, size)
+        self.get_driver = get_driver
+        self.login = login
+        self.close_worker = close
+        self.session = session or SharedLoginSession()
+        self.workers: List[W] = []
+        self._idle: "queue.Queue[W]" = queue.Queue()
+
+    def start(self) -> "BrowserPool":
+        """
+        Start every worker and log in once. If any browser fails to start, the
+        ones already running are closed before the error propagates (start()
+        runs from __enter__, so __exit__ would never clean them up).
+        """
+        try:
+            first = self.worker_factory()
+            self.workers.append(first)
+            if self.login and not self.session.is_captured:
+                if self.login(first):
+                    self.session.capture(self.get_driver(first))
+                else:
+                    logger.warning("⚠️  Pool login failed - workers will browse anonymously")
+            # Remaining browsers start in parallel; starting Chrome dominates setup time
+            with ThreadPoolExecutor(max_workers=self.size) as executor:
+                futures = [executor.submit(self.worker_factory) for _ in range(self.size - 1)]
+            others = [future.result() for future in futures if not future.exception()]
+            self.workers.extend(others)
+            for future in futures:
+                future.result()  # Re-raise the first startup failure
+            if self.session.is_captured:
+                for worker in others:
+                    self.session.apply(self.get_driver(worker))
+        except BaseException:
+            logger.error(f"❌ Browser pool failed to start - closing {len(self.workers)} started workers")
+            self.close()
+            raise
+        for worker in self.workers:
+            self._idle.put(worker)
+        logger.info(f"✅ Browser pool ready with {len(self.workers)} workers")
+        return self
+
+    def map(
+        self,
+        items: Iterable[Any],
+        task: Callable[[W, Any], Any],
+        on_result: Optional[Callable[[Any, Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Run task(worker, item) for every item. `on_result(item, result)` is
+        called from the calling thread as results complete, so it can safely
+        write to SQLite or a checkpoint without extra locking.
+        """
+        def run(item):
+            worker = self._idle.get()
+            try:
+                return task(worker, item)
+            finally:
+                self._idle.put(worker)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=len(self.workers)) as executor:
+            futures = {executor.submit(run, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Worker task failed for {item}: {e}")
+                    result = e
+                if on_result:
+                    on_result(item, result)
+                results.append(result)
+        return results
+
+    def close(self):
+        for worker in self.workers:
+            try:
+                self.close_worker(worker)
+            except Exception as e:
+                logger.debug(f"Error closing worker: {e}")
+        self.workers = []
+
+    def __enter__(self) -> "BrowserPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def throughput_summary(total: int, started: float) -> str:
+    elapsed = time.time() - started
+    rate = total / elapsed * 60 if elapsed > 0 else 0
+    return f"{total} pages in {elapsed:.1f}s ({rate:.1f} pages/min)"
@@ -0,0 +1,236 @@
+"""
+Startup Catalog - shared, read-only view of the startups table for the concierge
+
+One process-wide catalog replaces re-parsing the Slush JSON export on every
+concierge request:
+- StartupRecord uses __slots__ and keeps only the fields the concierge
+  prints; long descriptions are clipped, category strings are interned
+- by_id dict for O(1) get_startup_by_id
+- category inverted index (lower-cased category -> records)
+- rebuilt from the DB at most every REFRESH_INTERVAL_SECONDS, swapped in
+  atomically so readers never see a half-built catalog
+
+Records render to the same dict shape the JSON loader produced (name,
+shortDescription, categories=[{"name": ...}], ...), so callers don't change.
+"""
+
+import sys
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 300
+MAX_DESCRIPTION_CHARS = 2000
+MAX_SHORT_DESCRIPTION_CHARS = 500
+
+CATALOG_SQL = """
+    SELECT id, company_name, shortDescription, company_description, description, website,
+           employees, founding_year, company_city, billingCity, company_country, billingCountry,
+           total_funding, valuation, last_funding_date, funding_stage,
+           primary_industry, secondary_industry, topics, axa_primary_topic
+    FROM startups
+    ORDER BY id
+"""
+
+
+def _json_list(value: Any) -> List[Any]:
+    """JSON columns come back as text from raw SQL on SQLite"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [value] if value.strip() else []
+    return value if isinstance(value, list) else []
+
+
+def _clip(value: Optional[str], max_chars: int) -> Optional[str]:
+    if value and len(value) > max_chars:
+        return value[:max_chars - 1].rstrip() + "…"
+    return value
+
+
+def categories_for(row: Dict[str, Any]) -> Tuple[str, ...]:
+    """Industry and topic labels, de-duplicated case-insensitively, in order"""
+    labels = [row.get("primary_industry"), row.get("axa_primary_topic")]
+    labels += _json_list(row.get("secondary_industry")) + _json_list(row.get("topics"))
+    seen = set()
+    categories = []
+    for label in labels:
+        if isinstance(label, dict):
+            label = label.get("name")
+        if not isinstance(label, str) or not label.strip():
+            continue
+        label = sys.intern(label.strip())
+        if label.lower() not in seen:
+            seen.add(label.lower())
+            categories.append(label)
+    return tuple(categories)
+
+
+class StartupRecord:
+    """Compact startup row; to_dict() gives the legacy JSON shape"""
+
+    __slots__ = (
+        "id", "name", "short_description", "description", "website", "employees",
+        "founded", "city", "country", "total_funding", "valuation", "last_funding_date",
+        "funding_stage", "categories", "name_lower", "search_text",
+    )
+
+    def __init__(self, row: Dict[str, Any]):
+        self.id = row["id"]
+        self.name = row.get("company_name") or ""
+        description = row.get("company_description") or row.get("description")
+        self.short_description = _clip(row.get("shortDescription") or description, MAX_SHORT_DESCRIPTION_CHARS)
+        self.description = _clip(description, MAX_DESCRIPTION_CHARS)
+        self.website = row.get("website")
+        self.employees = row.get("employees")
+        self.founded = row.get("founding_year")
+        self.city = row.get("company_city") or row.get("billingCity")
+        self.country = row.get("company_country") or row.get("billingCountry")
+        self.total_funding = row.get("total_funding")
+        self.valuation = row.get("valuation")
+        self.last_funding_date = row.get("last_funding_date")
+        self.funding_stage = row.get("funding_stage")
+        self.categories = categories_for(row)
+        self.name_lower = self.name.lower()
+        self.search_text = "\n".join(
+            p for p in (self.short_description, self.description, *self.categories) if p
+        ).lower()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "company_name": self.name,
+            "shortDescription": self.short_description,
+            "description": self.description,
+            "website": self.website,
+            "employees": self.employees,
+            "dateFounded": self.founded,
+            "billingCity": self.city,
+            "billingCountry": self.country,
+            "total_funding": self.total_funding,
+            "valuation": self.valuation,
+            "last_funding_date": self.last_funding_date,
+            "funding_stage": self.funding_stage,
+            "categories": [{"name": c} for c in self.categories],
+        }
+
+
+class StartupCatalog:
+    """Immutable snapshot of all startups with id and category indexes"""
+
+    def __init__(self, records: Iterable[StartupRecord]):
+        self.records: Tuple[StartupRecord, ...] = tuple(records)
+        self.by_id: Dict[str, StartupRecord] = {str(r.id): r for r in self.records}
+        grouped: Dict[str, List[StartupRecord]] = {}
+        for record in self.records:
+            for category in record.categories:
+                grouped.setdefault(category.lower(), []).append(record)
+        self.by_category: Dict[str, Tuple[StartupRecord, ...]] = {
+            key: tuple(records) for key, records in grouped.items()
+        }
+        self.built_at = time.time()
+
+    @classmethod
+    def from_db(cls, db: Session) -> "StartupCatalog":
+        return cls(StartupRecord(dict(row._mapping)) for row in db.execute(text(CATALOG_SQL)))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, startup_id: Any) -> Optional[StartupRecord]:
+        return self.by_id.get(str(startup_id))
+
+    def search(self, query: str, limit: int = 10) -> List[StartupRecord]:
+        """Name matches first, then description / category matches, in id order"""
+        needle = (query or "").strip().lower()
+        if not needle:
+            return []
+        by_name, by_text = [], []
+        for record in self.records:
+            if needle in record.name_lower:
+                by_name.append(record)
+                if len(by_name) >= limit:
+                    break
+            elif len(by_text) < limit and needle in record.search_text:
+                by_text.append(record)
+        return (by_name + by_text)[:limit]
+
+    def in_category(self, category: str, limit: int = 10) -> List[StartupRecord]:
+        """Exact category hit via the index, else any category containing the text"""
+        needle = (category or "").strip().lower()
+        if not needle:
+            return []
+        exact = self.by_category.get(needle)
+        if exact:
+            return list(exact[:limit])
+        matched = set()
+        for key, records in self.by_category.items():
+            if needle in key:
+                matched.update(id(r) for r in records)
+        return [r for r in self.records if id(r) in matched][:limit]
+
+    def memory_stats(self) -> Dict[str, int]:
+        """Rough size of the catalog's own strings and containers, in bytes"""
+        strings = sum(
+            sys.getsizeof(getattr(r, slot)) for r in self.records for slot in
+            ("name", "short_description", "description", "name_lower", "search_text")
+            if getattr(r, slot) is not None
+        )
+        return {
+            "startups": len(self.records),
+            "categories": len(self.by_category),
+            "record_bytes": sum(sys.getsizeof(r) for r in self.records),
+            "string_bytes": strings,
+            "index_bytes": sys.getsizeof(self.by_id) + sys.getsizeof(self.by_category),
+        }
+
+
+_catalog: Optional[StartupCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_startup_catalog(db: Optional[Session] = None, max_age: float = REFRESH_INTERVAL_SECONDS) -> StartupCatalog:
+    """
+    Process-wide catalog, rebuilt from the DB at most every max_age seconds.
+
+    Args:
+        db: Session to read with; a short-lived SessionLocal is used if omitted
+        max_age: Seconds before the snapshot is rebuilt
+    """
+    global _catalog
+    catalog = _catalog
+    if catalog is not None and time.time() - catalog.built_at <= max_age:
+        return catalog
+
+    with _catalog_lock:
+        if _catalog is not None and time.time() - _catalog.built_at <= max_age:
+            return _catalog
+        started = time.perf_counter()
+        if db is None:
+            from database import SessionLocal
+            session = SessionLocal()
+            try:
+                _catalog = StartupCatalog.from_db(session)
+            finally:
+                session.close()
+        else:
+            _catalog = StartupCatalog.from_db(db)
+        logger.info(f"📇 Startup catalog built: {len(_catalog)} startups, "
+                    f"{len(_catalog.by_category)} categories in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return _catalog
+
+
+def reset_startup_catalog():
+    """Drop the cached catalog (tests, or right after a bulk import)"""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Streaming Startup Export - SQL-filtered, chunked, incrementally written
+
+The export engine behind download_startups.py:
+- Filters are SQL clauses on the startups table (StartupFilter), so only
+  matching rows ever leave the database
+- Rows are read in keyset-paginated chunks (WHERE id > last ORDER BY id),
+  so memory stays constant however large the export is
+- Each chunk is written as it arrives: NDJSON, a JSON array, CSV, or
+  columnar Parquet / Arrow IPC (optional pyarrow, requirements-export.txt;
+  one row group / record batch per chunk) with a schema derived from the
+  table's column types
+- Statistics for --stats are computed with GROUP BY over the same filter
+
+JSON columns are written as JSON text in CSV / Parquet / Arrow and as
+nested values in JSON / NDJSON; datetimes as ISO strings in text formats.
+
+    from startup_export import StartupFilter, export_startups
+    f = StartupFilter().countries(["FI", "SE"]).has_funding()
+    stats = export_startups("nordic.parquet", f)
+"""
+
+import csv
+import sys
+import json
+import time
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, String, and_, cast, func, or_, select, true
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import ColumnElement
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from models_startup import Startup
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+FORMATS = ("json", "ndjson", "csv", "parquet", "arrow")
+EXTENSION_FORMATS = {
+    ".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv",
+    ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow",
+}
+ENRICHMENT_FIELDS = ("enrichment_emails", "enrichment_linkedin", "enrichment_phone")
+DEFAULT_CSV_FIELDS = [
+    "id", "company_name", "website", "shortDescription",
+    "billingCountry", "billingCity", "maturity",
+    "employees", "dateFounded", "is_enriched",
+    "total_funding", "valuation", "last_funding_date",  # CB Insights funding data
+    *ENRICHMENT_FIELDS,
+]
+
+table = Startup.__table__
+
+
+# ============================================
+# Filters (SQL pushdown)
+# ============================================
+
+class StartupFilter:
+    """Named SQL conditions on the startups table, combined with AND"""
+
+    def __init__(self):
+        self.filters: List[Tuple[str, ColumnElement]] = []
+
+    def add_filter(self, name: str, clause: ColumnElement) -> "StartupFilter":
+        self.filters.append((name, clause))
+        return self
+
+    def where(self, upto: Optional[int] = None) -> ColumnElement:
+        clauses = [clause for _name, clause in self.filters[:upto]]
+        return and_(*clauses) if clauses else true()
+
+    def explain(self, conn: Connection) -> List[Tuple[str, int]]:
+        """Rows left after each filter (one COUNT per filter), logged like a funnel"""
+        before = conn.execute(select(func.count()).select_from(table)).scalar()
+        funnel = []
+        for i, (name, _clause) in enumerate(self.filters, 1):
+            after = conn.execute(select(func.count()).select_from(table).where(self.where(i))).scalar()
+            logger.info(f"Filter '{name}': {before} → {after} startups ({before - after} removed)")
+            funnel.append((name, after))
+            before = after
+        return funnel
+
+    # Common filters -------------------------------------------------------
+
+    def countries(self, codes: Sequence[str]) -> "StartupFilter":
+        codes = [c.strip().upper() for c in codes if c.strip()]
+        return self.add_filter(f"countries={','.join(codes)}", func.upper(table.c.billingCountry).in_(codes))
+
+    def maturity(self, stage: str) -> "StartupFilter":
+        return self.add_filter(f"maturity={stage}", func.lower(table.c.maturity).contains(stage.lower()))
+
+    def has_funding(self) -> "StartupFilter":
+        return self.add_filter("has_funding", table.c.total_funding > 0)
+
+    def min_funding(self, amount: float) -> "StartupFilter":
+        return self.add_filter(f"min_funding={amount}", table.c.total_funding >= amount)
+
+    def has_website(self) -> "StartupFilter":
+        return self.add_filter("has_website", func.trim(table.c.website) != "")
+
+    def enriched_only(self) -> "StartupFilter":
+        has_enrichment = and_(table.c.enrichment.isnot(None), func.json_type(table.c.enrichment) == "object")
+        return self.add_filter("enriched_only", or_(table.c.is_enriched.is_(True), has_enrichment))
+
+    def has_email(self) -> "StartupFilter":
+        return self.add_filter("has_email", func.json_array_length(table.c.enrichment, "$.emails") > 0)
+
+    def has_linkedin(self) -> "StartupFilter":
+        linkedin = func.json_extract(table.c.enrichment, "$.social_media.linkedin")
+        return self.add_filter("has_linkedin", func.coalesce(linkedin, "") != "")
+
+    def min_employees(self, bucket: str) -> "StartupFilter":
+        """Employee buckets ("11-50", "1000+") compared by their lower bound"""
+        lower = int("".join(ch for ch in bucket.split("-")[0] if ch.isdigit()) or 0)
+        # SQLite's CAST takes the leading integer: "11-50" -> 11, "1000+" -> 1000
+        return self.add_filter(f"min_employees={bucket}", cast(table.c.employees, Integer) >= lower)
+
+    def founded_after(self, year: int) -> "StartupFilter":
+        founded = func.coalesce(table.c.founding_year, cast(func.strftime("%Y", table.c.dateFounded), Integer))
+        return self.add_filter(f"founded_after={year}", founded >= year)
+
+    def topics(self, keywords: Sequence[str]) -> "StartupFilter":
+        keywords = [k.strip().lower() for k in keywords if k.strip()]
+        topics_text = func.lower(cast(table.c.topics, String))
+        return self.add_filter(f"topics={','.join(keywords)}", or_(*(topics_text.contains(k) for k in keywords)))
+
+
+# ============================================
+# Chunked reader
+# ============================================
+
+def _select_columns(fields: Optional[Sequence[str]]) -> List[str]:
+    """Table columns needed to produce the requested output fields"""
+    if not fields:
+        return [column.name for column in table.columns]
+    unknown = [f for f in fields if f not in table.c and f not in ENRICHMENT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    columns = [f for f in fields if f in table.c]
+    if any(f in ENRICHMENT_FIELDS for f in fields) and "enrichment" not in columns:
+        columns.append("enrichment")
+    if "id" not in columns:
+        columns.append("id")
+    return columns
+
+
+def flatten_enrichment(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Add enrichment_emails / _linkedin / _phone (comma-joined) from the enrichment JSON"""
+    enrichment = row.get("enrichment") or {}
+    if isinstance(enrichment, str):
+        try:
+            enrichment = json.loads(enrichment)
+        except ValueError:
+            enrichment = {}
+    row["enrichment_emails"] = ",".join(enrichment.get("emails") or [])
+    row["enrichment_linkedin"] = (enrichment.get("social_media") or {}).get("linkedin") or ""
+    row["enrichment_phone"] = ",".join(enrichment.get("phone_numbers") or [])
+    return row
+
+
+def iter_startup_chunks(
+    conn: Connection,
+    startup_filter: Optional[StartupFilter] = None,
+    fields: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield matching startups in id order, chunk_size rows at a time
+
+    Keyset pagination keeps each query an index range scan on the primary
+    key and never holds a cursor open between chunks.
+    """
+    columns = _select_columns(fields)
+    where = (startup_filter or StartupFilter()).where()
+    wants_enrichment = not fields or any(f in ENRICHMENT_FIELDS for f in fields)
+    last_id = None
+    while True:
+        query = select(*(table.c[name] for name in columns)).where(where)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = [dict(row._mapping) for row in conn.execute(query.order_by(table.c.id).limit(chunk_size))]
+        if not rows:
+            return
+        last_id = rows[-1]["id"]
+        if wants_enrichment:
+            rows = [flatten_enrichment(row) for row in rows]
+        if fields:
+            rows = [{f: row.get(f) for f in fields} for row in rows]
+        yield rows
+        if len(rows) < chunk_size:
+            return
+
+
+# ============================================
+# Incremental writers
+# ============================================
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _text_cell(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=_json_default)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class NDJSONWriter:
+    def __init__(self, path: Path, fields: Sequence[str]):
+        self.f: IO[str] = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        self.f.writelines(json.dumps(row, ensure_ascii=False, default=_json_default) + "\n" for row in rows)
+
+    def close(self):
+        self.f.close()
+
+
+class JSONArrayWriter:
+    """A JSON array written element by element (same output as json.dump of the list)"""
+
+    def __init__(self, path: Path, fields: Sequence[str], pretty: bool = True):
+        self.f: IO[str] = open(path, "w", encoding="utf-8")
+        self.indent = 2 if pretty else None
+        self.first = True
+        self.f.write("[")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        for row in rows:
+            item = json.dumps(row, indent=self.indent, ensure_ascii=False, default=_json_default)
+            if self.indent:
+                item = "\n  " + item.replace("\n", "\n  ")
+            self.f.write(item if self.first else ("," if self.indent else ", ") + item)
+            self.first = False
+
+    def close(self):
+        self.f.write("\n]" if self.indent and not self.first else "]")
+        self.f.close()
+
+
+class CSVWriter:
+    def __init__(self, path: Path, fields: Sequence[str]):
+        self.f: IO[str] = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.f, fieldnames=list(fields), extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]):
+        self.writer.writerows({k: _text_cell(v) for k, v in row.items()} for row in rows)
+
+    def close(self):
+        self.f.close()
+
+
+def arrow_schema(fields: Sequence[str]) -> "pa.Schema":
+    """Arrow types from the startups column types (JSON and unknown fields as strings)"""
+    def arrow_type(name: str):
+        column = table.c.get(name)
+        column_type = column.type if column is not None else None
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, Float):
+            return pa.float64()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp("us")
+        return pa.string()
+    return pa.schema([(name, arrow_type(name)) for name in fields])
+
+
+class _ArrowWriterBase:
+    def __init__(self, path: Path, fields: Sequence[str]):
+        if not HAS_PYARROW:
+            raise RuntimeError("Parquet / Arrow output needs pyarrow (pip install -r requirements-export.txt)")
+        self.fields = list(fields)
+        self.schema = arrow_schema(self.fields)
+        self.json_fields = {name for name in self.fields
+                            if name in table.c and isinstance(table.c[name].type, JSON)}
+
+    def batch(self, rows: List[Dict[str, Any]]) -> "pa.RecordBatch":
+        columns = []
+        for name in self.fields:
+            values = [row.get(name) for row in rows]
+            if name in self.json_fields:
+                values = [None if v is None else json.dumps(v, ensure_ascii=False, default=_json_default)
+                          for v in values]
+            columns.append(values)
+        return pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, self.schema)], schema=self.schema
+        )
+
+
+class ParquetWriter(_ArrowWriterBase):
+    """One Parquet row group per chunk"""
+
+    def __init__(self, path: Path, fields: Sequence[str]):
+        super().__init__(path, fields)
+        self.writer = pq.ParquetWriter(str(path), self.schema, compression="zstd")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        self.writer.write_batch(self.batch(rows))
+
+    def close(self):
+        self.writer.close()
+
+
+class ArrowWriter(_ArrowWriterBase):
+    """Arrow IPC file (Feather v2), one record batch per chunk"""
+
+    def __init__(self, path: Path, fields: Sequence[str]):
+        super().__init__(path, fields)
+        self.sink = pa.OSFile(str(path), "wb")
+        self.writer = pa.ipc.new_file(self.sink, self.schema)
+
+    def write(self, rows: List[Dict[str, Any]]):
+        self.writer.write_batch(self.batch(rows))
+
+    def close(self):
+        self.writer.close()
+        self.sink.close()
+
+
+WRITERS = {
+    "json": JSONArrayWriter,
+    "ndjson": NDJSONWriter,
+    "csv": CSVWriter,
+    "parquet": ParquetWriter,
+    "arrow": ArrowWriter,
+}
+
+
+# ============================================
+# Entry points
+# ============================================
+
+@dataclass
+class ExportStats:
+    path: str
+    format: str
+    rows: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} startups → {self.path} ({self.format}) in {self.elapsed_seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s, {self.chunks} chunks)"
+        )
+
+
+def detect_format(path: Path) -> str:
+    return EXTENSION_FORMATS.get(Path(path).suffix.lower(), "json")
+
+
+def export_startups(
+    output: Path,
+    startup_filter: Optional[StartupFilter] = None,
+    fmt: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    engine: Optional[Engine] = None,
+    pretty: bool = True,
+) -> ExportStats:
+    """
+    Stream matching startups from the database into output
+
+    Args:
+        output: Destination file
+        startup_filter: SQL filters (None = every startup)
+        fmt: One of FORMATS (default: from the file extension)
+        fields: Output fields (default: every column; for CSV, DEFAULT_CSV_FIELDS).
+            enrichment_emails / _linkedin / _phone are flattened from enrichment
+        chunk_size: Rows fetched and written per step
+        engine: Source database (default: the batch engine)
+        pretty: Indent JSON array output
+
+    Returns:
+        ExportStats
+    """
+    if engine is None:
+        from database import batch_engine as engine
+    output = Path(output)
+    fmt = fmt or detect_format(output)
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    if fields is None and fmt == "csv":
+        fields = DEFAULT_CSV_FIELDS
+    out_fields = list(fields) if fields else [column.name for column in table.columns]
+
+    stats = ExportStats(path=str(output), format=fmt)
+    started = time.perf_counter()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    writer = WRITERS[fmt](output, out_fields, pretty=pretty) if fmt == "json" else WRITERS[fmt](output, out_fields)
+    try:
+        with engine.connect() as conn:
+            for rows in iter_startup_chunks(conn, startup_filter, out_fields, chunk_size):
+                writer.write(rows)
+                stats.rows += len(rows)
+                stats.chunks += 1
+    finally:
+        writer.close()
+    stats.elapsed_seconds = time.perf_counter() - started
+    logger.info(f"✓ {stats.summary()}")
+    return stats
+
+
+def export_statistics(conn: Connection, startup_filter: Optional[StartupFilter] = None) -> Dict[str, Any]:
+    """Country / maturity distribution and completeness of the filtered set, aggregated in SQL"""
+    where = (startup_filter or StartupFilter()).where()
+
+    def distribution(column, limit=None):
+        label = func.coalesce(column, "Unknown")
+        query = (select(label, func.count()).select_from(table).where(where)
+                 .group_by(label).order_by(func.count().desc(), label))
+        return [(value, count) for value, count in conn.execute(query.limit(limit) if limit else query)]
+
+    enriched = or_(table.c.is_enriched.is_(True), func.json_type(table.c.enrichment) == "object")
+    total, with_enrichment, with_website, with_funding = conn.execute(
+        select(
+            func.count(),
+            func.count().filter(enriched),
+            func.count().filter(func.trim(table.c.website) != ""),
+            func.count().filter(table.c.total_funding > 0),
+        ).select_from(table).where(where)
+    ).one()
+    return {
+        "total": total,
+        "countries": distribution(table.c.billingCountry, limit=10),
+        "maturity": distribution(table.c.maturity),
+        "enriched": with_enrichment,
+        "with_website": with_website,
+        "with_funding": with_funding,
+    }
@@ -0,0 +1,304 @@
+"""
+Startup Facets - junction tables for the JSON array columns
+
+Startup.topics, axa_use_cases and tech are JSON arrays (older rows hold JSON
+text or a comma list), so every topic / use case filter loaded whole rows
+and ran parse_array over them. Each value now also has a row in
+startup_topics / startup_use_cases / startup_tech, indexed by
+(value, startup_id):
+
+- has_facet() / matching(): "startups with topic X" as an indexed subquery
+- facet_counts(): value -> number of startups, one GROUP BY
+- facet_values_for(): startup id -> values for a whole candidate set
+- top_per_value(): best-ranked startup per value, one window query
+  (optionally passing over skipped ids in Python)
+
+The rows are kept in sync by a Session after_flush hook (ORM writes in this
+process), by bulk_importer after a startups import, and by
+ensure_startup_facets() at app startup for rows written by other scripts.
+"""
+
+import json
+import time
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, event, func, insert, inspect, or_, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models_startup import Startup, StartupTech, StartupTopic, StartupUseCase
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Facet:
+    """A JSON array column of startups and the junction table it is copied to"""
+    source: str  # Startup column holding the JSON array
+    model: Any  # Junction model
+    column: str  # Value column on the junction table
+
+    @property
+    def table(self):
+        return self.model.__table__
+
+    @property
+    def value(self):
+        return getattr(self.model, self.column)
+
+
+FACETS = {
+    "topics": Facet("topics", StartupTopic, "topic"),
+    "use_cases": Facet("axa_use_cases", StartupUseCase, "use_case"),
+    "tech": Facet("tech", StartupTech, "tech"),
+}
+
+SOURCE_COLUMNS = tuple(facet.source for facet in FACETS.values())
+
+
+def facet_values(raw: Any) -> List[str]:
+    """Distinct non-empty strings of a JSON array column, in stored order (same parsing as parse_array)"""
+    if not raw:
+        return []
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            raw = raw.split(",")
+    if not isinstance(raw, list):
+        return []
+    values = (value.strip() for value in raw if isinstance(value, str))
+    return list(dict.fromkeys(value for value in values if value))
+
+
+# ============================================
+# Keeping the junction tables in sync
+# ============================================
+
+def _chunks(ids: Sequence[int], size: int = REBUILD_BATCH_SIZE) -> Iterable[Sequence[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def remove_facets(conn: Connection, startup_ids: Sequence[int]):
+    """Drop every junction row of these startups"""
+    for facet in FACETS.values():
+        for chunk in _chunks(list(startup_ids)):
+            conn.execute(delete(facet.table).where(facet.table.c.startup_id.in_(chunk)))
+
+
+def _insert_facets(conn: Connection, startups: Sequence[Tuple[int, Mapping[str, Any]]]) -> Dict[str, int]:
+    counts = {}
+    for name, facet in FACETS.items():
+        rows = [{"startup_id": startup_id, facet.column: value}
+                for startup_id, source in startups for value in facet_values(source.get(facet.source))]
+        if rows:
+            conn.execute(insert(facet.table), rows)
+        counts[name] = len(rows)
+    return counts
+
+
+def replace_facets(conn: Connection, startups: Sequence[Tuple[int, Mapping[str, Any]]]):
+    """Rewrite the junction rows of each (startup_id, {source column: raw value})"""
+    if startups:
+        remove_facets(conn, [startup_id for startup_id, _ in startups])
+        _insert_facets(conn, startups)
+
+
+def _iter_sources(conn: Connection) -> Iterable[List[Tuple[int, Mapping[str, Any]]]]:
+    """(id, source columns) of every startup, in id-ordered batches"""
+    columns = [Startup.id] + [getattr(Startup, name) for name in SOURCE_COLUMNS]
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(*columns).where(Startup.id > last_id).order_by(Startup.id).limit(REBUILD_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield [(row.id, row._mapping) for row in rows]
+        last_id = rows[-1].id
+
+
+def rebuild_facets(conn: Connection) -> Dict[str, int]:
+    """Recreate every junction row from the startups table (backfill / repair); returns rows per facet"""
+    for facet in FACETS.values():
+        facet.table.create(bind=conn, checkfirst=True)
+        conn.execute(delete(facet.table))
+    built = dict.fromkeys(FACETS, 0)
+    for batch in _iter_sources(conn):
+        for name, count in _insert_facets(conn, batch).items():
+            built[name] += count
+    return built
+
+
+def _facets_modified(obj: Startup) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[name].history.has_changes() for name in SOURCE_COLUMNS)
+
+
+def _after_flush(session: Session, flush_context):
+    changed = [obj for obj in session.new if isinstance(obj, Startup)]
+    changed += [obj for obj in session.dirty if isinstance(obj, Startup) and _facets_modified(obj)]
+    deleted = [obj.id for obj in session.deleted if isinstance(obj, Startup)]
+    if not (changed or deleted):
+        return
+    conn = session.connection()
+    if deleted:
+        remove_facets(conn, deleted)
+    replace_facets(conn, [(obj.id, {name: getattr(obj, name) for name in SOURCE_COLUMNS}) for obj in changed])
+
+
+def install_facet_hooks():
+    """Keep the junction tables in sync for every ORM flush in this process (idempotent)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def _pair_hash(startup_id: int, value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(f"{startup_id}\x00{value}".encode(), digest_size=8).digest(), "big")
+
+
+def _fingerprint(pairs: Iterable[Tuple[int, str]]) -> Tuple[int, int]:
+    """(count, order-independent hash) of (startup_id, value) pairs - a sum, so duplicates count"""
+    count = total = 0
+    for startup_id, value in pairs:
+        count += 1
+        total = (total + _pair_hash(startup_id, value)) & 0xFFFFFFFFFFFFFFFF
+    return count, total
+
+
+def ensure_startup_facets(db: Session) -> Dict[str, int]:
+    """
+    Create the junction tables if missing and rebuild them when their
+    content disagrees with the startups table (e.g. rows written by
+    scripts). Each facet is compared by a fingerprint of its
+    (startup_id, value) pairs, so a same-size swap is caught too.
+    """
+    conn = db.connection()
+    for facet in FACETS.values():
+        facet.table.create(bind=conn, checkfirst=True)
+    expected = {
+        name: _fingerprint((startup_id, value)
+                           for batch in _iter_sources(conn) for startup_id, source in batch
+                           for value in facet_values(source.get(facet.source)))
+        for name, facet in FACETS.items()
+    }
+    stored = {name: _fingerprint(conn.execute(select(facet.table.c.startup_id, facet.value)))
+              for name, facet in FACETS.items()}
+    if stored == expected:
+        db.commit()
+        return {}
+    started = time.perf_counter()
+    built = rebuild_facets(conn)
+    db.commit()
+    logger.info(f"🏷️  Rebuilt startup facets {built} in {(time.perf_counter() - started) * 1000:.0f}ms")
+    return built
+
+
+# ============================================
+# Queries
+# ============================================
+
+def facet_column(name: str):
+    """The value column of a facet's junction table, for building conditions"""
+    return FACETS[name].value
+
+
+def has_facet(name: str, *conditions):
+    """Startup.id IN (startups with a value matching any of the conditions)"""
+    facet = FACETS[name]
+    return Startup.id.in_(select(facet.model.startup_id).where(or_(*conditions)))
+
+
+def matching(name: str, patterns: Sequence[str], exact: bool = False):
+    """has_facet() for case-insensitive substring (or whole-value) matches of any pattern"""
+    value = func.lower(facet_column(name))
+    return has_facet(name, *[
+        value == p.lower() if exact else value.contains(p.lower(), autoescape=True) for p in patterns
+    ])
+
+
+def _joined(facet: Facet, *columns):
+    return select(*columns).select_from(facet.model).join(Startup, Startup.id == facet.model.startup_id)
+
+
+def facet_counts(db: Session, name: str, *where, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """(value, startups) for a facet over the startups matching where, most common first"""
+    facet = FACETS[name]
+    count = func.count(facet.model.startup_id)
+    query = _joined(facet, facet.value, count).where(*where).group_by(facet.value).order_by(count.desc(), facet.value)
+    if limit:
+        query = query.limit(limit)
+    return [(value, n) for value, n in db.execute(query)]
+
+
+def facet_values_for(db: Session, name: str, *where) -> Dict[int, List[str]]:
+    """startup id -> values, for every startup matching where that has any"""
+    facet = FACETS[name]
+    values: Dict[int, List[str]] = {}
+    for startup_id, value in db.execute(_joined(facet, facet.model.startup_id, facet.value).where(*where)):
+        values.setdefault(startup_id, []).append(value)
+    return values
+
+
+def top_per_value(db: Session, name: str, *where, order_by: Sequence[Any] = (),
+                  skip: Optional[Callable[[int], bool]] = None) -> List[Tuple[str, int]]:
+    """
+    (value, startup id) of the first startup per value among those matching
+    where, ranked by order_by then id; sorted by value.
+
+    skip(startup_id) -> True passes over a startup and takes the next one
+    ranked for that value. It runs on the ranked rows in Python, so the SQL
+    doesn't grow with the number of ids skipped (e.g. a user's seen set).
+    """
+    facet = FACETS[name]
+    rank = func.row_number().over(partition_by=facet.value, order_by=[*order_by, facet.model.startup_id])
+    ranked = _joined(facet, facet.value.label("value"), facet.model.startup_id, rank.label("rank")) \
+        .where(*where).subquery()
+    if skip is None:
+        query = select(ranked.c.value, ranked.c.startup_id).where(ranked.c.rank == 1).order_by(ranked.c.value)
+        return [(value, startup_id) for value, startup_id in db.execute(query)]
+
+    leaders: List[Tuple[str, int]] = []
+    query = select(ranked.c.value, ranked.c.startup_id).order_by(ranked.c.value, ranked.c.rank)
+    for value, startup_id in db.execute(query):
+        if (leaders and leaders[-1][0] == value) or skip(startup_id):
+            continue
+        leaders.append((value, startup_id))
+    return leaders
+
+
+def main():
+    import argparse
+    from database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Maintain the startup facet junction tables")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the row counts agree")
+    parser.add_argument("--counts", choices=sorted(FACETS), help="Print the most common values of a facet")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.rebuild:
+            built = rebuild_facets(db.connection())
+            db.commit()
+            print(f"✅ Rebuilt startup facets {built}")
+        else:
+            built = ensure_startup_facets(db)
+            print(f"✅ Startup facets {'rebuilt ' + str(built) if built else 'already in sync'}")
+        if args.counts:
+            for value, count in facet_counts(db, args.counts, limit=30):
+                print(f"  {count:5d}  {value}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
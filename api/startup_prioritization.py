@@ -6,6 +6,8 @@ from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 import random
 
+from keyword_matcher import KeywordGroups
+
 
 class StartupPrioritizer:
     """
@@ -99,6 +101,20 @@ class StartupPrioritizer:
         ],
     }
 
+    # Fallback categories when no specific category matches
+    GENERAL_CATEGORY_KEYWORDS = {
+        "ai_ml": ["ai", "ml"],
+        "automation": ["automation"],
+        "saas": ["saas", "software"],
+    }
+
+    # Exclusions, specific and general categories matched in a single scan
+    KEYWORD_GROUPS = KeywordGroups({
+        "excluded_consumer": EXCLUSION_KEYWORDS,
+        **CATEGORY_KEYWORDS,
+        **{f"general.{category}": keywords for category, keywords in GENERAL_CATEGORY_KEYWORDS.items()},
+    })
+
     # Stage diversity weights (to ensure variety)
     STAGE_WEIGHTS = {
         "Seed": 1.0,
@@ -117,8 +133,6 @@ class StartupPrioritizer:
         """
         Automatically categorize a startup based on its description and metadata
         """
-        categories = []
-
         # Combine all text fields for analysis
         text_fields = [
             startup.get("description", ""),
@@ -127,28 +141,19 @@ class StartupPrioritizer:
             " ".join(startup.get("technologies", [])),
             " ".join(startup.get("topics", [])),
         ]
-        combined_text = " ".join(text_fields).lower()
+        combined_text = " ".join(text_fields)
+        hits = self.KEYWORD_GROUPS.match(combined_text)
 
         # Check for excluded categories first (non-B2B)
-        for keyword in self.EXCLUSION_KEYWORDS:
-            if keyword.lower() in combined_text:
-                return ["excluded_consumer"]
+        if hits["excluded_consumer"]:
+            return ["excluded_consumer"]
 
         # Check against keywords
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in combined_text:
-                    categories.append(category)
-                    break
+        categories = [category for category in self.CATEGORY_KEYWORDS if hits[category]]
 
         # If no specific category found, use general categories
         if not categories:
-            if "ai" in combined_text or "ml" in combined_text:
-                categories.append("ai_ml")
-            if "automation" in combined_text:
-                categories.append("automation")
-            if "saas" in combined_text or "software" in combined_text:
-                categories.append("saas")
+            categories = [category for category in self.GENERAL_CATEGORY_KEYWORDS if hits[f"general.{category}"]]
 
         return categories or ["general"]
 
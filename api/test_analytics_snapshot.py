@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test the columnar analytics snapshot behind the dashboard stats
+
+- Every aggregate matches the SQL / Python code it replaced on the same data
+- Once built, stats requests issue no queries; refresh picks up new rows
+- /startups/stats is served from the snapshot
+"""
+
+import sys
+import json
+import random
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import sessionmaker
+
+import models
+import models_startup
+import db_queries
+import analytics_snapshot as snap
+from database import get_db
+from models_startup import FundingRound, Startup
+from routes_phase_endpoints import parse_array, router as phase_router
+from testing_db import record_statements, temp_engine
+
+
+def _database(tmp):
+    engine = temp_engine(tmp, "analytics.db")
+    rng = random.Random(5)
+    tiers = ["Tier 1: Critical", "Tier 2: High", "tier 2: high", "Tier 3: Monitor", None]
+    startups = [{
+        "id": i,
+        "company_name": f"Startup {i}",
+        "is_enriched": rng.random() < 0.4,
+        "logoUrl": rng.choice([None, f"https://logo/{i}.png"]),
+        "total_funding": rng.choice([None, 0.5, 3.25, 12.0, 140.75]),
+        "axa_priority_tier": rng.choice(tiers),
+        "axa_overall_score": rng.choice([None, 42.0, 67.5, 88.25]),
+        "cb_insights_id": rng.choice([None, 1000 + i]),
+        "axa_use_cases": rng.sample(["Claims", "Underwriting", "Workflow Automation"], rng.randint(0, 2)),
+        "extracted_product": rng.choice([None, "Platform"]),
+        "extracted_market": rng.choice([None, "Insurers"]),
+    } for i in range(1, 81)]
+    rounds = [{"id": i, "startup_id": rng.randint(1, 80),
+               "simplified_round": rng.choice(["Seed", "Series A", "Series B", None]),
+               "amount_millions": rng.choice([None, 1.0, 7.5, 30.0])} for i in range(1, 41)]
+    events = [{"id": i, "title": f"Event {i}", "organizer": rng.choice(["Slush", "Nordic VC", "Aalto", f"Org {i}"]),
+               "datetime": "Nov 19, 10:00 AM – 12:00 PM", "scraped_at": datetime(2025, 11, 1),
+               "status": rng.sample(["Signature Side Event", "Closed", "Waitlist"], rng.randint(0, 2)) or None}
+              for i in range(1, 31)]
+    with engine.begin() as conn:
+        conn.execute(insert(Startup.__table__), startups)
+        conn.execute(insert(FundingRound.__table__), rounds)
+        conn.execute(insert(models.SlushEvent.__table__), events)
+    return engine, sessionmaker(bind=engine), record_statements(engine)
+
+
+def _old_startup_stats(db):
+    """The ORM version of GET /startups/stats this replaced"""
+    tier2 = db.query(Startup).filter(Startup.axa_priority_tier.like('%Tier 2%'))
+    use_cases_count = {}
+    for startup in tier2.all():
+        for use_case in parse_array(startup.axa_use_cases):
+            use_cases_count[use_case] = use_cases_count.get(use_case, 0) + 1
+    return {
+        "total_startups": db.query(Startup).count(),
+        "tier2_startups": tier2.count(),
+        "use_cases_distribution": use_cases_count,
+        "data_completeness": {
+            "have_extracted_product": db.query(Startup).filter(Startup.extracted_product.isnot(None)).count(),
+            "have_extracted_market": db.query(Startup).filter(Startup.extracted_market.isnot(None)).count(),
+            "have_funding": db.query(Startup).filter(Startup.total_funding.isnot(None)).count(),
+        },
+    }
+
+
+def _old_slush_stats(db):
+    """The ORM version of GET /api/slush-events/stats/summary this replaced"""
+    counts = db.query(models.SlushEvent.organizer, func.count(models.SlushEvent.id)) \
+        .group_by(models.SlushEvent.organizer).all()
+    status_counts = {}
+    for (statuses,) in db.query(models.SlushEvent.status).filter(models.SlushEvent.status.isnot(None)):
+        for status in statuses or []:
+            status_counts[status] = status_counts.get(status, 0) + 1
+    return db.query(models.SlushEvent).count(), dict(counts), status_counts
+
+
+def test_aggregates_match_sql():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, _ = _database(tmp)
+        db = Session()
+        snapshot = snap.build_snapshot(db)
+
+        assert snapshot.enrichment == db_queries.get_enrichment_stats(db)
+        assert snapshot.funding == db_queries.get_funding_stats(db)
+        assert snapshot.axa_tiers == db_queries.get_axa_tier_statistics(db)
+        by_stage = db_queries.get_funding_by_stage(db)["by_stage"]
+        key = lambda row: (row["stage"] or "")
+        assert sorted(snapshot.funding_by_stage["by_stage"], key=key) == sorted(by_stage, key=key)
+        totals = [row["total_amount_millions"] for row in snapshot.funding_by_stage["by_stage"]]
+        assert totals == sorted(totals, reverse=True)
+
+        assert snapshot.startups == _old_startup_stats(db)
+        assert snapshot.startups["tier2_startups"] > 0 and snapshot.startups["use_cases_distribution"]
+
+        total, organizers, status_counts = _old_slush_stats(db)
+        events = snapshot.slush_events
+        assert events["total_events"] == total and events["status_counts"] == status_counts
+        top = [row["count"] for row in events["top_organizers"]]
+        assert len(top) == min(snap.TOP_ORGANIZERS, len(organizers))
+        assert top == sorted(organizers.values(), reverse=True)[:len(top)]
+        assert all(organizers[row["organizer"]] == row["count"] for row in events["top_organizers"])
+        json.dumps(snapshot.to_dict())
+        db.close()
+        engine.dispose()
+
+    print("✓ Snapshot aggregates equal the SQL / ORM versions they replaced")
+
+
+def test_empty_catalogue():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/empty.db")
+        models.Base.metadata.create_all(bind=engine)
+        models_startup.Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        snapshot = snap.build_snapshot(db)
+        assert snapshot.enrichment["total_startups"] == 0 and snapshot.enrichment["enrichment_percentage"] == 0
+        assert snapshot.funding["avg_funding_millions"] is None and snapshot.funding_by_stage == {"by_stage": []}
+        assert snapshot.axa_tiers == {} and snapshot.slush_events["top_organizers"] == []
+        db.close()
+        engine.dispose()
+
+    print("✓ Empty tables give zero / None aggregates")
+
+
+def test_served_from_memory():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, statements = _database(tmp)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(phase_router)
+        app.dependency_overrides[get_db] = override_db
+        snap.analytics.clear()
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = (await client.get("/startups/stats")).json()
+                assert first["total_startups"] == 80
+                statements.clear()
+                for _ in range(5):
+                    assert (await client.get("/startups/stats")).json() == first
+                assert statements == [], "stats served without touching the tables"
+        asyncio.run(run())
+
+        db = Session()
+        db.execute(insert(Startup.__table__), [{"id": 81, "company_name": "Late", "axa_priority_tier": "Tier 2"}])
+        db.commit()
+        assert snap.get_snapshot(db).startups["total_startups"] == 80
+        snap.refresh_snapshot(db)
+        assert snap.get_snapshot(db).startups["total_startups"] == 81
+        db.close()
+        snap.analytics.clear()
+        engine.dispose()
+
+    print("✓ Repeat stats requests run no queries; refresh picks up new rows")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ANALYTICS SNAPSHOT TEST")
+    print("=" * 60)
+    test_aggregates_match_sql()
+    test_empty_catalogue()
+    test_served_from_memory()
+    print("\n✅ All analytics snapshot tests passed")
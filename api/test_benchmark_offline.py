@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test the offline benchmark harness (mock NIM / CB Insights server)
+
+Runs entirely on localhost - no credentials or network access needed.
+"""
+
+import sys
+import json
+import urllib.request
+import urllib.error
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mock_api_server import MockAPIServer, MockServerConfig
+from benchmark_pipelines import percentile, check_regressions, BenchmarkResult
+
+
+def _post(url: str, payload: dict):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+
+def test_chat_completions_shape():
+    """Mock NIM returns OpenAI-compatible completions with usage"""
+    config = MockServerConfig(latency_ms=0, jitter_ms=0, completion_tokens=50)
+    with MockAPIServer(config) as server:
+        status, data = _post(f"{server.llm_base_url}/chat/completions", {
+            "model": "qwen/mock",
+            "messages": [{"role": "user", "content": "Hello there"}],
+        })
+        assert status == 200
+        assert data["choices"][0]["message"]["content"]
+        assert data["usage"]["completion_tokens"] == 50
+        assert server.stats.completion_tokens == 50
+    print("✓ chat completions shape")
+
+
+def test_evaluator_prompt_gets_json_array():
+    """Evaluator-style prompts get one JSON result per startup"""
+    config = MockServerConfig(latency_ms=0, jitter_ms=0)
+    prompt = "STARTUP 1: Alpha\nIndustry: AI\n---\nSTARTUP 2: Beta\nIndustry: Insurtech\n"
+    with MockAPIServer(config) as server:
+        status, data = _post(f"{server.llm_base_url}/chat/completions", {
+            "messages": [{"role": "user", "content": prompt}],
+        })
+        results = json.loads(data["choices"][0]["message"]["content"])
+        assert [r["startup_name"] for r in results] == ["Alpha", "Beta"]
+    print("✓ evaluator prompt returns JSON array")
+
+
+def test_tool_calls_returned_when_configured():
+    config = MockServerConfig(latency_ms=0, jitter_ms=0, tool_calls_per_turn=2)
+    tools = [{"type": "function", "function": {"name": n, "parameters": {}}} for n in ("a", "b", "c")]
+    with MockAPIServer(config) as server:
+        _, data = _post(f"{server.llm_base_url}/chat/completions", {
+            "messages": [{"role": "user", "content": "use tools"}],
+            "tools": tools,
+        })
+        calls = data["choices"][0]["message"]["tool_calls"]
+        assert [c["function"]["name"] for c in calls] == ["a", "b"]
+    print("✓ tool calls returned")
+
+
+def test_cbinsights_endpoints():
+    config = MockServerConfig(latency_ms=0, jitter_ms=0, org_payload_bytes=100)
+    with MockAPIServer(config) as server:
+        status, auth = _post(f"{server.base_url}/v2/authorize", {"clientId": "x", "clientSecret": "y"})
+        assert status == 200 and auth["token"]
+        _, firmo = _post(f"{server.base_url}/v2/firmographics", {"orgIds": [1, 2, 3]})
+        assert [o["orgId"] for o in firmo["orgs"]] == [1, 2, 3]
+        assert len(firmo["orgs"][0]["description"]) == 100
+        status, report = _post(f"{server.base_url}/v2/organizations/42/scoutingreport", {})
+        assert status == 200 and report["orgId"] == 42
+    print("✓ CB Insights endpoints")
+
+
+def test_rate_limit_ratio():
+    config = MockServerConfig(latency_ms=0, jitter_ms=0, rate_limit_ratio=0.5, seed=7)
+    with MockAPIServer(config) as server:
+        statuses = [
+            _post(f"{server.base_url}/v2/firmographics", {"orgIds": [1]})[0]
+            for _ in range(200)
+        ]
+        limited = statuses.count(429)
+        assert 60 < limited < 140, limited
+        assert server.stats.rate_limited == limited
+    print(f"✓ rate limiting ({limited}/200 answered with 429)")
+
+
+def test_percentile_and_regressions():
+    assert percentile([], 50) == 0.0
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile(list(range(101)), 99) == 99
+
+    result = BenchmarkResult(
+        pipeline="concierge", items=10, requests=10, errors=0, rate_limited=0,
+        elapsed_seconds=2.0, items_per_second=5.0, p50_ms=100, p99_ms=300,
+        prompt_tokens=0, completion_tokens=0, tokens_per_second=0,
+    )
+    baseline = {"pipelines": [{"pipeline": "concierge", "items_per_second": 10.0, "p99_ms": 200.0}]}
+    failures = check_regressions([result], baseline, tolerance=0.2)
+    assert len(failures) == 2
+    assert not check_regressions([result], {"pipelines": []})
+    print("✓ percentile and regression checks")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("OFFLINE BENCHMARK HARNESS TEST")
+    print("=" * 60)
+    test_chat_completions_shape()
+    test_evaluator_prompt_gets_json_array()
+    test_tool_calls_returned_when_configured()
+    test_cbinsights_endpoints()
+    test_rate_limit_ratio()
+    test_percentile_and_regressions()
+    print("\n✅ All benchmark harness tests passed")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test the bulk idempotent importer on a throwaway SQLite database
+
+- Events fixture imports once and re-imports as pure updates
+- Attendee CSV upserts by ID and refreshes changed rows
+- Startup upserts keep enrichment columns the file doesn't provide
+- crud.create_slush_events_bulk goes through the same upsert
+"""
+
+import sys
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import models
+from models_startup import Startup
+from bulk_importer import (
+    DEFAULT_EVENTS_FILE, import_attendees_file, import_events_file, import_startups_file,
+)
+
+
+def _engine(tmp: str):
+    engine = create_engine(f"sqlite:///{tmp}/import.db")
+    models.Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _count(engine, table: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+
+def test_events_reimport_is_idempotent():
+    recorded = json.loads(DEFAULT_EVENTS_FILE.read_text(encoding="utf-8"))
+    unique = {(e["title"], e["organizer"], e["datetime"]) for e in recorded}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine(tmp)
+        first = import_events_file(DEFAULT_EVENTS_FILE, engine=engine, batch_size=100)
+        assert first.rows == len(recorded)
+        assert first.inserted == len(unique)
+        assert _count(engine, "slush_events") == len(unique)
+
+        second = import_events_file(DEFAULT_EVENTS_FILE, engine=engine)
+        assert second.inserted == 0 and second.updated == len(recorded)
+        assert _count(engine, "slush_events") == len(unique)
+    print(f"✓ Events: {first.summary()}")
+
+
+def test_attendees_upsert_refreshes_rows():
+    fields = ["name", "title", "user_country", "user_industry", "user_occupation", "company_name"]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "people.csv"
+
+        def write(title: str):
+            with open(csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerow({"name": "Ada", "title": title, "user_country": "FI",
+                                 "user_industry": '["Insurtech"]', "user_occupation": "[]"})
+                writer.writerow({"name": "", "title": "no name"})
+                writer.writerow({"name": "Linus", "company_name": "Kernel Oy"})
+
+        engine = _engine(tmp)
+        write("CTO")
+        stats = import_attendees_file(csv_path, engine=engine)
+        assert (stats.inserted, stats.skipped) == (2, 1)
+
+        write("CEO")
+        stats = import_attendees_file(csv_path, engine=engine)
+        assert (stats.inserted, stats.updated) == (0, 2)
+
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            ada = db.query(models.Attendee).filter_by(name="Ada").one()
+            assert ada.title == "CEO"
+            assert ada.industry == ["Insurtech"] and ada.occupation is None
+    print("✓ Attendees upsert")
+
+
+def test_startup_upsert_keeps_enrichment():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "startups.json"
+        engine = _engine(tmp)
+
+        json_path.write_text(json.dumps([
+            {"company_name": "Alpha", "topics": ["AI", "Claims"], "founding_year": "2019"},
+            {"company_name": "Beta", "company_country": "Finland"},
+            {"company_description": "no name"},
+        ]))
+        stats = import_startups_file(json_path, engine=engine)
+        assert (stats.inserted, stats.skipped) == (2, 1)
+
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE startups SET total_funding = 12.5 WHERE company_name = 'Alpha'"))
+
+        json_path.write_text(json.dumps([{"company_name": "Alpha", "topics": ["AI"], "founding_year": 2020}]))
+        stats = import_startups_file(json_path, engine=engine)
+        assert (stats.inserted, stats.updated) == (0, 1)
+
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            alpha = db.query(Startup).filter_by(company_name="Alpha").one()
+            assert alpha.topics == ["AI"]  # Stored as a list, not a JSON string
+            assert alpha.founding_year == 2020
+            assert alpha.total_funding == 12.5
+            assert db.query(Startup).count() == 2
+    print("✓ Startups upsert keeps enrichment columns")
+
+
+def test_crud_bulk_events_upsert():
+    import crud
+
+    events = [
+        {"title": "Demo Day", "organizer": "Slush", "datetime": "Nov 19, 10:00 AM", "scraped_at": "2025-11-17T10:00:00"},
+        {"title": "Demo Day", "organizer": "Slush", "datetime": "Nov 19, 10:00 AM", "location": "Stage 1",
+         "scraped_at": "2025-11-17T11:00:00"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _engine(tmp)
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            assert crud.create_slush_events_bulk(db, events) == 2
+            assert crud.create_slush_events_bulk(db, events) == 2
+            [event] = crud.get_slush_events(db)
+            assert event.location == "Stage 1"
+    print("✓ crud.create_slush_events_bulk upserts")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("BULK IMPORTER TEST")
+    print("=" * 60)
+    test_events_reimport_is_idempotent()
+    test_attendees_upsert_refreshes_rows()
+    test_startup_upsert_keeps_enrichment()
+    test_crud_bulk_events_upsert()
+    print("\n✅ All bulk importer tests passed")
@@ -12,6 +12,7 @@ This script:
 
 import asyncio
 import aiohttp
+import os
 import time
 import json
 from datetime import datetime
@@ -25,26 +26,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# CB Insights API credentials
-CBINSIGHTS_CLIENT_ID = "d13b9206-0ab1-451c-bd27-19454cbd67b1"
-CBINSIGHTS_CLIENT_SECRET = "82fef28b517bd39ef977fe87415d69a45fbcdc376293ca3e3fd5ef0240901fb8"
-CB_INSIGHTS_BASE_URL = "https://api.cbinsights.com"
+# CB Insights API credentials (from environment, never hardcoded)
+CBINSIGHTS_CLIENT_ID = os.getenv("CBINSIGHTS_CLIENT_ID") or os.getenv("CBI_CLIENT_ID")
+CBINSIGHTS_CLIENT_SECRET = os.getenv("CBINSIGHTS_CLIENT_SECRET") or os.getenv("CBI_CLIENT_SECRET")
+# CBI_BASE_URL lets the test run against mock_api_server.py
+CB_INSIGHTS_BASE_URL = os.getenv("CBI_BASE_URL", "https://api.cbinsights.com")
 REQUEST_TIMEOUT = 180  # 3 minutes
 
 
 class ConcurrencyTester:
     """Test API concurrency limits"""
     
-    def __init__(self):
+    def __init__(self, client_id: str = None, client_secret: str = None, base_url: str = None):
+        self.client_id = client_id or CBINSIGHTS_CLIENT_ID
+        self.client_secret = client_secret or CBINSIGHTS_CLIENT_SECRET
+        self.base_url = base_url or CB_INSIGHTS_BASE_URL
         self.bearer_token: str = None
         self.results: Dict[int, Dict[str, Any]] = {}
         
     async def authorize(self, session: aiohttp.ClientSession) -> bool:
         """Get authorization token"""
-        auth_url = f"{CB_INSIGHTS_BASE_URL}/v2/authorize"
+        auth_url = f"{self.base_url}/v2/authorize"
         payload = {
-            "clientId": CBINSIGHTS_CLIENT_ID,
-            "clientSecret": CBINSIGHTS_CLIENT_SECRET
+            "clientId": self.client_id,
+            "clientSecret": self.client_secret
         }
         
         try:
@@ -63,7 +68,7 @@ class ConcurrencyTester:
         if not self.bearer_token:
             return {"success": False, "error": "Not authorized"}
         
-        report_url = f"{CB_INSIGHTS_BASE_URL}/v2/organizations/{org_id}/scoutingreport"
+        report_url = f"{self.base_url}/v2/organizations/{org_id}/scoutingreport"
         headers = {
             "Authorization": f"Bearer {self.bearer_token}",
             "Content-Type": "application/json"
@@ -173,7 +178,8 @@ class ConcurrencyTester:
                 "total_time": total_time,
                 "avg_time_per_request": avg_time,
                 "requests_per_second": len(test_companies) / total_time if total_time > 0 else 0,
-                "success_rate": successes / len(responses) * 100 if responses else 0
+                "success_rate": successes / len(responses) * 100 if responses else 0,
+                "latencies": [r.get("elapsed", 0) for r in responses if isinstance(r, dict)]
             }
             
             self.results[concurrency] = result
@@ -209,6 +215,12 @@ async def main():
         (1204229, "Straion"),
     ]
     
+    if not CBINSIGHTS_CLIENT_ID or not CBINSIGHTS_CLIENT_SECRET:
+        print("❌ CB Insights credentials not set")
+        print("   Set CBINSIGHTS_CLIENT_ID and CBINSIGHTS_CLIENT_SECRET environment variables")
+        print("   (or run benchmark_pipelines.py to test against the local mock server)")
+        return
+    
     tester = ConcurrencyTester()
     
     print("=" * 80)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test rolling summarization and token accounting for feedback/debrief chats
+
+- Prompt size stays flat over a long session (older turns get summarized)
+- The system prompt + session context prefix is identical turn to turn
+- Provider usage is used when reported, estimated otherwise
+- MemoryStore evicts the least recently used session
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from conversation_memory import (
+    ConversationMemory, MemoryStore, extractive_summary, llm_summarizer, messages_tokens,
+)
+
+SYSTEM_PROMPT = "You are a colleague debriefing an analyst. " * 10
+SESSION_CONTEXT = "Meeting with: Claimsly\nKEY TOPICS:\n  • Claims triage accuracy\n  • Pricing"
+
+
+def _reply(content, usage=None):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+def test_long_session_prompt_stays_flat():
+    async def fake_llm(messages, **kwargs):
+        return _reply("Interesting - how did that compare to what they promised in the pitch?")
+
+    summaries = []
+
+    async def fake_summarizer(previous, turns):
+        summaries.append(len(turns))
+        return extractive_summary(previous, turns, max_tokens=150)
+
+    async def run():
+        memory = ConversationMemory("debrief:1", recent_messages=6, compact_after_tokens=300)
+        history = []
+        prompt_sizes = []
+        for turn in range(40):
+            history.append({"role": "user", "content": f"Turn {turn}: they showed claims triage at 94% accuracy " * 3})
+            messages = memory.build_messages(SYSTEM_PROMPT, SESSION_CONTEXT, history, "Ask one follow-up question.")
+            assert messages[0]["content"].startswith(SYSTEM_PROMPT.strip())
+            prompt_sizes.append(messages_tokens(messages))
+            reply = await memory.complete(fake_llm, messages)
+            history.append({"role": "assistant", "content": reply})
+            task = memory.schedule_compaction(history, fake_summarizer)
+            if task:
+                await task
+        return memory, prompt_sizes
+
+    memory, prompt_sizes = asyncio.run(run())
+    usage = memory.usage.to_dict()
+    assert usage["turns"] == 40 and usage["estimated"]
+    assert usage["compactions"] >= 5 and sum(summaries) == usage["summarized_messages"]
+    # Prompt size is bounded: the late turns cost no more than the early-middle ones
+    assert max(prompt_sizes[20:]) <= max(prompt_sizes[:20]) * 1.2, prompt_sizes
+    assert usage["max_prompt_tokens"] < 1200
+    # Every turn after the first reused the whole stable prefix
+    prefix_tokens = (len(f"{SYSTEM_PROMPT}\n\n{SESSION_CONTEXT}".strip()) + 3) // 4
+    assert usage["reused_prefix_tokens"] == prefix_tokens * 39
+    print(f"✓ 40-turn session: prompt {prompt_sizes[0]} → {prompt_sizes[-1]} tokens, "
+          f"{usage['compactions']} compactions")
+
+
+def test_provider_usage_and_summarizer_fallback():
+    async def reporting_llm(messages, **kwargs):
+        details = SimpleNamespace(cached_tokens=80)
+        return _reply("ok", SimpleNamespace(prompt_tokens=120, completion_tokens=5, prompt_tokens_details=details))
+
+    async def failing_call(**kwargs):
+        raise RuntimeError("rate limited")
+
+    async def run():
+        memory = ConversationMemory("feedback:7")
+        messages = memory.build_messages("sys", "ctx", [{"role": "user", "content": "hi"}], "reply")
+        await memory.complete(reporting_llm, messages)
+        summary = await llm_summarizer(failing_call, max_tokens=20)("", [
+            {"role": "user", "content": "They integrate with Guidewire in two weeks."},
+            {"role": "assistant", "content": "Nice, what about pricing?"},
+        ])
+        return memory.usage.to_dict(), summary
+
+    usage, summary = asyncio.run(run())
+    assert (usage["prompt_tokens"], usage["completion_tokens"], usage["cached_tokens"]) == (120, 5, 80)
+    assert not usage["estimated"]
+    assert "Guidewire" in summary and "pricing" not in summary
+    print("✓ Provider usage recorded, extractive fallback summary")
+
+
+def test_memory_store_lru():
+    store = MemoryStore(max_sessions=2)
+    first = store.get("a")
+    store.get("b")
+    assert store.get("a") is first
+    store.get("c")
+    assert len(store) == 2 and store.peek("b") is None and store.peek("a") is first
+    store.drop("a")
+    assert store.peek("a") is None
+    print("✓ MemoryStore LRU eviction")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("CONVERSATION MEMORY TEST")
+    print("=" * 60)
+    test_long_session_prompt_stays_flat()
+    test_provider_usage_and_summarizer_fallback()
+    test_memory_store_lru()
+    print("\n✅ All conversation memory tests passed")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the role-based SQLite engine factory
+
+- Each role gets WAL and its own pragmas
+- Readers are not blocked by an open batch write transaction
+- Per-connection stats count queries and writes
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from database import make_engine, get_engine_stats
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_role_pragmas():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/roles.db"
+        api = make_engine(url, role="api")
+        writer = make_engine(url, role="batch_writer")
+        reader = make_engine(url, role="reader")
+
+        assert _pragma(api, "journal_mode") == "wal"
+        assert _pragma(api, "synchronous") == 1  # NORMAL
+        assert _pragma(api, "busy_timeout") == 5000
+        assert _pragma(writer, "busy_timeout") == 30000
+        assert _pragma(reader, "query_only") == 1
+
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        try:
+            with reader.begin() as conn:
+                conn.execute(text("INSERT INTO t VALUES (1)"))
+            raise AssertionError("reader role must not write")
+        except OperationalError:
+            pass
+
+        for engine in (api, writer, reader):
+            engine.dispose()
+    print("✓ Role pragmas applied")
+
+
+def test_reads_continue_during_batch_write():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{tmp}/wal.db"
+        api = make_engine(url, role="api")
+        writer = make_engine(url, role="batch_writer")
+
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE startups (id INTEGER PRIMARY KEY, name TEXT)"))
+            conn.execute(text("INSERT INTO startups (name) VALUES ('Alpha')"))
+
+        writing = threading.Event()
+        release = threading.Event()
+
+        def long_batch_write():
+            with writer.begin() as conn:
+                conn.execute(text("INSERT INTO startups (name) VALUES ('Beta')"))
+                writing.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=long_batch_write)
+        thread.start()
+        writing.wait(5)
+        try:
+            # The uncommitted write holds the lock; WAL readers see the last commit
+            with api.connect() as conn:
+                assert conn.execute(text("SELECT COUNT(*) FROM startups")).scalar() == 1
+        finally:
+            release.set()
+            thread.join()
+
+        with api.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM startups")).scalar() == 2
+
+        stats = get_engine_stats(writer)
+        assert stats["role"] == "batch_writer"
+        assert stats["writes"] >= 3
+        assert get_engine_stats(api)["queries"] >= 2
+        assert stats["lock_errors"] == 0
+
+        api.dispose()
+        writer.dispose()
+        assert get_engine_stats(writer)["open_connections"] == 0
+    print("✓ Reads continue during a batch write")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("DATABASE ENGINE TEST")
+    print("=" * 60)
+    test_role_pragmas()
+    test_reads_continue_during_batch_write()
+    print("\n✅ All database engine tests passed")
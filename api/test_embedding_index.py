@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test the embedding index with the offline hashing provider
+
+- Semantic ranking of startups by value proposition text
+- Incremental refresh (only changed rows re-embedded) and reload from disk
+- db_queries.get_similar_startups / search_startups_by_value_prop on SQLite
+- A stale index is refreshed in the background while requests keep being
+  served from the last good vectors
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ["EMBEDDING_PROVIDER"] = "hashing"
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import embedding_index
+from embedding_index import EmbeddingIndex, HashingEmbeddingProvider
+
+STARTUPS = [
+    (1, "AI claims automation for insurers", "Claims triage engine", "Automates FNOL and claims processing with AI."),
+    (2, "Fraud detection for insurance claims", "Claims fraud scoring", "Detects fraudulent insurance claims."),
+    (3, "Carbon accounting for factories", "Emissions dashboard", "Measures scope 3 emissions for manufacturers."),
+    (4, "Grocery delivery in 10 minutes", "Dark stores", "Quick commerce for urban consumers."),
+    (5, "Underwriting risk models for insurers", "Risk scoring API", "Helps insurance underwriting teams price risk."),
+]
+
+
+class CountingProvider(HashingEmbeddingProvider):
+    def __init__(self):
+        super().__init__(dim=256)
+        self.embedded = 0
+
+    def embed(self, texts, input_type="passage"):
+        if input_type == "passage":
+            self.embedded += len(texts)
+        return super().embed(texts, input_type)
+
+
+class SlowProvider(HashingEmbeddingProvider):
+    """Passages block until released, like a slow remote embedding call"""
+
+    def __init__(self, dim):
+        super().__init__(dim=dim)
+        self.release = threading.Event()
+
+    def embed(self, texts, input_type="passage"):
+        if input_type == "passage":
+            self.release.wait(5)
+        return super().embed(texts, input_type)
+
+
+def _startups_db(tmp):
+    import models
+    import models_startup  # noqa: F401 - registers the startups table
+
+    engine = create_engine(f"sqlite:///{tmp}/startups.db", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for id_, vp, core, desc in STARTUPS:
+            conn.execute(text(
+                "INSERT INTO startups (id, company_name, value_proposition, core_product, company_description, "
+                "primary_industry) VALUES (:id, :name, :vp, :core, :desc, 'Other')"
+            ), {"id": id_, "name": f"Startup {id_}", "vp": vp, "core": core, "desc": desc})
+    return engine
+
+
+def _records(rows):
+    return [(id_, "\n".join([vp, core, desc])) for id_, vp, core, desc in rows]
+
+
+def test_semantic_ranking_and_incremental_refresh():
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = CountingProvider()
+        index = EmbeddingIndex("startups", provider, directory=tmp)
+        stats = index.refresh(_records(STARTUPS))
+        assert stats["added"] == 5 and provider.embedded == 5
+
+        top = [id_ for id_, _ in index.search("insurance claims AI", k=2)]
+        assert set(top) == {"1", "2"}, top
+        similar = [id_ for id_, _ in index.similar_to(1, k=2)]
+        assert "1" not in similar and similar[0] == "2"
+
+        # Nothing changed -> nothing re-embedded
+        assert index.refresh(_records(STARTUPS))["added"] == 0 and provider.embedded == 5
+
+        # One edit, one delete, one new row
+        changed = [r for r in STARTUPS if r[0] != 4]
+        changed[2] = (3, "Carbon removal marketplace", "Credits", "Buy verified carbon removal.")
+        changed.append((6, "Parametric flood insurance", "Cover", "Pays out on flood sensor data."))
+        stats = index.refresh(_records(changed))
+        assert (stats["added"], stats["updated"], stats["removed"]) == (1, 1, 1)
+        assert provider.embedded == 7
+        assert index.vector(4) is None and len(index) == 5
+
+        # Reopening maps the same matrix without re-embedding
+        reopened = EmbeddingIndex("startups", CountingProvider(), directory=tmp)
+        assert len(reopened) == 5
+        assert reopened.search("flood insurance", k=1)[0][0] == "6"
+    print("✓ Semantic ranking and incremental refresh")
+
+
+def test_search_latency():
+    provider = HashingEmbeddingProvider(dim=256)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = EmbeddingIndex("bulk", provider, directory=tmp)
+        index.refresh((i, f"startup {i} building {STARTUPS[i % 5][1]}") for i in range(10000))
+        started = time.perf_counter()
+        for _ in range(20):
+            index.search("claims automation", k=10)
+        per_query_ms = (time.perf_counter() - started) / 20 * 1000
+    assert per_query_ms < 50, per_query_ms
+    print(f"✓ Top-10 over 10k vectors in {per_query_ms:.2f}ms")
+
+
+def test_db_queries_use_index():
+    import db_queries
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embedding_index.INDEX_DIR = Path(tmp)
+        embedding_index.reset_indexes()
+        engine = _startups_db(tmp)
+        db = sessionmaker(bind=engine)()
+        try:
+            embedding_index.refresh_indexes(db)
+            similar = db_queries.get_similar_startups(db, "Startup 1", limit=2)
+            assert similar[0]["company_name"] == "Startup 2"
+            assert "similarity" in similar[0]
+
+            results = db_queries.search_startups_by_value_prop(db, "pricing underwriting risk", limit=3)
+            assert results[0]["id"] == 5
+        finally:
+            db.close()
+            embedding_index.reset_indexes()
+            engine.dispose()
+    print("✓ db_queries similar / value-prop search use the index")
+
+
+def test_stale_index_refreshes_in_background():
+    with tempfile.TemporaryDirectory() as tmp:
+        embedding_index.INDEX_DIR = Path(tmp)
+        embedding_index.reset_indexes()
+        engine = _startups_db(tmp)
+        db = sessionmaker(bind=engine)()
+        try:
+            embedding_index.refresh_indexes(db)
+            index = embedding_index.get_startup_index(db)
+            provider = index.provider = SlowProvider(index.dim)
+            db.execute(text("UPDATE startups SET value_proposition = 'Parametric flood insurance', "
+                            "core_product = NULL, company_description = NULL WHERE id = 4"))
+            db.commit()
+
+            started = time.perf_counter()
+            assert embedding_index.get_startup_index(db, max_age=0) is index
+            served = index.search("insurance claims AI", k=2)
+            assert time.perf_counter() - started < 1, "the request didn't wait for the refresh"
+            assert {id_ for id_, _ in served} == {"1", "2"}, "last good vectors while refreshing"
+
+            provider.release.set()
+            embedding_index._refreshing["startups"].join(5)
+            assert index.search("flood insurance", k=1)[0][0] == "4"
+        finally:
+            db.close()
+            embedding_index.reset_indexes()
+            engine.dispose()
+    print("✓ Stale index refreshed in the background, last good vectors served meanwhile")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EMBEDDING INDEX TEST")
+    print("=" * 60)
+    test_semantic_ranking_and_incremental_refresh()
+    test_search_latency()
+    test_db_queries_use_index()
+    test_stale_index_refreshes_in_background()
+    print("\n✅ All embedding index tests passed")
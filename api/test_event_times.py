@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test parsed event times and the interval queries
+
+- Every scraped Slush time string parses to a UTC window (overnight and
+  multi-day ranges included); date questions map to days / instants
+- ORM writes and the bulk importer fill starts_at / ends_at; a database
+  created before the columns existed is migrated and backfilled
+- Overlap / at / next-N / per-day queries and date search run as range
+  scans of the starts_at index
+"""
+
+import sys
+import json
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import models
+import db_queries
+import event_times as et
+from bulk_importer import event_row
+from testing_db import temp_engine
+
+EVENTS_FILE = Path(__file__).parent.parent / "scrapper" / "slush_events_data" / "slush_events_full.json"
+NOW = datetime(2025, 11, 19, 11, 30)  # 13:30 in Helsinki
+
+
+def _session(tmp):
+    engine = temp_engine(tmp, "events.db")
+    return engine, sessionmaker(bind=engine)()
+
+
+def _event(title, when):
+    return models.SlushEvent(title=title, organizer="Org", datetime=when, scraped_at=NOW)
+
+
+def test_parsing():
+    assert et.parse_event_window("Nov 20, 10:00 AM – 12:00 PM") == (datetime(2025, 11, 20, 8), datetime(2025, 11, 20, 10))
+    assert et.parse_event_window("Nov 19, 10:00 PM – 2:00 AM") == (datetime(2025, 11, 19, 20), datetime(2025, 11, 20, 0))
+    assert et.parse_event_window("Nov 19, 11:00 AM – Nov 20, 1:00 AM")[1] == datetime(2025, 11, 19, 23)
+    assert et.parse_event_window("Nov 20, 18:00") == (datetime(2025, 11, 20, 16), datetime(2025, 11, 20, 17))
+    assert et.parse_event_window("Nov 21") == (datetime(2025, 11, 20, 22), datetime(2025, 11, 21, 22))
+    assert et.parse_event_window("TBA") is None and et.parse_event_window(None) is None
+
+    if EVENTS_FILE.exists():
+        scraped = [e["datetime"] for e in json.loads(EVENTS_FILE.read_text())]
+        windows = [et.parse_event_window(value) for value in scraped]
+        assert all(w and w[0] < w[1] for w in windows), [v for v, w in zip(scraped, windows) if not w or w[0] >= w[1]]
+
+    assert et.parse_date_query("Nov 19") == (datetime(2025, 11, 18, 22), datetime(2025, 11, 19, 22))
+    assert et.parse_date_query("20 November") == et.parse_date_query("2025-11-20")
+    assert et.parse_date_query("what's on Nov 19 at 3pm?") == (datetime(2025, 11, 19, 13),) * 2
+    assert et.parse_date_query("at 15:30", now=NOW) == (datetime(2025, 11, 19, 13, 30),) * 2
+    assert et.parse_date_query("tomorrow evening", now=NOW) == (datetime(2025, 11, 20, 15), datetime(2025, 11, 20, 22))
+    assert et.parse_date_query("anything right now?", now=NOW) == (NOW, NOW)
+    assert et.parse_date_query("Demo Day") is None
+    assert et.parse_when("2025-11-19", end_of_day=True) == datetime(2025, 11, 19, 22)
+    assert et.parse_when("2025-11-19T10:00:00Z") == datetime(2025, 11, 19, 10)
+
+    print("✓ Scraped time strings and date questions parse to UTC windows")
+
+
+def test_writes_and_backfill():
+    et.install_event_time_hooks()
+    et.install_event_time_hooks()
+    row = event_row({"title": "Demo", "organizer": "Slush", "datetime": "Nov 19, 3:00 PM – 5:00 PM"})
+    assert (row["starts_at"], row["ends_at"]) == (datetime(2025, 11, 19, 13), datetime(2025, 11, 19, 15))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, db = _session(tmp)
+        event = _event("Side event", "Nov 19, 3:00 PM – 5:00 PM")
+        db.add(event)
+        db.commit()
+        assert event.starts_at == datetime(2025, 11, 19, 13)
+        event.datetime = "Nov 20, 9:00 AM – 10:00 AM"
+        db.commit()
+        assert event.starts_at == datetime(2025, 11, 20, 7)
+        db.close()
+        engine.dispose()
+
+        # A database from before the columns existed
+        legacy = create_engine(f"sqlite:///{tmp}/legacy.db")
+        with legacy.begin() as conn:
+            conn.execute(text("CREATE TABLE slush_events (id INTEGER PRIMARY KEY, title VARCHAR, organizer VARCHAR, "
+                              "datetime VARCHAR, location VARCHAR, categories JSON, status JSON, "
+                              "scraped_at DATETIME, created_at DATETIME, updated_at DATETIME)"))
+            conn.execute(text("INSERT INTO slush_events (title, organizer, datetime, scraped_at) VALUES "
+                              "('A', 'Org', 'Nov 19, 3:00 PM – 5:00 PM', '2025-11-17'), "
+                              "('B', 'Org', 'Nov 20, 10:00 AM – 11:00 AM', '2025-11-17'), "
+                              "('C', 'Org', 'Date TBA', '2025-11-17')"))
+        models.Base.metadata.create_all(bind=legacy)
+        db = sessionmaker(bind=legacy)()
+        assert et.ensure_event_times(db) == {"slush_events": 2}
+        assert et.ensure_event_times(db) == {}
+        assert [e.title for e in et.events_at(db, datetime(2025, 11, 19, 14))] == ["A"]
+        indexes = db.execute(text("PRAGMA index_list(slush_events)")).fetchall()
+        assert any(index[1] == "ix_slush_events_starts_at" for index in indexes)
+        db.close()
+        legacy.dispose()
+
+    print("✓ Writes and imports fill starts_at; old databases are migrated and backfilled")
+
+
+def test_interval_queries():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, db = _session(tmp)
+        db.add_all([
+            _event("Breakfast", "Nov 19, 8:00 AM – 10:00 AM"),
+            _event("Workshop", "Nov 19, 1:00 PM – 4:00 PM"),
+            _event("Pitching", "Nov 19, 3:00 PM – 3:45 PM"),
+            _event("Afterparty", "Nov 19, 10:00 PM – 3:00 AM"),
+            _event("Demo Day", "Nov 20, 10:00 AM – 12:00 PM"),
+            _event("Mystery", "Time TBA"),
+        ])
+        db.add(models.CalendarEvent(id="c1", title="Meeting", type="meeting",
+                                    start_time=datetime(2025, 11, 19, 9), end_time=datetime(2025, 11, 19, 10)))
+        db.add_all([models.CalendarEventAttendee(event_id="c1", attendee=name) for name in ("ana", "ben, jr")])
+        db.commit()
+
+        at_3pm = et.parse_date_query("Nov 19 3pm")[0]
+        assert [e.title for e in et.events_at(db, at_3pm)] == ["Workshop", "Pitching"]
+        assert [e.title for e in et.events_at(db, et.parse_date_query("Nov 20 1am")[0])] == ["Afterparty"]
+        assert [e.title for e in et.next_events(db, NOW, n=2)] == ["Pitching", "Afterparty"]
+        days = et.events_by_day(db, et.parse_when("2025-11-19"), et.parse_when("2025-11-20", end_of_day=True))
+        assert {day: len(events) for day, events in days.items()} == {date(2025, 11, 19): 4, date(2025, 11, 20): 1}
+        assert [e.title for e in et.search_events_by_date(db, "Nov 20", now=NOW)] == ["Afterparty", "Demo Day"]
+        assert [e.title for e in et.search_events_by_date(db, "tba")] == ["Mystery"]  # substring fallback
+
+        query = et.overlapping(db.query(models.SlushEvent), models.SlushEvent, at_3pm, at_3pm)
+        sql = str(query.statement.compile(engine, compile_kwargs={"literal_binds": True}))
+        plan = " ".join(str(row) for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        assert "ix_slush_events_starts_at" in plan, plan
+
+        events = db_queries.get_events_by_date_range(db, "2025-11-19", "2025-11-19")
+        assert [(e["id"], e["attendees"]) for e in events] == [("c1", ["ana", "ben, jr"])]
+        assert db_queries.get_events_by_date_range(db, "2025-11-20", "2025-11-21") == []
+        db.close()
+        engine.dispose()
+
+    print("✓ Overlap, at, next-N and per-day queries scan the starts_at index")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EVENT TIMES TEST")
+    print("=" * 60)
+    test_parsing()
+    test_writes_and_backfill()
+    test_interval_queries()
+    print("\n✅ All event time tests passed")
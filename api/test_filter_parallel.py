@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test the parallel modes of filter_axa_startups_enhanced.filter_startups_enhanced
+
+- Process-pool local scoring gives the same scores, in the same order, as
+  scoring in-process
+- Async LLM validation runs requests concurrently, never above the shared
+  rate limit, and feeds the verdicts into the score
+- Every phase reports its time
+- MCP enrichment (phase 0) fills mcp_enriched and verified funding from the
+  startups table through the shared tool registry
+"""
+
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import database
+import models
+import filter_axa_startups_enhanced as axa
+from filter_cache import RateLimiter
+from mcp_client import get_startup_tools
+from models_startup import Startup
+
+DESCRIPTIONS = [
+    "Agent orchestration and LLM monitoring platform for enterprises",
+    "Claims automation and underwriting AI for insurers",
+    "Digital health platform for employee wellness and chronic disease",
+    "AI coding assistant and test automation for legacy modernization",
+    "Conversational AI for customer service automation",
+    "A mobile game for teenagers",
+    "Bakery chain",
+]
+
+
+def _catalogue(n):
+    rng = random.Random(7)
+    return [{
+        "company_name": f"Startup {i}",
+        "company_description": rng.choice(DESCRIPTIONS),
+        "shortDescription": "",
+        "topics": [],
+        "totalFunding": str(rng.choice(["", "2", "15", "120", "600"])),
+        "employees": rng.choice(["1-10", "11-50", "51-200", "201-500", "1000+"]),
+        "maturity": rng.choice(["Scaleup", "Startup", "Emerging"]),
+    } for i in range(n)]
+
+
+def test_process_pool_matches_serial():
+    startups = _catalogue(600)
+    serial = axa.score_startups_local(startups, workers=1)
+    pooled = axa.score_startups_local(startups, workers=2, chunk_size=100)
+    assert pooled == serial and len(pooled) == len(startups)
+
+    timings = {}
+    filtered, excluded = axa.filter_startups_enhanced(startups, min_score=20, workers=2, chunk_size=100,
+                                                      timings=timings)
+    assert filtered and excluded["excluded_keywords"] > 0
+    assert set(timings) == {"local_scoring", "total"}
+    assert all(s["axa_scoring"]["total_score"] >= 20 for s in filtered)
+
+    print(f"✓ Chunked process-pool scoring matches serial scoring "
+          f"({timings['local_scoring'] * 1000:.0f}ms for {len(startups)})")
+
+
+class _Message:
+    def __init__(self, content):
+        self.content = content
+        self.reasoning_content = None
+
+
+class _Response:
+    def __init__(self, content):
+        self.choices = [type("Choice", (), {"message": _Message(content)})()]
+
+
+def test_async_validation_is_concurrent_and_rate_limited():
+    calls = {"active": 0, "peak": 0, "count": 0}
+
+    async def fake_completion(messages, model=None, **kwargs):
+        calls["count"] += 1
+        calls["active"] += 1
+        calls["peak"] = max(calls["peak"], calls["active"])
+        await asyncio.sleep(0.02)
+        calls["active"] -= 1
+        if "Agentic Platform Enablers" in messages[0]["content"]:
+            return _Response('{"matches": true, "confidence": 95}')
+        return _Response("DECISION: VIABLE\nCONFIDENCE: 90\nREASON: B2B platform")
+
+    patched = {"HAS_LLM": True, "llm_completion": fake_completion,
+               "is_nvidia_nim_configured": lambda: False, "get_nvidia_nim_model": lambda: None}
+    saved = {name: getattr(axa, name, None) for name in patched}
+    for name, value in patched.items():
+        setattr(axa, name, value)
+    try:
+        candidates = []
+        for startup in _catalogue(40):
+            startup["axa_scoring"] = axa.calculate_axa_score_enhanced(startup)
+            if startup["axa_scoring"]["matched_rules"]:
+                candidates.append(startup)
+
+        started = time.perf_counter()
+        validated = axa.batch_llm_validation(candidates, max_parallel=8, requests_per_minute=6000)
+        elapsed = time.perf_counter() - started
+        assert len(validated) == len(candidates)
+        assert calls["peak"] > 1, "requests must overlap"
+        assert calls["peak"] <= 8
+        assert elapsed < calls["count"] * 0.02, "concurrent, not serial"
+        rule_1 = [s for s in validated if "Rule 1: Platform Enablers" in s["axa_scoring"]["rule_scores"]]
+        assert rule_1 and all(s["axa_scoring"]["rule_scores"]["Rule 1: Platform Enablers"]["confidence"] == 95
+                              for s in rule_1)
+        assert all(s["axa_scoring"]["breakdown"]["llm_adjustment"] == 15 for s in validated)
+    finally:
+        for name, value in saved.items():
+            setattr(axa, name, value)
+
+    limiter = RateLimiter(calls=5, period=0.5)
+
+    async def take(n):
+        for _ in range(n):
+            await axa._rate_limited(limiter)
+
+    started = time.perf_counter()
+    asyncio.run(take(10))
+    assert time.perf_counter() - started >= 0.4, "the 6th-10th requests wait for refills"
+
+    print(f"✓ {calls['count']} LLM requests ran {calls['peak']}-wide under one shared rate limiter")
+
+
+def test_mcp_enrichment_fills_fields():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/startups.db")
+        models.Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine)
+        db = factory()
+        db.add(Startup(company_name="Claimsly", total_funding=12.5, employees="42", website="https://claimsly.ai",
+                       enrichment={"tech_stack": ["Python"], "team_members": [{"name": "Ada"}]}))
+        db.commit()
+        db.close()
+
+        # The MCP tools open sessions from database.SessionLocal; point it at the temp database
+        saved = database.SessionLocal
+        database.SessionLocal = factory
+        try:
+            assert axa.init_mcp_tools() and axa.MCP_TOOLS is get_startup_tools()
+            enriched, missing = asyncio.run(axa.enrich_startups_with_mcp([
+                {"company_name": "claimsly", "totalFunding": ""},
+                {"company_name": "Unknown Co", "totalFunding": "3"},
+            ]))
+        finally:
+            database.SessionLocal = saved
+            axa.MCP_TOOLS = None
+            engine.dispose()
+
+    assert enriched["mcp_enriched"]["tech_stack"] == ["Python"]
+    assert enriched["totalFunding"] == 12.5 and enriched["funding_verified"]
+    assert enriched["employee_count_verified"] == 42 and enriched["website"] == "https://claimsly.ai"
+    assert "mcp_enriched" not in missing and missing["totalFunding"] == "3"
+    print("✓ MCP enrichment fills enrichment data, funding and employees from the database")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PARALLEL FILTER TEST")
+    print("=" * 60)
+    test_process_pool_matches_serial()
+    test_async_validation_is_concurrent_and_rate_limited()
+    test_mcp_enrichment_fills_fields()
+    print("\n✅ All parallel filter tests passed")
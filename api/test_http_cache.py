@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test the HTTP caching / compression middleware stack
+
+- Configured routes get a weak ETag (shared by gzip and identity bodies)
+  and their Cache-Control; a matching If-None-Match is answered with 304
+  before the handler runs
+- ORM commits, data_version bumps and bulk upserts that rewrite startups
+  in place change the ETag
+- Large bodies are gzip-compressed; personalised routes are never stored
+"""
+
+import sys
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import Depends, FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import models
+import models_startup  # noqa: F401 - registers the startups table
+from bulk_importer import startup_spec, upsert_rows
+from http_cache import COMPRESS_MIN_BYTES, DataVersions, HTTPCacheMiddleware
+
+
+class _Client:
+    """Sync wrapper over httpx's ASGI transport (the app runs in-process)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def get(self, url, headers=None):
+        async def request():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(url, headers=headers)
+        return asyncio.run(request())
+
+
+def _app(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/cache.db", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    versions = DataVersions(engine, ttl=60)
+    versions.install_hooks()
+
+    app = FastAPI()
+    app.add_middleware(HTTPCacheMiddleware, versions=versions)
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+    calls = {"events": 0}
+
+    def get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/api/slush-events")
+    def events(limit: int = 100, db: Session = Depends(get_db)):
+        calls["events"] += 1
+        return [{"id": e.id, "title": e.title} for e in db.query(models.SlushEvent).limit(limit)]
+
+    @app.get("/startups/phase1")
+    def phase1(user_id: str):
+        return {"startups": [{"name": f"s{i}", "pad": "x" * 40} for i in range(100)]}
+
+    @app.get("/uncached")
+    def uncached():
+        return {"ok": True}
+
+    return engine, factory, versions, _Client(app), calls
+
+
+def test_etag_304_and_invalidation():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory, versions, client, calls = _app(tmp)
+        db = factory()
+        db.add_all([models.SlushEvent(title=f"Side event {i}", organizer="Org", datetime="Nov 20, 18:00",
+                                       scraped_at=datetime.utcnow()) for i in range(80)])
+        db.commit()
+
+        first = client.get("/api/slush-events")
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and len(first.json()) == 80
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"].startswith("public, max-age=60")
+        assert "Accept-Encoding" in first.headers["vary"]
+        assert first.headers.get("content-encoding") == "gzip"
+
+        again = client.get("/api/slush-events", headers={"If-None-Match": etag})
+        assert again.status_code == 304 and again.content == b""
+        assert again.headers["etag"] == etag
+        assert calls["events"] == 1, "304 must not run the handler"
+        identity = client.get("/api/slush-events", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in identity.headers and identity.headers["etag"] == etag
+        assert client.get("/api/slush-events", headers={"If-None-Match": etag[2:]}).status_code == 304
+
+        other_query = client.get("/api/slush-events?limit=5", headers={"If-None-Match": etag})
+        assert other_query.status_code == 200 and other_query.headers["etag"] != etag
+
+        event = db.query(models.SlushEvent).first()
+        event.title = "Renamed"
+        db.commit()
+        changed = client.get("/api/slush-events", headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.json()[0]["title"] == "Renamed"
+        new_etag = changed.headers["etag"]
+        assert new_etag != etag
+
+        db.add(models.DataVersion(version="2025-11-20"))
+        db.commit()
+        assert client.get("/api/slush-events", headers={"If-None-Match": new_etag}).status_code == 200
+        db.close()
+        engine.dispose()
+
+    print("✓ Weak ETags answer 304 without the handler and change with the data")
+
+
+def test_upsert_in_place_changes_etag():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, _factory, versions, client, _calls = _app(tmp)
+        spec = startup_spec()
+        rows = [{"company_name": f"Startup {i}", "website": "https://old.example"} for i in range(5)]
+        with engine.begin() as conn:
+            upsert_rows(conn, spec, rows)
+        before = versions.etag("/startups/all", "", ("startups",))
+        versions.ttl = 0  # Another worker: nothing but the database to go on
+
+        with engine.begin() as conn:
+            stats = upsert_rows(conn, spec, [{**row, "website": "https://new.example"} for row in rows])
+        assert stats.updated == 5 and stats.inserted == 0
+        assert versions.etag("/startups/all", "", ("startups",)) != before, "same count and max id"
+        engine.dispose()
+
+    print("✓ Bulk upserts that rewrite rows in place change the ETag")
+
+
+def test_compression_and_private_routes():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, _factory, _versions, client, _calls = _app(tmp)
+
+        phase = client.get("/startups/phase1?user_id=1")
+        assert phase.headers["cache-control"] == "private, no-store"
+        assert "etag" not in phase.headers
+        assert phase.headers.get("content-encoding") == "gzip"
+        assert int(phase.headers["content-length"]) < len(phase.content) / 3
+
+        plain = client.get("/uncached")
+        assert "cache-control" not in plain.headers and "content-encoding" not in plain.headers
+        engine.dispose()
+
+    print("✓ Bodies above the threshold are gzipped; personalised routes are never stored")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("HTTP CACHE TEST")
+    print("=" * 60)
+    test_etag_304_and_invalidation()
+    test_upsert_in_place_changes_etag()
+    test_compression_and_private_routes()
+    print("\n✅ All HTTP cache tests passed")
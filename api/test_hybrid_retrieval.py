@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test hybrid BM25 + vector retrieval and the token-budgeted context packer
+
+- Reciprocal-rank fusion ordering
+- BM25 finds exact company names that embeddings don't weigh
+- HybridRetriever over a SQLite startups table (offline hashing embeddings);
+  unrelated queries return nothing once weak vector hits are cut
+- pack_startup_context never exceeds its budget and keeps rank order
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ["EMBEDDING_PROVIDER"] = "hashing"
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import embedding_index
+import hybrid_retrieval
+from hybrid_retrieval import (
+    BM25Index, HybridRetriever, bm25_document, estimate_tokens,
+    pack_startup_context, reciprocal_rank_fusion,
+)
+
+STARTUPS = [
+    (1, "Claimsly", "AI claims automation for insurers", "Claims triage engine"),
+    (2, "FraudGuard", "Fraud detection for insurance claims", "Claims fraud scoring"),
+    (3, "CarbonBook", "Carbon accounting for factories", "Emissions dashboard"),
+    (4, "Dashly", "Grocery delivery in 10 minutes", "Dark stores"),
+    (5, "RiskWise", "Underwriting risk models for insurers", "Risk scoring API"),
+]
+
+
+def _row(id_, name, vp, core):
+    return {"id": id_, "company_name": name, "value_proposition": vp, "core_product": core}
+
+
+def test_reciprocal_rank_fusion():
+    lexical = [("a", 9.0), ("b", 5.0), ("c", 1.0)]
+    vector = [("b", 0.9), ("d", 0.8), ("a", 0.1)]
+    fused = reciprocal_rank_fusion([lexical, vector], k=60)
+    # "b" is near the top of both lists and beats "a" (1st + 3rd)
+    assert [id_ for id_, _ in fused] == ["b", "a", "d", "c"], fused
+    weighted = reciprocal_rank_fusion([lexical, vector], k=60, weights=[3.0, 1.0])
+    assert weighted[0][0] == "a"
+    print("✓ Reciprocal-rank fusion")
+
+
+def test_bm25_ranking():
+    index = BM25Index().build((r[0], bm25_document(_row(*r))) for r in STARTUPS)
+    assert len(index) == 5
+    assert index.search("FraudGuard", k=1)[0][0] == "2"
+    top = [id_ for id_, _ in index.search("insurance claims", k=2)]
+    assert set(top) == {"1", "2"}, top
+    assert index.search("blockchain", k=5) == []
+    print("✓ BM25 ranking")
+
+
+def test_pack_respects_budget():
+    startups = [
+        {**_row(*r), "company_description": "x " * 400, "total_funding": 12.5, "website": f"https://{r[1]}.com"}
+        for r in STARTUPS
+    ]
+    for budget in (40, 120, 400, 5000):
+        packed = pack_startup_context(startups, token_budget=budget)
+        assert packed.tokens <= budget, (budget, packed.tokens)
+        assert estimate_tokens(packed.text) <= budget
+        names = packed.included + packed.abbreviated
+        assert sorted(names + packed.dropped) == sorted(r[1] for r in STARTUPS)
+        # Whatever made it in is a prefix of the ranking
+        assert [n for n in (r[1] for r in STARTUPS) if n in names] == [r[1] for r in STARTUPS][:len(names)]
+    assert len(pack_startup_context(startups, token_budget=5000).included) == 5
+    small = pack_startup_context(startups, token_budget=120)
+    assert small.abbreviated and small.dropped
+    print("✓ Context packing stays within budget")
+
+
+def test_hybrid_retriever_on_sqlite():
+    import models
+    import models_startup  # noqa: F401 - registers the startups table
+
+    with tempfile.TemporaryDirectory() as tmp:
+        embedding_index.INDEX_DIR = Path(tmp)
+        embedding_index.reset_indexes()
+        hybrid_retrieval.reset_bm25_index()
+        engine = create_engine(f"sqlite:///{tmp}/startups.db")
+        models.Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            for id_, name, vp, core in STARTUPS:
+                conn.execute(text(
+                    "INSERT INTO startups (id, company_name, value_proposition, core_product) "
+                    "VALUES (:id, :name, :vp, :core)"
+                ), {"id": id_, "name": name, "vp": vp, "core": core})
+
+        db = sessionmaker(bind=engine)()
+        try:
+            embedding_index.refresh_indexes(db)
+            hybrid_retrieval.refresh_bm25_index(db)
+            results = HybridRetriever(db).search("RiskWise underwriting", limit=3)
+            assert results[0]["company_name"] == "RiskWise"
+            assert results[0]["bm25_rank"] == 1 and "vector_rank" in results[0]
+            scores = [r["retrieval_score"] for r in results]
+            assert scores == sorted(scores, reverse=True)
+
+            claims = [r["id"] for r in HybridRetriever(db).search("insurance claims automation", limit=2)]
+            assert set(claims) == {1, 2}, claims
+
+            # Nothing relevant: neither BM25 nor the cosine floor lets a startup through
+            assert HybridRetriever(db).search("medieval tapestry restoration", limit=3) == []
+            unfiltered = HybridRetriever(db, min_vector_score=-1.0).search("medieval tapestry restoration", limit=3)
+            assert len(unfiltered) == 3, "nearest neighbours always exist without the floor"
+
+            # A stale index is served as-is while the rebuild runs on its own thread
+            stale = hybrid_retrieval.get_bm25_index(db)
+            stale.refreshed_at = 0
+            assert hybrid_retrieval.get_bm25_index(db) is stale
+            thread = hybrid_retrieval._bm25_refreshing
+            if thread is not None:
+                thread.join()
+            fresh = hybrid_retrieval.get_bm25_index(db)
+            assert fresh is not stale and len(fresh) == len(STARTUPS)
+        finally:
+            db.close()
+            embedding_index.reset_indexes()
+            hybrid_retrieval.reset_bm25_index()
+    print("✓ Hybrid retrieval over SQLite")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("HYBRID RETRIEVAL TEST")
+    print("=" * 60)
+    test_reciprocal_rank_fusion()
+    test_bm25_ranking()
+    test_pack_respects_budget()
+    test_hybrid_retriever_on_sqlite()
+    print("\n✅ All hybrid retrieval tests passed")
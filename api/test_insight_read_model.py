@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test the materialized insight read model
+
+- Cards follow inserts, edits, category moves and deletes (flush hook)
+- Cursor pagination walks a category newest-first without gaps or repeats
+- Versions (ETags) change only for the categories that changed
+- ensure_read_model() backfills rows written before the hook existed
+- Databases whose meeting_insights predates the note columns are upgraded
+"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import models
+import insight_read_model as rm
+from testing_db import temp_engine
+
+
+def _session(tmp):
+    return sessionmaker(bind=temp_engine(tmp, "insights.db"))()
+
+
+def _insight(n, category):
+    return models.CategorizedInsight(
+        meeting_id=f"m{n}", startup_id="1", startup_name=f"Startup {n}", user_id="u@axa.com",
+        category=category, title=f"Insight {n}", insight="text", tags=["ai"],
+        created_at=datetime(2025, 11, 20) + timedelta(minutes=n),
+    )
+
+
+def test_cards_follow_writes_and_paginate():
+    rm.install_read_model_hooks()
+    with tempfile.TemporaryDirectory() as tmp:
+        db = _session(tmp)
+        try:
+            db.add_all([_insight(n, "2" if n % 3 else "5") for n in range(30)])
+            db.commit()
+            versions = rm.feed_versions(db, "categorized")
+            assert versions["2"][1] == 20 and versions["5"][1] == 10
+
+            # Walk category 2 in pages of 7
+            seen, cursor = [], None
+            while True:
+                cards, cursor = rm.read_page(db, "categorized", "2", limit=7, cursor=cursor)
+                seen += [c["title"] for c in cards]
+                if not cursor:
+                    break
+            expected = [f"Insight {n}" for n in reversed(range(30)) if n % 3]
+            assert seen == expected, seen
+
+            # /insights/categorized/all serves complete sections, same order as the pages
+            sections = rm.read_sections(db, "categorized")
+            assert set(sections) == set(rm.CATEGORIES)
+            assert [c["title"] for c in sections["2"]] == expected and len(sections["5"]) == 10
+            assert sections["1"] == []
+
+            # Edit: card re-rendered, only category 2's version moves
+            insight = db.query(models.CategorizedInsight).filter_by(title="Insight 29").first()
+            insight.title = "Edited"
+            insight.is_edited = True
+            db.commit()
+            after_edit = rm.feed_versions(db, "categorized")
+            assert after_edit["2"][0] > versions["2"][0] and after_edit["5"] == versions["5"]
+            assert rm.read_page(db, "categorized", "2", limit=1)[0][0]["title"] == "Edited"
+
+            # Move to 5, then delete
+            insight.category = "5"
+            db.commit()
+            moved = rm.feed_versions(db, "categorized")
+            assert (moved["2"][1], moved["5"][1]) == (19, 11)
+            assert rm.read_page(db, "categorized", "5", limit=1)[0][0]["category"] == "5"
+            db.delete(insight)
+            db.commit()
+            assert rm.feed_versions(db, "categorized")["5"][1] == 10
+            assert db.query(models.InsightCard).count() == 29
+        finally:
+            db.close()
+    print("✓ Cards follow insert / edit / move / delete, cursor pages are exact")
+
+
+def test_etag_and_backfill():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = _session(tmp)
+        try:
+            rm.install_read_model_hooks()
+            db.add(_insight(1, "1"))
+            db.add(models.MeetingInsight(meetingId="m1", userId="u", startupId="1", startupName="Claimsly",
+                                         insight="Great team", tags=["pilot"], rating=4))
+            db.commit()
+            # Simulate rows written by a script that bypassed the hook
+            db.query(models.InsightCard).delete()
+            db.query(models.InsightFeedVersion).delete()
+            db.commit()
+            assert rm.ensure_read_model(db) == {"categorized": 1, "meeting": 1}
+            assert rm.ensure_read_model(db) == {}
+
+            meeting_cards, _ = rm.read_page(db, "meeting", "10")
+            assert meeting_cards[0]["title"] == "Meeting with Claimsly" and meeting_cards[0]["rating"] == 4
+
+            etag = rm.make_etag("categorized", sorted(rm.feed_versions(db, "categorized").items()), 50)
+            assert etag == rm.make_etag("categorized", sorted(rm.feed_versions(db, "categorized").items()), 50)
+            db.add(_insight(2, "3"))
+            db.commit()
+            assert etag != rm.make_etag("categorized", sorted(rm.feed_versions(db, "categorized").items()), 50)
+
+            try:
+                rm.read_page(db, "categorized", "1", cursor="not-a-cursor")
+                raise AssertionError("bad cursor accepted")
+            except ValueError:
+                pass
+        finally:
+            db.close()
+    print("✓ ETags track versions, backfill repairs missing cards")
+
+
+def test_old_meeting_insights_table_upgraded():
+    rm.install_read_model_hooks()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/insights.db")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE meeting_insights (id INTEGER PRIMARY KEY, meetingId VARCHAR NOT NULL, "
+                "userId VARCHAR NOT NULL, startupId VARCHAR, startupName VARCHAR)"
+            ))
+            conn.execute(text("INSERT INTO meeting_insights (meetingId, userId, startupName) "
+                              "VALUES ('m1', 'u', 'Claimsly')"))
+        models.Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            assert rm.ensure_read_model(db) == {"meeting": 1}
+            assert rm.ensure_meeting_insight_columns(db) == []
+            meeting_cards, _ = rm.read_page(db, "meeting", "10")
+            assert meeting_cards[0]["title"] == "Meeting with Claimsly"
+            row = db.query(models.MeetingInsight).one()
+            row.insight, row.rating = "Strong pilot fit", 5
+            db.commit()
+            assert rm.read_page(db, "meeting", "10")[0][0]["rating"] == 5
+        finally:
+            db.close()
+            engine.dispose()
+    print("✓ Old meeting_insights tables get the note columns before the backfill")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("INSIGHT READ MODEL TEST")
+    print("=" * 60)
+    test_cards_follow_writes_and_paginate()
+    test_etag_and_backfill()
+    test_old_meeting_insights_table_upgraded()
+    print("\n✅ All insight read model tests passed")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite-backed background job queue and debrief insight jobs
+
+- Jobs run on a bounded worker pool and survive in the table
+- Failures retry with backoff, then end as failed
+- Dedupe keys collapse repeat enqueues; stale running jobs are re-queued
+- debrief_insights replaces a session's insights idempotently
+"""
+
+import sys
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+import job_queue as jq
+from job_queue import JobQueue, get_job, requeue_stale_jobs
+from debrief_jobs import DEBRIEF_INSIGHTS_JOB, register_debrief_jobs
+
+
+def _session_factory(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/jobs.db", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_bounded_concurrency_and_retries():
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = _session_factory(tmp)
+        queue = JobQueue(factory, workers=3, poll_interval=0.05)
+        active, peak, calls = [0], [0], {}
+
+        @queue.handler("slow")
+        async def slow(payload):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.05)
+            active[0] -= 1
+            return {"n": payload["n"] * 2}
+
+        @queue.handler("flaky")
+        async def flaky(payload):
+            calls[payload["key"]] = calls.get(payload["key"], 0) + 1
+            if calls[payload["key"]] < payload["succeed_on"]:
+                raise RuntimeError("upstream 503")
+            return {"ok": True}
+
+        async def run():
+            original_retry = jq.RETRY_BASE_SECONDS
+            jq.RETRY_BASE_SECONDS = 0.01
+            db = factory()
+            try:
+                slow_ids = [queue.enqueue(db, "slow", {"n": i}).id for i in range(9)]
+                retry_id = queue.enqueue(db, "flaky", {"key": "a", "succeed_on": 2}).id
+                dead_id = queue.enqueue(db, "flaky", {"key": "b", "succeed_on": 9}, max_attempts=2).id
+                queue.start()
+                for _ in range(200):
+                    db.expire_all()
+                    jobs = [get_job(db, i) for i in slow_ids + [retry_id, dead_id]]
+                    if all(j.status in ("succeeded", "failed") for j in jobs):
+                        break
+                    await asyncio.sleep(0.02)
+                await queue.stop()
+                db.expire_all()
+                return [get_job(db, i) for i in slow_ids], get_job(db, retry_id), get_job(db, dead_id)
+            finally:
+                db.close()
+                jq.RETRY_BASE_SECONDS = original_retry
+
+        slow_jobs, retried, dead = asyncio.run(run())
+
+    assert all(j.status == "succeeded" for j in slow_jobs)
+    assert sorted(j.result["n"] for j in slow_jobs) == [i * 2 for i in range(9)]
+    assert peak[0] == 3, peak
+    assert retried.status == "succeeded" and retried.attempts == 2
+    assert dead.status == "failed" and dead.attempts == 2 and "upstream 503" in dead.error
+    print(f"✓ 9 jobs on 3 workers (peak {peak[0]}), retry then success, retry then failed")
+
+
+def test_dedupe_and_stale_recovery():
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = _session_factory(tmp)
+        queue = JobQueue(factory, workers=1)
+        queue.handler("noop")(lambda payload: None)
+        db = factory()
+        try:
+            first = queue.enqueue(db, "noop", {}, dedupe_key="debrief:s1")
+            assert queue.enqueue(db, "noop", {}, dedupe_key="debrief:s1").id == first.id
+            assert queue.enqueue(db, "noop", {}, dedupe_key="debrief:s2").id != first.id
+
+            job = jq.claim_next_job(db, "dead-worker")
+            assert job.id == first.id and job.status == "running"
+            assert requeue_stale_jobs(db) == 0
+            job.locked_at = datetime.utcnow() - timedelta(hours=1)
+            db.commit()
+            assert requeue_stale_jobs(db) == 1
+            db.expire_all()
+            assert get_job(db, first.id).status == "queued"
+        finally:
+            db.close()
+    print("✓ Dedupe keys and stale-lease recovery")
+
+
+def test_debrief_insights_job_is_idempotent():
+    extracted = [
+        {"section": "5", "title": "Claims cost", "insight": "Cuts claims handling cost 40%.", "confidence_score": 0.9},
+        {"section": "10", "title": "Pilot", "insight": "Pilot with AXA Germany in Q1.", "tags": ["pilot"]},
+        "not-a-dict",
+    ]
+    calls = []
+
+    async def fake_extractor(startup_name, conversation_history, meeting_prep_outline):
+        calls.append((startup_name, len(conversation_history), meeting_prep_outline))
+        return {"success": True, "insights": extracted}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        factory = _session_factory(tmp)
+        queue = JobQueue(factory, workers=1)
+        register_debrief_jobs(queue, extractor=fake_extractor)
+        db = factory()
+        try:
+            db.add(models.DebriefSession(
+                session_id="s1", startup_id="42", startup_name="Claimsly", user_id="ana.lopez@axa.com",
+                conversation_history=[{"role": "user", "content": "Great demo"}], status="completed"
+            ))
+            db.commit()
+
+            async def run_twice():
+                for _ in range(2):
+                    queue.enqueue(db, DEBRIEF_INSIGHTS_JOB, {"session_id": "s1", "meeting_prep_outline": "prep"})
+                    assert await queue.run_once() == "succeeded"
+
+            asyncio.run(run_twice())
+            rows = db.query(models.CategorizedInsight).filter_by(meeting_id="s1").all()
+            assert len(rows) == 2 and {r.category for r in rows} == {"5", "10"}
+            assert rows[0].user_name == "ana.lopez"
+            assert calls == [("Claimsly", 1, "prep")] * 2
+
+            job = queue.enqueue(db, DEBRIEF_INSIGHTS_JOB, {"session_id": "missing"})
+            assert asyncio.run(queue.run_once()) == "queued"  # Will retry with backoff
+            db.expire_all()
+            assert "not found" in get_job(db, job.id).error
+        finally:
+            db.close()
+    print("✓ debrief_insights job replaces insights idempotently")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("JOB QUEUE TEST")
+    print("=" * 60)
+    test_bounded_concurrency_and_retries()
+    test_dedupe_and_stale_recovery()
+    test_debrief_insights_job_is_idempotent()
+    print("\n✅ All job queue tests passed")
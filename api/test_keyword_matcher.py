@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test the compiled keyword matcher shared by the rule-based filters
+
+- Whole-word, case-insensitive hits with optional plurals; overlapping
+  keywords are all reported, in the order they were given
+- One scan agrees with a per-keyword whole-word search on the real rule sets
+- The AXA rules and the prioritizer categorize through it
+"""
+
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from keyword_matcher import KeywordGroups, KeywordMatcher, compile_keywords
+import filter_axa_startups_enhanced as axa
+from startup_prioritization import StartupPrioritizer
+
+
+def _brute_force(keywords, text):
+    return {k for k in keywords if re.search(r"(?<!\w)" + re.escape(k) + r"(?:e?s)?(?!\w)", text.lower())}
+
+
+def test_matcher_semantics():
+    matcher = KeywordMatcher(["Insurance", "claim", "claims", "agent", "agent orchestration",
+                              "orchestration", "api", "ai", "ci/cd", "e-commerce platform"])
+    text = ("Agent orchestration for INSURANCE claims and CI/CD pipelines; "
+            "raised capital by email, e-commerce platforms")
+    assert matcher.findall(text) == ["insurance", "claim", "claims", "agent", "agent orchestration",
+                                     "orchestration", "ci/cd", "e-commerce platform"]
+    assert matcher.count("agents and apis") == 2
+    assert matcher.first("orchestration of an agent") == "agent"
+    assert matcher.search("capital") is False and matcher.findall("") == []
+    assert KeywordMatcher([]).findall("anything") == []
+    assert compile_keywords(["a", "b"]) is compile_keywords(["a", "b"])
+
+    groups = KeywordGroups({"primary": ["claims automation"], "secondary": ["claims", "automation", "crm"]})
+    assert groups.match("Claims automation for carriers") == {
+        "primary": ["claims automation"], "secondary": ["claims", "automation"]
+    }
+
+    print("✓ Whole-word hits with plurals; overlapping keywords all reported in order")
+
+
+def test_single_scan_matches_brute_force():
+    groups = {f"{n}.{tier}": rule[tier]
+              for n, rule in enumerate([axa.RULE_1_KEYWORDS, axa.RULE_2_KEYWORDS, axa.RULE_3_KEYWORDS,
+                                        axa.RULE_4_KEYWORDS, axa.RULE_5_KEYWORDS], 1)
+              for tier in ("primary", "secondary")}
+    matcher = KeywordGroups(groups).matcher
+    words = " ".join(matcher.keywords).split() + ["capital", "emails", "the", "rapid", "codes", "agents"]
+    rng = random.Random(42)
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 120))) for _ in range(500)]
+    for text in texts:
+        assert matcher.hits(text) == _brute_force(matcher.keywords, text), text
+
+    catalogue = [{"company_description": text, "shortDescription": "", "topics": []} for text in texts] * 4
+    started = time.perf_counter()
+    for startup in catalogue:
+        for rule in (axa.matches_rule_1, axa.matches_rule_2, axa.matches_rule_3,
+                     axa.matches_rule_4, axa.matches_rule_5):
+            rule(startup)
+        axa.should_exclude(startup)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(f"✓ One scan agrees with per-keyword search; {len(catalogue)} startups x 5 rules in {elapsed:.0f}ms")
+
+
+def test_filters_use_whole_words():
+    insurer = {"company_description": "Claims automation and underwriting for insurers",
+               "shortDescription": "", "topics": ["Insurtech"]}
+    matches, confidence, keywords = axa.matches_rule_3(insurer)
+    assert matches and keywords == ["insurtech", "claims", "underwriting", "claims automation"]
+    assert axa.matches_rule_2(insurer) == (False, 0, [])
+
+    rapid = {"company_description": "Rapid capital for restaurants", "shortDescription": "", "topics": []}
+    assert axa.matches_rule_1(rapid)[1] == 0, "'rag' / 'api' must not match inside words"
+    assert axa.should_exclude({"company_description": "A dating app", "shortDescription": "", "topics": []})
+
+    prioritizer = StartupPrioritizer()
+    assert prioritizer.categorize_startup({"description": "Email marketing in HTML"}) == ["general"]
+    assert prioritizer.categorize_startup({"description": "AI agents for claims processing"}) == [
+        "agentic_platform_enabler", "agentic_claims"
+    ]
+    assert prioritizer.categorize_startup({"description": "A mobile game studio"}) == ["excluded_consumer"]
+
+    print("✓ AXA rules and the prioritizer match whole words only")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("KEYWORD MATCHER TEST")
+    print("=" * 60)
+    test_matcher_semantics()
+    test_single_scan_matches_brute_force()
+    test_filters_use_whole_words()
+    print("\n✅ All keyword matcher tests passed")
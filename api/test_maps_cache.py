@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test the cached Google Maps layer
+
+- Directions / places are fetched once per normalized request and mode;
+  expired entries are refetched, errors are never cached
+- The maps_cache table carries cached routes across client instances
+- Identical requests in flight share one fetch
+- precompute_routes() warms every venue pair and skips cached ones
+"""
+
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+from google_maps_integration import GoogleMapsAPI, MapsCache, normalize_location, route_key
+
+
+def _route(origin, destination):
+    leg = {"start_address": origin, "end_address": destination,
+           "duration": {"text": "5 mins"}, "distance": {"text": "400 m"}, "steps": []}
+    return {"status": "OK", "routes": [{"legs": [leg]}]}
+
+
+def _client(cache=None, fail=()):
+    """GoogleMapsAPI whose HTTP layer is replaced by a counting fake"""
+    api = GoogleMapsAPI(api_key="test", cache=cache or MapsCache())
+    api.requests = []
+
+    async def fake_get_json(url, params):
+        api.requests.append((url.rsplit("/", 2)[-2], dict(params)))
+        await asyncio.sleep(0.01)
+        if params.get("origin") in fail:
+            return {"error": "API error: 500"}
+        if "findplacefromtext" in url:
+            return {"status": "OK", "candidates": [{"place_id": "p1"}]}
+        if "details" in url:
+            return {"status": "OK", "result": {"geometry": {"location": {"lat": 60.2, "lng": 24.9}}}}
+        if "nearbysearch" in url:
+            return {"status": "OK", "results": [{"name": "Cafe"}]}
+        return _route(params["origin"], params["destination"])
+
+    api._get_json = fake_get_json
+    return api
+
+
+def test_normalized_keys_and_ttl():
+    assert normalize_location("  Messukeskus,Helsinki. ") == "messukeskus, helsinki"
+    assert normalize_location("60.2034567, 24.93") == "60.20346,24.93000"
+    assert route_key("Kamppi", "Messukeskus") == route_key(" kamppi ", "MESSUKESKUS")
+    assert route_key("Kamppi", "Messukeskus", "transit") != route_key("Kamppi", "Messukeskus")
+
+    api = _client()
+
+    async def run():
+        first = await api.get_directions("Kamppi", "Messukeskus")
+        assert await api.get_directions("  KAMPPI", "messukeskus.") == first
+        assert await api.get_travel_time("Kamppi", "Messukeskus") == ("5 mins", "400 m")
+        await api.get_directions("Kamppi", "Messukeskus", mode="transit")
+        assert len(api.requests) == 2, "one fetch per normalized route and mode"
+
+        await api.get_nearby_places("Messukeskus", "cafe")
+        await api.get_nearby_places("messukeskus", "cafe")
+        assert [kind for kind, _ in api.requests[2:]] == ["findplacefromtext", "details", "nearbysearch"]
+
+        # Expired entries are refetched
+        api.cache._memory[("directions", route_key("Kamppi", "Messukeskus"))] = (0, first)
+        await api.get_directions("Kamppi", "Messukeskus")
+        assert len(api.requests) == 6
+    asyncio.run(run())
+
+    assert api.cache.ttl_for("directions", route_key("a", "b", "transit")) < api.cache.ttl_for("directions", "walking|a|b")
+    print(f"✓ Fetched once per normalized request ({api.cache.hits} hits, {api.cache.misses} misses)")
+
+
+def test_persistent_cache_and_errors():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/maps.db")
+        models.Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        first = _client(MapsCache(session_factory=Session), fail={"Nowhere"})
+
+        async def warm():
+            await first.get_directions("Kamppi", "Messukeskus")
+            assert "error" in await first.get_directions("Nowhere", "Messukeskus")
+            assert "error" in await first.get_directions("Nowhere", "Messukeskus")
+        asyncio.run(warm())
+        assert len(first.requests) == 3, "errors are not cached"
+
+        # A new process: empty memory, same table
+        second = _client(MapsCache(session_factory=Session))
+        asyncio.run(second.get_directions("kamppi", "Messukeskus"))
+        assert second.requests == [] and second.cache.hits == 1
+
+        second.cache.put("directions", route_key("Kamppi", "Messukeskus"), _route("x", "y"))
+        db = Session()
+        assert db.query(models.MapsCacheEntry).count() == 1
+        db.close()
+        engine.dispose()
+
+    print("✓ Cached routes survive restarts; errors are never cached")
+
+
+def test_coalescing_and_precompute():
+    api = _client()
+
+    async def run():
+        results = await asyncio.gather(*(api.get_directions("Kamppi", "Messukeskus") for _ in range(10)))
+        assert len(api.requests) == 1 and all(r == results[0] for r in results)
+
+        venues = ["Messukeskus", "Kamppi", "Oodi", "kamppi"]
+        stats = await api.precompute_routes(venues, modes=("walking",), concurrency=3)
+        assert stats == {"cached": 1, "fetched": 5, "failed": 0}, stats
+        again = await api.precompute_routes(venues)
+        assert again["fetched"] == 0 and again["cached"] == 6
+    asyncio.run(run())
+
+    print(f"✓ Concurrent identical requests share a fetch; {len(api.requests)} requests warmed 3 venues")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MAPS CACHE TEST")
+    print("=" * 60)
+    test_normalized_keys_and_ttl()
+    test_persistent_cache_and_errors()
+    test_coalescing_and_precompute()
+    print("\n✅ All maps cache tests passed")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test the shared MCP tool registry and the Streamable HTTP client
+
+- Every advertised tool dispatches to a method; unknown tools and tool
+  exceptions come back as {"success": False, ...} instead of raising
+- MCPClient initializes once, reuses the session id, parses JSON and SSE
+  bodies, and re-initializes once when the server drops the session
+- When the mcp package is installed, the real server round-trips a call
+"""
+
+import sys
+import json
+import asyncio
+import contextlib
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+
+from mcp_client import MCPClient, MCPError, StartupDatabaseMCPTools, ToolRegistry, get_startup_tools
+
+
+def test_registry_dispatch():
+    tools = StartupDatabaseMCPTools()
+    names = [d["function"]["name"] for d in tools.tools_definition]
+    assert len(tools.registry) == len(names) and len(set(names)) == len(names)
+    for name in names:
+        assert name in tools.registry
+        assert tools.registry.tools[name].func == getattr(tools, f"_{name}")
+    assert "search_attendees_by_company" in tools.registry
+    assert get_startup_tools() is get_startup_tools()
+
+    registry = ToolRegistry()
+
+    async def echo(text: str):
+        return {"success": True, "text": text}
+
+    async def broken():
+        raise ValueError("boom")
+
+    registry.register("echo", echo)
+    registry.register("broken", broken)
+
+    async def run():
+        assert await registry.call("echo", {"text": "hi"}) == {"success": True, "text": "hi"}
+        assert await registry.call("broken") == {"success": False, "error": "boom"}
+        assert (await registry.call("missing"))["error"] == "Unknown tool: missing"
+        assert (await tools.call_tool("missing"))["success"] is False
+    asyncio.run(run())
+
+    print(f"✓ {len(names)} tools dispatch through one registry; errors never raise")
+
+
+def _fake_server(sse: bool):
+    """Minimal Streamable HTTP JSON-RPC endpoint; expire() forgets every session"""
+    state = {"sessions": set(), "initialized": 0, "calls": 0, "next": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        message = json.loads(request.content)
+        session = request.headers.get("mcp-session-id")
+        if message["method"] == "initialize":
+            state["next"] += 1
+            session = f"s{state['next']}"
+            state["sessions"].add(session)
+            state["initialized"] += 1
+            result = {"protocolVersion": message["params"]["protocolVersion"], "capabilities": {}}
+        elif session not in state["sessions"]:
+            return httpx.Response(404)
+        elif "id" not in message:
+            return httpx.Response(202)
+        elif message["method"] == "tools/call":
+            state["calls"] += 1
+            assert request.headers["mcp-protocol-version"]
+            payload = {"success": True, "echo": message["params"]["arguments"]}
+            result = {"content": [{"type": "text", "text": json.dumps(payload)}], "isError": False}
+        else:
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": message["id"],
+                                             "error": {"code": -32601, "message": "Method not found"}})
+
+        body = {"jsonrpc": "2.0", "id": message["id"], "result": result}
+        headers = {"mcp-session-id": session}
+        if sse:
+            stream = f"event: message\ndata: {json.dumps(body)}\n\n"
+            return httpx.Response(200, headers={**headers, "content-type": "text/event-stream"}, text=stream)
+        return httpx.Response(200, headers=headers, json=body)
+
+    return state, handler
+
+
+def test_client_session_reuse_and_reinit():
+    for sse in (False, True):
+        state, handler = _fake_server(sse)
+
+        async def run():
+            client = MCPClient(config={"url": "http://mcp.test/mcp/",
+                                       "client": httpx.AsyncClient(transport=httpx.MockTransport(handler))})
+            for i in range(5):
+                assert await client.call_tool("echo", n=i) == {"success": True, "echo": {"n": i}}
+            assert state["initialized"] == 1, "one handshake for many calls"
+
+            state["sessions"].clear()  # server restarted
+            assert (await client.call_tool("echo", n=9))["echo"] == {"n": 9}
+            assert state["initialized"] == 2 and state["calls"] == 6
+
+            try:
+                await client.list_tools()
+                raise AssertionError("JSON-RPC errors must raise")
+            except MCPError as e:
+                assert "Method not found" in str(e)
+            await client.client.aclose()
+        asyncio.run(run())
+
+    print("✓ MCPClient reuses one session (JSON and SSE) and recovers from expiry")
+
+
+def test_real_server_round_trip():
+    try:
+        from mcp_startup_server import StartupDatabaseServer
+    except ImportError as e:
+        print(f"⚠️  Skipping real server round trip (mcp not installed: {e})")
+        return
+
+    async def double(n: int):
+        return {"success": True, "n": n * 2}
+
+    tools = StartupDatabaseMCPTools()
+    tools.registry = ToolRegistry()
+    tools.registry.register("double", double, "Double a number",
+                            {"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]})
+    app = StartupDatabaseServer(tools).http_app(json_response=True)
+
+    async def run():
+        async with contextlib.AsyncExitStack() as stack:
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            http = await stack.enter_async_context(
+                httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://mcp.test")
+            )
+            client = MCPClient(config={"url": "http://mcp.test/mcp/", "client": http})
+            assert [t["name"] for t in await client.list_tools()] == ["double"]
+            assert await client.call_tool("double", n=21) == {"success": True, "n": 42}
+    asyncio.run(run())
+
+    print("✓ mcp_startup_server serves the registry over Streamable HTTP")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MCP REGISTRY TEST")
+    print("=" * 60)
+    test_registry_dispatch()
+    test_client_session_reuse_and_reinit()
+    test_real_server_round_trip()
+    print("\n✅ All MCP registry tests passed")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test the batched post-meeting notification dispatcher
+
+- Hundreds of due reminders go out concurrently over one pooled client,
+  with a bounded number of queries and one commit per batch
+- 410 / 404 subscriptions are pruned; failed pushes leave reminders pending
+- Future, dismissed and already-answered reminders are not sent
+"""
+
+import sys
+import json
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import models
+from models import CalendarEvent, NotificationQueue, PushSubscription
+from notification_dispatcher import NotificationDispatcher, next_due_at
+
+
+def _session_factory(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/notifications.db", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def _plain_request(subscription, payload):
+    return subscription.endpoint, {"ttl": "60"}, payload
+
+
+def _seed(db, now, users=300):
+    for i in range(users):
+        db.add(CalendarEvent(id=f"m{i}", title=f"Meeting {i}", start_time=now - timedelta(hours=1),
+                             end_time=now - timedelta(minutes=6), type="meeting"))
+        db.add(NotificationQueue(userId=f"u{i}", meetingId=f"m{i}", meetingEndTime=now - timedelta(minutes=6),
+                                 scheduledFor=now - timedelta(minutes=1)))
+        db.add(PushSubscription(userId=f"u{i}", endpoint=f"https://push.example/u{i}/a", p256dh="k", auth="a"))
+        if i % 3 == 0:
+            db.add(PushSubscription(userId=f"u{i}", endpoint=f"https://push.example/u{i}/gone", p256dh="k", auth="a"))
+    db.commit()
+
+
+def test_batched_concurrent_dispatch():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory = _session_factory(tmp)
+        now = datetime.utcnow()
+        db = factory()
+        _seed(db, now)
+        db.add(NotificationQueue(userId="u1", meetingId="later", meetingEndTime=now,
+                                 scheduledFor=now + timedelta(minutes=5)))
+        db.add(NotificationQueue(userId="u2", meetingId="skip", meetingEndTime=now,
+                                 scheduledFor=now - timedelta(minutes=1), dismissed=True))
+        db.add(NotificationQueue(userId="nobody", meetingId="m0", meetingEndTime=now,
+                                 scheduledFor=now - timedelta(minutes=1)))
+        db.commit()
+
+        active, peak, titles = [0], [0], set()
+
+        async def handler(request):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            titles.add(json.loads(request.content)["body"])
+            return httpx.Response(410 if request.url.path.endswith("/gone") else 201)
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                dispatcher = NotificationDispatcher(_plain_request, client=client, concurrency=20, batch_size=128)
+                return await dispatcher.dispatch(db, now)
+
+        stats = asyncio.run(run())
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+        assert stats.due == 301 and stats.sent == 300, stats
+        assert stats.no_subscription == 1
+        assert stats.pruned_subscriptions == 100 and stats.failed_pushes == 100
+        assert stats.batches == 3
+        assert 1 < peak[0] <= 20, peak[0]
+        assert "How was Meeting 7? Share one key insight!" in titles
+        # Two queries per batch, never per notification
+        assert len(selects) <= 2 * stats.batches, len(selects)
+
+        db.expire_all()
+        assert db.query(NotificationQueue).filter_by(sent=True).count() == 300
+        assert db.query(PushSubscription).filter_by(active=False).count() == 100
+        assert db.query(NotificationQueue).filter_by(meetingId="later").one().sent is False
+        assert next_due_at(db, now) > now
+        db.close()
+
+    print("✓ 300 due reminders sent in 3 batches with bounded concurrency, 100 dead subscriptions pruned")
+
+
+def test_failed_pushes_stay_pending():
+    with tempfile.TemporaryDirectory() as tmp:
+        _engine, factory = _session_factory(tmp)
+        now = datetime.utcnow()
+        db = factory()
+        _seed(db, now, users=4)
+
+        def transport(request):
+            if "u0" in request.url.path:
+                raise httpx.ConnectError("push service down")
+            return httpx.Response(503 if "u1" in request.url.path else 201)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(transport)) as client:
+                dispatcher = NotificationDispatcher(_plain_request, client=client)
+                first = await dispatcher.dispatch(db, now)
+                second = await dispatcher.dispatch(db, now)
+                return first, second
+
+        first, second = asyncio.run(run())
+        assert first.sent == 2 and first.pruned_subscriptions == 0, first
+        assert second.due == 2 and second.sent == 0, second
+
+        db.expire_all()
+        pending = {n.userId for n in db.query(NotificationQueue).filter_by(sent=False)}
+        assert pending == {"u0", "u1"}
+        assert db.query(PushSubscription).filter_by(active=False).count() == 0
+        db.close()
+
+    print("✓ Connection errors and 5xx leave reminders pending for the next tick")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("NOTIFICATION DISPATCHER TEST")
+    print("=" * 60)
+    test_batched_concurrent_dispatch()
+    test_failed_pushes_stay_pending()
+    print("\n✅ All notification dispatcher tests passed")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the access-token principal cache in auth.get_current_user
+
+- Repeat requests with the same token skip JWT decode and the user query
+- revoke_all_user_tokens and user updates drop the user's cached tokens
+- Entries never outlive the TTL, the token's exp, or the size bound
+"""
+
+import sys
+import time
+import asyncio
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import models
+import schemas
+import auth
+import crud
+from auth import PrincipalCache, create_access_token, get_current_user, principal_cache, revoke_all_user_tokens
+
+
+def _session(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/auth.db", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(models.User(email="ana@example.com", hashed_password="x", full_name="Ana"))
+    db.add(models.User(email="bo@example.com", hashed_password="x", full_name="Bo"))
+    db.commit()
+    return engine, db
+
+
+def test_cached_principal_and_invalidation():
+    principal_cache.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, db = _session(tmp)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        ana_token = create_access_token({"sub": "ana@example.com"})
+        bo_token = create_access_token({"sub": "bo@example.com"})
+
+        async def current(token):
+            return await get_current_user(token=token, db=db)
+
+        first = asyncio.run(current(ana_token))
+        asyncio.run(current(bo_token))
+        queries = len(statements)
+        for _ in range(50):
+            user = asyncio.run(current(ana_token))
+        assert len(statements) == queries, "cache hits must not query the DB"
+        assert (user.id, user.email, user.full_name, user.is_active) == (first.id, "ana@example.com", "Ana", True)
+        assert principal_cache.hits == 50
+
+        crud.update_user(db, first.id, schemas.UserUpdate(full_name="Ana B"))
+        assert asyncio.run(current(ana_token)).full_name == "Ana B"
+        assert len(principal_cache) == 2
+
+        revoke_all_user_tokens(db, first.id)
+        assert len(principal_cache) == 1, "only the revoked user's tokens are dropped"
+
+        asyncio.run(current(ana_token))
+        crud.delete_user(db, first.id)
+        try:
+            asyncio.run(current(ana_token))
+            raise AssertionError("deleted user must not authenticate")
+        except HTTPException as e:
+            assert e.status_code == 401
+        db.close()
+        engine.dispose()
+    principal_cache.clear()
+
+    print("✓ Warm requests skip decode + query; updates and revocation invalidate")
+
+
+def test_ttl_expiry_and_bound():
+    cache = PrincipalCache(ttl=60, max_entries=3)
+    cache.put("a", time.time() + 0.05, {"id": 1, "email": "a"})
+    cache.put("b", None, {"id": 2, "email": "b"})
+    assert cache.get("a") is not None
+    time.sleep(0.06)
+    assert cache.get("a") is None, "token exp caps the entry"
+    for token in ("c", "d", "e"):
+        cache.put(token, None, {"id": 3, "email": token})
+    assert cache.get("b") is None and len(cache) == 3, "LRU bound evicts the oldest"
+    assert cache.invalidate(user_id=3) == 3 and len(cache) == 0
+
+    expired = create_access_token({"sub": "ana@example.com"}, expires_delta=timedelta(seconds=-1))
+    assert auth.decode_access_token(expired) is None
+
+    print("✓ Entries are bounded by TTL, token exp and max size")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRINCIPAL CACHE TEST")
+    print("=" * 60)
+    test_cached_principal_and_invalidation()
+    test_ttl_expiry_and_bound()
+    print("\n✅ All principal cache tests passed")
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Test the parallel scraper building blocks without a browser
+
+- Event card parsing against the saved activities_page_source.html fixture
+- Per-URL checkpoint resume
+- Shared login cookie sanitizing
+- BrowserPool fan-out with stand-in workers
+- HTTP fast path: JSON payload parsing against slush_events_data and
+  concurrent pagination against an in-memory transport
+"""
+
+import sys
+import json
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+SCRAPPER_DIR = Path(__file__).parent.parent / "scrapper"
+sys.path.insert(0, str(SCRAPPER_DIR))
+
+from slush_scraper_pool import BrowserPool, ScrapeCheckpoint, SharedLoginSession
+from slush_page_parsers import parse_event_cards, parse_events_payload, format_event_datetime
+from slush_http_scraper import APISession, EndpointConfig, SlushHTTPScraper, find_api_requests
+
+import httpx
+
+
+def test_parse_activities_fixture():
+    """The saved activities page holds 8 cards (4 unique events)"""
+    html = (SCRAPPER_DIR / "activities_page_source.html").read_text(encoding="utf-8")
+    events = parse_event_cards(html, scraped_at="2025-11-17T00:00:00")
+
+    assert len(events) == 8
+    first = events[0]
+    assert first["title"] == "Startups Supercharge: AI for Accelerated Business"
+    assert first["organizer"] == "Google"
+    assert first["datetime"] == "Nov 20, 10:00 AM – 12:00 PM"
+    assert first["location"] == "Partner Side Event Wing, Venue 5 in Messukeskus"
+    assert first["categories"] == ["Artificial Intelligence", "Demo"]
+    assert first["status"] == ["Signature Side Event", "Closed"]
+
+    unique = {(e["title"], e["organizer"]) for e in events}
+    assert len(unique) == 4
+    print(f"✓ Parsed {len(events)} cards ({len(unique)} unique events) from fixture")
+
+
+def test_checkpoint_resume():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "checkpoint.json"
+        urls = [f"https://platform.slush.org/p/{i}" for i in range(5)]
+
+        checkpoint = ScrapeCheckpoint(path, flush_every=100, max_attempts=2)
+        checkpoint.mark(urls[0], True)
+        checkpoint.mark(urls[1], False, "timeout")
+        checkpoint.flush()
+
+        resumed = ScrapeCheckpoint(path, max_attempts=2)
+        assert resumed.pending(urls) == urls[1:]  # Failed URL gets a retry
+
+        resumed.mark(urls[1], False, "timeout")
+        assert resumed.pending(urls) == urls[2:]  # Out of retries
+
+        # Without resume a new run ignores the old file and overwrites it
+        fresh = ScrapeCheckpoint(path, resume=False)
+        assert fresh.pending(urls) == urls
+        fresh.mark(urls[3], True)
+        fresh.flush()
+        assert ScrapeCheckpoint(path).pending(urls) == urls[:3] + urls[4:]
+    print("✓ Checkpoint resume")
+
+
+def test_cookie_cleaning():
+    cookie = {
+        "name": "session", "value": "abc", "domain": ".slush.org", "path": "/",
+        "expiry": 1.7e9, "sameSite": "unspecified", "storeId": "0",
+    }
+    cleaned = SharedLoginSession._clean(cookie)
+    assert cleaned == {"name": "session", "value": "abc", "domain": ".slush.org", "path": "/", "expiry": 1700000000}
+    print("✓ Cookie cleaning")
+
+
+class FakeDriver:
+    def __init__(self):
+        self.cookies = []
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script):
+        return "complete"
+
+    def get_cookies(self):
+        return [{"name": "session", "value": "token", "domain": ".slush.org"}]
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+
+class FakeScraper:
+    def __init__(self):
+        self.driver = FakeDriver()
+        self.closed = False
+        self.logins = 0
+
+    def login(self):
+        self.logins += 1
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+def test_browser_pool_shares_login_and_runs_in_parallel():
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def task(scraper, url):
+        with lock:
+            active.append(url)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(url)
+        return {"url": url, "success": True}
+
+    seen = []
+    pool = BrowserPool(FakeScraper, size=4, login=FakeScraper.login)
+    with pool:
+        assert sum(w.logins for w in pool.workers) == 1  # One login for the whole pool
+        assert all(w.driver.cookies for w in pool.workers[1:])  # Others got the cookie jar
+        started = time.time()
+        pool.map(range(16), task, on_result=lambda item, result: seen.append(item))
+        elapsed = time.time() - started
+        workers = list(pool.workers)
+
+    assert sorted(seen) == list(range(16))
+    assert peak[0] == 4
+    assert elapsed < 16 * 0.05  # Faster than serial
+    assert all(w.closed for w in workers)
+    print(f"✓ Browser pool ran 16 pages on 4 workers in {elapsed:.2f}s")
+
+
+def test_browser_pool_closes_started_workers_when_startup_fails():
+    started = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            if len(started) == 2:
+                raise RuntimeError("chrome did not start")
+            started.append(FakeScraper())
+            return started[-1]
+
+    pool = BrowserPool(factory, size=4, login=FakeScraper.login)
+    try:
+        with pool:
+            raise AssertionError("pool should not start")
+    except RuntimeError:
+        pass
+    assert len(started) >= 2 and all(w.closed for w in started)
+    assert pool.workers == []
+    print(f"✓ Browser pool closed {len(started)} started workers after a startup failure")
+
+
+def test_payload_parser_matches_recorded_events():
+    """Saved scraper output round-trips through the JSON payload parser"""
+    for path in sorted((SCRAPPER_DIR / "slush_events_data").glob("*.json")):
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+        parsed = parse_events_payload({"data": {"activities": recorded}}, scraped_at="x")
+        assert len(parsed) == len(recorded), path.name
+        for event, original in zip(parsed, recorded):
+            assert event == {**original, "scraped_at": "x"}
+    print("✓ Payload parser reproduces slush_events_data records")
+
+
+def test_graphql_payload_normalized():
+    payload = {"data": {"sideEvents": {"totalCount": 1, "edges": [{"node": {
+        "name": "Deep Tech Unleashed",
+        "organizer": {"name": "CERN Venture Connect"},
+        "startsAt": "2025-11-19T09:00:00Z",
+        "endsAt": "2025-11-19T11:00:00Z",
+        "venue": {"name": "Partner Side Event Wing, Venue 8 in Messukeskus"},
+        "tags": [{"name": "Deep Tech"}, "Pitching"],
+        "status": "Signature Side Event",
+    }}]}}}
+    [event] = parse_events_payload(payload, scraped_at="x")
+    assert event == {
+        "title": "Deep Tech Unleashed",
+        "organizer": "CERN Venture Connect",
+        "datetime": "Nov 19, 11:00 AM – 1:00 PM",  # UTC shown in Helsinki time
+        "location": "Partner Side Event Wing, Venue 8 in Messukeskus",
+        "categories": ["Deep Tech", "Pitching"],
+        "status": ["Signature Side Event"],
+        "scraped_at": "x",
+    }
+    assert format_event_datetime(None) == ""
+    print("✓ GraphQL payload normalized")
+
+
+def test_endpoint_discovery_from_network_log():
+    def entry(method, params):
+        return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+    log = [
+        entry("Network.requestWillBeSent", {"requestId": "1", "type": "Script",
+                                            "request": {"url": "https://platform.slush.org/app.js"}}),
+        entry("Network.requestWillBeSent", {"requestId": "2", "type": "Fetch", "request": {
+            "url": "https://api.slush.org/v1/activities?page=1&limit=24&event=slush25",
+            "method": "GET", "headers": {"Authorization": "Bearer t", "Accept": "*/*"}}}),
+        entry("Network.responseReceived", {"requestId": "2", "response": {"mimeType": "application/json"}}),
+    ]
+    [request] = find_api_requests(log)
+    config = EndpointConfig.from_request(request["url"], page_size=50)
+    assert config.url == "https://api.slush.org/v1/activities"
+    assert config.params == {"event": "slush25"}
+    assert config.request_kwargs(2)["params"] == {"event": "slush25", "page": 3, "limit": 50}
+
+    graphql = EndpointConfig.from_request(
+        "https://api.slush.org/graphql", "POST",
+        json.dumps({"query": "query Activities", "variables": {"offset": 0, "first": 20}}),
+    )
+    body = graphql.request_kwargs(1)["json"]
+    assert body["variables"] == {"offset": 100, "first": 100}
+    print("✓ Endpoint discovery and pagination params")
+
+
+def test_http_scraper_paginates_concurrently():
+    recorded = json.loads((SCRAPPER_DIR / "slush_events_data" / "slush_events_full.json").read_text())
+    page_size = 50
+    in_flight = [0]
+    peak = [0]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == "Bearer t"
+        assert request.headers["cookie"] == "session=abc"
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        page = int(request.url.params["page"])
+        items = recorded[(page - 1) * page_size: page * page_size]
+        return httpx.Response(200, json={"items": items, "total": len(recorded)})
+
+    session = APISession(
+        cookies=[{"name": "session", "value": "abc", "domain": "api.slush.org"}],
+        headers={"Authorization": "Bearer t"},
+        events=EndpointConfig(url="https://api.slush.org/v1/activities", page_size=page_size),
+    )
+    scraper = SlushHTTPScraper(session, concurrency=4, transport=httpx.MockTransport(handler))
+    events = asyncio.run(scraper.scrape_events())
+
+    unique = {(e["title"], e["organizer"], e["datetime"]) for e in recorded}
+    assert len(events) == len(unique)
+    assert scraper.requests_made == 8  # ceil(381 / 50)
+    assert peak[0] == 4
+    print(f"✓ HTTP scraper fetched {scraper.requests_made} pages ({len(events)} unique events)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SCRAPER POOL TEST")
+    print("=" * 60)
+    test_parse_activities_fixture()
+    test_checkpoint_resume()
+    test_cookie_cleaning()
+    test_browser_pool_shares_login_and_runs_in_parallel()
+    test_browser_pool_closes_started_workers_when_startup_fails()
+    test_payload_parser_matches_recorded_events()
+    test_graphql_payload_normalized()
+    test_endpoint_discovery_from_network_log()
+    test_http_scraper_paginates_concurrently()
+    print("\n✅ All scraper pool tests passed")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test the per-user seen bitmaps used for swipe exclusion
+
+- SeenSet membership, id listing and byte round-trip
+- crud.create_vote / delete_vote keep user_seen_sets and the cache in step
+  (duplicate votes included); other workers pick changes up via version
+- Users without a stored row are built from all of their votes, however
+  many other votes come before them (the old limit=1000 bug)
+- /startups/phase1 and /phase2 exclude voted startups without loading votes
+  or sending seen ids back to the database as NOT IN lists
+- Startup ids above MAX(startups.id) never become bits
+"""
+
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import crud
+import schemas
+import seen_sets
+import startup_facets
+import routes_phase_endpoints as phase
+from database import get_db
+from models import UserSeenSet, Vote
+from models_startup import Startup
+from testing_db import record_statements, temp_engine
+
+
+def _database(tmp, startups=40):
+    engine = temp_engine(tmp, "seen.db")
+    with engine.begin() as conn:
+        conn.execute(insert(Startup.__table__), [{
+            "id": i, "company_name": f"Startup {i}", "axa_priority_tier": "Tier 2: High",
+            "axa_grade": ["A+", "A", "B"][i % 3], "topics": ["AI - Agentic"] if i % 4 == 0 else ["Health"],
+        } for i in range(1, startups + 1)])
+        startup_facets.rebuild_facets(conn)
+    return engine, sessionmaker(bind=engine), record_statements(engine)
+
+
+def _vote(db, user_id, startup_id, interested=True):
+    return crud.create_vote(db, schemas.VoteCreate(
+        startupId=str(startup_id), userId=user_id, userName=user_id, interested=interested))
+
+
+def test_bitmaps():
+    seen = seen_sets.SeenSet.from_votes([("3", True), ("700", False), ("not-an-id", True), (3, False)])
+    assert 3 in seen and "700" in seen and 4 not in seen and "not-an-id" not in seen
+    assert seen.ids() == [3, 700] and seen.interested_ids() == [3] and len(seen) == 2
+    assert seen.is_interested("3") and not seen.is_interested(700)
+    data = seen_sets._to_bytes(seen.seen)
+    assert len(data) == 88 and seen_sets._from_bytes(data) == seen.seen
+    seen.set(700, False, False)
+    assert seen.ids() == [3]
+    print("✓ SeenSet membership, listing and 88-byte encoding of ids up to 700")
+
+
+def test_votes_keep_bitmaps_in_step():
+    seen_sets.seen_cache.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, statements = _database(tmp)
+        db = Session()
+        _vote(db, "ada", 5)
+        _vote(db, "ada", 7, interested=False)
+        _vote(db, "ada", 7, interested=True)  # Duplicate vote on 7
+        row = db.get(UserSeenSet, "ada")
+        assert row.version == 3 and seen_sets.SeenSet.from_row(row).ids() == [5, 7]
+
+        statements.clear()
+        seen = seen_sets.get_seen_set(db, "ada")
+        assert statements == [], "fresh cache entry written by create_vote"
+        assert seen.interested_ids() == [5, 7]
+
+        other_worker = seen_sets.SeenSetCache(ttl=0)
+        assert other_worker.get(db, "ada").ids() == [5, 7]
+        assert crud.delete_vote(db, "7", "ada")
+        assert 7 in seen_sets.get_seen_set(db, "ada"), "one vote on 7 remains"
+        assert crud.delete_vote(db, "7", "ada") and not crud.delete_vote(db, "7", "ada")
+        assert seen_sets.get_seen_set(db, "ada").ids() == [5]
+        assert other_worker.get(db, "ada").ids() == [5], "picked up through the version column"
+
+        assert seen_sets.rebuild_seen_sets(db) == 1
+        assert seen_sets.get_seen_set(db, "ada").ids() == [5]
+        db.close()
+        engine.dispose()
+    seen_sets.seen_cache.clear()
+
+    print("✓ create_vote / delete_vote update the stored bitmaps, cache and other workers")
+
+
+def test_history_beyond_first_thousand_votes():
+    seen_sets.seen_cache.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, _ = _database(tmp)
+        with engine.begin() as conn:
+            conn.execute(insert(Vote.__table__), [
+                {"startup_id": str(i % 40 + 1), "user_id": f"crowd{i}", "user_name": "c", "interested": False}
+                for i in range(1200)
+            ] + [{"startup_id": str(i), "user_id": "late", "user_name": "l", "interested": i == 2}
+                 for i in (2, 9, 31)])
+        db = Session()
+        old_view = [v for v in crud.get_votes(db, skip=0, limit=1000) if v.userId == "late"]
+        seen = seen_sets.get_seen_set(db, "late")
+        assert old_view == [] and seen.ids() == [2, 9, 31] and seen.interested_ids() == [2]
+        assert db.get(UserSeenSet, "late") is None, "reads don't write; the next vote persists the row"
+        _vote(db, "late", 12)
+        assert seen_sets.SeenSet.from_row(db.get(UserSeenSet, "late")).ids() == [2, 9, 12, 31]
+        db.close()
+        engine.dispose()
+    seen_sets.seen_cache.clear()
+
+    print("✓ Seen sets cover a user's whole history, not the first 1000 votes overall")
+
+
+def test_out_of_range_ids_ignored():
+    seen_sets.seen_cache.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, _ = _database(tmp)
+        db = Session()
+        _vote(db, "mallory", "10000000000")  # Creates the row from the votes table
+        _vote(db, "mallory", 3)
+        _vote(db, "mallory", 41)  # One past the last startup
+        _vote(db, "mallory", "10000000001")  # Updates the existing row
+        row = db.get(UserSeenSet, "mallory")
+        assert len(row.seen) <= 6 and seen_sets.SeenSet.from_row(row).ids() == [3]
+        assert seen_sets.get_seen_set(db, "mallory").ids() == [3]
+        assert seen_sets.rebuild_seen_sets(db) == 1
+        assert len(db.get(UserSeenSet, "mallory").seen) <= 6
+        db.close()
+        engine.dispose()
+    seen_sets.seen_cache.clear()
+
+    print("✓ Votes on ids above MAX(startups.id) don't grow the bitmaps")
+
+
+def test_phase_endpoints_exclude_seen():
+    seen_sets.seen_cache.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, statements = _database(tmp)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(phase.router)
+        app.dependency_overrides[get_db] = override_db
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                first = (await client.get("/startups/phase1", params={"user_id": "grace"})).json()
+                top = [s["id"] for s in first["startups"]]
+                db = Session()
+                for startup_id in top[:3] + [top[-1]]:
+                    _vote(db, "grace", startup_id, interested=startup_id == top[0])
+                db.close()
+
+                statements.clear()
+                again = [s["id"] for s in (await client.get(
+                    "/startups/phase1", params={"user_id": "grace"})).json()["startups"]]
+                assert not set(again) & set(top[:3] + [top[-1]])
+                assert len(again) == 17, "7 Agentic left of 10, still 10 others"
+                assert not any("FROM votes" in s for s in statements), "no Vote rows loaded"
+
+                page_size = phase.PHASE1_PAGE_SIZE
+                phase.PHASE1_PAGE_SIZE = 4
+                try:
+                    paged = [s["id"] for s in (await client.get(
+                        "/startups/phase1", params={"user_id": "grace"})).json()["startups"]]
+                finally:
+                    phase.PHASE1_PAGE_SIZE = page_size
+                assert paged == again, "reading 4 at a time finds the same unseen startups"
+
+                statements.clear()
+                two = (await client.get("/startups/phase2", params={"user_id": "grace", "limit": 10})).json()
+                ids = [s["id"] for s in two["startups"]]
+                assert not set(ids) & set(top[:3] + [top[-1]]) and len(ids) == len(set(ids)) == 10
+                assert two["user_preference_signals"]["topics"] == ["AI - Agentic"]
+                assert not any("NOT IN" in s for s in statements), "seen ids filtered in Python"
+        asyncio.run(run())
+        engine.dispose()
+    seen_sets.seen_cache.clear()
+
+    print("✓ /startups/phase1 and /phase2 exclude voted startups via the bitmap")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SEEN SETS TEST")
+    print("=" * 60)
+    test_bitmaps()
+    test_votes_keep_bitmaps_in_step()
+    test_history_beyond_first_thousand_votes()
+    test_out_of_range_ids_ignored()
+    test_phase_endpoints_exclude_seen()
+    print("\n✅ All seen set tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the shared startup catalog behind the concierge's StartupDataLoader
+
+- Records are __slots__ objects and render to the legacy JSON shape
+- get() by id, name-first search and the category inverted index
+- get_startup_catalog() is cached per process and rebuilt when stale
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import startup_catalog
+from startup_catalog import StartupCatalog, StartupRecord, get_startup_catalog
+
+STARTUPS = [
+    (1, "Claimsly", "AI claims automation", "InsurTech", ["Insurance", "AI"]),
+    (2, "FraudGuard", "Fraud detection for Claimsly-style insurers", "InsurTech", ["Fraud"]),
+    (3, "CarbonBook", "Carbon accounting", "Climate", ["insurtech", "Sustainability"]),
+    (4, "Dashly", "Grocery delivery", "Retail", []),
+]
+
+
+def _session(tmp):
+    import models
+    import models_startup  # noqa: F401 - registers the startups table
+
+    engine = create_engine(f"sqlite:///{tmp}/startups.db")
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for id_, name, desc, industry, topics in STARTUPS:
+            conn.execute(text(
+                "INSERT INTO startups (id, company_name, shortDescription, primary_industry, topics, total_funding) "
+                "VALUES (:id, :name, :desc, :industry, :topics, 4.5)"
+            ), {"id": id_, "name": name, "desc": desc, "industry": industry, "topics": json.dumps(topics)})
+    return sessionmaker(bind=engine)()
+
+
+def test_catalog_lookups():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = _session(tmp)
+        try:
+            catalog = StartupCatalog.from_db(db)
+        finally:
+            db.close()
+
+    assert len(catalog) == 4
+    record = catalog.get(2)
+    assert isinstance(record, StartupRecord) and not hasattr(record, "__dict__")
+    legacy = record.to_dict()
+    assert legacy["name"] == "FraudGuard" and legacy["total_funding"] == 4.5
+    assert legacy["categories"] == [{"name": "InsurTech"}, {"name": "Fraud"}]
+    assert catalog.get("99") is None
+
+    # Name hits rank ahead of description hits
+    assert [r.id for r in catalog.search("claimsly")] == [1, 2]
+    assert [r.id for r in catalog.search("claimsly", limit=1)] == [1]
+
+    # Categories are case-insensitive and de-duplicated per startup
+    assert [r.id for r in catalog.in_category("INSURTECH")] == [1, 2, 3]
+    assert catalog.get(3).categories == ("Climate", "insurtech", "Sustainability")
+    assert [r.id for r in catalog.in_category("sustain")] == [3]
+    assert catalog.in_category("") == []
+    print("✓ Catalog id, search and category lookups")
+
+
+def test_shared_catalog_refresh():
+    startup_catalog.reset_startup_catalog()
+    with tempfile.TemporaryDirectory() as tmp:
+        db = _session(tmp)
+        try:
+            first = get_startup_catalog(db)
+            assert get_startup_catalog(db) is first
+
+            db.execute(text("INSERT INTO startups (id, company_name) VALUES (5, 'Newco')"))
+            db.commit()
+            assert get_startup_catalog(db).get(5) is None
+            rebuilt = get_startup_catalog(db, max_age=0)
+            assert rebuilt is not first and rebuilt.get(5).name == "Newco"
+        finally:
+            db.close()
+            startup_catalog.reset_startup_catalog()
+    print("✓ Shared catalog is cached and rebuilt when stale")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STARTUP CATALOG TEST")
+    print("=" * 60)
+    test_catalog_lookups()
+    test_shared_catalog_refresh()
+    print("\n✅ All startup catalog tests passed")
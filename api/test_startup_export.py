@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test the streaming startup export engine
+
+- Every StartupFilter clause selects the same startups as the Python
+  predicate download_startups.py used to apply
+- Rows are read in id-ordered chunks and written incrementally; JSON,
+  NDJSON and CSV round-trip, and Parquet / Arrow when pyarrow is installed
+- --stats aggregates in SQL and agrees with counting in Python
+"""
+
+import csv
+import sys
+import json
+import random
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine, event, insert
+
+import startup_export as se
+from models_startup import Base, Startup
+
+
+def _startups(n=60):
+    rng = random.Random(3)
+    rows = []
+    for i in range(1, n + 1):
+        enriched = rng.random() < 0.4
+        rows.append({
+            "id": i,
+            "company_name": f"Startup {i}",
+            "billingCountry": rng.choice(["FI", "fi", "SE", "DE", None]),
+            "maturity": rng.choice(["Scaleup", "Startup", "Emerging", None]),
+            "total_funding": rng.choice([None, 0.0, 1.5, 20.0, 150.0]),
+            "website": rng.choice([None, "", "  ", f"https://s{i}.io"]),
+            "employees": rng.choice([None, "1-10", "11-50", "51-200", "1000+"]),
+            "founding_year": rng.choice([None, 2012, 2019, 2022]),
+            "dateFounded": rng.choice([None, datetime(2021, 5, 1)]),
+            "topics": rng.sample(["AI", "Insurtech", "Health", "Fintech"], rng.randint(0, 2)),
+            "is_enriched": enriched,
+            "enrichment": {
+                "emails": rng.sample(["a@s.io", "b@s.io"], rng.randint(0, 2)),
+                "social_media": {"linkedin": rng.choice(["", "https://linkedin.com/company/s"])},
+                "phone_numbers": ["+358 1"],
+            } if enriched or rng.random() < 0.2 else None,
+        })
+    return rows
+
+
+# The Python predicates download_startups.py applied before the SQL pushdown
+REFERENCE = {
+    "countries": (lambda f: f.countries(["fi", "SE"]), lambda s: (s["billingCountry"] or "").upper() in ("FI", "SE")),
+    "maturity": (lambda f: f.maturity("scale"), lambda s: "scale" in (s["maturity"] or "").lower()),
+    "has_funding": (lambda f: f.has_funding(), lambda s: (s["total_funding"] or 0) > 0),
+    "min_funding": (lambda f: f.min_funding(20), lambda s: (s["total_funding"] or 0) >= 20),
+    "has_website": (lambda f: f.has_website(), lambda s: bool((s["website"] or "").strip())),
+    "enriched_only": (lambda f: f.enriched_only(), lambda s: s["is_enriched"] or bool(s["enrichment"])),
+    "has_email": (lambda f: f.has_email(), lambda s: bool((s["enrichment"] or {}).get("emails"))),
+    "has_linkedin": (lambda f: f.has_linkedin(),
+                     lambda s: bool(((s["enrichment"] or {}).get("social_media") or {}).get("linkedin"))),
+    "min_employees": (lambda f: f.min_employees("11-50"),
+                      lambda s: int((s["employees"] or "0").split("-")[0].rstrip("+")) >= 11),
+    "founded_after": (lambda f: f.founded_after(2020),
+                      lambda s: (s["founding_year"] or (s["dateFounded"].year if s["dateFounded"] else 0)) >= 2020),
+    "topics": (lambda f: f.topics(["insur", "health"]),
+               lambda s: any(k in t.lower() for t in s["topics"] for k in ("insur", "health"))),
+}
+
+
+def _database(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/startups.db")
+    Base.metadata.create_all(bind=engine)
+    rows = _startups()
+    with engine.begin() as conn:
+        conn.execute(insert(Startup.__table__), rows)
+    return engine, rows
+
+
+def _ids(engine, startup_filter):
+    with engine.connect() as conn:
+        return [row["id"] for rows in se.iter_startup_chunks(conn, startup_filter, ["id"], 7) for row in rows]
+
+
+def test_filters_push_down():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, rows = _database(tmp)
+        for name, (add, predicate) in REFERENCE.items():
+            expected = [s["id"] for s in rows if predicate(s)]
+            assert _ids(engine, add(se.StartupFilter())) == expected, name
+            assert expected and len(expected) < len(rows), f"{name} should split the sample"
+
+        combined = se.StartupFilter().countries(["FI"]).has_website().enriched_only()
+        expected = [s["id"] for s in rows if all(REFERENCE[n][1](s) for n in ("has_website", "enriched_only"))
+                    and (s["billingCountry"] or "").upper() == "FI"]
+        assert _ids(engine, combined) == expected
+        with engine.connect() as conn:
+            funnel = combined.explain(conn)
+        assert [n for n, _ in funnel] == ["countries=FI", "has_website", "enriched_only"]
+        assert funnel[-1][1] == len(expected)
+        engine.dispose()
+
+    print(f"✓ {len(REFERENCE)} filters run as SQL and match the old Python predicates")
+
+
+def test_streaming_writers():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, rows = _database(tmp)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        f = se.StartupFilter().has_funding()
+        expected = [s["id"] for s in rows if (s["total_funding"] or 0) > 0]
+
+        stats = se.export_startups(Path(tmp) / "out.json", f, chunk_size=10, engine=engine)
+        assert stats.rows == len(expected) and stats.chunks == -(-len(expected) // 10)
+        assert sum("LIMIT" in s for s in statements) == stats.chunks + (len(expected) % 10 == 0)
+        exported = json.loads((Path(tmp) / "out.json").read_text())
+        assert [s["id"] for s in exported] == expected
+        assert exported[0]["topics"] == next(s["topics"] for s in rows if s["id"] == expected[0])
+
+        se.export_startups(Path(tmp) / "compact.json", f, engine=engine, pretty=False)
+        assert json.loads((Path(tmp) / "compact.json").read_text()) == exported
+
+        se.export_startups(Path(tmp) / "out.ndjson", f, chunk_size=4, engine=engine)
+        lines = (Path(tmp) / "out.ndjson").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == exported
+
+        se.export_startups(Path(tmp) / "out.csv", f, engine=engine)
+        with open(Path(tmp) / "out.csv", newline="") as fh:
+            table = list(csv.DictReader(fh))
+        assert list(table[0]) == se.DEFAULT_CSV_FIELDS and [int(r["id"]) for r in table] == expected
+        by_id = {s["id"]: s for s in rows}
+        for row in table:
+            emails = ((by_id[int(row["id"])]["enrichment"] or {}).get("emails")) or []
+            assert row["enrichment_emails"] == ",".join(emails)
+
+        empty = se.export_startups(Path(tmp) / "none.json", se.StartupFilter().countries(["XX"]), engine=engine)
+        assert empty.rows == 0 and json.loads((Path(tmp) / "none.json").read_text()) == []
+
+        try:
+            se.export_startups(Path(tmp) / "bad.csv", f, fields=["id", "nope"], engine=engine)
+            raise AssertionError("unknown fields must be rejected")
+        except ValueError:
+            pass
+
+        if se.HAS_PYARROW:
+            import pyarrow.parquet as pq
+            import pyarrow.feather as feather
+            se.export_startups(Path(tmp) / "out.parquet", f, chunk_size=10, engine=engine)
+            parquet = pq.ParquetFile(Path(tmp) / "out.parquet")
+            assert parquet.metadata.num_rows == len(expected) and parquet.metadata.num_row_groups == stats.chunks
+            assert parquet.read(columns=["id"]).column("id").to_pylist() == expected
+            se.export_startups(Path(tmp) / "out.arrow", f, fields=["id", "total_funding"], engine=engine)
+            assert feather.read_table(Path(tmp) / "out.arrow").column("id").to_pylist() == expected
+            print("✓ Parquet (one row group per chunk) and Arrow IPC written")
+        else:
+            print("⚠️  Skipping Parquet / Arrow output (pyarrow not installed)")
+        engine.dispose()
+
+    print(f"✓ {stats.rows} rows streamed in {stats.chunks} chunks to JSON, NDJSON and CSV")
+
+
+def test_statistics_in_sql():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, rows = _database(tmp)
+        with engine.connect() as conn:
+            stats = se.export_statistics(conn, se.StartupFilter().has_website())
+        subset = [s for s in rows if (s["website"] or "").strip()]
+        countries = {}
+        for s in subset:
+            countries[s["billingCountry"] or "Unknown"] = countries.get(s["billingCountry"] or "Unknown", 0) + 1
+        assert stats["total"] == len(subset)
+        assert dict(stats["countries"]) == countries
+        assert stats["with_website"] == len(subset)
+        assert stats["with_funding"] == sum(1 for s in subset if (s["total_funding"] or 0) > 0)
+        assert stats["enriched"] == sum(1 for s in subset if s["is_enriched"] or s["enrichment"])
+        engine.dispose()
+
+    print("✓ --stats aggregates in SQL over the same filter")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STARTUP EXPORT TEST")
+    print("=" * 60)
+    test_filters_push_down()
+    test_streaming_writers()
+    test_statistics_in_sql()
+    print("\n✅ All startup export tests passed")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test the topic / use case / tech junction tables
+
+- ORM inserts, edits and deletes keep the tables in sync (after_flush hook);
+  ensure_startup_facets() repairs rows written behind the ORM's back and
+  the startups bulk import rebuilds them
+- Facet counts, top-per-value and the Agentic topic test agree with the
+  parse_array loops they replaced
+- /startups/phase1, /phase2 and /facets run on the junction tables
+"""
+
+import sys
+import json
+import random
+import asyncio
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+import db_queries
+import startup_facets as facets
+import routes_phase_endpoints as phase
+from bulk_importer import import_startups_file
+from database import get_db
+from models import Vote
+from models_startup import Startup, StartupTopic, StartupUseCase
+from testing_db import temp_engine
+
+TOPICS = ["AI - Agentic", "Agent frameworks", "AI Claims", "Health", "Fintech", "Insurtech"]
+USE_CASES = ["Claims management", "Underwriting", "Workflow automation", "Customer support"]
+
+
+def _rows(n=60):
+    rng = random.Random(11)
+    return [{
+        "id": i,
+        "company_name": f"Startup {i}",
+        "topics": rng.sample(TOPICS, rng.randint(0, 3)),
+        "axa_use_cases": rng.sample(USE_CASES, rng.randint(0, 2)),
+        "tech": rng.sample(["Python", "LLM", "Rust"], rng.randint(0, 2)),
+        "axa_grade": rng.choice(["A+", "A", "B+", "B", "C", None]),
+        "axa_priority_tier": rng.choice(["Tier 2: High", "Tier 3: Monitor"]),
+        "maturity": rng.choice(["Emerging", "Scaleup", "Startup"]),
+    } for i in range(1, n + 1)]
+
+
+def _stored(db, model, column):
+    values = {}
+    for startup_id, value in db.execute(select(model.startup_id, getattr(model, column))):
+        values.setdefault(startup_id, set()).add(value)
+    return values
+
+
+def test_rows_follow_orm_writes():
+    facets.install_facet_hooks()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = temp_engine(tmp, "facets.db")
+        db = sessionmaker(bind=engine)()
+        db.add_all([
+            Startup(company_name="Alpha", topics=["AI", " Claims ", "AI"], axa_use_cases='["Underwriting"]'),
+            Startup(company_name="Beta", topics="Health, Wellness", tech=["Rust"]),
+        ])
+        db.commit()
+        alpha, beta = db.query(Startup).order_by(Startup.id).all()
+        assert _stored(db, StartupTopic, "topic") == {alpha.id: {"AI", "Claims"}, beta.id: {"Health", "Wellness"}}
+        assert _stored(db, StartupUseCase, "use_case") == {alpha.id: {"Underwriting"}}
+
+        alpha.topics = ["Fintech"]
+        beta.company_name = "Beta Oy"
+        db.commit()
+        assert _stored(db, StartupTopic, "topic")[alpha.id] == {"Fintech"}
+
+        db.delete(beta)
+        db.commit()
+        assert set(_stored(db, StartupTopic, "topic")) == {alpha.id}
+        assert facets.ensure_startup_facets(db) == {}, "hook kept the junction rows in sync"
+
+        db.execute(insert(Startup.__table__), [{"company_name": "Gamma", "topics": ["Health"]}])
+        db.commit()
+        assert facets.ensure_startup_facets(db)["topics"] == 2
+        assert "Health" in {v for vs in _stored(db, StartupTopic, "topic").values() for v in vs}
+
+        # Same number of topics, different content: caught by the fingerprint, not by counts
+        db.execute(text("UPDATE startups SET topics = '[\"Climate\"]' WHERE company_name = 'Gamma'"))
+        db.commit()
+        assert facets.ensure_startup_facets(db)["topics"] == 2
+        assert "Climate" in {v for vs in _stored(db, StartupTopic, "topic").values() for v in vs}
+        assert facets.ensure_startup_facets(db) == {}
+        db.close()
+
+        json_path = Path(tmp) / "startups.json"
+        json_path.write_text(json.dumps([{"company_name": "Delta", "topics": ["Insurtech"]}]))
+        import_startups_file(json_path, engine=engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM startup_topics WHERE topic = 'Insurtech'")).scalar() == 1
+        engine.dispose()
+
+    print("✓ Junction rows follow ORM writes, imports and ensure_startup_facets()")
+
+
+def test_queries_match_python():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = temp_engine(tmp, "facets.db")
+        rows = _rows()
+        with engine.begin() as conn:
+            conn.execute(insert(Startup.__table__), rows)
+            facets.rebuild_facets(conn)
+        db = sessionmaker(bind=engine)()
+
+        expected = Counter(t for r in rows for t in r["topics"])
+        counts = facets.facet_counts(db, "topics")
+        assert dict(counts) == expected and [c for _, c in counts] == sorted(expected.values(), reverse=True)
+        tier2 = [r for r in rows if "Tier 2" in r["axa_priority_tier"]]
+        assert dict(facets.facet_counts(db, "use_cases", Startup.axa_priority_tier.like("%Tier 2%"))) == \
+            Counter(u for r in tier2 for u in r["axa_use_cases"])
+
+        # The old grouping: startups per topic, stable-sorted by grade, first of each
+        groups = {}
+        for r in rows:
+            for t in r["topics"]:
+                groups.setdefault(t, []).append(r)
+        old = [(t, sorted(groups[t], key=lambda r: phase.grade_to_score(r["axa_grade"]), reverse=True)[0]["id"])
+               for t in sorted(groups)]
+        assert facets.top_per_value(db, "topics", order_by=(phase.GRADE_SCORE_SQL.desc(),)) == old
+
+        # Skipped ids fall through to the next startup ranked for that topic
+        skipped = {startup_id for _, startup_id in old} | {r["id"] for r in rows if r["id"] % 5 == 0}
+        fallback = [(t, first[0]["id"]) for t, first in (
+            (t, [r for r in sorted(groups[t], key=lambda r: phase.grade_to_score(r["axa_grade"]), reverse=True)
+                 if r["id"] not in skipped]) for t in sorted(groups)) if first]
+        assert facets.top_per_value(db, "topics", order_by=(phase.GRADE_SCORE_SQL.desc(),),
+                                    skip=skipped.__contains__) == fallback
+
+        agentic = {s.id for s in db.query(Startup).filter(phase.AGENTIC_TOPIC)}
+        assert agentic == {r["id"] for r in rows if any(
+            'agentic' in t.lower() or 'ai' in t.lower() and 'agent' in t.lower() for t in r["topics"])}
+
+        claims = db_queries.search_startups_by_axa_category(db, "claims", limit=100)
+        assert {r["id"] for r in claims} == {r["id"] for r in rows if "Claims management" in r["axa_use_cases"]}
+        db.close()
+        engine.dispose()
+
+    print("✓ Facet counts, top-per-topic and the Agentic filter match the parse_array loops")
+
+
+def test_phase_endpoints():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = temp_engine(tmp, "facets.db")
+        rows = _rows()
+        with engine.begin() as conn:
+            conn.execute(insert(Startup.__table__), rows)
+            facets.rebuild_facets(conn)
+            conn.execute(insert(Vote.__table__), [
+                {"startup_id": str(i), "user_id": "u1", "user_name": "U", "interested": i % 2 == 0}
+                for i in range(1, 11)
+            ])
+        Session = sessionmaker(bind=engine)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(phase.router)
+        app.dependency_overrides[get_db] = override_db
+        unvoted = [r for r in rows if r["id"] > 10]
+        is_agentic = lambda r: any('agentic' in t.lower() or 'ai' in t.lower() and 'agent' in t.lower()
+                                   for t in r["topics"])
+        by_grade = lambda group: [r["id"] for r in sorted(
+            group, key=lambda r: phase.grade_to_score(r["axa_grade"]), reverse=True)][:10]
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                one = (await client.get("/startups/phase1", params={"user_id": "u1"})).json()
+                assert [s["id"] for s in one["startups"]] == \
+                    by_grade([r for r in unvoted if is_agentic(r)]) + by_grade([r for r in unvoted if not is_agentic(r)])
+
+                two = (await client.get("/startups/phase2", params={"user_id": "u1", "limit": 20})).json()
+                ids = [s["id"] for s in two["startups"]]
+                assert two["tier_used"] == "Tier 2: High" and len(ids) == len(set(ids)) == 20
+                assert all(i > 10 for i in ids)
+                assert {r["id"] for r in rows if r["id"] in ids and "Tier 2" not in r["axa_priority_tier"]} == set()
+                liked = {t for r in rows if r["id"] <= 10 and r["id"] % 2 == 0 for t in r["topics"]}
+                assert set(two["user_preference_signals"]["topics"]) == liked
+
+                fresh = (await client.get("/startups/phase2", params={"user_id": "nobody", "limit": 10})).json()
+                assert fresh["breakdown"] == {"preference_based": 5, "diverse": 5}
+
+                counts = (await client.get("/startups/facets", params={"facet": "tech"})).json()
+                assert {v["value"]: v["count"] for v in counts["values"]} == \
+                    Counter(t for r in rows for t in r["tech"])
+                assert (await client.get("/startups/facets", params={"facet": "nope"})).status_code == 400
+        asyncio.run(run())
+        engine.dispose()
+
+    print("✓ /startups/phase1, /phase2 and /facets run on the junction tables")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STARTUP FACETS TEST")
+    print("=" * 60)
+    test_rows_follow_orm_writes()
+    test_queries_match_python()
+    test_phase_endpoints()
+    print("\n✅ All startup facets tests passed")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test concurrent tool-call execution for the function-calling concierges
+
+Stand-in tools sleep (blocking, like SQLAlchemy lookups) so the test checks
+that a multi-tool turn takes about as long as its slowest tool.
+"""
+
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tool_runner import execute_tool_calls, assistant_tool_call_message
+
+
+def _call(call_id: str, name: str, arguments) -> SimpleNamespace:
+    if not isinstance(arguments, str):
+        arguments = json.dumps(arguments)
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=arguments))
+
+
+def blocking_tool(name, arguments):
+    time.sleep(arguments.get("seconds", 0))
+    if name == "explode":
+        raise RuntimeError("boom")
+    if name == "big":
+        return {"results": ["x" * 100] * 100}
+    return f"{name} done"
+
+
+def test_calls_overlap_and_keep_order():
+    calls = [_call(f"c{i}", f"lookup_{i}", {"seconds": 0.2}) for i in range(4)]
+    started = time.perf_counter()
+    results = asyncio.run(execute_tool_calls(calls, blocking_tool))
+    elapsed = time.perf_counter() - started
+
+    assert [r.tool_call_id for r in results] == ["c0", "c1", "c2", "c3"]
+    assert [r.content for r in results] == [f"lookup_{i} done" for i in range(4)]
+    assert elapsed < 0.6, elapsed  # Sequential would be 0.8s
+    print(f"✓ 4 blocking tools in {elapsed:.2f}s, original order kept")
+
+
+def test_async_handlers_supported():
+    async def handler(name, arguments):
+        await asyncio.sleep(0.1)
+        return {"success": True, "tool": name}
+
+    calls = [_call("a", "one", {}), _call("b", "two", {})]
+    results = asyncio.run(execute_tool_calls(calls, handler))
+    assert [json.loads(r.content)["tool"] for r in results] == ["one", "two"]
+    print("✓ Async handlers")
+
+
+def test_timeouts_errors_and_truncation():
+    calls = [
+        _call("slow", "slow", {"seconds": 1.0}),
+        _call("err", "explode", {}),
+        _call("big", "big", {}),
+        _call("junk", "plain", "{not json"),
+    ]
+    async def run():
+        # Timed inside the loop: asyncio.run() itself waits for the abandoned thread
+        started = time.perf_counter()
+        results = await execute_tool_calls(calls, blocking_tool, timeouts={"slow": 0.1}, max_result_chars=500)
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+
+    slow, err, big, junk = results
+    assert slow.timed_out and "timed out" in slow.content
+    assert err.error == "boom" and err.content.startswith("Tool execution error")
+    assert big.truncated and len(big.content) < 600 and "truncated" in big.content
+    assert junk.content == "plain done"  # Unparseable arguments fall back to {}
+    assert elapsed < 0.5, elapsed
+    assert slow.to_message() == {"role": "tool", "tool_call_id": "slow", "name": "slow", "content": slow.content}
+    print("✓ Timeouts, errors and truncation become tool output")
+
+
+def test_assistant_message_echo():
+    message = SimpleNamespace(content=None, tool_calls=[_call("x", "search", {"q": "a"})])
+    echoed = assistant_tool_call_message(message)
+    assert echoed["content"] == ""
+    assert echoed["tool_calls"][0]["function"] == {"name": "search", "arguments": '{"q": "a"}'}
+    print("✓ Assistant tool-call message")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TOOL RUNNER TEST")
+    print("=" * 60)
+    test_calls_overlap_and_keep_order()
+    test_async_handlers_supported()
+    test_timeouts_errors_and_truncation()
+    test_assistant_message_echo()
+    print("\n✅ All tool runner tests passed")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test the cached topics / use cases tree
+
+- The tree is built with one query and matches the per-topic queries it
+  replaced (order included); topics without use cases are kept
+- Repeat requests are served from memory; after the TTL only the cheap
+  fingerprint is re-read, and added or touched rows rebuild the tree
+- The three endpoints serve the cached tree; unknown topics are 404
+"""
+
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+import routes_topics_usecases as topics
+from database import get_db
+
+
+def _database(tmp):
+    engine = create_engine(f"sqlite:///{tmp}/topics.db", connect_args={"check_same_thread": False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE topics (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(255) NOT NULL "
+                          "UNIQUE, order_index INTEGER, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"))
+        conn.execute(text("CREATE TABLE use_cases (id INTEGER PRIMARY KEY AUTOINCREMENT, topic_id INTEGER NOT NULL, "
+                          "name VARCHAR(255) NOT NULL, order_index INTEGER, "
+                          "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"))
+        for order, name in [(2, "Fintech"), (1, "AI - Agentic"), (3, "Empty")]:
+            conn.execute(text("INSERT INTO topics (name, order_index) VALUES (:n, :o)"), {"n": name, "o": order})
+        for topic_id, order, name in [(1, 2, "Lending"), (1, 1, "Payments"), (2, 1, "Workflow Automation")]:
+            conn.execute(text("INSERT INTO use_cases (topic_id, name, order_index) VALUES (:t, :n, :o)"),
+                         {"t": topic_id, "n": name, "o": order})
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return engine, sessionmaker(bind=engine), statements
+
+
+def _per_topic_queries(db):
+    """The N+1 version this replaced"""
+    tree = []
+    for topic_id, name in db.execute(text("SELECT id, name FROM topics ORDER BY order_index")).fetchall():
+        use_cases = db.execute(text("SELECT id, name FROM use_cases WHERE topic_id = :t ORDER BY order_index"),
+                               {"t": topic_id}).fetchall()
+        tree.append({"id": topic_id, "name": name, "use_cases": [{"id": i, "name": n} for i, n in use_cases]})
+    return tree
+
+
+def test_single_query_and_revalidation():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, statements = _database(tmp)
+        db = Session()
+        expected = _per_topic_queries(db)
+
+        statements.clear()
+        tree = topics.load_topics_tree(db)
+        assert tree.topics == expected and len(statements) == 1
+        assert tree.names == ["AI - Agentic", "Fintech", "Empty"] and tree.total_use_cases == 3
+
+        cache = topics.TopicsCache(ttl=60)
+        statements.clear()
+        assert cache.get(db) is cache.get(db) and cache.get(db).topics == expected
+        assert len(statements) == 3, "fingerprint + data_version + one tree query, then memory"
+
+        cache.ttl = 0
+        statements.clear()
+        assert cache.get(db).topics == expected
+        assert "JOIN" not in " ".join(statements), "unchanged tables: fingerprint only"
+
+        db.execute(text("INSERT INTO use_cases (topic_id, name, order_index) VALUES (3, 'Anything', 1)"))
+        db.commit()
+        assert cache.get(db).by_id[3]["use_cases"] == [{"id": 4, "name": "Anything"}]
+
+        db.execute(text("UPDATE topics SET name = 'Agentic AI', updated_at = '2099-01-01' WHERE id = 2"))
+        db.commit()
+        assert cache.get(db).names[0] == "Agentic AI"
+        db.close()
+        engine.dispose()
+
+    print("✓ One joined query builds the tree; changes are picked up via the fingerprint")
+
+
+def test_endpoints_serve_cached_tree():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, Session, statements = _database(tmp)
+
+        def override_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(topics.router)
+        app.dependency_overrides[get_db] = override_db
+        topics.invalidate_topics_cache()
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                body = (await client.get("/topics-usecases/topics")).json()
+                assert body["total_topics"] == 3 and body["total_use_cases"] == 3
+                statements.clear()
+                quick = (await client.get("/topics-usecases/quick-list")).json()
+                assert quick == {"topics": ["AI - Agentic", "Fintech", "Empty"], "count": 3}
+                one = (await client.get("/topics-usecases/topics/1/use-cases")).json()
+                assert [uc["name"] for uc in one["use_cases"]] == ["Payments", "Lending"]
+                assert statements == [], "dropdowns served from memory"
+                assert (await client.get("/topics-usecases/topics/99/use-cases")).status_code == 404
+                assert (await client.post("/topics-usecases/refresh")).json()["total_topics"] == 3
+        asyncio.run(run())
+        topics.invalidate_topics_cache()
+        engine.dispose()
+
+    print("✓ /topics, /quick-list and /topics/{id}/use-cases read the cached tree")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("TOPICS TREE TEST")
+    print("=" * 60)
+    test_single_query_and_revalidation()
+    test_endpoints_serve_cached_tree()
+    print("\n✅ All topics tree tests passed")
@@ -0,0 +1,30 @@
+"""
+Throwaway SQLite databases for the api/test_*.py scripts
+
+temp_engine() creates every table (core models and models_startup) in a
+file under a TemporaryDirectory; record_statements() collects the SQL an
+engine runs so tests can assert how many queries a code path issues.
+"""
+
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+import models
+import models_startup  # noqa: F401 - registers the startups tables on models.Base
+
+
+def temp_engine(tmp, name: str = "test.db") -> Engine:
+    """Engine on tmp/name with all tables created (usable from worker threads)"""
+    engine = create_engine(f"sqlite:///{Path(tmp) / name}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def record_statements(engine: Engine) -> List[str]:
+    """List that every statement executed on engine from now on is appended to"""
+    statements: List[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
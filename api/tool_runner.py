@@ -0,0 +1,182 @@
+"""
+Concurrent Tool-Call Runner for the function-calling concierges
+
+When the model asks for several tools in one turn they are independent, so
+they run side by side instead of one after another:
+- Each call gets its own timeout (per-tool overrides for slow APIs)
+- Results are truncated so one huge payload can't blow the context window
+- Results come back in the order the model requested them, ready to be
+  appended as "tool" messages
+
+Database tools in this repo are synchronous (or async functions that block
+on SQLAlchemy), so with offload=True every call runs in a worker thread -
+coroutines get their own event loop there. Handlers used that way must not
+share a Session across calls.
+"""
+
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOOL_TIMEOUT = 15.0  # seconds
+DEFAULT_MAX_RESULT_CHARS = 8000
+
+# Tools that call external APIs get more time than local DB lookups
+TOOL_TIMEOUTS: Dict[str, float] = {
+    "advanced_research_request": 30.0,
+    "get_startup_enrichment_data": 30.0,
+}
+
+ToolHandler = Callable[[str, Dict[str, Any]], Union[Any, Awaitable[Any]]]
+
+
+@dataclass
+class ToolCallResult:
+    tool_call_id: str
+    name: str
+    content: str
+    elapsed_ms: float
+    timed_out: bool = False
+    error: Optional[str] = None
+    truncated: bool = False
+
+    def to_message(self) -> Dict[str, Any]:
+        """OpenAI-style tool result message"""
+        return {
+            "role": "tool",
+            "tool_call_id": self.tool_call_id,
+            "name": self.name,
+            "content": self.content,
+        }
+
+
+def parse_arguments(arguments: Any) -> Dict[str, Any]:
+    """Tool call arguments arrive as a JSON string; tolerate junk"""
+    if isinstance(arguments, dict):
+        return arguments
+    try:
+        parsed = json.loads(arguments or "{}")
+    except (TypeError, json.JSONDecodeError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def truncate_result(content: str, max_chars: int) -> tuple:
+    """Cut content to max_chars, saying how much was dropped"""
+    if max_chars <= 0 or len(content) <= max_chars:
+        return content, False
+    dropped = len(content) - max_chars
+    return f"{content[:max_chars]}\n... [truncated {dropped} characters]", True
+
+
+def _run_in_thread(handler: ToolHandler, name: str, arguments: Dict[str, Any]) -> Any:
+    result = handler(name, arguments)
+    if asyncio.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+async def _invoke(handler: ToolHandler, name: str, arguments: Dict[str, Any], offload: bool) -> Any:
+    if offload:
+        return await asyncio.to_thread(_run_in_thread, handler, name, arguments)
+    result = handler(name, arguments)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+
+async def run_tool_call(
+    tool_call: Any,
+    handler: ToolHandler,
+    timeout: Optional[float] = None,
+    max_result_chars: int = DEFAULT_MAX_RESULT_CHARS,
+    offload: bool = True,
+) -> ToolCallResult:
+    """Execute one tool call, converting timeouts and errors into tool output"""
+    name = tool_call.function.name
+    arguments = parse_arguments(tool_call.function.arguments)
+    timeout = timeout if timeout is not None else TOOL_TIMEOUTS.get(name, DEFAULT_TOOL_TIMEOUT)
+    started = time.perf_counter()
+
+    logger.info(f"Executing tool: {name} with {arguments}")
+    try:
+        raw = await asyncio.wait_for(_invoke(handler, name, arguments, offload), timeout=timeout)
+        content = raw if isinstance(raw, str) else json.dumps(raw, default=str)
+        result = ToolCallResult(tool_call.id, name, content, 0.0)
+    except asyncio.TimeoutError:
+        # An offloaded thread can't be killed; it finishes in the background
+        logger.warning(f"⏱️  Tool {name} timed out after {timeout:g}s")
+        result = ToolCallResult(
+            tool_call.id, name, f"Tool '{name}' timed out after {timeout:g}s - answer without it.",
+            0.0, timed_out=True,
+        )
+    except Exception as e:
+        logger.error(f"Tool execution error ({name}): {e}")
+        result = ToolCallResult(tool_call.id, name, f"Tool execution error: {str(e)}", 0.0, error=str(e))
+
+    result.content, result.truncated = truncate_result(result.content, max_result_chars)
+    result.elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"Tool {name} finished in {result.elapsed_ms:.0f}ms: {result.content[:200]}...")
+    return result
+
+
+async def execute_tool_calls(
+    tool_calls: List[Any],
+    handler: ToolHandler,
+    timeouts: Optional[Dict[str, float]] = None,
+    max_result_chars: int = DEFAULT_MAX_RESULT_CHARS,
+    offload: bool = True,
+) -> List[ToolCallResult]:
+    """
+    Run every tool call of one model turn concurrently.
+
+    Args:
+        tool_calls: Objects with .id and .function.name / .function.arguments
+        handler: handler(name, arguments) -> result (sync or async)
+        timeouts: Per-tool timeout overrides in seconds
+        max_result_chars: Truncate each result to this many characters
+        offload: Run calls in worker threads (needed for blocking DB tools)
+
+    Returns:
+        Results in the same order as tool_calls
+    """
+    timeouts = {**TOOL_TIMEOUTS, **(timeouts or {})}
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_tool_call(
+            tc, handler,
+            timeout=timeouts.get(tc.function.name, DEFAULT_TOOL_TIMEOUT),
+            max_result_chars=max_result_chars,
+            offload=offload,
+        )
+        for tc in tool_calls
+    ))
+    if len(results) > 1:
+        wall_ms = (time.perf_counter() - started) * 1000
+        serial_ms = sum(r.elapsed_ms for r in results)
+        logger.info(f"Ran {len(results)} tools in {wall_ms:.0f}ms (sequential would be ~{serial_ms:.0f}ms)")
+    return list(results)
+
+
+def assistant_tool_call_message(message: Any) -> Dict[str, Any]:
+    """Echo the model's tool-call turn back into the message history"""
+    return {
+        "role": "assistant",
+        "content": message.content or "",
+        "tool_calls": [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments
+                }
+            }
+            for tc in message.tool_calls
+        ]
+    }
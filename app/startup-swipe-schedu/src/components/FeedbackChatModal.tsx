@@ -271,7 +271,8 @@ export function FeedbackChatModal({
       sessionStorage.setItem(`debrief_${sessionId}`, JSON.stringify({
         startup_name: startupName,
         insights_extraction_success: data.insights_extraction_success || false,
-        insights_saved: data.insights_saved || 0
+        insights_saved: data.insights_saved || 0,
+        job_id: data.job_id // poll /jobs/{job_id} for the extracted insights
       }))
       setTimeout(() => {
         onClose()
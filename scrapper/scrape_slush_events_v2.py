@@ -5,7 +5,6 @@ Parses DOM elements directly instead of looking for direct URLs
 """
 
 import os
-import time
 import json
 import logging
 from pathlib import Path
@@ -23,6 +22,9 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
+from slush_page_parsers import parse_event_cards
+from slush_http_scraper import DEFAULT_SESSION_PATH, enable_network_capture, scrape_events_http
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +35,12 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Event card body: the clickable container holding organizer, title and details
+EVENT_CARD_XPATH = (
+    "//div[contains(@class, 'fxipBD') and "
+    ".//span[contains(@class, 'sc-gDGPri') and contains(text(), 'Organized by')]]"
+)
+
 
 class SlushEventsScraperV2:
     """Scrapes event data from Slush platform activities page"""
@@ -41,10 +49,12 @@ class SlushEventsScraperV2:
         self,
         selenium_grid_url: str = "http://localhost:4444",
         screenshots: bool = False,
-        output_dir: str = "slush_events_data"
+        output_dir: str = "slush_events_data",
+        capture_network: bool = False
     ):
         self.selenium_grid_url = selenium_grid_url
         self.screenshots = screenshots
+        self.capture_network = capture_network
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
@@ -69,13 +79,17 @@ class SlushEventsScraperV2:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            if self.capture_network:
+                enable_network_capture(options)
             
             self.driver = webdriver.Remote(
                 command_executor=self.selenium_grid_url,
                 options=options
             )
             
-            self.driver.implicitly_wait(5)
+            # Explicit readiness waits only; an implicit wait would stall every
+            # find_elements() call that legitimately matches nothing
+            self.driver.implicitly_wait(0)
             logger.info("✅ Connected to Selenium Grid")
             
         except Exception as e:
@@ -90,6 +104,23 @@ class SlushEventsScraperV2:
             self.driver.save_screenshot(str(filename))
             logger.debug(f"Screenshot saved: {filename}")
     
+    def count_event_cards(self) -> int:
+        return len(self.driver.find_elements(By.XPATH, EVENT_CARD_XPATH))
+    
+    def wait_for_cards_change(self, previous: int, timeout: float = 5) -> int:
+        """Wait until the number of rendered event cards differs from `previous`"""
+        counts = [previous]
+        
+        def changed(driver) -> bool:
+            counts[0] = len(driver.find_elements(By.XPATH, EVENT_CARD_XPATH))
+            return counts[0] != previous
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(changed)
+        except TimeoutException:
+            pass
+        return counts[0]
+    
     def login(self) -> bool:
         """Login to Slush platform"""
         if not self.email or not self.password:
@@ -100,22 +131,21 @@ class SlushEventsScraperV2:
             logger.info("Attempting to login to Slush platform...")
             
             self.driver.get("https://platform.slush.org/")
-            time.sleep(3)
-            self.take_screenshot("01_login_page")
             
             # Find email input
-            email_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='email'], input[name='email']")
+            email_input = WebDriverWait(self.driver, 15).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='email'], input[name='email']"))
+            )
+            self.take_screenshot("01_login_page")
             email_input.clear()
             email_input.send_keys(self.email)
             logger.info(f"✅ Entered email")
-            time.sleep(1)
             
             # Find password input
             password_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password'], input[name='password']")
             password_input.clear()
             password_input.send_keys(self.password)
             logger.info("✅ Entered password")
-            time.sleep(1)
             
             self.take_screenshot("02_credentials_entered")
             
@@ -125,7 +155,10 @@ class SlushEventsScraperV2:
             logger.info("✅ Submitted login form")
             
             # Wait for redirect
-            time.sleep(5)
+            try:
+                WebDriverWait(self.driver, 20).until(EC.url_contains("slush25"))
+            except TimeoutException:
+                pass
             self.take_screenshot("03_after_login")
             
             current_url = self.driver.current_url
@@ -153,8 +186,6 @@ class SlushEventsScraperV2:
             logger.info("="*70)
             
             self.driver.get("https://platform.slush.org/slush25/activities/browse")
-            time.sleep(5)
-            self.take_screenshot("04_browse_page_loaded")
             
             logger.info(f"Current URL: {self.driver.current_url}")
             logger.info(f"Page title: {self.driver.title}")
@@ -162,13 +193,14 @@ class SlushEventsScraperV2:
             # Wait for content to load
             logger.info("Waiting for event content to load...")
             try:
-                WebDriverWait(self.driver, 15).until(
+                WebDriverWait(self.driver, 20).until(
                     EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Organized by')]"))
                 )
                 logger.info("✅ Event content detected on page")
             except TimeoutException:
                 logger.error("❌ Timeout waiting for event content")
                 return []
+            self.take_screenshot("04_browse_page_loaded")
             
             # Activate day filters to see all events
             logger.info("Activating day filters...")
@@ -180,22 +212,22 @@ class SlushEventsScraperV2:
                         "//span[contains(@class, 'sc-jHSbPC') and text()='Advanced Filters']"
                     )
                     advanced_filters_btn.click()
-                    time.sleep(1)
                     logger.info("✅ Opened Advanced Filters")
                 except:
                     logger.info("Advanced Filters already open or not found")
                 
                 # Click "Day" accordion to expand it
                 try:
-                    day_accordion = self.driver.find_element(
-                        By.XPATH,
-                        "//button[.//span[text()='Day ']]"
+                    day_accordion = WebDriverWait(self.driver, 5).until(
+                        EC.presence_of_element_located((By.XPATH, "//button[.//span[text()='Day ']]"))
                     )
                     # Check if it's closed (data-state="closed")
                     parent = day_accordion.find_element(By.XPATH, "..")
                     if parent.get_attribute("data-state") == "closed":
                         day_accordion.click()
-                        time.sleep(1)
+                        WebDriverWait(self.driver, 5).until(
+                            lambda d: parent.get_attribute("data-state") == "open"
+                        )
                         logger.info("✅ Expanded Day filter")
                 except Exception as e:
                     logger.warning(f"Could not expand Day accordion: {e}")
@@ -207,6 +239,7 @@ class SlushEventsScraperV2:
                 )
                 
                 checked_count = 0
+                cards_before = self.count_event_cards()
                 for idx, checkbox in enumerate(day_checkboxes):
                     try:
                         # Check if already checked
@@ -215,14 +248,13 @@ class SlushEventsScraperV2:
                             parent_label = checkbox.find_element(By.XPATH, "../..")
                             self.driver.execute_script("arguments[0].click();", parent_label)
                             checked_count += 1
-                            time.sleep(0.5)
                     except Exception as e:
                         logger.debug(f"Could not click checkbox {idx}: {e}")
                         continue
                 
                 if checked_count > 0:
                     logger.info(f"✅ Activated {checked_count} day filters")
-                    time.sleep(2)  # Wait for content to reload
+                    self.wait_for_cards_change(cards_before)  # Wait for content to reload
                 else:
                     logger.info("Day filters already active or not found")
                 
@@ -245,18 +277,16 @@ class SlushEventsScraperV2:
                     try:
                         # Scroll button into view
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        time.sleep(0.5)
                         
-                        # Click it
+                        # Click it and wait for the category to render its extra cards
+                        cards_before = self.count_event_cards()
                         self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(1)
+                        self.wait_for_cards_change(cards_before, timeout=3)
                         logger.info(f"✅ Clicked 'view all' button {idx + 1}")
                     except Exception as e:
                         logger.debug(f"Could not click button {idx}: {e}")
                         continue
                 
-                # Wait for content to expand
-                time.sleep(3)
                 self.take_screenshot("05_categories_expanded")
                 
             except Exception as e:
@@ -273,114 +303,22 @@ class SlushEventsScraperV2:
             
             for scroll_num in range(max_scrolls):
                 try:
-                    # Find all event card containers - look for the specific clickable container with event details
-                    # Pattern: div with class "fxipBD" that contains the organizer and title
-                    event_containers = self.driver.find_elements(
-                        By.XPATH,
-                        "//div[contains(@class, 'fxipBD') and .//span[contains(@class, 'sc-gDGPri') and contains(text(), 'Organized by')]]"
-                    )
+                    # Parse one page snapshot instead of one WebDriver round trip per field
+                    cards = parse_event_cards(self.driver.page_source)
                     
-                    logger.info(f"\n[Scroll {scroll_num + 1}/{max_scrolls}] Found {len(event_containers)} event containers on page")
+                    logger.info(f"\n[Scroll {scroll_num + 1}/{max_scrolls}] Found {len(cards)} event containers on page")
                     
-                    for idx, container in enumerate(event_containers):
-                        try:
-                            # Extract organizer
-                            organizer_elem = container.find_element(
-                                By.XPATH,
-                                ".//span[contains(@class, 'sc-gDGPri') and contains(text(), 'Organized by')]"
-                            )
-                            organizer = organizer_elem.text.replace("Organized by ", "").strip()
-                            
-                            # Extract title
-                            title_elem = container.find_element(
-                                By.XPATH,
-                                ".//span[contains(@class, 'sc-gUYXyr')]"
-                            )
-                            title = title_elem.text.strip()
-                            
-                            # Create unique key
-                            event_key = f"{title}|||{organizer}"
-                            
-                            # Skip if we've seen this event
-                            if event_key in seen_events:
-                                continue
-                            
-                            seen_events.add(event_key)
-                            
-                            # Extract datetime (first jxiMIY span)
-                            datetime_str = ""
-                            try:
-                                datetime_elem = container.find_element(
-                                    By.XPATH,
-                                    ".//div[contains(@class, 'dtaHQV')]//span[contains(@class, 'jxiMIY')]"
-                                )
-                                datetime_str = datetime_elem.text.strip()
-                            except:
-                                pass
-                            
-                            # Extract location (second jxiMIY span)
-                            location = ""
-                            try:
-                                location_elems = container.find_elements(
-                                    By.XPATH,
-                                    ".//div[contains(@class, 'dtaHQV')]//span[contains(@class, 'jxiMIY')]"
-                                )
-                                if len(location_elems) > 1:
-                                    location = location_elems[1].text.strip()
-                            except:
-                                pass
-                            
-                            # Extract categories/tags - only from this specific event container
-                            categories = []
-                            try:
-                                tag_container = container.find_element(
-                                    By.XPATH,
-                                    ".//div[contains(@class, 'jpeGDW')]"
-                                )
-                                tag_elems = tag_container.find_elements(
-                                    By.XPATH,
-                                    ".//span[contains(@class, 'gEnNDj')]"
-                                )
-                                categories = [tag.text.strip() for tag in tag_elems if tag.text.strip()]
-                            except:
-                                pass
-                            
-                            # Extract status badges - look in sibling container
-                            status = []
-                            try:
-                                # Navigate to parent container to find status
-                                card_parent = container.find_element(By.XPATH, "../..")
-                                status_container = card_parent.find_element(
-                                    By.XPATH,
-                                    ".//div[contains(@class, 'sdiOz')]//div[contains(@class, 'dSaUeQ')]"
-                                )
-                                status_elems = status_container.find_elements(
-                                    By.XPATH,
-                                    ".//span[contains(@class, 'flPfqf')]"
-                                )
-                                status = [s.text.strip() for s in status_elems if s.text.strip()]
-                            except:
-                                pass
-                            
-                            # Create event data
-                            event_data = {
-                                "title": title,
-                                "organizer": organizer,
-                                "datetime": datetime_str,
-                                "location": location,
-                                "categories": categories,
-                                "status": status,
-                                "scraped_at": datetime.now().isoformat()
-                            }
-                            
-                            events_data.append(event_data)
-                            logger.info(f"  ✅ [{len(events_data)}] {title[:60]}... by {organizer[:30]}")
-                            
-                        except StaleElementReferenceException:
-                            continue
-                        except Exception as e:
-                            logger.debug(f"  ⚠️  Error parsing container {idx}: {e}")
+                    for event_data in cards:
+                        # Create unique key
+                        event_key = f"{event_data['title']}|||{event_data['organizer']}"
+                        
+                        # Skip if we've seen this event
+                        if event_key in seen_events:
                             continue
+                        
+                        seen_events.add(event_key)
+                        events_data.append(event_data)
+                        logger.info(f"  ✅ [{len(events_data)}] {event_data['title'][:60]}... by {event_data['organizer'][:30]}")
                     
                     # Check progress
                     current_count = len(events_data)
@@ -394,8 +332,8 @@ class SlushEventsScraperV2:
                         last_count = current_count
                     
                     # Scroll down
+                    cards_before = self.count_event_cards()
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
                     
                     # Try scrolling specific content container
                     try:
@@ -407,9 +345,12 @@ class SlushEventsScraperV2:
                             "arguments[0].scrollTop = arguments[0].scrollHeight",
                             scroll_container
                         )
-                    except:
+                    except NoSuchElementException:
                         pass
                     
+                    # Wait for the next page of cards instead of a fixed sleep
+                    self.wait_for_cards_change(cards_before, timeout=3)
+                    
                 except Exception as e:
                     logger.error(f"Error during scroll {scroll_num + 1}: {e}")
                     continue
@@ -472,9 +413,34 @@ def main():
     parser.add_argument("--screenshots", action="store_true", help="Take screenshots during scraping")
     parser.add_argument("--max-scrolls", type=int, default=30, help="Maximum number of scrolls")
     parser.add_argument("--output", help="Output JSON filename")
+    parser.add_argument("--mode", choices=["auto", "http", "selenium"], default="auto",
+                        help="http replays the JSON API, selenium scrolls the page, auto tries http first")
+    parser.add_argument("--session-file", default=DEFAULT_SESSION_PATH,
+                        help="Saved login session / endpoint for HTTP mode")
+    parser.add_argument("--endpoint", help="Activities API URL (copied from DevTools) if auto-discovery misses it")
+    parser.add_argument("--page-size", type=int, default=100, help="Records per API page in HTTP mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent API requests in HTTP mode")
     
     args = parser.parse_args()
     
+    if args.mode in ("auto", "http"):
+        events = scrape_events_http(
+            args.grid_url,
+            session_path=args.session_file,
+            endpoint=args.endpoint,
+            page_size=args.page_size,
+            concurrency=args.concurrency,
+        )
+        if events:
+            scraper = SlushEventsScraperV2(selenium_grid_url=args.grid_url)
+            scraper.events_data = events
+            scraper.save_events_json(args.output)
+            return
+        if args.mode == "http":
+            logger.error("HTTP mode failed - rerun with --mode selenium or --endpoint")
+            return
+        logger.info("Falling back to Selenium scraping")
+    
     scraper = SlushEventsScraperV2(
         selenium_grid_url=args.grid_url,
         screenshots=args.screenshots
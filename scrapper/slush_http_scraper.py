@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Slush HTTP Fast Path - replays the platform's JSON endpoints with httpx
+
+The activities browse page renders from XHR responses, so driving a browser
+to scroll and read DOM classes is only needed once: to log in and see which
+endpoint the page calls. After that:
+- One Selenium login (with Chrome performance logging) captures the cookies,
+  auth headers and the activities request the page makes
+- The session is saved to disk, so later runs skip the browser entirely
+  until the login expires
+- Pages are fetched concurrently with httpx and parsed by
+  slush_page_parsers.parse_events_payload() into the usual event records
+- Selenium DOM scraping (SlushEventsScraperV2) stays as the fallback
+
+The endpoint is not hardcoded: it is discovered from the browser's network
+log, or can be given explicitly with --endpoint (copy it from DevTools).
+"""
+
+import os
+import json
+import math
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse, parse_qsl, urlunparse
+
+import httpx
+
+from slush_page_parsers import extract_items, extract_total, parse_events_payload
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+ACTIVITIES_URL = "https://platform.slush.org/slush25/activities/browse"
+DEFAULT_SESSION_PATH = "slush_api_session.json"
+
+# URL / GraphQL operation fragments that identify the activities request
+ENDPOINT_HINTS = ("activit", "event", "sideevent", "side-event", "agenda")
+
+# Request headers worth replaying; everything else httpx sets itself
+REPLAY_HEADERS = {"authorization", "x-api-key", "x-csrf-token", "x-requested-with", "apollo-require-preflight"}
+
+# Query / variable names commonly used for pagination
+PAGE_PARAMS = ("page", "pageNumber", "offset", "skip")
+SIZE_PARAMS = ("limit", "pageSize", "page_size", "perPage", "per_page", "first", "take", "size")
+
+
+class SessionExpired(Exception):
+    """The replayed cookies / token are no longer accepted"""
+
+
+@dataclass
+class EndpointConfig:
+    """How to replay one paginated list request"""
+    url: str
+    method: str = "GET"
+    params: Dict[str, Any] = field(default_factory=dict)
+    json_body: Optional[Dict[str, Any]] = None
+    page_param: str = "page"
+    size_param: str = "limit"
+    page_size: int = 100
+    first_page: int = 1
+    offset_pagination: bool = False  # page_param counts records, not pages
+
+    def page_value(self, index: int) -> int:
+        """Value of page_param for the index-th page (0-based)"""
+        return index * self.page_size if self.offset_pagination else self.first_page + index
+
+    def request_kwargs(self, index: int) -> Dict[str, Any]:
+        paging = {self.page_param: self.page_value(index), self.size_param: self.page_size}
+        if self.json_body is None:
+            return {"params": {**self.params, **paging}}
+        body = json.loads(json.dumps(self.json_body))  # Deep copy
+        target = body.setdefault("variables", {}) if "query" in body else body
+        target.update(paging)
+        return {"params": self.params, "json": body}
+
+    @classmethod
+    def from_request(cls, url: str, method: str = "GET", post_data: Optional[str] = None,
+                     page_size: int = 100) -> "EndpointConfig":
+        """Build a config from a captured request, guessing the pagination fields"""
+        parsed = urlparse(url)
+        params = dict(parse_qsl(parsed.query))
+        base_url = urlunparse(parsed._replace(query=""))
+        json_body = None
+        if post_data:
+            try:
+                json_body = json.loads(post_data)
+            except ValueError:
+                json_body = None
+
+        fields = params
+        if isinstance(json_body, dict):
+            fields = json_body.get("variables", json_body) if "query" in json_body else json_body
+            if not isinstance(fields, dict):
+                fields = {}
+        page_param = next((p for p in PAGE_PARAMS if p in fields), "page")
+        size_param = next((p for p in SIZE_PARAMS if p in fields), "limit")
+        first_page = fields.get(page_param, 1)
+
+        config = cls(
+            url=base_url,
+            method=method.upper(),
+            params={k: v for k, v in params.items() if k not in (page_param, size_param)},
+            json_body=json_body,
+            page_param=page_param,
+            size_param=size_param,
+            page_size=page_size,
+            first_page=first_page if isinstance(first_page, int) else 1,
+            offset_pagination=page_param in ("offset", "skip"),
+        )
+        return config
+
+
+@dataclass
+class APISession:
+    """Cookies, replay headers and discovered endpoints from one login"""
+    cookies: List[Dict[str, Any]] = field(default_factory=list)
+    headers: Dict[str, str] = field(default_factory=dict)
+    events: Optional[EndpointConfig] = None
+    captured_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def save(self, path: Path):
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+        os.chmod(tmp_path, 0o600)  # Holds session cookies
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["APISession"]:
+        if not Path(path).exists():
+            return None
+        with open(path, "r") as f:
+            data = json.load(f)
+        events = data.pop("events", None)
+        return cls(events=EndpointConfig(**events) if events else None, **data)
+
+    def cookie_jar(self) -> httpx.Cookies:
+        jar = httpx.Cookies()
+        for cookie in self.cookies:
+            jar.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+        return jar
+
+
+# ============================================
+# Endpoint discovery (Chrome performance log)
+# ============================================
+
+def enable_network_capture(options) -> None:
+    """Ask Chrome to record DevTools network events for find_api_requests()"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def find_api_requests(performance_log: List[Dict[str, Any]], hints=ENDPOINT_HINTS) -> List[Dict[str, Any]]:
+    """
+    Pick the JSON XHR/fetch requests matching `hints` out of a
+    driver.get_log("performance") dump, most recent last.
+    """
+    requests: Dict[str, Dict[str, Any]] = {}
+    json_responses = set()
+
+    for entry in performance_log:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            if params.get("type") not in (None, "XHR", "Fetch"):
+                continue
+            request = params.get("request", {})
+            requests[params.get("requestId")] = {
+                "url": request.get("url", ""),
+                "method": request.get("method", "GET"),
+                "headers": request.get("headers", {}),
+                "post_data": request.get("postData"),
+            }
+        elif message.get("method") == "Network.responseReceived":
+            if "json" in params.get("response", {}).get("mimeType", ""):
+                json_responses.add(params.get("requestId"))
+
+    matches = []
+    for request_id, request in requests.items():
+        if request_id not in json_responses:
+            continue
+        haystack = (request["url"] + (request["post_data"] or "")).lower()
+        if any(hint in haystack for hint in hints):
+            matches.append(request)
+    return matches
+
+
+def capture_session_with_selenium(grid_url: str, page_size: int = 100) -> Optional[APISession]:
+    """
+    Log in once through Selenium, open the activities page and capture the
+    cookies, auth headers and activities request it makes.
+    """
+    from scrape_slush_events_v2 import SlushEventsScraperV2
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    scraper = SlushEventsScraperV2(selenium_grid_url=grid_url, capture_network=True)
+    try:
+        scraper.setup_driver()
+        if not scraper.login():
+            return None
+        scraper.driver.get(ACTIVITIES_URL)
+        WebDriverWait(scraper.driver, 20).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        scraper.wait_for_cards_change(0, timeout=15)
+        return session_from_driver(scraper.driver, page_size=page_size)
+    finally:
+        scraper.cleanup()
+
+
+def session_from_driver(driver, page_size: int = 100) -> APISession:
+    """Build an APISession from a logged-in driver with network capture enabled"""
+    session = APISession(cookies=[
+        {k: c[k] for k in ("name", "value", "domain", "path") if k in c}
+        for c in driver.get_cookies()
+    ])
+    try:
+        matches = find_api_requests(driver.get_log("performance"))
+    except Exception as e:
+        logger.warning(f"⚠️  Network log unavailable: {e}")
+        matches = []
+
+    if matches:
+        request = matches[-1]
+        session.events = EndpointConfig.from_request(
+            request["url"], request["method"], request["post_data"], page_size=page_size
+        )
+        session.headers = {
+            k: v for k, v in request["headers"].items() if k.lower() in REPLAY_HEADERS
+        }
+        logger.info(f"✅ Captured activities endpoint: {session.events.method} {session.events.url}")
+    else:
+        logger.warning("⚠️  No activities JSON request seen in the network log")
+    return session
+
+
+# ============================================
+# Concurrent replay
+# ============================================
+
+class SlushHTTPScraper:
+    """Fetch every page of a captured endpoint concurrently"""
+
+    def __init__(self, session: APISession, concurrency: int = 8, timeout: float = 20.0, max_retries: int = 3,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.session = session
+        self.transport = transport
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.requests_made = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers={"Accept": "application/json", **self.session.headers},
+            cookies=self.session.cookie_jar(),
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            follow_redirects=True,
+            transport=self.transport,
+        )
+
+    async def _fetch_page(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                          endpoint: EndpointConfig, index: int) -> Any:
+        async with semaphore:
+            for attempt in range(self.max_retries):
+                self.requests_made += 1
+                response = await client.request(endpoint.method, endpoint.url, **endpoint.request_kwargs(index))
+                if response.status_code in (401, 403):
+                    raise SessionExpired(f"HTTP {response.status_code} from {endpoint.url}")
+                if response.status_code == 429 or response.status_code >= 500:
+                    retry_after = float(response.headers.get("Retry-After", 2 ** attempt))
+                    await asyncio.sleep(min(retry_after, 30))
+                    continue
+                response.raise_for_status()
+                if "json" not in response.headers.get("content-type", ""):
+                    # A login redirect comes back as HTML with status 200
+                    raise SessionExpired(f"Non-JSON response from {endpoint.url}")
+                return response.json()
+            raise httpx.HTTPError(f"Page {index} failed after {self.max_retries} attempts")
+
+    async def fetch_all(self, endpoint: EndpointConfig, max_pages: int = 500) -> List[Any]:
+        """
+        Return every page payload. The first page tells us the total when the
+        API reports one; otherwise pages are fetched in concurrent waves until
+        a short page comes back.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._client() as client:
+            first = await self._fetch_page(client, semaphore, endpoint, 0)
+            payloads = [first]
+            if len(extract_items(first)) < endpoint.page_size:
+                return payloads
+
+            total = extract_total(first)
+            if total is not None:
+                pages = min(math.ceil(total / endpoint.page_size), max_pages)
+                payloads += await asyncio.gather(*(
+                    self._fetch_page(client, semaphore, endpoint, i) for i in range(1, pages)
+                ))
+                return payloads
+
+            index = 1
+            while index < max_pages:
+                wave = range(index, min(index + self.concurrency, max_pages))
+                results = await asyncio.gather(*(
+                    self._fetch_page(client, semaphore, endpoint, i) for i in wave
+                ))
+                payloads += results
+                if any(len(extract_items(r)) < endpoint.page_size for r in results):
+                    break
+                index = wave.stop
+            return payloads
+
+    async def scrape_events(self) -> List[Dict]:
+        if not self.session.events:
+            raise ValueError("No activities endpoint captured")
+        scraped_at = datetime.now().isoformat()
+        payloads = await self.fetch_all(self.session.events)
+        events = []
+        for payload in payloads:
+            events.extend(parse_events_payload(payload, scraped_at=scraped_at))
+        return dedupe_events(events)
+
+
+def dedupe_events(events: List[Dict]) -> List[Dict]:
+    """Drop repeats that overlapping pages return, keeping first-seen order"""
+    seen = set()
+    unique = []
+    for event in events:
+        key = (event["title"], event["organizer"], event["datetime"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(event)
+    return unique
+
+
+def scrape_events_http(
+    grid_url: str,
+    session_path: str = DEFAULT_SESSION_PATH,
+    endpoint: Optional[str] = None,
+    page_size: int = 100,
+    concurrency: int = 8,
+) -> Optional[List[Dict]]:
+    """
+    Fast path: reuse the saved session (or log in once via Selenium to
+    capture one) and replay the activities endpoint. Returns None when the
+    fast path is unavailable so the caller can fall back to the browser.
+    """
+    session = APISession.load(session_path)
+    if session is None:
+        session = capture_session_with_selenium(grid_url, page_size=page_size)
+        if session is None:
+            return None
+    if endpoint:
+        session.events = EndpointConfig.from_request(endpoint, page_size=page_size)
+    if not session.events:
+        return None
+    session.save(session_path)
+
+    for attempt in range(2):
+        started = time.time()
+        scraper = SlushHTTPScraper(session, concurrency=concurrency)
+        try:
+            events = asyncio.run(scraper.scrape_events())
+        except SessionExpired as e:
+            if attempt:
+                logger.warning(f"⚠️  {e} - giving up on HTTP mode")
+                return None
+            logger.info(f"Session expired ({e}) - logging in again")
+            fresh = capture_session_with_selenium(grid_url, page_size=page_size)
+            if fresh is None:
+                return None
+            if endpoint or not fresh.events:
+                fresh.events = session.events
+            session = fresh
+            session.save(session_path)
+            continue
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"⚠️  HTTP fast path failed: {e}")
+            return None
+
+        if not events:
+            logger.warning("⚠️  HTTP fast path returned no events")
+            return None
+        logger.info(
+            f"✅ HTTP mode: {len(events)} events from {scraper.requests_made} requests "
+            f"in {time.time() - started:.1f}s"
+        )
+        return events
+    return None
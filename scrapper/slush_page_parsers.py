@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Offline parsers for Slush platform pages
+
+Parse a full page snapshot (driver.page_source) in one pass instead of issuing
+one WebDriver round trip per field. Pure functions, so they can be checked
+against the saved fixtures (activities_page_source.html) without a browser.
+
+parse_events_payload() does the same for the JSON the activities page loads
+over XHR, so the HTTP fast path (slush_http_scraper.py) produces the same
+records as the DOM scraper.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from bs4 import BeautifulSoup
+
+# styled-components class hashes used by the activities browse page
+EVENT_CARD_CLASS = "fxipBD"
+ORGANIZER_CLASS = "sc-gDGPri"
+TITLE_CLASS = "sc-gUYXyr"
+DETAILS_CLASS = "dtaHQV"
+DETAIL_TEXT_CLASS = "jxiMIY"
+TAGS_CLASS = "jpeGDW"
+TAG_CLASS = "gEnNDj"
+STATUS_SECTION_CLASS = "sdiOz"
+STATUS_LIST_CLASS = "dSaUeQ"
+STATUS_CLASS = "flPfqf"
+
+
+def _text(element) -> str:
+    return element.get_text(" ", strip=True) if element else ""
+
+
+def parse_event_cards(html: str, scraped_at: Optional[str] = None) -> List[Dict]:
+    """
+    Extract every event card from an activities browse page snapshot.
+
+    Returns dicts with the same keys SlushEventsScraperV2 saves:
+    title, organizer, datetime, location, categories, status, scraped_at.
+    Cards without an organizer or title are skipped.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    scraped_at = scraped_at or datetime.now().isoformat()
+    events = []
+
+    for card in soup.select(f"div[class*='{EVENT_CARD_CLASS}']"):
+        organizer_elem = next(
+            (s for s in card.select(f"span[class*='{ORGANIZER_CLASS}']")
+             if "Organized by" in s.get_text()),
+            None
+        )
+        title_elem = card.select_one(f"span[class*='{TITLE_CLASS}']")
+        if not organizer_elem or not title_elem:
+            continue
+
+        details = card.select(f"div[class*='{DETAILS_CLASS}'] span[class*='{DETAIL_TEXT_CLASS}']")
+
+        # Tags and status badges are siblings of the card body inside the card root
+        root = card.parent or card
+        categories = [
+            _text(tag)
+            for tag in root.select(f"div[class*='{TAGS_CLASS}'] span[class*='{TAG_CLASS}']")
+            if _text(tag)
+        ]
+        status = [
+            _text(badge)
+            for badge in root.select(
+                f"div[class*='{STATUS_SECTION_CLASS}'] div[class*='{STATUS_LIST_CLASS}'] "
+                f"span[class*='{STATUS_CLASS}']"
+            )
+            if _text(badge)
+        ]
+
+        events.append({
+            "title": _text(title_elem),
+            "organizer": _text(organizer_elem).replace("Organized by", "", 1).strip(),
+            "datetime": _text(details[0]) if details else "",
+            "location": _text(details[1]) if len(details) > 1 else "",
+            "categories": categories,
+            "status": status,
+            "scraped_at": scraped_at,
+        })
+
+    return events
+
+
+# ============================================
+# JSON / GraphQL payloads
+# ============================================
+
+# Event time zone used when the API returns UTC timestamps
+EVENT_TIMEZONE = "Europe/Helsinki"
+
+# Containers that hold the list of records in REST and GraphQL responses
+ITEM_CONTAINER_KEYS = ("items", "results", "events", "activities", "nodes", "edges", "data")
+
+TITLE_KEYS = ("title", "name")
+ORGANIZER_KEYS = ("organizer", "organizerName", "organiser", "host", "organization", "company")
+LOCATION_KEYS = ("location", "locationName", "venue", "place")
+CATEGORY_KEYS = ("categories", "tags", "topics")
+STATUS_KEYS = ("status", "labels", "badges")
+START_KEYS = ("startTime", "startsAt", "start_time", "start", "startDate")
+END_KEYS = ("endTime", "endsAt", "end_time", "end", "endDate")
+
+
+def _first(record: Dict[str, Any], keys) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _label(value: Any) -> str:
+    """Display string for a scalar or a {"name": ...} style object"""
+    if isinstance(value, dict):
+        value = _first(value, ("name", "title", "label", "value"))
+    return str(value).strip() if value is not None else ""
+
+
+def _labels(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [label for label in (_label(v) for v in value) if label]
+
+
+def _parse_timestamp(value: Any, tz: ZoneInfo) -> Optional[datetime]:
+    if isinstance(value, (int, float)):
+        # Epoch seconds or milliseconds
+        return datetime.fromtimestamp(value / 1000 if value > 1e11 else value, tz)
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.astimezone(tz) if parsed.tzinfo else parsed
+
+
+def _clock(value: datetime) -> str:
+    return value.strftime("%I:%M %p").lstrip("0")
+
+
+def format_event_datetime(start: Any, end: Any = None, tz: str = EVENT_TIMEZONE) -> str:
+    """
+    Render API timestamps the way the browse page shows them,
+    e.g. "Nov 20, 10:00 AM – 12:00 PM". Returns "" if start can't be parsed.
+    """
+    zone = ZoneInfo(tz)
+    start_dt = _parse_timestamp(start, zone)
+    if not start_dt:
+        return ""
+    text = f"{start_dt.strftime('%b')} {start_dt.day}, {_clock(start_dt)}"
+    end_dt = _parse_timestamp(end, zone)
+    if end_dt:
+        text += f" – {_clock(end_dt)}"
+    return text
+
+
+def extract_items(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Find the record list in a response: a bare list, a REST envelope
+    ({"items": [...]}, {"data": {"activities": [...]}}) or a GraphQL
+    connection ({"edges": [{"node": {...}}]}).
+    """
+    if isinstance(payload, list):
+        return [item.get("node", item) if isinstance(item, dict) else item for item in payload]
+    if not isinstance(payload, dict):
+        return []
+
+    for key in ITEM_CONTAINER_KEYS:
+        if key in payload:
+            items = extract_items(payload[key])
+            if items:
+                return items
+
+    # GraphQL: {"data": {"<queryName>": {...}}} with an arbitrary query name
+    for value in payload.values():
+        if isinstance(value, (dict, list)):
+            items = extract_items(value)
+            if items and isinstance(items[0], dict):
+                return items
+    return []
+
+
+def parse_event_record(record: Dict[str, Any], scraped_at: str, tz: str = EVENT_TIMEZONE) -> Optional[Dict]:
+    """Normalize one API record to the saved event shape, or None if untitled"""
+    title = _label(_first(record, TITLE_KEYS))
+    if not title:
+        return None
+
+    when = record.get("datetime")
+    if not isinstance(when, str):
+        when = format_event_datetime(_first(record, START_KEYS), _first(record, END_KEYS), tz)
+
+    location = _first(record, LOCATION_KEYS)
+    if isinstance(location, dict):
+        location = _first(location, ("name", "title", "address"))
+
+    return {
+        "title": title,
+        "organizer": _label(_first(record, ORGANIZER_KEYS)).replace("Organized by", "", 1).strip(),
+        "datetime": when,
+        "location": _label(location),
+        "categories": _labels(_first(record, CATEGORY_KEYS)),
+        "status": _labels(_first(record, STATUS_KEYS)),
+        "scraped_at": scraped_at,
+    }
+
+
+def parse_events_payload(payload: Any, scraped_at: Optional[str] = None, tz: str = EVENT_TIMEZONE) -> List[Dict]:
+    """
+    Extract events from an activities API response (REST or GraphQL).
+
+    Returns dicts with the same keys as parse_event_cards(). Records that are
+    already in that shape (e.g. the saved slush_events_data/*.json files) pass
+    through unchanged apart from scraped_at.
+    """
+    scraped_at = scraped_at or datetime.now().isoformat()
+    events = []
+    for record in extract_items(payload):
+        if isinstance(record, dict):
+            event = parse_event_record(record, scraped_at, tz)
+            if event:
+                events.append(event)
+    return events
+
+
+def extract_total(payload: Any) -> Optional[int]:
+    """Total record count advertised by a paginated response, if any"""
+    if not isinstance(payload, dict):
+        return None
+    for key in ("total", "totalCount", "total_count", "count", "totalItems"):
+        if isinstance(payload.get(key), int):
+            return payload[key]
+    for key in ("meta", "pagination", "pageInfo", "data"):
+        total = extract_total(payload.get(key))
+        if total is not None:
+            return total
+    for value in payload.values():
+        if isinstance(value, dict):
+            total = extract_total(value)
+            if total is not None:
+                return total
+    return None